@@ -0,0 +1,227 @@
+"""Control de admisión: límites de entrada y pedidos simultáneos por cliente
+
+Un código demasiado grande o demasiado anidado no debe llegar a las fases
+caras. Los límites se revisan lo antes posible:
+- bytes: antes de tokenizar (y en la API, el tamaño del cuerpo antes de leerlo)
+- tokens: mientras se tokeniza; al pasar el límite se deja de tokenizar
+- anidamiento: paréntesis, corchetes y llaves antes de parsear, y la
+  profundidad del AST antes del análisis semántico y de convertirlo a JSON.
+  Las cadenas de operadores (`1 + 1 + ... + 1`) no tienen paréntesis pero
+  anidan el AST igual, y los recorridos recursivos (y orjson, que corta a los
+  255 niveles) fallarían con ellas.
+
+Los límites son los de `limites`, que se cambian con fijar_limites; el
+EjecutorAnalisis se los pasa a sus procesos al iniciarlos.
+
+ControlAdmision es un middleware ASGI que rechaza antes de leer el cuerpo:
+413 si el cuerpo pasa de `max_bytes_cuerpo` y 429 si el cliente ya tiene
+`max_por_cliente` pedidos en curso.
+"""
+import math
+from collections import Counter
+from typing import Any, Callable, Dict, NamedTuple, Optional
+
+import metricas_lynx
+from lexer_lynx import tokenizar
+from serializacion_lynx import a_json
+
+MAX_BYTES_CODIGO = 1024 * 1024
+MAX_TOKENS = 200_000
+# Con margen: una escalera de 129 `sinosi` ya no se puede escribir como el
+# AST de siempre, que envuelve cada lista (orjson corta a los 255 niveles)
+MAX_PROFUNDIDAD = 120
+
+BYTES = "bytes"
+TOKENS = "tokens"
+PROFUNDIDAD = "profundidad"
+
+_APERTURAS = {"PAREN_ABRIR", "CORCHETE_ABRIR", "LLAVE_ABRIR"}
+_CIERRES = {"PAREN_CERRAR", "CORCHETE_CERRAR", "LLAVE_CERRAR"}
+_HOJAS = {str, int, float, bool, type(None)}
+
+
+class Limites(NamedTuple):
+    bytes: int = MAX_BYTES_CODIGO
+    tokens: int = MAX_TOKENS
+    profundidad: int = MAX_PROFUNDIDAD
+
+
+limites = Limites()
+
+
+class LimiteExcedido(ValueError):
+    """El código pasa uno de los límites de admisión"""
+
+    def __init__(self, limite: str, maximo: int):
+        # Los argumentos tal cual, para que se pueda mandar desde un proceso trabajador
+        super().__init__(limite, maximo)
+        self.limite = limite
+        self.maximo = maximo
+
+    def __str__(self) -> str:
+        descripcion = {
+            BYTES: f"ocupa más de {self.maximo} bytes",
+            TOKENS: f"tiene más de {self.maximo} tokens",
+            PROFUNDIDAD: f"anida más de {self.maximo} niveles",
+        }[self.limite]
+        return f"El código {descripcion}"
+
+
+def _excedido(limite: str, maximo: int) -> LimiteExcedido:
+    # Se cuenta aquí y no en LimiteExcedido, que se vuelve a construir al llegar desde un trabajador
+    metricas_lynx.limites_excedidos.sumar(limite)
+    return LimiteExcedido(limite, maximo)
+
+
+def fijar_limites(nuevos: Optional[Limites]):
+    global limites
+    if nuevos is not None:
+        limites = nuevos
+
+
+def verificar_bytes(codigo: str):
+    # Un carácter ocupa de 1 a 4 bytes: solo se codifica si hace falta
+    if len(codigo) > limites.bytes or (
+        4 * len(codigo) > limites.bytes and len(codigo.encode("utf-8")) > limites.bytes
+    ):
+        raise _excedido(BYTES, limites.bytes)
+
+
+def verificar_tokens(tokens: list):
+    """Cantidad de tokens y anidamiento de paréntesis, corchetes y llaves"""
+    if len(tokens) > limites.tokens:
+        raise _excedido(TOKENS, limites.tokens)
+    profundidad = 0
+    for token in tokens:
+        tipo = token.type
+        if tipo in _APERTURAS:
+            profundidad += 1
+            if profundidad > limites.profundidad:
+                raise _excedido(PROFUNDIDAD, limites.profundidad)
+        elif tipo in _CIERRES:
+            profundidad -= 1
+
+
+def tokenizar_admitido(codigo: str):
+    """lexer_lynx.tokenizar dentro de los límites; LimiteExcedido si no"""
+    verificar_bytes(codigo)
+    lexico, errores = tokenizar(codigo, max_tokens=limites.tokens)
+    verificar_tokens(lexico[1])
+    return lexico, errores
+
+
+def verificar_ast(ast):
+    """Profundidad del AST (nodos, listas y tuplas), nivel por nivel y sin recursión"""
+    nivel = [ast]
+    profundidad = 0
+    while nivel:
+        profundidad += 1
+        if profundidad > limites.profundidad:
+            raise _excedido(PROFUNDIDAD, limites.profundidad)
+        siguiente: list = []
+        agregar = siguiente.extend
+        for valor in nivel:
+            tipo = type(valor)
+            if tipo in _HOJAS:
+                continue
+            if tipo is list or tipo is tuple:
+                agregar(valor)
+            else:
+                agregar(valor.__dict__.values())
+        nivel = siguiente
+
+
+def segundos_reintento(espera: float) -> str:
+    """Valor de Retry-After: segundos enteros, al menos 1"""
+    return str(max(1, math.ceil(espera)))
+
+
+async def _rechazar(send, estado: int, detalle: str, encabezados=()):
+    cuerpo = a_json({"detail": detalle})
+    await send({
+        "type": "http.response.start",
+        "status": estado,
+        "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(cuerpo)).encode())]
+                   + list(encabezados),
+    })
+    await send({"type": "http.response.body", "body": cuerpo})
+
+
+def _reproducir(mensajes: list, receive):
+    """`receive` que primero devuelve los mensajes ya leídos"""
+    async def recibir():
+        return mensajes.pop(0) if mensajes else await receive()
+    return recibir
+
+
+class ControlAdmision:
+    """Middleware ASGI para los POST: tamaño del cuerpo y pedidos en curso por cliente
+
+    Sin Content-Length el cuerpo se lee acá, hasta el máximo, y se le pasa
+    entero a la aplicación. `espera()` son los segundos sugeridos en
+    Retry-After. `max_por_cliente=0` no limita los pedidos por cliente.
+    """
+
+    def __init__(
+        self,
+        app,
+        max_bytes_cuerpo: int,
+        max_por_cliente: int = 0,
+        max_bytes_ruta: Optional[Dict[str, int]] = None,
+        espera: Callable[[], float] = lambda: 1.0,
+    ):
+        self.app = app
+        self.max_bytes_cuerpo = max_bytes_cuerpo
+        self.max_por_cliente = max_por_cliente
+        self.max_bytes_ruta = max_bytes_ruta or {}
+        self.espera = espera
+        self.en_curso: Counter = Counter()
+        self.estadisticas = {"cuerpo_grande": 0, "por_cliente": 0}
+
+    def _rechazado(self, motivo: str):
+        self.estadisticas[motivo] += 1
+        metricas_lynx.rechazos_admision.sumar(motivo)
+
+    async def __call__(self, scope: Dict[str, Any], receive, send):
+        if scope["type"] != "http" or scope["method"] != "POST":
+            await self.app(scope, receive, send)
+            return
+
+        maximo = self.max_bytes_ruta.get(scope["path"], self.max_bytes_cuerpo)
+        largo = dict(scope["headers"]).get(b"content-length")
+        if largo is not None and largo.isdigit() and int(largo) > maximo:
+            self._rechazado("cuerpo_grande")
+            await _rechazar(send, 413, f"El cuerpo supera los {maximo} bytes")
+            return
+
+        cliente = scope["client"][0] if scope.get("client") else ""
+        if self.max_por_cliente and self.en_curso[cliente] >= self.max_por_cliente:
+            self._rechazado("por_cliente")
+            await _rechazar(
+                send, 429, f"Hay {self.en_curso[cliente]} pedidos de este cliente en curso",
+                [(b"retry-after", segundos_reintento(self.espera()).encode())],
+            )
+            return
+
+        if largo is None:
+            mensajes = []
+            leidos = 0
+            while True:
+                mensaje = await receive()
+                mensajes.append(mensaje)
+                leidos += len(mensaje.get("body", b""))
+                if leidos > maximo:
+                    self._rechazado("cuerpo_grande")
+                    await _rechazar(send, 413, f"El cuerpo supera los {maximo} bytes")
+                    return
+                if mensaje["type"] != "http.request" or not mensaje.get("more_body", False):
+                    break
+            receive = _reproducir(mensajes, receive)
+
+        self.en_curso[cliente] += 1
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.en_curso[cliente] -= 1
+            if not self.en_curso[cliente]:
+                del self.en_curso[cliente]
@@ -0,0 +1,148 @@
+"""Degradación ante abuso: límites de entrada y pedidos por cliente
+
+`--editores` clientes (cada uno con su IP) validan un programa chico sin
+pausa, como un editor, mientras un cliente abusivo mantiene
+`--abusivos` pedidos a la vez, rotando entre:
+- grande: un programa de ~1.4 MB (pasa el límite de bytes)
+- tokens: uno de ~680 KB y más de 200 mil tokens
+- profundo: una suma de 3000 términos (el AST anida 3000 niveles)
+
+Sin control no hay límites ni tope por cliente: los programas del abusivo
+ocupan los trabajadores durante segundos y llenan la cola, y los editores
+esperan o reciben 503. Con control (los valores por omisión de main.py) el
+abusivo recibe 413, 422 o 429 y los editores siguen cerca de su latencia sin
+carga. Los pedidos que siguen en curso al terminar se cuentan aparte.
+
+Procesos, como la API, y la aplicación en este mismo proceso con
+httpx.ASGITransport. Los clientes esperan 50 ms tras un rechazo.
+
+Uso: python benchmarks/bench_admision.py [--segundos S] [--editores N] [--abusivos N]
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+
+import admision_lynx
+import main
+from admision_lynx import ControlAdmision, Limites
+from servicio_lynx import PROCESOS, EjecutorAnalisis
+
+from programas_lynx import programa_declaraciones
+
+ESPERA_RECHAZO = 0.05
+SIN_LIMITE = 10 ** 12
+
+# Cuerpos ya escritos: codificar 1.4 MB por pedido le quitaría CPU al servidor
+ABUSIVOS = {
+    nombre: json.dumps({"codigo": codigo}).encode()
+    for nombre, codigo in (
+        ("grande", programa_declaraciones(6000)),
+        ("tokens", programa_declaraciones(3000)),
+        ("profundo", "val x = " + " + ".join(["1"] * 3000)),
+    )
+}
+
+
+def percentil(valores, p):
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, int(p / 100 * len(ordenados)))]
+
+
+def configurar(control: bool):
+    """Límites de código y del middleware de main.app para el escenario"""
+    admision_lynx.fijar_limites(Limites() if control else Limites(SIN_LIMITE, SIN_LIMITE, SIN_LIMITE))
+    for middleware in main.app.user_middleware:
+        if middleware.cls is ControlAdmision:
+            middleware.kwargs.update(
+                max_bytes_cuerpo=main.MAX_BYTES_CUERPO if control else SIN_LIMITE,
+                max_por_cliente=8 if control else 0,
+            )
+    main.app.middleware_stack = None
+
+
+async def editor(cliente, codigo: str, latencias: list, estados: dict):
+    while True:
+        inicio = time.perf_counter()
+        respuesta = await cliente.post(
+            "/analizar-unificado", json={"codigo": codigo, "nivel": "rapido", "secciones": ["errores"]}
+        )
+        estados[respuesta.status_code] = estados.get(respuesta.status_code, 0) + 1
+        if respuesta.status_code == 200:
+            latencias.append(time.perf_counter() - inicio)
+            await asyncio.sleep(0)
+        else:
+            await asyncio.sleep(ESPERA_RECHAZO)
+
+
+async def abusivo(cliente, indice: int, estados: dict):
+    nombres = list(ABUSIVOS)
+    while True:
+        nombre = nombres[indice % len(nombres)]
+        indice += 1
+        respuesta = await cliente.post(
+            "/analizar-unificado", content=ABUSIVOS[nombre], headers={"content-type": "application/json"}
+        )
+        clave = f"{nombre} {respuesta.status_code}"
+        estados[clave] = estados.get(clave, 0) + 1
+        await asyncio.sleep(ESPERA_RECHAZO)
+
+
+async def escenario(control: bool, argumentos):
+    configurar(control)
+    codigo = programa_declaraciones(argumentos.declaraciones)
+    main.ejecutor_analisis = EjecutorAnalisis(PROCESOS, trabajadores=2, max_cola=64).iniciar()
+    latencias, estados_editores, estados_abusivo = [], {}, {}
+    clientes = []
+    try:
+        for ip in [f"10.0.0.{i + 1}" for i in range(argumentos.editores)] + ["10.0.1.1"]:
+            transporte = httpx.ASGITransport(app=main.app, client=(ip, 4321))
+            clientes.append(httpx.AsyncClient(transport=transporte, base_url="http://lynx", timeout=None))
+        tareas = [asyncio.create_task(editor(cliente, codigo, latencias, estados_editores))
+                  for cliente in clientes[:-1]]
+        tareas += [asyncio.create_task(abusivo(clientes[-1], indice, estados_abusivo))
+                   for indice in range(argumentos.abusivos)]
+        await asyncio.sleep(argumentos.segundos)
+        en_curso = main.ejecutor_analisis.pendientes
+        for tarea in tareas:
+            tarea.cancel()
+        await asyncio.gather(*tareas, return_exceptions=True)
+    finally:
+        for cliente in clientes:
+            await cliente.aclose()
+        main.ejecutor_analisis.cerrar()
+    return latencias, estados_editores, estados_abusivo, en_curso
+
+
+async def main_async(argumentos):
+    print(f"{argumentos.editores} editores, {argumentos.abusivos} pedidos abusivos a la vez, "
+          f"{argumentos.segundos:g} s por escenario")
+    print(f"{'Escenario':<14} {'OK':>5} {'p50':>8} {'p99':>9} {'En curso':>9}  Editores / abusivo")
+    for nombre, control, abusivos in (
+        ("sin abuso", True, 0), ("sin control", False, argumentos.abusivos), ("con control", True, argumentos.abusivos)
+    ):
+        argumentos_escenario = argparse.Namespace(**dict(vars(argumentos), abusivos=abusivos))
+        latencias, editores, abusivo, en_curso = await escenario(control, argumentos_escenario)
+        p50 = f"{percentil(latencias, 50) * 1000:>6.0f}ms" if latencias else f"{'-':>8}"
+        p99 = f"{percentil(latencias, 99) * 1000:>7.0f}ms" if latencias else f"{'-':>9}"
+        print(f"{nombre:<14} {len(latencias):>5} {p50} {p99} {en_curso:>9}  {editores} / {abusivo}")
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--segundos", type=float, default=10.0)
+    parser.add_argument("--editores", type=int, default=4)
+    parser.add_argument("--abusivos", type=int, default=24)
+    parser.add_argument("--declaraciones", type=int, default=50)
+    argumentos = parser.parse_args()
+    asyncio.run(main_async(argumentos))
+
+
+if __name__ == "__main__":
+    main_cli()
@@ -0,0 +1,113 @@
+"""Tamaño y latencia del AST compacto (versión 2) frente al de siempre
+
+Para cada programa compara los bytes del AST en JSON (y comprimido con gzip),
+el tiempo de escribirlo en el servidor y el de leerlo en el cliente: en
+Python con json.loads (más ast_desde_compacto para la versión 2) y, si hay
+node, con JSON.parse y el decodificador del editor (astCompacto.js). Ambos
+decodificadores se comprueban contra la versión 1.
+
+Uso: python benchmarks/bench_ast_compacto.py
+"""
+import gzip
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from parser_lynx import analizar_sintactico
+from serializacion_lynx import a_json, ast_compacto, ast_compacto_json, ast_desde_compacto, ast_json
+
+from programas_lynx import programa_declaraciones
+
+REPETICIONES = 5
+DECODIFICADOR_JS = os.path.join(RAIZ, "front-lynx", "src", "components", "astCompacto.js")
+
+# Lee los dos JSON, comprueba que decodificarAst reproduce la versión 1 e
+# imprime el mejor tiempo de cada lectura en ms
+SCRIPT_NODE = """
+import { readFileSync } from 'node:fs';
+import { pathToFileURL } from 'node:url';
+const [decodificador, rutaV1, rutaV2, repeticiones] = process.argv.slice(1);
+const { decodificarAst } = await import(pathToFileURL(decodificador).href);
+const v1 = readFileSync(rutaV1, 'utf8');
+const v2 = readFileSync(rutaV2, 'utf8');
+if (JSON.stringify(decodificarAst(JSON.parse(v2).ast)) !== JSON.stringify(JSON.parse(v1).ast)) {
+  throw new Error('decodificarAst no reproduce la versión 1');
+}
+const medir = (funcion) => {
+  let mejor = Infinity;
+  for (let i = 0; i < Number(repeticiones); i++) {
+    const inicio = performance.now();
+    funcion();
+    mejor = Math.min(mejor, performance.now() - inicio);
+  }
+  return mejor;
+};
+console.log(JSON.stringify([medir(() => JSON.parse(v1)), medir(() => decodificarAst(JSON.parse(v2).ast))]));
+"""
+
+
+def medir(funcion, repeticiones=REPETICIONES):
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+
+def lectura_en_node(v1: bytes, v2: bytes):
+    """(ms de JSON.parse de v1, ms de JSON.parse + decodificarAst de v2), o None sin node"""
+    node = shutil.which("node")
+    if node is None:
+        return None
+    with tempfile.TemporaryDirectory() as directorio:
+        rutas = []
+        for nombre, contenido in (("v1.json", v1), ("v2.json", v2)):
+            rutas.append(os.path.join(directorio, nombre))
+            with open(rutas[-1], "wb") as archivo:
+                archivo.write(contenido)
+        salida = subprocess.run(
+            [node, "--input-type=module", "-e", SCRIPT_NODE, DECODIFICADOR_JS, *rutas, str(REPETICIONES)],
+            check=True, capture_output=True, text=True,
+        ).stdout
+    return json.loads(salida)
+
+
+def main():
+    print(
+        f"{'Líneas':>8} {'v1':>10} {'v2':>10} {'Razón':>6} {'gzip v1':>9} {'gzip v2':>9} "
+        f"{'Escribir v1':>12} {'v2':>8} {'Leer py v1':>11} {'v2':>8} {'Leer js v1':>11} {'v2':>8}"
+    )
+    for n in (20, 200, 1000, 2500, 12500):
+        codigo = programa_declaraciones(n)
+        ast, errores = analizar_sintactico(codigo)
+        assert not errores, errores
+
+        v1 = a_json({"ast": ast_json(ast)})
+        v2 = a_json({"ast": ast_compacto_json(ast)})
+        assert json.loads(v2) == json.loads(a_json({"ast": ast_compacto(ast)}))
+        assert ast_desde_compacto(json.loads(v2)["ast"]) == json.loads(v1)["ast"]
+
+        t_escribir_v1 = medir(lambda: a_json({"ast": ast_json(ast)}))
+        t_escribir_v2 = medir(lambda: a_json({"ast": ast_compacto_json(ast)}))
+        t_leer_v1 = medir(lambda: json.loads(v1))
+        t_leer_v2 = medir(lambda: ast_desde_compacto(json.loads(v2)["ast"]))
+        js = lectura_en_node(v1, v2)
+        columnas_js = f"{js[0]:>9.2f}ms {js[1]:>6.2f}ms" if js else f"{'-':>11} {'-':>8}"
+        print(
+            f"{codigo.count(chr(10)) + 1:>8} {len(v1):>10} {len(v2):>10} {len(v1) / len(v2):>5.1f}x "
+            f"{len(gzip.compress(v1)):>9} {len(gzip.compress(v2)):>9} "
+            f"{t_escribir_v1 * 1000:>10.2f}ms {t_escribir_v2 * 1000:>6.2f}ms "
+            f"{t_leer_v1 * 1000:>9.2f}ms {t_leer_v2 * 1000:>6.2f}ms {columnas_js}"
+        )
+
+
+if __name__ == "__main__":
+    main()
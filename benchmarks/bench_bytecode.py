@@ -0,0 +1,62 @@
+"""VM de bytecode frente a la evaluación directa del AST y al intérprete de clausuras
+
+Uso: python benchmarks/bench_bytecode.py [--desensamblar]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bytecode_lynx import compilar_bytecode, desensamblar
+from interprete_lynx import analizar_programa, compilar
+from vm_lynx import MaquinaVirtual
+
+from evaluador_ast import EvaluadorAST
+from programas_lynx import programa_fibonacci, programa_mientras, programa_para_anidado
+
+REPETICIONES = 3
+
+CASOS = [
+    ("para anidado 200x200", programa_para_anidado(200)),
+    ("mientras 100000", programa_mientras(100000)),
+    ("fibonacci(18)", programa_fibonacci(18)),
+]
+
+
+def medir(funcion, repeticiones=REPETICIONES):
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+
+def main():
+    if "--desensamblar" in sys.argv:
+        for nombre, codigo in CASOS:
+            programa = compilar_bytecode(analizar_programa(codigo), codigo)
+            print(f"# {nombre}\n{desensamblar(programa)}\n")
+        return
+
+    print(f"{'Programa':<22} {'Instr.':>7} {'AST':>10} {'Clausuras':>10} {'Bytecode':>10} {'AST/VM':>7}")
+    for nombre, codigo in CASOS:
+        ast = analizar_programa(codigo)
+        clausuras = compilar(ast, codigo)
+        bytecode = compilar_bytecode(ast, codigo)
+
+        salidas = {"ast": [], "clausuras": [], "bytecode": []}
+        t_ast = medir(lambda: EvaluadorAST(salidas["ast"].append).ejecutar(ast))
+        t_clausuras = medir(lambda: clausuras.ejecutar(salidas["clausuras"].append))
+        t_bytecode = medir(lambda: MaquinaVirtual(salidas["bytecode"].append).ejecutar(bytecode))
+        assert salidas["ast"] == salidas["clausuras"] == salidas["bytecode"], salidas
+
+        print(
+            f"{nombre:<22} {len(bytecode.codigo) // 2:>7} {t_ast * 1000:>8.1f}ms "
+            f"{t_clausuras * 1000:>8.1f}ms {t_bytecode * 1000:>8.1f}ms {t_ast / t_bytecode:>6.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
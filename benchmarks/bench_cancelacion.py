@@ -0,0 +1,85 @@
+"""Reemplazo por sesión y cálculo compartido en el EjecutorAnalisis
+
+- escribir: un editor manda una validación cada `--intervalo` segundos con el
+  código un poco más largo, y cada una tarda más que el intervalo. Sin sesión
+  todas se calculan y la cola crece; con sesión cada una reemplaza a la
+  anterior, que se abandona en el próximo límite de fase. Se mide cuánto tarda
+  en llegar la respuesta de la última versión y cuántos análisis terminaron.
+- pestañas: `--pestanas` pedidos iguales a la vez, sin y con `clave`.
+
+Usa procesos, como la API.
+
+Uso: python benchmarks/bench_cancelacion.py [--intervalo S] [--teclas N] [--pestanas N] [--declaraciones N]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from servicio_lynx import PROCESOS, AnalisisCancelado, EjecutorAnalisis, analisis_unificado, como_json
+
+from programas_lynx import programa_declaraciones
+
+
+async def escribir(ejecutor, codigo, teclas, intervalo, sesion):
+    """Segundos desde la última tecla hasta su resultado"""
+    pedidos = []
+    for tecla in range(teclas):
+        codigo += f"val tecla{tecla} = {tecla}\n"
+        pedidos.append(asyncio.ensure_future(
+            ejecutor.ejecutar(como_json, analisis_unificado, codigo, ["errores"], "rapido", sesion=sesion)
+        ))
+        await asyncio.sleep(intervalo)
+    ultima = time.perf_counter() - intervalo
+    resultados = await asyncio.gather(*pedidos, return_exceptions=True)
+    assert isinstance(resultados[-1], bytes), resultados[-1]
+    assert all(isinstance(r, (bytes, AnalisisCancelado)) for r in resultados)
+    return time.perf_counter() - ultima
+
+
+async def pestanas(ejecutor, codigo, cantidad, compartir):
+    inicio = time.perf_counter()
+    clave = ("pestanas", codigo) if compartir else None
+    resultados = await asyncio.gather(*[
+        ejecutor.ejecutar(como_json, analisis_unificado, codigo, ["tokens", "ast", "errores"], clave=clave)
+        for _ in range(cantidad)
+    ])
+    assert len(set(resultados)) == 1
+    return time.perf_counter() - inicio
+
+
+async def escenario(argumentos, sesion, compartir):
+    codigo = programa_declaraciones(argumentos.declaraciones)
+    with EjecutorAnalisis(PROCESOS, trabajadores=2, max_cola=argumentos.teclas + argumentos.pestanas) as ejecutor:
+        t_ultima = await escribir(ejecutor, codigo, argumentos.teclas, argumentos.intervalo, sesion)
+        while ejecutor.pendientes:
+            await asyncio.sleep(0.01)
+        escritura = dict(ejecutor.estadisticas)
+        t_pestanas = await pestanas(ejecutor, codigo, argumentos.pestanas, compartir)
+        calculados = ejecutor.estadisticas["ejecutados"] - escritura["ejecutados"]
+    return t_ultima, escritura, t_pestanas, calculados
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--intervalo", type=float, default=0.05)
+    parser.add_argument("--teclas", type=int, default=40)
+    parser.add_argument("--pestanas", type=int, default=8)
+    parser.add_argument("--declaraciones", type=int, default=400)
+    argumentos = parser.parse_args()
+
+    print(f"{'':>12} {'Última tecla':>13} {'Calculados':>11} {'Cancelados':>11} {'Pestañas':>10} {'Calculados':>11}")
+    for nombre, sesion, compartir in (("sin nada", None, False), ("con sesión", "editor", True)):
+        t_ultima, escritura, t_pestanas, calculados = asyncio.run(escenario(argumentos, sesion, compartir))
+        terminados = escritura["ejecutados"] - escritura["cancelados"]
+        print(
+            f"{nombre:>12} {t_ultima * 1000:>11.0f}ms {terminados:>11} {escritura['cancelados']:>11} "
+            f"{t_pestanas * 1000:>8.0f}ms {calculados:>11}"
+        )
+
+
+if __name__ == "__main__":
+    main_cli()
@@ -0,0 +1,113 @@
+"""Latencia de /health mientras la API analiza programas grandes
+
+Varios clientes envían sin pausa programas grandes a /analizar mientras un
+sondeo pide /health cada 10 ms. Con el ejecutor en modo `directo` (el análisis
+en el bucle de eventos, como antes del ejecutor) cada /health espera a que
+termine un análisis completo. Con procesos su latencia debería quedar casi
+igual que sin carga; con hilos el análisis compite con el bucle por el GIL.
+
+El último escenario usa una cola de 1 con más clientes que trabajadores:
+las peticiones que no caben reciben 503 con Retry-After en vez de esperar.
+
+La aplicación corre en este mismo proceso con httpx.ASGITransport.
+
+Uso: python benchmarks/bench_carga_api.py [--segundos S] [--clientes N] [--declaraciones N]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+
+import main
+from servicio_lynx import DIRECTO, HILOS, PROCESOS, EjecutorAnalisis
+
+from programas_lynx import programa_declaraciones
+
+INTERVALO_SONDEO = 0.01
+
+
+def percentil(valores, p):
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, int(p / 100 * len(ordenados)))]
+
+
+async def sondear_health(cliente, detener: asyncio.Event, latencias: list):
+    while not detener.is_set():
+        # Se mide desde que el sondeo debía salir: incluye la espera por un bucle bloqueado
+        programado = time.perf_counter() + INTERVALO_SONDEO
+        await asyncio.sleep(INTERVALO_SONDEO)
+        respuesta = await cliente.get("/health")
+        assert respuesta.status_code == 200
+        latencias.append(time.perf_counter() - programado)
+
+
+async def analizar_sin_pausa(cliente, codigo: str, detener: asyncio.Event, estados: dict):
+    while not detener.is_set():
+        respuesta = await cliente.post("/analizar", json={"codigo": codigo})
+        estados[respuesta.status_code] = estados.get(respuesta.status_code, 0) + 1
+        if respuesta.status_code == 503:
+            # El cliente respeta Retry-After, acortado para el benchmark
+            assert respuesta.headers["Retry-After"]
+            await asyncio.sleep(0.05)
+        else:
+            # Con ASGITransport una petición puede no ceder nunca el bucle
+            await asyncio.sleep(0)
+
+
+async def escenario(modo, trabajadores, max_cola, clientes, codigo, segundos):
+    main.ejecutor_analisis = EjecutorAnalisis(modo, trabajadores, max_cola).iniciar()
+    try:
+        transporte = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transporte, base_url="http://lynx", timeout=None) as cliente:
+            detener = asyncio.Event()
+            latencias, estados = [], {}
+            tareas = [asyncio.create_task(sondear_health(cliente, detener, latencias))]
+            tareas += [
+                asyncio.create_task(analizar_sin_pausa(cliente, codigo, detener, estados))
+                for _ in range(clientes)
+            ]
+            await asyncio.sleep(segundos)
+            detener.set()
+            await asyncio.gather(*tareas)
+        return latencias, estados, dict(main.ejecutor_analisis.estadisticas)
+    finally:
+        main.ejecutor_analisis.cerrar()
+
+
+async def main_async(argumentos):
+    codigo = programa_declaraciones(argumentos.declaraciones)
+    print(f"Programa de {len(codigo)} bytes, {argumentos.clientes} clientes, {argumentos.segundos:g} s por escenario")
+    print(f"{'Escenario':<26} {'p50':>8} {'p99':>8} {'máx':>8} {'Sondeos':>8}  Respuestas de /analizar")
+    escenarios = [
+        ("sin carga", HILOS, 2, 64, 0),
+        ("directo", DIRECTO, 1, 64, argumentos.clientes),
+        ("hilos", HILOS, 2, 64, argumentos.clientes),
+        ("procesos", PROCESOS, 2, 64, argumentos.clientes),
+        ("procesos, cola de 1", PROCESOS, 1, 1, argumentos.clientes * 2),
+    ]
+    for nombre, modo, trabajadores, max_cola, clientes in escenarios:
+        latencias, estados, estadisticas = await escenario(
+            modo, trabajadores, max_cola, clientes, codigo, argumentos.segundos
+        )
+        print(
+            f"{nombre:<26} {percentil(latencias, 50) * 1000:>6.1f}ms {percentil(latencias, 99) * 1000:>6.1f}ms "
+            f"{max(latencias) * 1000:>6.1f}ms {len(latencias):>8}  {estados} {estadisticas}"
+        )
+
+
+def main_cli():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--segundos", type=float, default=5.0)
+    parser.add_argument("--clientes", type=int, default=2)
+    parser.add_argument("--declaraciones", type=int, default=300)
+    argumentos = parser.parse_args()
+    asyncio.run(main_async(argumentos))
+
+
+if __name__ == "__main__":
+    main_cli()
@@ -0,0 +1,71 @@
+"""Hash-consing de subexpresiones y memoización de tipos en el análisis semántico
+
+Solo se comparten las expresiones sin nombres repetidas en una misma línea:
+en programa_repetitivo casi nada, así que mide sobre todo el costo de la tabla.
+
+Uso: python benchmarks/bench_compartir.py
+"""
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from parser_lynx import ASTNode, analizar_sintactico
+from semantic_lynx import AnalizadorSemantico
+
+from programas_lynx import programa_repetitivo
+
+REPETICIONES = 5
+
+
+def contar_nodos(ast):
+    """(nodos alcanzables contando repeticiones, nodos distintos)"""
+    total, distintos = 0, set()
+    pendientes = [ast]
+    while pendientes:
+        nodo = pendientes.pop()
+        if isinstance(nodo, (list, tuple)):
+            pendientes.extend(nodo)
+        elif isinstance(nodo, ASTNode):
+            total += 1
+            distintos.add(id(nodo))
+            pendientes.extend(nodo.__dict__.values())
+    return total, len(distintos)
+
+
+def memoria_ast(codigo, compartir):
+    tracemalloc.start()
+    ast, _ = analizar_sintactico(codigo, compartir_subexpresiones=compartir)
+    actual, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return ast, actual
+
+
+def medir(funcion):
+    mejor = float("inf")
+    for _ in range(REPETICIONES):
+        inicio = time.perf_counter()
+        funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+
+def main():
+    print(f"{'Líneas':>7} {'Nodos':>8} {'Distintos':>10} {'Mem normal':>11} {'Mem compart.':>13} "
+          f"{'Sem normal':>11} {'Sem compart.':>13}")
+    for n in (100, 1000, 5000):
+        codigo = programa_repetitivo(n)
+        ast_normal, mem_normal = memoria_ast(codigo, False)
+        ast_compartido, mem_compartido = memoria_ast(codigo, True)
+        total, distintos = contar_nodos(ast_compartido)
+
+        t_normal = medir(lambda: AnalizadorSemantico(memoizar=False).analizar(ast_normal, codigo))
+        t_compartido = medir(lambda: AnalizadorSemantico().analizar(ast_compartido, codigo))
+        print(f"{n:>7} {total:>8} {distintos:>10} {mem_normal / 1024:>9.0f}KB {mem_compartido / 1024:>11.0f}KB "
+              f"{t_normal * 1000:>9.2f}ms {t_compartido * 1000:>11.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Concatenación de cadenas en un bucle: cuerdas contra copias
+
+Arma con `s = s + "..."` en un `mientras` cadenas de 100 KB, 1 MB y 10 MB y
+las imprime. La referencia es el runtime copiando en cada `+` (MIN_CUERDA
+infinito), que es cuadrático; con --max-base se limita el tamaño hasta el
+que se mide, porque a 10 MB tarda decenas de segundos.
+
+Uso: python benchmarks/bench_cuerdas.py [--trozo N] [--max-base BYTES]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import runtime_lynx
+from bytecode_lynx import compilar_codigo_bytecode
+from vm_lynx import MaquinaVirtual
+
+from programas_lynx import programa_concatenacion
+
+REPETICIONES = 3
+TAMANOS = [100_000, 1_000_000, 10_000_000]
+MIN_CUERDA = runtime_lynx.MIN_CUERDA
+
+
+def medir(funcion, repeticiones=REPETICIONES):
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+
+def ejecutar(programa, min_cuerda):
+    runtime_lynx.MIN_CUERDA = min_cuerda
+    salida = []
+    try:
+        MaquinaVirtual(salida.append).ejecutar(programa)
+    finally:
+        runtime_lynx.MIN_CUERDA = MIN_CUERDA
+    return salida
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--trozo", type=int, default=100, help="caracteres agregados por vuelta")
+    parser.add_argument("--max-base", type=int, default=10_000_000,
+                        help="tamaño máximo al que se mide la referencia con copias")
+    argumentos = parser.parse_args()
+
+    print(f"Trozo: {argumentos.trozo} caracteres por vuelta")
+    print(f"{'Tamaño':>12} {'Vueltas':>9} {'Copias':>11} {'Cuerdas':>10} {'Aceleración':>12}")
+    for tamano in TAMANOS:
+        programa = compilar_codigo_bytecode(programa_concatenacion(tamano, argumentos.trozo))
+
+        salidas = {}
+        t_cuerdas = medir(lambda: salidas.__setitem__("cuerdas", ejecutar(programa, MIN_CUERDA)))
+        assert len(salidas["cuerdas"][-1]) == tamano // argumentos.trozo * argumentos.trozo
+        if tamano <= argumentos.max_base:
+            # La referencia es cuadrática: una sola medición en los tamaños grandes
+            repeticiones = REPETICIONES if tamano <= 1_000_000 else 1
+            t_base = medir(lambda: salidas.__setitem__("base", ejecutar(programa, float("inf"))), repeticiones)
+            assert salidas["base"] == salidas["cuerdas"]
+            base = f"{t_base * 1000:>9.1f}ms"
+            factor = f"{t_base / t_cuerdas:>11.1f}x"
+        else:
+            base, factor = f"{'-':>11}", f"{'-':>12}"
+        print(f"{tamano:>12,} {tamano // argumentos.trozo:>9,} {base} {t_cuerdas * 1000:>8.1f}ms {factor}")
+
+
+if __name__ == "__main__":
+    main()
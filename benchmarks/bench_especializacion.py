@@ -0,0 +1,85 @@
+"""Especialización de bucles calientes en la VM
+
+Compara la VM sin especializar (especializar=False) y con especialización
+sobre bucles `mientras` y `para` de enteros y un bucle de flotantes, con y sin
+presupuesto de instrucciones. Las salidas y las instrucciones consumidas deben
+ser iguales; al final se muestran las estadísticas de la última ejecución.
+
+Uso: python benchmarks/bench_especializacion.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bytecode_lynx import compilar_codigo_bytecode
+from vm_lynx import MaquinaVirtual
+
+from programas_lynx import programa_mientras, programa_para_anidado
+
+REPETICIONES = 5
+PRESUPUESTO = 10 ** 9
+
+
+def programa_flotante(n: int) -> str:
+    """Bucle `mientras` que acumula flotantes con división y módulo enteros"""
+    return "\n".join([
+        "val x = 0.5",
+        "val i = 0",
+        f"mientras (i < {n}) {{",
+        "    x = x * 0.999 + i / 7 - i % 5",
+        "    i = i + 1",
+        "}",
+        "imprimir(x)",
+    ])
+
+
+CASOS = [
+    ("mientras 100000", programa_mientras(100000)),
+    ("para anidado 300x300", programa_para_anidado(300)),
+    ("flotante 100000", programa_flotante(100000)),
+]
+
+
+def medir(funcion, repeticiones=REPETICIONES):
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+
+def main():
+    print(f"{'Programa':<22} {'Presupuesto':<12} {'Genérica':>10} {'Especial.':>10} {'Aceleración':>12}")
+    for nombre, codigo in CASOS:
+        for presupuesto in (None, PRESUPUESTO):
+            programa = compilar_codigo_bytecode(codigo)
+            salidas = {False: [], True: []}
+            maquinas = {False: [], True: []}
+
+            def correr(especializar):
+                maquina = MaquinaVirtual(
+                    salidas[especializar].append, presupuesto=presupuesto, especializar=especializar
+                )
+                maquina.ejecutar(programa)
+                maquinas[especializar].append(maquina)
+
+            t_generica = medir(lambda: correr(False))
+            t_especial = medir(lambda: correr(True))
+            assert salidas[False] == salidas[True], salidas
+            assert maquinas[False][-1].consumidas == maquinas[True][-1].consumidas
+            limite = "no" if presupuesto is None else f"{presupuesto:.0e}"
+            print(
+                f"{nombre:<22} {limite:<12} {t_generica * 1000:>8.1f}ms {t_especial * 1000:>8.1f}ms "
+                f"{t_generica / t_especial:>11.1f}x"
+            )
+        # La primera ejecución especializa; las siguientes reusan el bucle del código
+        primera = maquinas[True][0].estadisticas
+        print(f"{'':<22} especializados={primera['especializados']} rechazados={primera['rechazados']} "
+              f"entradas={primera['entradas']} desoptimizaciones={primera['desoptimizaciones']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Ejecución de programas con bucles en el intérprete de clausuras
+
+Compara el tiempo de compilación (análisis semántico incluido) y de ejecución
+con el de un programa equivalente escrito en Python.
+
+Uso: python benchmarks/bench_interprete.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from interprete_lynx import compilar_codigo
+
+from programas_lynx import programa_fibonacci, programa_mientras, programa_para_anidado
+
+REPETICIONES = 3
+
+
+def medir(funcion, repeticiones=REPETICIONES):
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+
+def python_para_anidado(n):
+    suma = 0
+    for i in range(n):
+        for j in range(n):
+            suma = suma + i * j % 7
+    return suma
+
+
+def python_mientras(n):
+    i = pares = 0
+    while i < n and pares >= 0:
+        if i % 2 == 0:
+            pares = pares + 1
+        i = i + 1
+    return pares
+
+
+def python_fibonacci(n):
+    return n if n <= 1 else python_fibonacci(n - 1) + python_fibonacci(n - 2)
+
+
+CASOS = [
+    ("para anidado 300x300", programa_para_anidado(300), lambda: python_para_anidado(300)),
+    ("mientras 200000", programa_mientras(200000), lambda: python_mientras(200000)),
+    ("fibonacci(20)", programa_fibonacci(20), lambda: python_fibonacci(20)),
+]
+
+
+def main():
+    print(f"{'Programa':<22} {'Compilar':>10} {'Ejecutar':>10} {'Python':>10} {'Razón':>7}")
+    for nombre, codigo, referencia in CASOS:
+        inicio = time.perf_counter()
+        programa = compilar_codigo(codigo)
+        t_compilar = time.perf_counter() - inicio
+
+        salida = []
+        t_ejecutar = medir(lambda: programa.ejecutar(salida.append))
+        t_python = medir(referencia)
+        print(
+            f"{nombre:<22} {t_compilar * 1000:>8.2f}ms {t_ejecutar * 1000:>8.1f}ms "
+            f"{t_python * 1000:>8.1f}ms {t_ejecutar / t_python:>6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""/analizar-lote contra una petición a /analizar-semantico por programa
+
+Analiza el mismo conjunto de programas de tres formas: una petición por
+programa en secuencia (como el pipeline de corrección actual), una petición
+por programa con tantas en vuelo como trabajadores, y un solo lote en NDJSON.
+Del lote se mide también cuándo llega el primer resultado; eso se mide sobre
+analizar_lote directamente, porque httpx.ASGITransport entrega la respuesta
+completa de una vez.
+
+El ejecutor usa hilos.
+
+Uso: python benchmarks/bench_lote.py [--programas N] [--trabajadores N]
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+
+import main
+from lote_lynx import ProgramaLote, analizar_lote
+from servicio_lynx import HILOS, EjecutorAnalisis
+
+from programas_lynx import programa_declaraciones, programa_fibonacci, programa_mientras, programa_para_anidado
+
+REPETICIONES = 3
+
+
+def programas_de_prueba(n: int):
+    generadores = [
+        lambda i: programa_declaraciones(5 + i % 10),
+        lambda i: programa_fibonacci(10 + i % 5),
+        lambda i: programa_mientras(100 + i),
+        lambda i: programa_para_anidado(10 + i % 7),
+    ]
+    return [generadores[i % len(generadores)](i) for i in range(n)]
+
+
+def medir(funcion, repeticiones=REPETICIONES):
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        resultado = asyncio.get_event_loop().run_until_complete(funcion())
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor, resultado
+
+
+async def uno_por_uno(cliente, programas):
+    for codigo in programas:
+        respuesta = await cliente.post("/analizar-semantico", json={"codigo": codigo})
+        assert respuesta.status_code == 200
+
+
+async def uno_por_uno_concurrente(cliente, programas, concurrencia):
+    semaforo = asyncio.Semaphore(concurrencia)
+
+    async def una(codigo):
+        async with semaforo:
+            respuesta = await cliente.post("/analizar-semantico", json={"codigo": codigo})
+            assert respuesta.status_code == 200
+
+    await asyncio.gather(*(una(codigo) for codigo in programas))
+
+
+async def en_lote(cliente, programas):
+    cuerpo = {"programas": [{"codigo": codigo} for codigo in programas]}
+    respuesta = await cliente.post("/analizar-lote", json=cuerpo)
+    lineas = respuesta.content.splitlines()
+    assert len(lineas) == len(programas) + 1 and json.loads(lineas[-1])["resumen"]["programas"] == len(programas)
+
+
+async def primer_resultado(ejecutor, programas, concurrencia):
+    inicio = time.perf_counter()
+    lote = analizar_lote(ejecutor, [ProgramaLote(f"p{i}", codigo) for i, codigo in enumerate(programas)],
+                         concurrencia=concurrencia)
+    await lote.__anext__()
+    primero = time.perf_counter() - inicio
+    await lote.aclose()
+    return primero
+
+
+def main_cli():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--programas", type=int, default=200)
+    parser.add_argument("--trabajadores", type=int, default=os.cpu_count() or 2)
+    argumentos = parser.parse_args()
+    programas = programas_de_prueba(argumentos.programas)
+
+    asyncio.set_event_loop(asyncio.new_event_loop())
+    main.ejecutor_analisis = EjecutorAnalisis(HILOS, argumentos.trabajadores, max_cola=64).iniciar()
+    transporte = httpx.ASGITransport(app=main.app)
+    cliente = httpx.AsyncClient(transport=transporte, base_url="http://lynx", timeout=None)
+    try:
+        t_secuencial, _ = medir(lambda: uno_por_uno(cliente, programas))
+        t_concurrente, _ = medir(lambda: uno_por_uno_concurrente(cliente, programas, argumentos.trabajadores))
+        t_lote, _ = medir(lambda: en_lote(cliente, programas))
+        primero = min(
+            asyncio.get_event_loop().run_until_complete(
+                primer_resultado(main.ejecutor_analisis, programas, argumentos.trabajadores)
+            )
+            for _ in range(REPETICIONES)
+        )
+    finally:
+        asyncio.get_event_loop().run_until_complete(cliente.aclose())
+        main.ejecutor_analisis.cerrar()
+
+    n = len(programas)
+    print(f"{n} programas, {argumentos.trabajadores} trabajadores")
+    print(f"{'Forma':<28} {'Total':>10} {'Prog/s':>8}")
+    print(f"{'una petición, en secuencia':<28} {t_secuencial * 1000:>8.0f}ms {n / t_secuencial:>8.0f}")
+    print(f"{'una petición, concurrentes':<28} {t_concurrente * 1000:>8.0f}ms {n / t_concurrente:>8.0f}")
+    print(f"{'/analizar-lote':<28} {t_lote * 1000:>8.0f}ms {n / t_lote:>8.0f}  primer resultado a {primero * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main_cli()
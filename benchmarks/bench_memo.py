@@ -0,0 +1,76 @@
+"""Memoización de funciones puras en la VM
+
+Compara la VM con el memo desactivado (memo=0) y activado sobre Fibonacci
+recursivo, que el análisis de pureza marca como pura. El caso "impura" lee
+una variable global, así que no se memoiza: mide lo que cuesta el memo a las
+llamadas que no lo usan.
+
+Uso: python benchmarks/bench_memo.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bytecode_lynx import compilar_codigo_bytecode
+from vm_lynx import MaquinaVirtual
+
+from programas_lynx import programa_fibonacci
+
+REPETICIONES = 5
+
+
+def programa_fibonacci_impura(n: int) -> str:
+    return programa_fibonacci(n).replace("val r = n", "val r = n + cero").replace(
+        "fun fib", "val cero = 0\nfun fib", 1
+    )
+
+
+CASOS = [
+    ("fibonacci(15)", programa_fibonacci(15)),
+    ("fibonacci(20)", programa_fibonacci(20)),
+    ("fibonacci(25)", programa_fibonacci(25)),
+    ("fibonacci(20) impura", programa_fibonacci_impura(20)),
+]
+
+
+def medir(funcion, repeticiones=REPETICIONES):
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+
+def main():
+    print(f"{'Programa':<22} {'Sin memo':>10} {'Con memo':>10} {'Aceleración':>12}  Aciertos/fallos")
+    for nombre, codigo in CASOS:
+        programa = compilar_codigo_bytecode(codigo)
+
+        salidas = {"sin": [], "con": []}
+        t_sin = medir(lambda: MaquinaVirtual(salidas["sin"].append, memo=0).ejecutar(programa))
+        maquinas = []
+
+        def con_memo():
+            maquinas.append(MaquinaVirtual(salidas["con"].append))
+            maquinas[-1].ejecutar(programa)
+
+        t_con = medir(con_memo)
+        assert salidas["sin"] == salidas["con"], salidas
+        estadisticas = maquinas[-1].memo.estadisticas
+        print(
+            f"{nombre:<22} {t_sin * 1000:>8.2f}ms {t_con * 1000:>8.2f}ms {t_sin / t_con:>11.1f}x  "
+            f"{estadisticas['aciertos']}/{estadisticas['fallos']}"
+        )
+
+    # Sin memo sería exponencial: solo se mide con memo
+    programa = compilar_codigo_bytecode(programa_fibonacci(90))
+    salida = []
+    t_con = medir(lambda: MaquinaVirtual(salida.append).ejecutar(programa))
+    print(f"{'fibonacci(90)':<22} {'-':>10} {t_con * 1000:>8.2f}ms {'':>12}  resultado {salida[-1]}")
+
+
+if __name__ == "__main__":
+    main()
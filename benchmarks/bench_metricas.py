@@ -0,0 +1,104 @@
+"""Costo de las métricas de /metrics
+
+- por observación: Histograma.observar y Contador.sumar, en el hilo que ya
+  tiene su fila
+- por análisis: analisis_unificado escrito como JSON (nivel rápido y
+  completo) con las métricas y con observar y sumar reemplazados por
+  funciones que no hacen nada, alternados. La diferencia medida queda dentro
+  del ruido, así que también se estima: observaciones por análisis por el
+  costo de una
+- exponer: armar el texto de /metrics
+
+Uso: python benchmarks/bench_metricas.py [--repeticiones N]
+"""
+import argparse
+import contextlib
+import os
+import sys
+import time
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import metricas_lynx
+from servicio_lynx import analisis_unificado, como_json
+
+from programas_lynx import programa_declaraciones
+
+
+def por_llamada(sentencia, numero=200_000):
+    return min(timeit.repeat(sentencia, number=numero, repeat=5, globals={"m": metricas_lynx})) / numero
+
+
+@contextlib.contextmanager
+def sin_metricas():
+    originales = metricas_lynx.Histograma.observar, metricas_lynx.Contador.sumar
+    metricas_lynx.Histograma.observar = lambda self, valor, *serie: None
+    metricas_lynx.Contador.sumar = lambda self, *serie, cantidad=1: None
+    try:
+        yield
+    finally:
+        metricas_lynx.Histograma.observar, metricas_lynx.Contador.sumar = originales
+
+
+def analizar(codigo, nivel, repeticiones):
+    """Mejor tiempo sin y con métricas, alternando para que el ruido afecte a los dos igual"""
+    mejores = [float("inf"), float("inf")]
+    for _ in range(repeticiones):
+        for indice, contexto in enumerate((sin_metricas, contextlib.nullcontext)):
+            with contexto():
+                inicio = time.perf_counter()
+                como_json(analisis_unificado, codigo, ["tokens", "ast", "errores"], nivel)
+                mejores[indice] = min(mejores[indice], time.perf_counter() - inicio)
+    return mejores
+
+
+def observaciones(codigo, nivel):
+    """Llamadas a observar y sumar de un análisis"""
+    contadas = [0]
+    originales = metricas_lynx.Histograma.observar, metricas_lynx.Contador.sumar
+
+    def contar(original):
+        def contada(self, *argumentos, **opciones):
+            contadas[0] += 1
+            return original(self, *argumentos, **opciones)
+        return contada
+
+    metricas_lynx.Histograma.observar, metricas_lynx.Contador.sumar = map(contar, originales)
+    try:
+        como_json(analisis_unificado, codigo, ["tokens", "ast", "errores"], nivel)
+    finally:
+        metricas_lynx.Histograma.observar, metricas_lynx.Contador.sumar = originales
+    return contadas[0]
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeticiones", type=int, default=20)
+    argumentos = parser.parse_args()
+
+    metricas_lynx.errores.sumar("lexico", cantidad=0)
+    observar = por_llamada("m.lexico_segundos.observar(0.003)")
+    observar_serie = por_llamada("m.serializacion_segundos.observar(0.003, 'ast')")
+    sumar = por_llamada("m.errores.sumar('semantico')")
+    print(f"observar {observar * 1e9:.0f} ns, con etiqueta {observar_serie * 1e9:.0f} ns, sumar {sumar * 1e9:.0f} ns")
+
+    print(f"{'Líneas':>7} {'Nivel':>9} {'Sin métricas':>13} {'Con métricas':>13} {'Medido':>8} "
+          f"{'Observaciones':>14} {'Estimado':>9}")
+    for n in (10, 100, 1000):
+        codigo = programa_declaraciones(n)
+        for nivel in ("rapido", "completo"):
+            t_sin, t_con = analizar(codigo, nivel, argumentos.repeticiones)
+            cantidad = observaciones(codigo, nivel)
+            print(
+                f"{codigo.count(chr(10)) + 1:>7} {nivel:>9} {t_sin * 1000:>11.3f}ms {t_con * 1000:>11.3f}ms "
+                f"{(t_con - t_sin) / t_sin * 100:>7.2f}% {cantidad:>14} {cantidad * observar_serie / t_sin * 100:>8.3f}%"
+            )
+
+    inicio = time.perf_counter()
+    texto = metricas_lynx.exponer()
+    print(f"exponer: {(time.perf_counter() - inicio) * 1000:.2f} ms, {len(texto)} bytes")
+
+
+if __name__ == "__main__":
+    main_cli()
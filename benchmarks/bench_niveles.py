@@ -0,0 +1,47 @@
+"""Latencia de los niveles de análisis `rapido` y `completo`
+
+Uso: python benchmarks/bench_niveles.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lexer_lynx import analizar_lexico
+from parser_lynx import analizar_sintactico
+from semantic_lynx import AnalizadorSemantico
+
+from programas_lynx import programa_declaraciones
+
+REPETICIONES = 5
+
+
+def medir(funcion, repeticiones=REPETICIONES):
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+
+def main():
+    print(f"{'Tamaño':>8} {'Líneas':>8} {'Léxico':>10} {'Sintaxis':>10} {'Rápido':>10} {'Completo':>10} {'Razón':>7}")
+    for n in (10, 100, 500, 1000):
+        codigo = programa_declaraciones(n)
+        ast, errores = analizar_sintactico(codigo)
+        assert not errores, errores
+
+        t_lexico = medir(lambda: analizar_lexico(codigo))
+        t_sintaxis = medir(lambda: analizar_sintactico(codigo))
+        t_rapido = medir(lambda: AnalizadorSemantico(nivel="rapido").analizar(ast, codigo))
+        t_completo = medir(lambda: AnalizadorSemantico(nivel="completo").analizar(ast, codigo))
+        print(
+            f"{n:>8} {codigo.count(chr(10)) + 1:>8} {t_lexico * 1000:>8.2f}ms {t_sintaxis * 1000:>8.2f}ms "
+            f"{t_rapido * 1000:>8.2f}ms {t_completo * 1000:>8.2f}ms {t_completo / t_rapido:>6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+"""Pases de optimización de la IR: equivalencia con programas dorados y tiempos
+
+Cada programa dorado se ejecuta sin optimizar, con cada pase por separado y con
+la secuencia completa; la salida y los errores deben coincidir con los
+esperados. Después se mide la ejecución de la IR antes y después de optimizar.
+
+Uso: python benchmarks/bench_optimizador.py [--solo-dorados]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from interprete_lynx import ErrorCompilacion
+from ir_lynx import InterpreteIR, generar_ir_codigo
+from optimizador_lynx import ORDEN_POR_DEFECTO, PASES, GestorPases, contar_instrucciones, formatear_estadisticas
+from runtime_lynx import ErrorEjecucion
+
+from programas_lynx import programa_invariantes, programa_mientras, programa_para_anidado
+
+REPETICIONES = 3
+
+# nombre -> (código, salida esperada, errores esperados)
+DORADOS = {
+    "licm_tabla": (
+        'val t = {"k" = 3}\nval a = [1, 2]\nval s = 0\npara (val i = 0; i < 10; i + 1) {\n'
+        '    s = s + t["k"] * 2 + a[1] * i\n}\nimprimir(s)',
+        ["150"], [],
+    ),
+    "licm_error_en_bucle": (
+        'val t = {"k" = 3}\nval s = 0\npara (val i = 0; i < 3; i + 1) {\n    imprimir(i)\n'
+        '    s = s + t["z"]\n}\nimprimir(s)',
+        ["0"], ["Error de ejecución línea 5: Clave 'z' no encontrada en la tabla"],
+    ),
+    "licm_bucle_vacio": (
+        'val t = {"k" = 3}\nval s = 0\nmientras (s > 0) {\n    s = s + t["z"]\n}\nimprimir(s)',
+        ["0"], [],
+    ),
+    "licm_capturar": (
+        "val a = [1]\nval n = 0\npara (val i = 0; i < 3; i + 1) {\n    intentar {\n        n = n + a[i]\n"
+        "    } capturar (e) {\n        imprimir(i, e)\n    }\n}\nimprimir(n)",
+        [
+            "1 Índice 1 fuera de rango para un arreglo de 1 elementos",
+            "2 Índice 2 fuera de rango para un arreglo de 1 elementos",
+            "1",
+        ],
+        [],
+    ),
+    "copias_y_plegado": (
+        'val a = 5\nval b = a\nval c = b + 1\nsi (c > 100) {\n    imprimir("nunca")\n}\n'
+        "mientras (c < 20) {\n    c = c + b\n}\nimprimir(c, 2 * 3 + 1)",
+        ["21 7"], [],
+    ),
+    "cse": (
+        "val a = 3\nval b = 4\nval x = a * b + 1\nval z = a * b + 2\nimprimir(x, z, a * b)",
+        ["13 14 12"], [],
+    ),
+    "induccion": (
+        "val s = 0\npara (val i = 0; i < 10; i + 1) {\n    s = s + i * 3 + i * 2\n}\nimprimir(s)",
+        ["225"], [],
+    ),
+    "volatil": (
+        "val c = 0\nfun inc() {\n    c = c + 1\n    retornar c\n}\nval s = 0\n"
+        "para (val i = 0; i < 3; i + 1) {\n    s = s + c * 2\n    inc()\n}\nimprimir(s, c)",
+        ["6 3"], [],
+    ),
+    "orden_evaluacion": (
+        "val x = 1\nfun f() {\n    x = 10\n    retornar 1\n}\nimprimir(x + f(), x)",
+        ["2 10"], [],
+    ),
+    "segun_y_para_en": (
+        'val nombres = ["a", "b", "c"]\npara (n en nombres) {\n    segun (n) {\n'
+        '        caso "a": imprimir("uno") parar\n        caso "b": imprimir("dos") parar\n'
+        '        predeterminado: imprimir("otro", n)\n    }\n}',
+        ["uno", "dos", "otro c"], [],
+    ),
+    "repetir_y_logica": (
+        "val i = 0\nrepetir {\n    i = i + 1\n} hasta (i >= 5 o falso)\nimprimir(i, i > 2 y no (i == 3))",
+        ["5 verdadero"], [],
+    ),
+    "finalmente": (
+        'val a = [1]\nintentar {\n    intentar {\n        imprimir(a[5])\n    } capturar (e) {\n'
+        '        imprimir("c1", e)\n        imprimir(1 / 0)\n    } finalmente {\n        imprimir("f1")\n'
+        '    }\n} capturar (e2) {\n    imprimir("c2", e2)\n}',
+        ["c1 Índice 5 fuera de rango para un arreglo de 1 elementos", "f1", "c2 División por cero"], [],
+    ),
+    "cadenas": (
+        'val s = ""\npara (val i = 0; i < 3; i + 1) {\n    s = s + i + ","\n}\nimprimir(s + verdadero)',
+        ["0,1,2,verdadero"], [],
+    ),
+    "recursion": (
+        "fun fib(n) {\n    val r = n\n    si (n > 1) { r = fib(n - 1) + fib(n - 2) }\n    retornar r\n}\n"
+        "imprimir(fib(15))",
+        ["610"], [],
+    ),
+    "error_de_tipo": (
+        'val a = 1\nval b = "x"\nimprimir(a)\nimprimir(a - b)',
+        ["1"], ["Error de ejecución línea 4: Operador '-' requiere operandos numéricos, no entero y cadena"],
+    ),
+}
+
+CONFIGURACIONES = [("sin pases", [])] + [(p, [p]) for p in PASES] + [("todos", list(ORDEN_POR_DEFECTO))]
+
+
+def ejecutar(codigo: str, pases):
+    salida = []
+    try:
+        programa = generar_ir_codigo(codigo)
+        GestorPases(pases).ejecutar(programa)
+        InterpreteIR(salida.append).ejecutar(programa)
+    except ErrorCompilacion as e:
+        return salida, e.errores
+    except ErrorEjecucion as e:
+        return salida, [str(e)]
+    return salida, []
+
+
+def verificar_dorados() -> bool:
+    correcto = True
+    for nombre, (codigo, salida, errores) in DORADOS.items():
+        fallidas = [
+            configuracion for configuracion, pases in CONFIGURACIONES
+            if ejecutar(codigo, pases) != (salida, errores)
+        ]
+        print(f"{'OK   ' if not fallidas else 'FALLA'} {nombre}" + (f"  ({', '.join(fallidas)})" if fallidas else ""))
+        correcto = correcto and not fallidas
+    return correcto
+
+
+def medir(funcion, repeticiones=REPETICIONES):
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+
+def main():
+    print(f"Programas dorados ({len(CONFIGURACIONES)} configuraciones de pases cada uno)")
+    if not verificar_dorados():
+        sys.exit(1)
+    if "--solo-dorados" in sys.argv:
+        return
+
+    casos = [
+        ("invariantes 50000", programa_invariantes(50000)),
+        ("para anidado 150x150", programa_para_anidado(150)),
+        ("mientras 50000", programa_mientras(50000)),
+    ]
+    print(f"\n{'Programa':<22} {'Instr.':>7} {'Optim.':>7} {'Sin optimizar':>14} {'Optimizado':>11} {'Mejora':>7}")
+    detalles = []
+    for nombre, codigo in casos:
+        original = generar_ir_codigo(codigo)
+        optimizado = generar_ir_codigo(codigo)
+        gestor = GestorPases()
+        estadisticas = gestor.ejecutar(optimizado)
+        detalles.append((nombre, estadisticas))
+
+        salidas = {"original": [], "optimizado": []}
+        t_original = medir(lambda: InterpreteIR(salidas["original"].append).ejecutar(original))
+        t_optimizado = medir(lambda: InterpreteIR(salidas["optimizado"].append).ejecutar(optimizado))
+        assert salidas["original"] == salidas["optimizado"], salidas
+        print(
+            f"{nombre:<22} {contar_instrucciones(original):>7} {contar_instrucciones(optimizado):>7} "
+            f"{t_original * 1000:>12.1f}ms {t_optimizado * 1000:>9.1f}ms {t_original / t_optimizado:>6.2f}x"
+        )
+
+    for nombre, estadisticas in detalles:
+        print(f"\n{nombre}\n{formatear_estadisticas(estadisticas)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Costo del perfilador por línea, activado y desactivado
+
+Desactivado, el bytecode no lleva instrucciones de perfilado y la VM solo
+suma ramas al final de su cadena de despacho, así que debería costar lo mismo
+que la VM de antes del perfilador. Para comprobarlo se carga vm_lynx.py tal
+como estaba en el commit anterior al que agregó perfil_lynx.py (o en la
+revisión de `--base`) y se compara con la actual sobre el mismo bytecode.
+
+Uso: python benchmarks/bench_perfil.py [--base REVISION]
+"""
+import argparse
+import importlib.util
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from bytecode_lynx import PERFIL_ENTRAR, PERFIL_LINEA, PERFIL_SALIR, compilar_codigo_bytecode
+from perfil_lynx import Perfil
+from vm_lynx import MaquinaVirtual
+
+from programas_lynx import programa_fibonacci, programa_mientras, programa_para_anidado
+
+REPETICIONES = 5
+
+CASOS = [
+    ("para anidado 200x200", programa_para_anidado(200)),
+    ("mientras 100000", programa_mientras(100000)),
+    ("fibonacci(18)", programa_fibonacci(18)),
+]
+
+
+def medir(funcion, repeticiones=REPETICIONES):
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+
+def revision_base() -> str:
+    agregado = subprocess.run(
+        ["git", "log", "--diff-filter=A", "--format=%H", "--", "perfil_lynx.py"],
+        cwd=RAIZ, capture_output=True, text=True,
+    ).stdout.split()
+    return f"{agregado[-1]}~1" if agregado else "HEAD"
+
+
+def cargar_vm(revision: str):
+    fuente = subprocess.run(
+        ["git", "show", f"{revision}:vm_lynx.py"], cwd=RAIZ, capture_output=True, text=True, check=True
+    ).stdout
+    with tempfile.NamedTemporaryFile("w", suffix=".py", delete=False, encoding="utf-8") as archivo:
+        archivo.write(fuente)
+    especificacion = importlib.util.spec_from_file_location("vm_lynx_base", archivo.name)
+    modulo = importlib.util.module_from_spec(especificacion)
+    especificacion.loader.exec_module(modulo)
+    os.unlink(archivo.name)
+    return modulo.MaquinaVirtual
+
+
+def opcodes(funcion):
+    yield from funcion.codigo[0::2]
+    for constante in funcion.constantes:
+        if hasattr(constante, "codigo") and hasattr(constante, "constantes"):
+            yield from opcodes(constante)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--base", help="revisión de git con la VM de referencia")
+    argumentos = parser.parse_args()
+    revision = argumentos.base or revision_base()
+    MaquinaBase = cargar_vm(revision)
+
+    print(f"VM de referencia: {revision}")
+    print(f"{'Programa':<22} {'Base':>10} {'Desact.':>10} {'Dif.':>7} {'Activado':>10} {'Factor':>7}")
+    for nombre, codigo in CASOS:
+        normal = compilar_codigo_bytecode(codigo)
+        perfilado = compilar_codigo_bytecode(codigo, perfilar=True)
+        assert not {PERFIL_LINEA, PERFIL_ENTRAR, PERFIL_SALIR} & set(opcodes(normal))
+
+        salidas = {"base": [], "desactivado": [], "activado": []}
+        t_base = medir(lambda: MaquinaBase(salidas["base"].append).ejecutar(normal))
+        t_desactivado = medir(lambda: MaquinaVirtual(salidas["desactivado"].append).ejecutar(normal))
+        t_activado = medir(
+            lambda: MaquinaVirtual(salidas["activado"].append, perfil=Perfil()).ejecutar(perfilado)
+        )
+        assert salidas["base"] == salidas["desactivado"] == salidas["activado"], salidas
+
+        print(
+            f"{nombre:<22} {t_base * 1000:>8.1f}ms {t_desactivado * 1000:>8.1f}ms "
+            f"{(t_desactivado / t_base - 1) * 100:>+6.1f}% {t_activado * 1000:>8.1f}ms "
+            f"{t_activado / t_desactivado:>6.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
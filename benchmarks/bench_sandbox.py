@@ -0,0 +1,100 @@
+"""Rendimiento y latencia del grupo de ejecución aislada bajo carga concurrente
+
+Mide peticiones por segundo y percentiles de latencia con distinto número de
+peticiones simultáneas, con y sin programas que agotan sus límites. Un sondeo
+en paralelo mide el retraso máximo del bucle de eventos: si `ejecutar_async`
+bloqueara, ese retraso crecería con la duración de los programas.
+
+Uso: python benchmarks/bench_sandbox.py [--trabajadores N] [--peticiones N]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sandbox_lynx import GrupoEjecucion, Limites
+
+from programas_lynx import programa_fibonacci, programa_mientras, programa_para_anidado
+
+NORMALES = [
+    programa_para_anidado(30),
+    programa_mientras(5000),
+    programa_fibonacci(12),
+]
+INFINITO = "mientras (1 < 2) { }"
+LENTO = "val x = 3\nmientras (1 < 2) { x = x * x }"
+
+
+def percentil(valores, p):
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, int(p / 100 * len(ordenados)))]
+
+
+async def sondear_bucle(detener: asyncio.Event, retrasos: list):
+    while not detener.is_set():
+        inicio = time.perf_counter()
+        await asyncio.sleep(0.005)
+        retrasos.append(time.perf_counter() - inicio - 0.005)
+
+
+async def escenario(grupo, programas, peticiones, concurrencia):
+    semaforo = asyncio.Semaphore(concurrencia)
+    latencias = []
+    estados = {}
+
+    async def una(codigo):
+        async with semaforo:
+            inicio = time.perf_counter()
+            resultado = await grupo.ejecutar_async(codigo)
+            latencias.append(time.perf_counter() - inicio)
+            estados[resultado["estado"]] = estados.get(resultado["estado"], 0) + 1
+
+    detener = asyncio.Event()
+    retrasos = []
+    sondeo = asyncio.create_task(sondear_bucle(detener, retrasos))
+    inicio = time.perf_counter()
+    await asyncio.gather(*(una(programas[i % len(programas)]) for i in range(peticiones)))
+    total = time.perf_counter() - inicio
+    detener.set()
+    await sondeo
+    return total, latencias, estados, max(retrasos, default=0.0)
+
+
+async def main_async(trabajadores, peticiones):
+    limites = Limites(instrucciones=500_000, tiempo_s=0.5)
+    with GrupoEjecucion(trabajadores, limites) as grupo:
+        # Calentar cada trabajador antes de medir
+        await asyncio.gather(*(grupo.ejecutar_async(NORMALES[0]) for _ in range(trabajadores)))
+
+        mezclas = [
+            ("normales", NORMALES),
+            ("10% presupuesto", NORMALES * 3 + [INFINITO]),
+            ("10% tiempo", NORMALES * 3 + [LENTO]),
+        ]
+        print(f"Trabajadores: {trabajadores}, peticiones por escenario: {peticiones}")
+        print(f"{'Escenario':<18} {'Conc.':>5} {'Pet/s':>8} {'p50':>8} {'p95':>8} {'p99':>8} "
+              f"{'Bucle máx':>10}  Estados")
+        for nombre, programas in mezclas:
+            for concurrencia in (1, trabajadores, trabajadores * 4):
+                total, latencias, estados, retraso = await escenario(grupo, programas, peticiones, concurrencia)
+                print(
+                    f"{nombre:<18} {concurrencia:>5} {peticiones / total:>8.1f} "
+                    f"{percentil(latencias, 50) * 1000:>6.1f}ms {percentil(latencias, 95) * 1000:>6.1f}ms "
+                    f"{percentil(latencias, 99) * 1000:>6.1f}ms {retraso * 1000:>8.1f}ms  {estados}"
+                )
+        print("Estadísticas del grupo:", grupo.estadisticas)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--trabajadores", type=int, default=os.cpu_count() or 2)
+    parser.add_argument("--peticiones", type=int, default=40)
+    argumentos = parser.parse_args()
+    asyncio.run(main_async(argumentos.trabajadores, argumentos.peticiones))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Costo de escribir la respuesta de /analizar como JSON
+
+Parte de los tokens de PLY y el AST ya construidos y mide solo la
+conversión a bytes:
+- pydantic: un Token por token, AnalisisResponse validado y vuelto a
+  convertir, como hacía FastAPI con `response_model`
+- json: diccionarios de tokens y AST escritos con json.dumps
+- propio: serializacion_lynx, directo desde tokens y nodos, con json para
+  el resto de la respuesta
+- orjson: lo mismo con orjson para el resto (si está instalado)
+
+Uso: python benchmarks/bench_serializacion.py
+"""
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import serializacion_lynx
+from lexer_lynx import tokenizar, tokens_a_dicts
+from main import AnalisisResponse, Token
+from parser_lynx import analizar_sintactico
+from serializacion_lynx import a_json, ast_json, ast_to_dict, tokens_json
+
+from programas_lynx import programa_declaraciones
+
+REPETICIONES = 3
+
+
+def medir(funcion, repeticiones=REPETICIONES):
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        resultado = funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor, resultado
+
+
+def con_pydantic(codigo, tokens_ply, ast):
+    respuesta = AnalisisResponse(
+        tokens=[Token(**token) for token in tokens_a_dicts(codigo, tokens_ply)],
+        errores=[],
+        ast=ast_to_dict(ast),
+        exito=True,
+    )
+    contenido = AnalisisResponse.model_validate(respuesta.model_dump()).model_dump(mode="json")
+    return json.dumps(contenido, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode()
+
+
+def con_json(codigo, tokens_ply, ast):
+    contenido = {"tokens": tokens_a_dicts(codigo, tokens_ply), "errores": [], "ast": ast_to_dict(ast), "exito": True}
+    return json.dumps(contenido, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode()
+
+
+def con_serializacion(codigo, tokens_ply, ast):
+    return a_json({"tokens": tokens_json(codigo, tokens_ply), "errores": [], "ast": ast_json(ast), "exito": True})
+
+
+def main():
+    orjson = serializacion_lynx.orjson
+    print(f"{'Tokens':>8} {'Bytes':>10} {'pydantic':>10} {'json':>10} {'propio':>10} {'orjson':>10} {'Mejor vs pydantic':>18}")
+    for n in (20, 200, 1000, 2500):
+        codigo = programa_declaraciones(n)
+        (lexer, tokens_ply), _ = tokenizar(codigo)
+        ast, errores = analizar_sintactico(codigo, lexico=(lexer, tokens_ply))
+        assert not errores, errores
+
+        t_pydantic, esperado = medir(lambda: con_pydantic(codigo, tokens_ply, ast))
+        t_json, resultado = medir(lambda: con_json(codigo, tokens_ply, ast))
+        assert resultado == esperado
+        serializacion_lynx.orjson = None
+        t_propio, resultado = medir(lambda: con_serializacion(codigo, tokens_ply, ast))
+        assert resultado == esperado
+        serializacion_lynx.orjson = orjson
+        t_orjson = None
+        if orjson is not None:
+            t_orjson, resultado = medir(lambda: con_serializacion(codigo, tokens_ply, ast))
+            assert resultado == esperado
+        mejor = min(t for t in (t_propio, t_orjson) if t is not None)
+        print(
+            f"{len(tokens_ply):>8} {len(esperado):>10} {t_pydantic * 1000:>8.1f}ms {t_json * 1000:>8.1f}ms "
+            f"{t_propio * 1000:>8.1f}ms "
+            + (f"{t_orjson * 1000:>8.1f}ms" if t_orjson is not None else f"{'-':>10}")
+            + f" {t_pydantic / mejor:>17.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Validación en vivo: sesión con deltas (/ws/sesion) contra POST del código completo
+
+Simula escribir una línea nueva, tecla por tecla, a la mitad de programas de
+varios tamaños. Por tecla se mide:
+- POST: analisis_unificado con secciones ['errores'] y nivel rápido, escrito
+  como JSON, y los bytes de ida (código completo) y de vuelta
+- sesión: aplicar el cambio de Monaco, retokenizar el tramo, parsear,
+  analizar y calcular los marcadores agregados y eliminados, con los bytes de
+  ida (el cambio) y de vuelta (el delta)
+Aparte, solo el léxico: tokenizar todo contra lexer_lynx.retokenizar.
+
+Uso: python benchmarks/bench_sesion.py
+"""
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lexer_lynx import retokenizar, tokenizar
+from serializacion_lynx import a_json
+from servicio_lynx import analisis_unificado, como_json
+from sesiones_lynx import Sesion, analizar_version
+
+from programas_lynx import programa_declaraciones
+
+LINEA = "val nueva = arr0[0] + 1\n"
+
+
+def teclas(codigo):
+    """Cambios de Monaco de escribir LINEA al principio de la línea del medio"""
+    posicion = codigo.index("\n", len(codigo) // 2) + 1
+    return [
+        {"rangeOffset": posicion + indice, "rangeLength": 0, "text": caracter}
+        for indice, caracter in enumerate(LINEA)
+    ]
+
+
+def por_post(codigo, cambios):
+    ida = vuelta = 0
+    inicio = time.perf_counter()
+    for cambio in cambios:
+        posicion = cambio["rangeOffset"]
+        codigo = codigo[:posicion] + cambio["text"] + codigo[posicion:]
+        ida += len(json.dumps({"codigo": codigo, "nivel": "rapido", "secciones": ["errores"]}).encode())
+        vuelta += len(como_json(analisis_unificado, codigo, ["errores"], "rapido"))
+    return time.perf_counter() - inicio, ida, vuelta
+
+
+def por_sesion(codigo, cambios):
+    sesion = Sesion(1)
+    sesion.abrir(codigo, 1, "rapido")
+    sesion.publicar(analizar_version(codigo, None, None, "rapido"))
+    ida = vuelta = 0
+    inicio = time.perf_counter()
+    for version, cambio in enumerate(cambios, 2):
+        mensaje = {"tipo": "cambios", "version": version, "cambios": [cambio]}
+        ida += len(a_json(mensaje))
+        sesion.aplicar(mensaje["cambios"], version)
+        anterior, tramo = sesion.analisis, sesion.tramo
+        sesion.tramo = None
+        agregados, eliminados = sesion.publicar(analizar_version(sesion.codigo, anterior, tramo, "rapido"))
+        vuelta += len(a_json({"tipo": "diagnosticos", "version": version, "agregados": agregados,
+                              "eliminados": eliminados, "ms": 0.0}))
+    return time.perf_counter() - inicio, ida, vuelta
+
+
+def solo_lexico(codigo, cambios):
+    (_, tokens), _ = tokenizar(codigo)
+    t_completo = t_incremental = 0.0
+    for cambio in cambios:
+        posicion = cambio["rangeOffset"]
+        codigo = codigo[:posicion] + cambio["text"] + codigo[posicion:]
+        inicio = time.perf_counter()
+        (_, esperado), _ = tokenizar(codigo)
+        t_completo += time.perf_counter() - inicio
+        inicio = time.perf_counter()
+        _, tokens = retokenizar(tokens, codigo, posicion, posicion + 1, posicion)
+        t_incremental += time.perf_counter() - inicio
+        assert [(t.type, t.value, t.lineno, t.lexpos) for t in tokens] == \
+               [(t.type, t.value, t.lineno, t.lexpos) for t in esperado]
+    return t_completo, t_incremental
+
+
+def main():
+    print(
+        f"{'Líneas':>7} {'POST/tecla':>11} {'Sesión/tecla':>13} {'Razón':>6} "
+        f"{'Ida POST':>9} {'Ida sesión':>11} {'Vuelta POST':>12} {'Vuelta sesión':>14} "
+        f"{'Léxico todo':>12} {'Retokenizar':>12}"
+    )
+    for n in (10, 100, 500):
+        codigo = programa_declaraciones(n)
+        cambios = teclas(codigo)
+        t_post, ida_post, vuelta_post = por_post(codigo, cambios)
+        t_sesion, ida_sesion, vuelta_sesion = por_sesion(codigo, cambios)
+        t_completo, t_incremental = solo_lexico(codigo, cambios)
+        k = len(cambios)
+        print(
+            f"{codigo.count(chr(10)) + 1:>7} {t_post / k * 1000:>9.2f}ms {t_sesion / k * 1000:>11.2f}ms "
+            f"{t_post / t_sesion:>5.2f}x {ida_post // k:>9} {ida_sesion // k:>11} "
+            f"{vuelta_post // k:>12} {vuelta_sesion // k:>14} "
+            f"{t_completo / k * 1000:>10.3f}ms {t_incremental / k * 1000:>10.3f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
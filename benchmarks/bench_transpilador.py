@@ -0,0 +1,72 @@
+"""Transpilación a Python frente al intérprete de clausuras y la VM, y costo de la caché
+
+Uso: python benchmarks/bench_transpilador.py
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bytecode_lynx import compilar_bytecode
+from interprete_lynx import analizar_programa, compilar
+from transpilador_lynx import CacheCodigo, transpilar_codigo
+from vm_lynx import MaquinaVirtual
+
+from programas_lynx import programa_fibonacci, programa_mientras, programa_para_anidado
+
+REPETICIONES = 3
+
+CASOS = [
+    ("para anidado 200x200", programa_para_anidado(200)),
+    ("mientras 100000", programa_mientras(100000)),
+    ("fibonacci(18)", programa_fibonacci(18)),
+]
+
+
+def medir(funcion, repeticiones=REPETICIONES):
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+
+def main():
+    directorio = tempfile.mkdtemp(prefix="lynx-cache-")
+
+    print("Ejecución")
+    print(f"{'Programa':<22} {'Clausuras':>10} {'Bytecode':>10} {'Python':>10} {'Claus./Py':>10}")
+    for nombre, codigo in CASOS:
+        ast = analizar_programa(codigo)
+        clausuras = compilar(ast, codigo)
+        bytecode = compilar_bytecode(ast, codigo)
+        transpilado = transpilar_codigo(codigo, CacheCodigo(directorio))
+
+        salidas = {"clausuras": [], "bytecode": [], "python": []}
+        t_clausuras = medir(lambda: clausuras.ejecutar(salidas["clausuras"].append))
+        t_bytecode = medir(lambda: MaquinaVirtual(salidas["bytecode"].append).ejecutar(bytecode))
+        t_python = medir(lambda: transpilado.ejecutar(salidas["python"].append))
+        assert salidas["clausuras"] == salidas["bytecode"] == salidas["python"], salidas
+
+        print(
+            f"{nombre:<22} {t_clausuras * 1000:>8.1f}ms {t_bytecode * 1000:>8.1f}ms "
+            f"{t_python * 1000:>8.1f}ms {t_clausuras / t_python:>9.2f}x"
+        )
+
+    print("\nCompilación (programa_fibonacci)")
+    codigo = programa_fibonacci(18)
+    frio = medir(lambda: transpilar_codigo(codigo, CacheCodigo(None)))
+    cache = CacheCodigo(directorio)
+    transpilar_codigo(codigo, cache)
+    memoria = medir(lambda: transpilar_codigo(codigo, cache), 100)
+    disco = medir(lambda: transpilar_codigo(codigo, CacheCodigo(directorio)), 100)
+    print(f"  sin caché (léxico, sintaxis, semántica, generación): {frio * 1e6:>9.1f}µs")
+    print(f"  acierto en disco:                                      {disco * 1e6:>9.1f}µs")
+    print(f"  acierto en memoria:                                    {memoria * 1e6:>9.1f}µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Costo de las trazas: desactivadas, muestreadas y completas
+
+- por punto: tramo() y el `if trazas_lynx.nivel <= DEPURACION` de los
+  puntos por nodo, con las trazas desactivadas
+- por análisis: analisis_semantico (nivel completo) con las trazas
+  desactivadas, en info, en depuración con el 1% de muestreo y en depuración
+  completa. Las líneas se descartan en vez de escribirse, así se mide armar
+  las trazas y no la salida. `Tramos` son las líneas de un análisis en
+  depuración completa.
+
+Uso: python benchmarks/bench_trazas.py [--repeticiones N]
+"""
+import argparse
+import os
+import sys
+import time
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import trazas_lynx
+from servicio_lynx import analisis_semantico
+
+from programas_lynx import programa_declaraciones
+
+CONFIGURACIONES = (
+    ("desactivadas", None, 1.0),
+    ("info", "info", 1.0),
+    ("depuración 1%", "depuracion", 0.01),
+    ("depuración", "depuracion", 1.0),
+)
+
+
+def por_llamada(sentencia, numero=500_000):
+    entorno = {"trazas_lynx": trazas_lynx, "DEPURACION": trazas_lynx.DEPURACION}
+    return min(timeit.repeat(sentencia, number=numero, repeat=5, globals=entorno)) / numero
+
+
+def medir(codigo, repeticiones):
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        # Como en un trabajador del EjecutorAnalisis: la traza empieza en el análisis
+        with trazas_lynx.tramo("analisis", funcion="analisis_semantico"):
+            analisis_semantico(codigo, "completo")
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeticiones", type=int, default=10)
+    argumentos = parser.parse_args()
+
+    trazas_lynx.configurar(None)
+    t_tramo = por_llamada("with trazas_lynx.tramo('lexico', caracteres=10): pass")
+    t_guarda = por_llamada("if trazas_lynx.nivel <= DEPURACION: pass")
+    print(f"desactivadas: tramo {t_tramo * 1e9:.0f} ns, guarda por nodo {t_guarda * 1e9:.0f} ns")
+
+    lineas = []
+    print(f"{'Líneas':>7} " + " ".join(f"{nombre:>14}" for nombre, _, _ in CONFIGURACIONES) + f" {'Tramos':>7}")
+    for n in (10, 100, 1000):
+        codigo = programa_declaraciones(n)
+        tiempos = []
+        for _, nivel, muestreo in CONFIGURACIONES:
+            lineas.clear()
+            trazas_lynx.configurar(nivel, muestreo, destino=lineas.append)
+            tiempos.append(medir(codigo, argumentos.repeticiones))
+        trazas_lynx.configurar(None)
+        print(
+            f"{codigo.count(chr(10)) + 1:>7} " + " ".join(f"{t * 1000:>12.3f}ms" for t in tiempos)
+            + f" {len(lineas) // argumentos.repeticiones:>7}"
+        )
+
+
+if __name__ == "__main__":
+    main_cli()
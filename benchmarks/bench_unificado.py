@@ -0,0 +1,61 @@
+"""/analizar-unificado contra las tres peticiones que hacía el editor por acción
+
+`tres endpoints` es léxico + sintáctico + semántico por separado (el código
+se tokeniza tres veces y se parsea dos); `unificado` pide todas las
+secciones en una pasada, y las demás columnas solo lo que muestra cada vista.
+Se incluye la conversión a JSON de la respuesta, que también hace el trabajador.
+
+Uso: python benchmarks/bench_unificado.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from servicio_lynx import (
+    SECCIONES,
+    analisis_lexico,
+    analisis_semantico,
+    analisis_sintactico,
+    analisis_unificado,
+    como_json,
+)
+
+from programas_lynx import programa_declaraciones
+
+REPETICIONES = 5
+
+
+def medir(funcion, repeticiones=REPETICIONES):
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+
+def tres_endpoints(codigo):
+    como_json(analisis_lexico, codigo)
+    como_json(analisis_sintactico, codigo)
+    como_json(analisis_semantico, codigo, "completo")
+
+
+def main():
+    print(f"{'Tamaño':>8} {'3 endpoints':>12} {'Unificado':>10} {'Razón':>7} {'Tokens':>10} {'AST':>10} {'Errores':>10}")
+    for n in (10, 100, 500):
+        codigo = programa_declaraciones(n)
+        t_tres = medir(lambda: tres_endpoints(codigo))
+        t_unificado = medir(lambda: como_json(analisis_unificado, codigo, SECCIONES))
+        t_tokens = medir(lambda: como_json(analisis_unificado, codigo, ["tokens"]))
+        t_ast = medir(lambda: como_json(analisis_unificado, codigo, ["ast"]))
+        t_errores = medir(lambda: como_json(analisis_unificado, codigo, ["errores"]))
+        print(
+            f"{n:>8} {t_tres * 1000:>10.2f}ms {t_unificado * 1000:>8.2f}ms {t_tres / t_unificado:>6.1f}x "
+            f"{t_tokens * 1000:>8.2f}ms {t_ast * 1000:>8.2f}ms {t_errores * 1000:>8.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Bucles `para (x en arreglo)` vectorizados con numpy frente al bucle de la VM
+
+Los arreglos literales de enteros o de flotantes se guardan como
+numpy.ndarray y los bucles con reducciones o mapas aritméticos se ejecutan
+como operaciones vectoriales. Se compara con el mismo bytecode compilado sin
+vectorizar; las salidas deben ser idénticas. Sin numpy instalado solo se mide
+el bucle normal.
+
+Uso: python benchmarks/bench_vectorial.py [--elementos N]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bytecode_lynx import CompiladorBytecode
+from interprete_lynx import analizar_programa, resolver
+from runtime_lynx import numpy
+from vm_lynx import MaquinaVirtual
+
+from programas_lynx import programa_arreglo_numerico
+
+REPETICIONES = 3
+
+
+def medir(funcion, repeticiones=REPETICIONES):
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--elementos", type=int, default=1_000_000)
+    n = parser.parse_args().elementos
+
+    casos = [
+        (f"enteros {n}", programa_arreglo_numerico(n)),
+        (f"flotantes {n}", programa_arreglo_numerico(n, flotante=True)),
+        (f"enteros + imprimir {n}", programa_arreglo_numerico(n, imprimir_cada=True)),
+    ]
+    if numpy is None:
+        print("numpy no está instalado: los arreglos son listas y solo se mide el bucle normal")
+
+    print(f"{'Programa':<30} {'Compilar':>10} {'Bucle':>10} {'Vectorial':>10} {'Mejora':>8}")
+    for nombre, codigo in casos:
+        inicio = time.perf_counter()
+        ast = analizar_programa(codigo)
+        resoluciones = resolver(ast, codigo)
+        escalar = CompiladorBytecode(resoluciones, vectorizar=False).compilar_programa(ast)
+        vectorial = CompiladorBytecode(resoluciones).compilar_programa(ast)
+        t_compilar = time.perf_counter() - inicio
+
+        salidas = {"escalar": [], "vectorial": []}
+
+        def ejecutar(programa, clave):
+            salidas[clave] = []
+            MaquinaVirtual(salidas[clave].append).ejecutar(programa)
+
+        t_escalar = medir(lambda: ejecutar(escalar, "escalar"))
+        if numpy is None:
+            print(f"{nombre:<30} {t_compilar:>9.2f}s {t_escalar * 1000:>8.1f}ms {'-':>10} {'-':>8}")
+            continue
+        t_vectorial = medir(lambda: ejecutar(vectorial, "vectorial"))
+        assert salidas["escalar"] == salidas["vectorial"], (salidas["escalar"][-1:], salidas["vectorial"][-1:])
+        print(
+            f"{nombre:<30} {t_compilar:>9.2f}s {t_escalar * 1000:>8.1f}ms "
+            f"{t_vectorial * 1000:>8.1f}ms {t_escalar / t_vectorial:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""Evaluador directo del AST, usado solo como referencia en los benchmarks
+
+Recorre el árbol en cada paso, despacha por el nombre de la clase del nodo y
+busca las variables por nombre en una cadena de diccionarios: es el costo que
+evitan el intérprete de clausuras y la VM de bytecode.
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from runtime_lynx import (
+    OPERACIONES_BINARIAS,
+    OPERACIONES_UNARIAS,
+    ErrorEjecucion,
+    a_cadena,
+    booleano,
+    iguales,
+    indexar,
+    iterar,
+    verificar_aridad,
+)
+
+
+class FuncionAST:
+    def __init__(self, nodo, entorno):
+        self.nombre = nodo.nombre
+        self.aridad = len(nodo.parametros)
+        self.nodo = nodo
+        self.entorno = entorno
+
+
+class EvaluadorAST:
+    def __init__(self, escribir=print):
+        self.escribir = escribir
+
+    def ejecutar(self, ast):
+        self.bloque(ast or [], [{}])
+
+    def buscar(self, entorno, nombre):
+        for ambito in reversed(entorno):
+            if nombre in ambito:
+                return ambito
+        raise ErrorEjecucion(f"Variable '{nombre}' no declarada")
+
+    def bloque(self, instrucciones, entorno):
+        for instruccion in instrucciones or []:
+            self.sentencia(instruccion, entorno)
+
+    def sentencia(self, nodo, entorno):
+        if isinstance(nodo, tuple):
+            if nodo[0] == "para_cada":
+                _, variable, coleccion, bloque = nodo
+                for elemento in iterar(self.evaluar(coleccion, entorno)):
+                    self.bloque(bloque, entorno + [{variable.nombre: elemento}])
+            elif nodo[0] == "intentar":
+                _, bloque, (_, variable, captura), finalmente = nodo
+                try:
+                    self.bloque(bloque, entorno)
+                except ErrorEjecucion as error:
+                    self.bloque(captura, entorno + [{variable.nombre: error.mensaje}])
+                finally:
+                    if finalmente:
+                        self.bloque(finalmente[1], entorno)
+            return
+        clase = nodo.__class__.__name__
+        if clase == "DeclaracionVariable":
+            entorno[-1][nodo.nombre] = self.evaluar(nodo.valor, entorno)
+        elif clase == "AsignacionVariable":
+            self.buscar(entorno, nodo.nombre)[nodo.nombre] = self.evaluar(nodo.valor, entorno)
+        elif clase == "DeclaracionArreglo":
+            entorno[-1][nodo.nombre] = [self.evaluar(e, entorno) for e in nodo.elementos]
+        elif clase == "DeclaracionTabla":
+            entorno[-1][nodo.nombre] = {k: self.evaluar(v, entorno) for k, v in nodo.pares}
+        elif clase == "DeclaracionFuncion":
+            entorno[-1][nodo.nombre] = FuncionAST(nodo, entorno)
+        elif clase == "Imprimir":
+            self.escribir(" ".join(a_cadena(self.evaluar(e, entorno)) for e in nodo.elementos))
+        elif clase == "EstructuraSi":
+            if self.condicion(nodo.condicion, entorno):
+                self.bloque(nodo.bloque, entorno + [{}])
+                return
+            siguiente = nodo.sinosis
+            while siguiente:
+                if siguiente[0] == "sino":
+                    self.bloque(siguiente[1], entorno)
+                    return
+                _, condicion, bloque, siguiente = siguiente
+                if self.condicion(condicion, entorno):
+                    self.bloque(bloque, entorno)
+                    return
+        elif clase == "EstructuraMientras":
+            while self.condicion(nodo.condicion, entorno):
+                self.bloque(nodo.bloque, entorno + [{}])
+        elif clase == "EstructuraPara":
+            ambito = {nodo.init.nombre: self.evaluar(nodo.init.valor, entorno)}
+            interno = entorno + [ambito]
+            while self.condicion(nodo.condicion, interno):
+                self.bloque(nodo.bloque, interno)
+                ambito[nodo.init.nombre] = self.evaluar(nodo.incremento, interno)
+        elif clase == "EstructuraRepetir":
+            while True:
+                self.bloque(nodo.bloque, entorno + [{}])
+                if self.condicion(nodo.condicion, entorno):
+                    break
+        elif clase == "EstructuraSegun":
+            valor = self.evaluar(nodo.expresion, entorno)
+            for caso in nodo.casos:
+                if iguales(valor, self.evaluar(caso.valor, entorno)):
+                    self.bloque(caso.bloque, entorno)
+                    return
+            self.bloque(nodo.predeterminado, entorno)
+        else:
+            self.evaluar(nodo, entorno)
+
+    def condicion(self, nodo, entorno):
+        return booleano(self.evaluar(nodo, entorno), "La condición")
+
+    def evaluar(self, nodo, entorno):
+        if nodo is None or isinstance(nodo, (str, int, float, bool)):
+            return nodo
+        clase = nodo.__class__.__name__
+        if clase == "Identificador":
+            return self.buscar(entorno, nodo.nombre)[nodo.nombre]
+        if clase == "ExpresionBinaria":
+            if nodo.op == "y":
+                return self.condicion(nodo.izq, entorno) and self.condicion(nodo.der, entorno)
+            if nodo.op == "o":
+                return self.condicion(nodo.izq, entorno) or self.condicion(nodo.der, entorno)
+            return OPERACIONES_BINARIAS[nodo.op](
+                self.evaluar(nodo.izq, entorno), self.evaluar(nodo.der, entorno)
+            )
+        if clase == "ExpresionUnaria":
+            return OPERACIONES_UNARIAS[nodo.op](self.evaluar(nodo.expr, entorno))
+        if clase in ("AccesoArreglo", "AccesoTabla"):
+            clave = nodo.indice if clase == "AccesoArreglo" else nodo.clave
+            contenedor = self.buscar(entorno, nodo.nombre)[nodo.nombre]
+            return indexar(contenedor, self.evaluar(clave, entorno))
+        if clase == "LlamadaFuncion":
+            funcion = self.buscar(entorno, nodo.nombre)[nodo.nombre]
+            argumentos = [self.evaluar(a, entorno) for a in nodo.argumentos]
+            verificar_aridad(funcion.nombre, funcion.aridad, len(argumentos))
+            ambito = {p.nombre: v for p, v in zip(funcion.nodo.parametros, argumentos)}
+            interno = funcion.entorno + [ambito]
+            self.bloque(funcion.nodo.bloque, interno)
+            return self.evaluar(funcion.nodo.retorno, interno)
+        raise ErrorEjecucion(f"Nodo no soportado: {clase}")
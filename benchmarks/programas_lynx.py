@@ -0,0 +1,117 @@
+"""Generadores de programas Lynx sintéticos para los benchmarks"""
+
+
+def programa_declaraciones(n: int) -> str:
+    """Declaraciones, arreglos, tablas y condicionales repetidos n veces"""
+    lineas = []
+    for i in range(n):
+        lineas.append(f"val v{i} = {i}")
+        lineas.append(f'val arr{i} = [{i}, {i + 1}, {i + 2}, {i + 3}, {i + 4}, {i + 5}]')
+        lineas.append(f'val tab{i} = {{"a" = {i}, "b" = "texto{i}", "c" = {i}.5}}')
+        lineas.append(f"val w{i} = (arr{i}[0] * 2)")
+        lineas.append(f'si (v{i} > 3) {{ imprimir("mayor", tab{i}["a"]) }} sino {{ imprimir(w{i}) }}')
+    return "\n".join(lineas)
+
+
+def programa_repetitivo(n: int) -> str:
+    """Código generado con subexpresiones idénticas repetidas"""
+    lineas = [
+        "val a = [1, 2, 3]",
+        'val b = {"k" = 4, "j" = 5}',
+    ]
+    for i in range(n):
+        lineas.append(f'val r{i} = a[0] + b["k"]')
+        lineas.append(f'val s{i} = a[0] * 2')
+        lineas.append(f'imprimir(a[1] + b["j"])')
+    return "\n".join(lineas)
+
+
+def programa_para_anidado(n: int) -> str:
+    """Dos bucles `para` anidados de n iteraciones cada uno"""
+    return "\n".join([
+        "val suma = 0",
+        f"para (val i = 0; i < {n}; i + 1) {{",
+        f"    para (val j = 0; j < {n}; j + 1) {{",
+        "        suma = suma + i * j % 7",
+        "    }",
+        "}",
+        "imprimir(suma)",
+    ])
+
+
+def programa_mientras(n: int) -> str:
+    """Bucle `mientras` con una condición compuesta y un `si` en el cuerpo"""
+    return "\n".join([
+        "val i = 0",
+        "val pares = 0",
+        f"mientras (i < {n} y pares >= 0) {{",
+        "    si (i % 2 == 0) { pares = pares + 1 }",
+        "    i = i + 1",
+        "}",
+        "imprimir(pares)",
+    ])
+
+
+def programa_fibonacci(n: int) -> str:
+    """Fibonacci recursivo: domina el costo de las llamadas"""
+    return "\n".join([
+        "fun fib(n) {",
+        "    val r = n",
+        "    si (n > 1) { r = fib(n - 1) + fib(n - 2) }",
+        "    retornar r",
+        "}",
+        f"imprimir(fib({n}))",
+    ])
+
+
+def programa_invariantes(n: int) -> str:
+    """Bucle que recalcula accesos a tablas y arreglos que no cambian"""
+    return "\n".join([
+        'val t = {"base" = 3, "factor" = 7}',
+        "val a = [2, 4, 6]",
+        "val suma = 0",
+        f"para (val i = 0; i < {n}; i + 1) {{",
+        '    val k = t["base"] * t["factor"] + a[2]',
+        "    suma = suma + k * i + a[1] * 2",
+        "}",
+        "imprimir(suma)",
+    ])
+
+
+def programa_arreglo_numerico(n: int, flotante: bool = False, imprimir_cada: bool = False) -> str:
+    """Arreglo literal de n números con reducciones en un `para (x en a)`
+
+    Con `imprimir_cada` el cuerpo además imprime un mapa de cada elemento.
+    """
+    if flotante:
+        elementos = ", ".join(f"{i % 1000}.25" for i in range(n))
+    else:
+        elementos = ", ".join(str(i % 1000) for i in range(n))
+    cuerpo = ["    suma = suma + x", "    cuadrados = cuadrados + x * x - k", "    escalado = escalado + x / 3"]
+    if imprimir_cada:
+        cuerpo.append("    imprimir(x * 2 + 1)")
+    return "\n".join([
+        f"val a = [{elementos}]",
+        "val k = 7",
+        "val suma = 0",
+        "val cuadrados = 0",
+        "val escalado = 0.5",
+        "para (x en a) {",
+        *cuerpo,
+        "}",
+        "imprimir(suma, cuadrados, escalado)",
+    ])
+
+
+def programa_concatenacion(bytes_total: int, trozo: int = 100) -> str:
+    """Cadena de `bytes_total` caracteres armada con + en un `mientras`"""
+    texto = "".join(chr(ord("a") + i % 26) for i in range(trozo))
+    return "\n".join([
+        'val s = ""',
+        "val i = 0",
+        f"mientras (i < {bytes_total // trozo}) {{",
+        f'    s = s + "{texto}"',
+        "    i = i + 1",
+        "}",
+        "imprimir(s)",
+    ])
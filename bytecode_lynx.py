@@ -0,0 +1,587 @@
+from array import array
+from typing import Any, Dict, List, Optional
+
+from interprete_lynx import (
+    ContextoFuncion,
+    ErrorCompilacion,
+    ResolucionRanuras,
+    analizar_programa,
+    clave_caso,
+    es_literal,
+    resolver,
+)
+from runtime_lynx import (
+    ARREGLO_NUMERICO,
+    OPERACIONES_BINARIAS,
+    ErrorEjecucion,
+    crear_arreglo,
+    representar,
+)
+from vectorial_lynx import planificar_para_cada
+
+# Cada instrucción ocupa dos enteros en el array('i') del código: el opcode y
+# su operando (0 si no lo usa). Los saltos apuntan a índices del array.
+NOMBRES_OPCODES = (
+    "CARGAR_CONST",       # constantes[arg]
+    "CARGAR_LOCAL",       # locales[arg]
+    "GUARDAR_LOCAL",
+    "CARGAR_EXTERNA",     # arg = profundidad << 16 | ranura
+    "GUARDAR_EXTERNA",
+    "SACAR",
+    "SUMAR",
+    "RESTAR",
+    "MULTIPLICAR",
+    "DIVIDIR",
+    "MODULO",
+    "IGUAL",
+    "DIFERENTE",
+    "MENOR",
+    "MAYOR",
+    "MENOR_IGUAL",
+    "MAYOR_IGUAL",
+    "OPUESTO",
+    "IDENTIDAD",
+    "NO",
+    "BOOLEANO",           # exige un booleano en la cima; constantes[arg] es el mensaje
+    "SALTAR",
+    "SALTAR_SI_FALSO",
+    "SALTAR_SI_VERDADERO",
+    "Y_CORTO",            # falso: deja falso y salta; verdadero: lo saca
+    "O_CORTO",
+    "INDEXAR",
+    "CONSTRUIR_ARREGLO",  # arg = cantidad de elementos
+    "CONSTRUIR_TABLA",    # arg = cantidad de pares clave, valor
+    "IMPRIMIR",           # arg = cantidad de valores
+    "CREAR_FUNCION",      # constantes[arg] es un CodigoFuncion
+    "LLAMAR",             # arg = cantidad de argumentos
+    "RETORNAR",
+    "ITERAR",
+    "SIGUIENTE",          # agotado: saca el iterador y salta a arg
+    "DESPACHAR",          # segun con casos constantes: constantes[arg] es la tabla
+    "INTENTAR",           # arg = dirección del manejador
+    "FIN_INTENTAR",
+    "MENSAJE_ERROR",
+    "RELANZAR",
+    # Solo se emiten al compilar con `perfilar=True`
+    "PERFIL_LINEA",       # arg = línea de la sentencia que empieza
+    "PERFIL_ENTRAR",      # al empezar el cuerpo de una función
+    "PERFIL_SALIR",       # antes de RETORNAR
+    "CONSTRUIR_NUMERICO", # como CONSTRUIR_ARREGLO, con runtime_lynx.crear_arreglo
+    "VECTORIZAR",         # constantes[arg] es un PlanVectorial para la colección en la cima
+)
+
+(
+    CARGAR_CONST, CARGAR_LOCAL, GUARDAR_LOCAL, CARGAR_EXTERNA, GUARDAR_EXTERNA,
+    SACAR, SUMAR, RESTAR, MULTIPLICAR, DIVIDIR, MODULO, IGUAL, DIFERENTE, MENOR,
+    MAYOR, MENOR_IGUAL, MAYOR_IGUAL, OPUESTO, IDENTIDAD, NO, BOOLEANO, SALTAR,
+    SALTAR_SI_FALSO, SALTAR_SI_VERDADERO, Y_CORTO, O_CORTO, INDEXAR,
+    CONSTRUIR_ARREGLO, CONSTRUIR_TABLA, IMPRIMIR, CREAR_FUNCION, LLAMAR, RETORNAR,
+    ITERAR, SIGUIENTE, DESPACHAR, INTENTAR, FIN_INTENTAR, MENSAJE_ERROR, RELANZAR,
+    PERFIL_LINEA, PERFIL_ENTRAR, PERFIL_SALIR, CONSTRUIR_NUMERICO, VECTORIZAR,
+) = range(len(NOMBRES_OPCODES))
+
+OPCODES_BINARIOS: Dict[str, int] = {
+    "+": SUMAR,
+    "-": RESTAR,
+    "*": MULTIPLICAR,
+    "/": DIVIDIR,
+    "%": MODULO,
+    "==": IGUAL,
+    "!=": DIFERENTE,
+    "<": MENOR,
+    ">": MAYOR,
+    "<=": MENOR_IGUAL,
+    ">=": MAYOR_IGUAL,
+}
+OPCODES_UNARIOS: Dict[str, int] = {"-": OPUESTO, "+": IDENTIDAD, "no": NO}
+SALTOS = frozenset(
+    (SALTAR, SALTAR_SI_FALSO, SALTAR_SI_VERDADERO, Y_CORTO, O_CORTO, SIGUIENTE, INTENTAR)
+)
+
+# En DESPACHAR, la clave bajo la que se guarda el destino del predeterminado
+PREDETERMINADO = ("predeterminado", None)
+
+# CARGAR_EXTERNA/GUARDAR_EXTERNA llevan la ranura en los 16 bits bajos
+MAX_RANURA_EXTERNA = 0xFFFF
+
+
+def externa(profundidad: int, ranura: int) -> int:
+    """Argumento de CARGAR_EXTERNA/GUARDAR_EXTERNA"""
+    if ranura > MAX_RANURA_EXTERNA:
+        raise ErrorCompilacion([
+            f"Demasiadas variables en un ámbito exterior: ranura {ranura}, el máximo es {MAX_RANURA_EXTERNA}"
+        ])
+    return profundidad << 16 | ranura
+
+
+class CodigoFuncion:
+    """Código de una función (o del programa): instrucciones, constantes y locales"""
+
+    def __init__(self, nombre: str, aridad: int = 0):
+        self.nombre = nombre
+        self.aridad = aridad
+        self.codigo = array("i")
+        self.lineas = array("i")  # línea de cada instrucción (0 si no se conoce)
+        self.constantes: List[Any] = []
+        self.locales: List[str] = []
+        self.num_locales = 0
+        # Mensaje de error de los saltos condicionales, por dirección
+        self.mensajes: Dict[int, str] = {}
+        # Compilado con las instrucciones de perfilado
+        self.perfilado = False
+        # Función pura (ver pureza_lynx): la VM puede memoizar sus llamadas
+        self.pura = False
+        # Bucles de la VM por dirección de cabecera: vueltas contadas, el
+        # BucleEspecializado o False si no se especializa (ver especializador_lynx)
+        self.calientes: Dict[int, Any] = {}
+
+
+class FuncionBytecode:
+    """Valor de función en la VM: código más el marco donde se creó"""
+
+    __slots__ = ("codigo", "entorno")
+
+    def __init__(self, codigo: CodigoFuncion, entorno: list):
+        self.codigo = codigo
+        self.entorno = entorno
+
+    @property
+    def nombre(self) -> str:
+        return self.codigo.nombre
+
+    @property
+    def aridad(self) -> int:
+        return self.codigo.aridad
+
+
+class CompiladorBytecode(ResolucionRanuras):
+    def __init__(self, resoluciones: Dict[int, Any], perfilar: bool = False, vectorizar: bool = True):
+        super().__init__(resoluciones)
+        self.perfilar = perfilar
+        self.vectorizar = vectorizar
+        self.actual = self.nueva_funcion("<programa>")
+        self.linea = 0
+        self._indices_constantes: Dict[Any, int] = {}
+
+    # Emisión
+
+    def emitir(self, opcode: int, argumento: int = 0) -> int:
+        direccion = len(self.actual.codigo)
+        self.actual.codigo.append(opcode)
+        self.actual.codigo.append(argumento)
+        self.actual.lineas.append(self.linea or 0)
+        return direccion
+
+    def aqui(self) -> int:
+        return len(self.actual.codigo)
+
+    def nueva_funcion(self, nombre: str, aridad: int = 0) -> CodigoFuncion:
+        funcion = CodigoFuncion(nombre, aridad)
+        funcion.perfilado = self.perfilar
+        return funcion
+
+    def marcar_linea(self, linea: Optional[int] = None):
+        """Con perfilado, anotar que empieza a ejecutarse la línea dada (o la actual)"""
+        linea = linea or self.linea
+        if self.perfilar and linea:
+            self.emitir(PERFIL_LINEA, linea)
+
+    def retornar(self):
+        if self.perfilar:
+            self.emitir(PERFIL_SALIR)
+        self.emitir(RETORNAR)
+
+    def parchear(self, direccion: int, destino: Optional[int] = None):
+        self.actual.codigo[direccion + 1] = self.aqui() if destino is None else destino
+
+    def constante(self, valor: Any) -> int:
+        # Los literales se comparten dentro del pool (1 y verdadero son distintos)
+        clave = (type(valor).__name__, valor) if es_literal(valor) else ("id", id(valor))
+        indice = self._indices_constantes.get(clave)
+        if indice is None:
+            indice = len(self.actual.constantes)
+            self.actual.constantes.append(valor)
+            self._indices_constantes[clave] = indice
+        return indice
+
+    def con_linea(self, nodo):
+        linea = getattr(nodo, "linea", None)
+        if linea:
+            self.linea = linea
+
+    # Programa
+
+    def compilar_programa(self, ast) -> CodigoFuncion:
+        self.bloque(ast or [])
+        self.emitir(CARGAR_CONST, self.constante(None))
+        self.retornar()
+        return self.cerrar_funcion()
+
+    def cerrar_funcion(self) -> CodigoFuncion:
+        self.actual.locales = list(self.funcion.nombres)
+        self.actual.num_locales = len(self.actual.locales)
+        return self.actual
+
+    def bloque(self, instrucciones):
+        if instrucciones is None:
+            return
+        if not isinstance(instrucciones, list):
+            instrucciones = [instrucciones]
+        for instruccion in instrucciones:
+            self.sentencia(instruccion)
+
+    def sentencia(self, nodo):
+        if es_literal(nodo):
+            return
+        if isinstance(nodo, tuple):
+            getattr(self, f"compilar_{nodo[0]}")(nodo)
+            return
+        self.con_linea(nodo)
+        self.marcar_linea()
+        clase = nodo.__class__.__name__
+        metodo = getattr(self, f"compilar_{clase}", None)
+        if metodo is not None:
+            metodo(nodo)
+        elif clase == "Identificador":
+            self.ubicar(nodo, nodo.nombre)
+        else:
+            self.expresion(nodo)
+            self.emitir(SACAR)
+
+    # Variables
+
+    def cargar(self, nodo, nombre: str):
+        profundidad, ranura = self.ubicar(nodo, nombre)
+        if profundidad == 0:
+            self.emitir(CARGAR_LOCAL, ranura)
+        else:
+            self.emitir(CARGAR_EXTERNA, externa(profundidad, ranura))
+
+    def guardar(self, profundidad: int, ranura: int):
+        if profundidad == 0:
+            self.emitir(GUARDAR_LOCAL, ranura)
+        else:
+            self.emitir(GUARDAR_EXTERNA, externa(profundidad, ranura))
+
+    # Expresiones
+
+    def expresion(self, nodo):
+        if es_literal(nodo):
+            self.emitir(CARGAR_CONST, self.constante(nodo))
+            return
+        self.con_linea(nodo)
+        clase = nodo.__class__.__name__
+        if clase == "Identificador":
+            self.cargar(nodo, nodo.nombre)
+        elif clase == "ExpresionBinaria":
+            self.binaria(nodo)
+        elif clase == "ExpresionUnaria":
+            self.expresion(nodo.expr)
+            self.emitir(OPCODES_UNARIOS[nodo.op])
+        elif clase in ("AccesoArreglo", "AccesoTabla"):
+            self.cargar(nodo, nodo.nombre)
+            self.expresion(nodo.indice if hasattr(nodo, "indice") else nodo.clave)
+            self.emitir(INDEXAR)
+        elif clase == "LlamadaFuncion":
+            self.cargar(nodo, nodo.nombre)
+            for argumento in nodo.argumentos:
+                self.expresion(argumento)
+            self.emitir(LLAMAR, len(nodo.argumentos))
+        else:
+            raise ErrorCompilacion([f"Expresión no soportada: {clase}"])
+
+    def binaria(self, nodo):
+        op = nodo.op
+        if op in ("y", "o"):
+            self.expresion(nodo.izq)
+            corto = self.emitir(Y_CORTO if op == "y" else O_CORTO)
+            self.actual.mensajes[corto] = f"Operando izquierdo de '{op}'"
+            self.expresion(nodo.der)
+            self.emitir(BOOLEANO, self.constante(f"Operando derecho de '{op}'"))
+            self.parchear(corto)
+            return
+
+        if es_literal(nodo.izq) and es_literal(nodo.der):
+            try:
+                valor = OPERACIONES_BINARIAS[op](nodo.izq, nodo.der)
+                self.emitir(CARGAR_CONST, self.constante(valor))
+                return
+            except ErrorEjecucion:
+                pass  # el error se reporta al ejecutar, con su línea
+        self.expresion(nodo.izq)
+        self.expresion(nodo.der)
+        self.emitir(OPCODES_BINARIOS[op])
+
+    def condicion(self, nodo, estructura: str, opcode: int = SALTAR_SI_FALSO) -> int:
+        """Evaluar la condición y emitir el salto condicional (a parchear)"""
+        self.expresion(nodo)
+        salto = self.emitir(opcode)
+        self.actual.mensajes[salto] = f"La condición de '{estructura}'"
+        return salto
+
+    # Declaraciones
+
+    def compilar_DeclaracionVariable(self, nodo):
+        self.expresion(nodo.valor)
+        self.emitir(GUARDAR_LOCAL, self.declarar(nodo, nodo.nombre))
+
+    def compilar_AsignacionVariable(self, nodo):
+        self.expresion(nodo.valor)
+        self.con_linea(nodo)
+        self.guardar(*self.ubicar(nodo, nodo.nombre))
+
+    def compilar_DeclaracionArreglo(self, nodo):
+        # El análisis ya tipó arreglo<entero>/<flotante>; crear_arreglo lo confirma
+        tipo = getattr(self.simbolo_de(nodo, nodo.nombre), "tipo", "")
+        numerico = tipo in ("arreglo<entero>", "arreglo<flotante>")
+        if numerico and all(es_literal(elemento) for elemento in nodo.elementos):
+            # Los arreglos no se modifican: uno de literales se arma una sola vez
+            arreglo = crear_arreglo(list(nodo.elementos))
+            if type(arreglo) is ARREGLO_NUMERICO:
+                self.emitir(CARGAR_CONST, self.constante(arreglo))
+                self.emitir(GUARDAR_LOCAL, self.declarar(nodo, nodo.nombre))
+                return
+        for elemento in nodo.elementos:
+            self.expresion(elemento)
+        self.emitir(CONSTRUIR_NUMERICO if numerico else CONSTRUIR_ARREGLO, len(nodo.elementos))
+        self.emitir(GUARDAR_LOCAL, self.declarar(nodo, nodo.nombre))
+
+    def compilar_DeclaracionTabla(self, nodo):
+        for clave, valor in nodo.pares:
+            self.emitir(CARGAR_CONST, self.constante(clave))
+            self.expresion(valor)
+        self.emitir(CONSTRUIR_TABLA, len(nodo.pares))
+        self.emitir(GUARDAR_LOCAL, self.declarar(nodo, nodo.nombre))
+
+    def compilar_DeclaracionFuncion(self, nodo):
+        ranura = self.declarar(nodo, nodo.nombre)
+        anterior_funcion, anterior_codigo = self.funcion, self.actual
+        anterior_indices, anterior_linea = self._indices_constantes, self.linea
+
+        self.funcion = ContextoFuncion(anterior_funcion.nivel + 1)
+        self.actual = self.nueva_funcion(nodo.nombre, len(nodo.parametros))
+        self.actual.pura = getattr(self.simbolo_de(nodo, nodo.nombre), "es_pura", False)
+        self._indices_constantes = {}
+        try:
+            if self.perfilar:
+                self.emitir(PERFIL_ENTRAR)
+            for parametro in nodo.parametros:
+                self.declarar(parametro, parametro.nombre)
+            self.bloque(nodo.bloque)
+            if getattr(nodo, "retorno", None) is not None:
+                self.marcar_linea(getattr(nodo.retorno, "linea", None))
+                self.expresion(nodo.retorno)
+            else:
+                self.emitir(CARGAR_CONST, self.constante(None))
+            self.retornar()
+            codigo = self.cerrar_funcion()
+        finally:
+            self.funcion, self.actual = anterior_funcion, anterior_codigo
+            self._indices_constantes, self.linea = anterior_indices, anterior_linea
+
+        self.emitir(CREAR_FUNCION, self.constante(codigo))
+        self.emitir(GUARDAR_LOCAL, ranura)
+
+    def compilar_Imprimir(self, nodo):
+        for elemento in nodo.elementos:
+            self.expresion(elemento)
+        self.con_linea(nodo)
+        self.emitir(IMPRIMIR, len(nodo.elementos))
+
+    # Estructuras de control
+
+    def compilar_EstructuraSi(self, nodo):
+        finales = []
+        salto = self.condicion(nodo.condicion, "si")
+        self.bloque(nodo.bloque)
+        siguiente = nodo.sinosis
+        while siguiente:
+            finales.append(self.emitir(SALTAR))
+            self.parchear(salto)
+            salto = None
+            if siguiente[0] == "sinosi":
+                _, condicion, bloque, siguiente = siguiente
+                salto = self.condicion(condicion, "sinosi")
+                self.bloque(bloque)
+            else:
+                self.bloque(siguiente[1])
+                siguiente = None
+        if salto is not None:
+            self.parchear(salto)
+        for direccion in finales:
+            self.parchear(direccion)
+
+    def compilar_EstructuraMientras(self, nodo):
+        inicio = self.aqui()
+        salida = self.condicion(nodo.condicion, "mientras")
+        self.bloque(nodo.bloque)
+        self.marcar_linea(nodo.linea)
+        self.emitir(SALTAR, inicio)
+        self.parchear(salida)
+
+    def compilar_EstructuraPara(self, nodo):
+        self.expresion(nodo.init.valor)
+        ranura = self.declarar(nodo.init, nodo.init.nombre)
+        self.emitir(GUARDAR_LOCAL, ranura)
+        inicio = self.aqui()
+        self.linea = nodo.linea
+        salida = self.condicion(nodo.condicion, "para")
+        self.bloque(nodo.bloque)
+        # El valor del incremento se asigna a la variable del para
+        self.linea = nodo.linea
+        self.marcar_linea()
+        self.expresion(nodo.incremento)
+        self.emitir(GUARDAR_LOCAL, ranura)
+        self.emitir(SALTAR, inicio)
+        self.parchear(salida)
+
+    def compilar_EstructuraRepetir(self, nodo):
+        inicio = self.aqui()
+        self.bloque(nodo.bloque)
+        self.linea = nodo.linea
+        self.marcar_linea()
+        salto = self.condicion(nodo.condicion, "repetir-hasta")
+        self.parchear(salto, inicio)
+
+    def compilar_para_cada(self, nodo):
+        _, variable, coleccion, bloque = nodo
+        self.con_linea(variable)
+        self.marcar_linea()
+        linea = self.linea
+        self.expresion(coleccion)
+        # Al perfilar se ejecuta el bucle normal, para contar sus líneas
+        vectorizar = self.vectorizar and not self.perfilar
+        plan = planificar_para_cada(self, variable, bloque) if vectorizar else None
+        if plan is not None:
+            self.emitir(VECTORIZAR, self.constante(plan))
+        self.emitir(ITERAR)
+        inicio = self.emitir(SIGUIENTE)
+        self.emitir(GUARDAR_LOCAL, self.declarar(variable, variable.nombre))
+        self.bloque(bloque)
+        self.marcar_linea(linea)
+        self.emitir(SALTAR, inicio)
+        self.parchear(inicio)
+        if plan is not None:
+            plan.destino = self.aqui()
+            # Instrucciones de una vuelta, para cobrarlas del presupuesto de la VM
+            plan.costo = (self.aqui() - inicio) >> 1
+
+    def compilar_EstructuraSegun(self, nodo):
+        self.expresion(nodo.expresion)
+        finales = []
+        if all(es_literal(caso.valor) for caso in nodo.casos):
+            # Casos constantes: un salto indexado por una tabla
+            tabla: Dict[Any, int] = {}
+            self.emitir(DESPACHAR, self.constante(tabla))
+            for caso in nodo.casos:
+                tabla.setdefault(clave_caso(caso.valor), self.aqui())
+                self.bloque(caso.bloque)
+                finales.append(self.emitir(SALTAR))
+            tabla[PREDETERMINADO] = self.aqui()
+            self.bloque(nodo.predeterminado)
+        else:
+            temporal = self.funcion.reservar("<segun>")
+            self.emitir(GUARDAR_LOCAL, temporal)
+            for caso in nodo.casos:
+                self.emitir(CARGAR_LOCAL, temporal)
+                self.expresion(caso.valor)
+                self.emitir(IGUAL)
+                siguiente = self.emitir(SALTAR_SI_FALSO)
+                self.bloque(caso.bloque)
+                finales.append(self.emitir(SALTAR))
+                self.parchear(siguiente)
+            self.bloque(nodo.predeterminado)
+        for direccion in finales:
+            self.parchear(direccion)
+
+    def compilar_intentar(self, nodo):
+        _, bloque, capturar, finalmente = nodo
+        _, variable, bloque_captura = capturar
+        final = finalmente[1] if finalmente else None
+
+        manejador = self.emitir(INTENTAR)
+        self.bloque(bloque)
+        self.emitir(FIN_INTENTAR)
+        tras_intento = self.emitir(SALTAR)
+
+        # capturar: la VM deja el error en la pila
+        self.parchear(manejador)
+        self.emitir(MENSAJE_ERROR)
+        self.emitir(GUARDAR_LOCAL, self.declarar(variable, variable.nombre))
+        if final is not None:
+            manejador_final = self.emitir(INTENTAR)
+        self.bloque(bloque_captura)
+        if final is None:
+            self.parchear(tras_intento)
+            return
+
+        self.emitir(FIN_INTENTAR)
+        tras_captura = self.emitir(SALTAR)
+        # Un error dentro de capturar ejecuta finalmente y se propaga
+        self.parchear(manejador_final)
+        self.bloque(final)
+        self.emitir(RELANZAR)
+
+        self.parchear(tras_intento)
+        self.parchear(tras_captura)
+        self.bloque(final)
+
+
+def compilar_bytecode(ast, codigo: str = "", perfilar: bool = False) -> CodigoFuncion:
+    """Resolver ámbitos con el analizador semántico y compilar a bytecode"""
+    return CompiladorBytecode(resolver(ast, codigo), perfilar).compilar_programa(ast)
+
+
+def compilar_codigo_bytecode(codigo: str, perfilar: bool = False) -> CodigoFuncion:
+    return compilar_bytecode(analizar_programa(codigo), codigo, perfilar)
+
+
+def describir_operando(funcion: CodigoFuncion, direccion: int) -> str:
+    opcode = funcion.codigo[direccion]
+    argumento = funcion.codigo[direccion + 1]
+    if opcode in (CARGAR_CONST, CREAR_FUNCION, BOOLEANO):
+        valor = funcion.constantes[argumento]
+        if isinstance(valor, CodigoFuncion):
+            return f"{argumento} (<codigo {valor.nombre}>)"
+        return f"{argumento} ({representar(valor)})"
+    if opcode == DESPACHAR:
+        tabla = funcion.constantes[argumento]
+        casos = ", ".join(
+            f"{representar(clave[1])} -> {destino}"
+            for clave, destino in tabla.items()
+            if clave != PREDETERMINADO
+        )
+        return f"{argumento} ({casos}; predeterminado -> {tabla.get(PREDETERMINADO)})"
+    if opcode in (CARGAR_LOCAL, GUARDAR_LOCAL):
+        return f"{argumento} ({funcion.locales[argumento]})"
+    if opcode in (CARGAR_EXTERNA, GUARDAR_EXTERNA):
+        return f"{argumento >> 16}:{argumento & 0xFFFF}"
+    if opcode in SALTOS:
+        return f"-> {argumento}"
+    if opcode in (CONSTRUIR_ARREGLO, CONSTRUIR_NUMERICO, CONSTRUIR_TABLA, IMPRIMIR, LLAMAR, PERFIL_LINEA):
+        return str(argumento)
+    if opcode == VECTORIZAR:
+        return f"{argumento} ({funcion.constantes[argumento]!r}; -> {funcion.constantes[argumento].destino})"
+    return ""
+
+
+def desensamblar(funcion: CodigoFuncion) -> str:
+    """Listado legible del bytecode de una función y de las funciones que define"""
+    lineas = [
+        f"== {funcion.nombre} (aridad {funcion.aridad}, "
+        f"locales: {', '.join(funcion.locales[1:]) or '-'}"
+        f"{', pura' if funcion.pura else ''}) =="
+    ]
+    linea_anterior = None
+    for direccion in range(0, len(funcion.codigo), 2):
+        linea = funcion.lineas[direccion // 2]
+        columna_linea = str(linea) if linea and linea != linea_anterior else ""
+        linea_anterior = linea
+        nombre = NOMBRES_OPCODES[funcion.codigo[direccion]]
+        operando = describir_operando(funcion, direccion)
+        lineas.append(f"{columna_linea:>5} {direccion:>5}  {nombre:<20} {operando}".rstrip())
+    for constante in funcion.constantes:
+        if isinstance(constante, CodigoFuncion):
+            lineas.append("")
+            lineas.append(desensamblar(constante))
+    return "\n".join(lineas)
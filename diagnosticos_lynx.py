@@ -0,0 +1,143 @@
+from typing import Dict, List, Optional, Tuple, Any
+
+# Catálogo de mensajes: el texto solo se construye al serializar
+MENSAJES: Dict[str, str] = {
+    # Errores
+    "uso_antes_de_declaracion": "Variable '{0}' usada antes de ser declarada",
+    "variable_no_declarada": "Variable '{0}' no declarada",
+    "funcion_no_declarada": "Función '{0}' no declarada",
+    "no_es_funcion": "'{0}' no es una función",
+    "suma_incompatible": "Tipos incompatibles para suma: {0} + {1}",
+    "operandos_no_numericos": "Operador '{0}' requiere operandos numéricos",
+    "operando_izquierdo_no_booleano": "Operando izquierdo de '{0}' debe ser booleano",
+    "operando_derecho_no_booleano": "Operando derecho de '{0}' debe ser booleano",
+    "negacion_no_booleana": "Operador 'no' requiere operando booleano",
+    "arreglo_no_declarado": "Arreglo '{0}' no declarado",
+    "no_es_arreglo": "'{0}' no es un arreglo",
+    "indice_no_entero": "El índice de arreglo debe ser entero",
+    "tabla_no_declarada": "Tabla '{0}' no declarada",
+    "no_es_tabla": "'{0}' no es una tabla",
+    "clave_no_cadena": "Clave de tabla debe ser cadena",
+    "variable_redeclarada": "Variable '{0}' ya declarada en este ámbito",
+    "arreglo_redeclarado": "Arreglo '{0}' ya declarado en este ámbito",
+    "tabla_redeclarada": "Tabla '{0}' ya declarada en este ámbito",
+    "funcion_redeclarada": "Función '{0}' ya declarada",
+    "condicion_no_booleana": "Condición de '{0}' debe ser booleana",
+    "error_interno": "Error interno en análisis semántico: {0}",
+    # Advertencias
+    "variable_no_utilizada": "Variable '{0}' declarada pero no utilizada",
+    "funcion_no_utilizada": "Función '{0}' declarada pero no utilizada",
+    "arreglo_tipos_mixtos": "Arreglo '{0}' contiene elementos de tipos diferentes",
+    "codigo_inalcanzable": "Código inalcanzable",
+    "posible_no_inicializada": "Variable '{0}' podría usarse sin haber sido inicializada",
+    "asignacion_muerta": "El valor asignado a '{0}' nunca se utiliza",
+}
+
+ERROR = "error"
+ADVERTENCIA = "advertencia"
+
+# Límites por defecto para que una entrada patológica no genere listas sin fin
+MAX_ERRORES_POR_DEFECTO = 100
+MAX_ADVERTENCIAS_POR_DEFECTO = 100
+
+
+class LimiteDiagnosticosAlcanzado(Exception):
+    """Se agotó el presupuesto de errores: el análisis debe detenerse"""
+
+
+class Diagnostico:
+    """Registro compacto de un diagnóstico; el mensaje se genera al renderizar"""
+
+    __slots__ = ("codigo", "linea", "columna", "args")
+
+    def __init__(
+        self,
+        codigo: str,
+        linea: Optional[int] = None,
+        columna: Optional[int] = None,
+        args: Tuple[Any, ...] = (),
+    ):
+        self.codigo = codigo
+        self.linea = linea
+        self.columna = columna
+        self.args = args
+
+    def mensaje(self) -> str:
+        return MENSAJES[self.codigo].format(*self.args)
+
+    def renderizar(self, severidad: str) -> str:
+        if severidad == ERROR:
+            prefijo = "Error semántico"
+        else:
+            prefijo = "Advertencia"
+        if self.linea:
+            return f"{prefijo} línea {self.linea}: {self.mensaje()}"
+        return f"{prefijo}: {self.mensaje()}"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "codigo": self.codigo,
+            "linea": self.linea,
+            "columna": self.columna,
+            "args": list(self.args),
+        }
+
+
+class ColectorDiagnosticos:
+    """Acumula diagnósticos sin duplicados y con límites por severidad"""
+
+    def __init__(
+        self,
+        max_errores: Optional[int] = MAX_ERRORES_POR_DEFECTO,
+        max_advertencias: Optional[int] = MAX_ADVERTENCIAS_POR_DEFECTO,
+    ):
+        self.limites: Dict[str, Optional[int]] = {
+            ERROR: max_errores,
+            ADVERTENCIA: max_advertencias,
+        }
+        self.registros: Dict[str, List[Diagnostico]] = {ERROR: [], ADVERTENCIA: []}
+        self.vistos: set = set()
+        self.truncado = False
+
+    def agregar(
+        self,
+        severidad: str,
+        codigo: str,
+        args: Tuple[Any, ...] = (),
+        linea: Optional[int] = None,
+        columna: Optional[int] = None,
+    ) -> bool:
+        """Registrar un diagnóstico; retorna False si era duplicado o se descartó"""
+        clave = (severidad, codigo, linea, columna, args)
+        if clave in self.vistos:
+            return False
+
+        registros = self.registros[severidad]
+        limite = self.limites[severidad]
+        if limite is not None and len(registros) >= limite:
+            self.truncado = True
+            if severidad == ERROR:
+                raise LimiteDiagnosticosAlcanzado()
+            return False
+
+        self.vistos.add(clave)
+        registros.append(Diagnostico(codigo, linea, columna, args))
+
+        # Agotar el presupuesto de errores detiene el análisis de inmediato
+        if severidad == ERROR and limite is not None and len(registros) >= limite:
+            self.truncado = True
+            raise LimiteDiagnosticosAlcanzado()
+        return True
+
+    def cantidad(self, severidad: str) -> int:
+        return len(self.registros[severidad])
+
+    def renderizar(self, severidad: str) -> List[str]:
+        return [diag.renderizar(severidad) for diag in self.registros[severidad]]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "errores": [diag.to_dict() for diag in self.registros[ERROR]],
+            "advertencias": [diag.to_dict() for diag in self.registros[ADVERTENCIA]],
+            "truncado": self.truncado,
+        }
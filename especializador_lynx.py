@@ -0,0 +1,458 @@
+"""Especialización de bucles calientes de la VM
+
+La VM cuenta los saltos hacia atrás de cada bucle (`mientras` y `para`).
+Cuando uno pasa de UMBRAL_CALIENTE vueltas, `especializar` traduce su región
+de bytecode a una función de Python para los tipos que tienen en ese momento
+las variables que el bucle lee (entero, flotante o booleano):
+
+- las variables del bucle son variables locales de Python y la pila de
+  operandos se vuelve expresiones, sin despacho por instrucción;
+- las operaciones se emiten ya resueltas para esos tipos (`a + b` en vez de
+  `sumar(a, b)`), porque un análisis de flujo prueba que los tipos no cambian
+  dentro del bucle;
+- al entrar, unas guardas baratas (`type(x) is int`) comprueban los tipos de
+  las variables vivas; si no se cumplen, el bucle corre por la VM como siempre.
+
+Solo se especializan bucles cuyo cuerpo usa instrucciones aritméticas, de
+comparación, de variables y de salto. Lo que podría fallar (una división por
+cero) o agotar el presupuesto de instrucciones desoptimiza: la función
+devuelve las variables a su marco y la dirección de esa instrucción, y la VM
+la ejecuta por el camino genérico, con sus errores y manejadores de siempre.
+"""
+import math
+import re
+from typing import Any, Callable, Dict, List, Tuple
+
+from bytecode_lynx import (
+    BOOLEANO, CARGAR_CONST, CARGAR_EXTERNA, CARGAR_LOCAL, DIFERENTE, DIVIDIR,
+    GUARDAR_EXTERNA, GUARDAR_LOCAL, IDENTIDAD, IGUAL, MAYOR, MAYOR_IGUAL, MENOR,
+    MENOR_IGUAL, MODULO, MULTIPLICAR, NO, O_CORTO, OPUESTO, RESTAR, SACAR,
+    SALTAR, SALTAR_SI_FALSO, SALTAR_SI_VERDADERO, SUMAR, Y_CORTO, CodigoFuncion,
+)
+
+# Vueltas de un bucle antes de intentar especializarlo
+UMBRAL_CALIENTE = 500
+# Bucles más largos que esto (en instrucciones) no se especializan
+MAX_INSTRUCCIONES = 512
+# Entradas con guardas fallidas antes de dejar el bucle en la VM para siempre
+MAX_FALLOS_GUARDA = 16
+
+ENTERO, FLOTANTE, BOOLEANO_T, VARIABLE = "i", "f", "b", "?"
+TIPOS_PYTHON = {int: ENTERO, float: FLOTANTE, bool: BOOLEANO_T}
+NOMBRES_TIPOS = {ENTERO: "int", FLOTANTE: "float", BOOLEANO_T: "bool"}
+NUMERICOS = (ENTERO, FLOTANTE)
+
+ARITMETICAS = {SUMAR: "+", RESTAR: "-", MULTIPLICAR: "*"}
+COMPARACIONES = {MENOR: "<", MAYOR: ">", MENOR_IGUAL: "<=", MAYOR_IGUAL: ">="}
+SALTOS_CONDICIONALES = (SALTAR_SI_FALSO, SALTAR_SI_VERDADERO, Y_CORTO, O_CORTO)
+SOPORTADAS = frozenset(
+    (CARGAR_CONST, CARGAR_LOCAL, GUARDAR_LOCAL, CARGAR_EXTERNA, GUARDAR_EXTERNA,
+     SACAR, DIVIDIR, MODULO, IGUAL, DIFERENTE, OPUESTO, IDENTIDAD, NO, BOOLEANO, SALTAR)
+) | set(ARITMETICAS) | set(COMPARACIONES) | set(SALTOS_CONDICIONALES)
+
+
+class NoEspecializable(Exception):
+    pass
+
+
+def _dividir_enteros(a: int, b: int) -> int:
+    # Igual que runtime_lynx.dividir: trunca hacia cero
+    cociente = abs(a) // abs(b)
+    return cociente if (a >= 0) == (b >= 0) else -cociente
+
+
+def _modulo_enteros(a: int, b: int) -> int:
+    return a - b * _dividir_enteros(a, b)
+
+
+AYUDANTES = {"_dividir": _dividir_enteros, "_modulo": _modulo_enteros, "_fmod": math.fmod}
+
+
+class BucleEspecializado:
+    """Función especializada de un bucle, con su fuente para depurar"""
+
+    __slots__ = ("ejecutar", "cabecera", "fuente", "fallos")
+
+    def __init__(self, ejecutar: Callable, cabecera: int, fuente: str):
+        # ejecutar(locales, restante) -> None si fallan las guardas, si no
+        # (dirección donde sigue la VM, pila extra, restante, desoptimizado)
+        self.ejecutar = ejecutar
+        self.cabecera = cabecera
+        self.fuente = fuente
+        self.fallos = 0
+
+
+def _variable(op: int, arg: int) -> Tuple:
+    if op in (CARGAR_LOCAL, GUARDAR_LOCAL):
+        return ("l", arg)
+    return ("e", arg >> 16, arg & 0xFFFF)
+
+
+def _nombre(variable: Tuple) -> str:
+    if variable[0] == "l":
+        return f"l{variable[1]}"
+    return f"e{variable[1]}_{variable[2]}"
+
+
+class _Region:
+    """Instrucciones de un bucle y sus sucesores dentro de él"""
+
+    def __init__(self, funcion: CodigoFuncion, cabecera: int, salto: int):
+        self.funcion = funcion
+        self.cabecera = cabecera
+        self.salto = salto
+        self.codigo = funcion.codigo
+        self.direcciones = range(cabecera, salto + 2, 2)
+        if len(self.direcciones) > MAX_INSTRUCCIONES:
+            raise NoEspecializable("bucle demasiado largo")
+        for direccion in self.direcciones:
+            op = self.codigo[direccion]
+            if op not in SOPORTADAS:
+                raise NoEspecializable(f"opcode {op}")
+            if op == CARGAR_CONST:
+                valor = funcion.constantes[self.codigo[direccion + 1]]
+                if type(valor) not in TIPOS_PYTHON:
+                    raise NoEspecializable("constante no numérica")
+
+    def dentro(self, direccion: int) -> bool:
+        return self.cabecera <= direccion <= self.salto
+
+    def sucesores(self, direccion: int) -> List[int]:
+        op = self.codigo[direccion]
+        destino = self.codigo[direccion + 1]
+        if op == SALTAR:
+            siguientes = [destino]
+        elif op in SALTOS_CONDICIONALES:
+            siguientes = [direccion + 2, destino]
+        else:
+            siguientes = [direccion + 2]
+        return [siguiente for siguiente in siguientes if self.dentro(siguiente)]
+
+    def variables(self) -> List[Tuple]:
+        encontradas = []
+        for direccion in self.direcciones:
+            op = self.codigo[direccion]
+            if op in (CARGAR_LOCAL, GUARDAR_LOCAL, CARGAR_EXTERNA, GUARDAR_EXTERNA):
+                variable = _variable(op, self.codigo[direccion + 1])
+                if variable not in encontradas:
+                    encontradas.append(variable)
+        return encontradas
+
+    def escritas(self) -> List[Tuple]:
+        return [
+            variable for variable in self.variables()
+            if any(
+                self.codigo[d] in (GUARDAR_LOCAL, GUARDAR_EXTERNA)
+                and _variable(self.codigo[d], self.codigo[d + 1]) == variable
+                for d in self.direcciones
+            )
+        ]
+
+    def vivas_al_entrar(self) -> set:
+        """Variables que el bucle puede leer antes de escribirlas"""
+        usos, definiciones = {}, {}
+        for direccion in self.direcciones:
+            op = self.codigo[direccion]
+            variable = None
+            if op in (CARGAR_LOCAL, CARGAR_EXTERNA, GUARDAR_LOCAL, GUARDAR_EXTERNA):
+                variable = _variable(op, self.codigo[direccion + 1])
+            lectura = op in (CARGAR_LOCAL, CARGAR_EXTERNA)
+            usos[direccion] = {variable} if lectura else set()
+            definiciones[direccion] = {variable} if variable is not None and not lectura else set()
+
+        vivas: Dict[int, set] = {direccion: set() for direccion in self.direcciones}
+        cambio = True
+        while cambio:
+            cambio = False
+            for direccion in reversed(self.direcciones):
+                salida = set()
+                for siguiente in self.sucesores(direccion):
+                    salida |= vivas[siguiente]
+                entrada = usos[direccion] | (salida - definiciones[direccion])
+                if entrada != vivas[direccion]:
+                    vivas[direccion] = entrada
+                    cambio = True
+        return vivas[self.cabecera]
+
+
+def _unir(a: Dict, b: Dict) -> Dict:
+    return {variable: tipo if b.get(variable) == tipo else VARIABLE for variable, tipo in a.items()}
+
+
+def _tipos(region: _Region, entrada: Dict[Tuple, str]) -> Dict[int, Tuple[tuple, Dict]]:
+    """Pila y variables (con sus tipos) antes de cada instrucción del bucle"""
+    estados: Dict[int, Tuple[tuple, Dict]] = {region.cabecera: ((), dict(entrada))}
+    pendientes = [region.cabecera]
+    codigo, constantes = region.codigo, region.funcion.constantes
+    while pendientes:
+        direccion = pendientes.pop()
+        pila, variables = estados[direccion]
+        pila, variables = list(pila), dict(variables)
+        op, arg = codigo[direccion], codigo[direccion + 1]
+
+        def sacar(*permitidos) -> str:
+            if not pila:
+                raise NoEspecializable("la pila baja de la del bucle")
+            tipo = pila.pop()
+            if tipo not in permitidos:
+                raise NoEspecializable(f"tipo {tipo} en {op}")
+            return tipo
+
+        condicional_deja = None
+        if op == CARGAR_CONST:
+            pila.append(TIPOS_PYTHON[type(constantes[arg])])
+        elif op in (CARGAR_LOCAL, CARGAR_EXTERNA):
+            tipo = variables[_variable(op, arg)]
+            if tipo == VARIABLE:
+                raise NoEspecializable("variable de tipo inestable")
+            pila.append(tipo)
+        elif op in (GUARDAR_LOCAL, GUARDAR_EXTERNA):
+            variables[_variable(op, arg)] = sacar(ENTERO, FLOTANTE, BOOLEANO_T)
+        elif op == SACAR:
+            sacar(ENTERO, FLOTANTE, BOOLEANO_T)
+        elif op in ARITMETICAS or op in (DIVIDIR, MODULO):
+            b, a = sacar(*NUMERICOS), sacar(*NUMERICOS)
+            pila.append(ENTERO if a == b == ENTERO else FLOTANTE)
+        elif op in COMPARACIONES:
+            sacar(*NUMERICOS)
+            sacar(*NUMERICOS)
+            pila.append(BOOLEANO_T)
+        elif op in (IGUAL, DIFERENTE):
+            sacar(ENTERO, FLOTANTE, BOOLEANO_T)
+            sacar(ENTERO, FLOTANTE, BOOLEANO_T)
+            pila.append(BOOLEANO_T)
+        elif op in (OPUESTO, IDENTIDAD):
+            pila.append(sacar(*NUMERICOS))
+        elif op in (NO, BOOLEANO):
+            pila.append(sacar(BOOLEANO_T))
+        elif op in (SALTAR_SI_FALSO, SALTAR_SI_VERDADERO):
+            sacar(BOOLEANO_T)
+        elif op in (Y_CORTO, O_CORTO):
+            # Al saltar deja el booleano; si no, lo saca
+            sacar(BOOLEANO_T)
+            condicional_deja = tuple(pila) + (BOOLEANO_T,)
+
+        for siguiente in region.sucesores(direccion):
+            pila_siguiente = tuple(pila)
+            if condicional_deja is not None and siguiente == arg:
+                pila_siguiente = condicional_deja
+            anterior = estados.get(siguiente)
+            if anterior is None:
+                estados[siguiente] = (pila_siguiente, variables)
+                pendientes.append(siguiente)
+                continue
+            if anterior[0] != pila_siguiente:
+                raise NoEspecializable("pilas distintas al unir caminos")
+            unidas = _unir(anterior[1], variables)
+            if unidas != anterior[1]:
+                estados[siguiente] = (pila_siguiente, unidas)
+                pendientes.append(siguiente)
+    return estados
+
+
+class _Generador:
+    def __init__(self, region: _Region, estados: Dict, escritas: List[Tuple]):
+        self.region = region
+        self.estados = estados
+        self.escritas = escritas
+        self.lineas: List[str] = []
+        # Destinos de saltos dentro del bucle: cada uno es un bloque del despacho
+        self.bloques = [region.cabecera] + sorted({
+            region.codigo[d + 1]
+            for d in region.direcciones
+            if region.codigo[d] in (SALTAR,) + SALTOS_CONDICIONALES
+            and region.dentro(region.codigo[d + 1])
+            and region.codigo[d + 1] != region.cabecera
+        })
+
+    def emitir(self, nivel: int, linea: str):
+        self.lineas.append("    " * nivel + linea)
+
+    def salir(self, nivel: int, direccion: int, pila: List[Tuple[str, str]], desoptimizado: bool):
+        for variable in self.escritas:
+            if variable[0] == "l":
+                self.emitir(nivel, f"locales[{variable[1]}] = {_nombre(variable)}")
+            else:
+                self.emitir(nivel, f"m{variable[1]}[{variable[2]}] = {_nombre(variable)}")
+        extra = ", ".join(expresion for expresion, _ in pila)
+        self.emitir(nivel, f"return ({direccion}, [{extra}], restante, {desoptimizado})")
+
+    def materializar(self, nivel: int, pila: List[Tuple[str, str]]):
+        """Dejar cada elemento de la pila en su variable s<k> (en orden creciente)"""
+        for k, (expresion, tipo) in enumerate(pila):
+            if expresion != f"s{k}":
+                self.emitir(nivel, f"s{k} = {expresion}")
+                pila[k] = (f"s{k}", tipo)
+
+    def ir_a(self, nivel: int, destino: int, pila: List[Tuple[str, str]], direccion: int):
+        if not self.region.dentro(destino):
+            self.salir(nivel, destino, pila, False)
+            return
+        self.materializar(nivel, pila)
+        if len(self.bloques) > 1:
+            self.emitir(nivel, f"b = {destino}")
+        self.emitir(nivel, "continue")
+
+    def bloque(self, nivel: int, inicio: int):
+        pila_tipos = self.estados[inicio][0]
+        pila = [(f"s{k}", tipo) for k, tipo in enumerate(pila_tipos)]
+        codigo, constantes = self.region.codigo, self.region.funcion.constantes
+        direccion = inicio
+        while True:
+            if direccion not in self.estados:
+                # Inalcanzable desde la cabecera: no se ejecuta nunca aquí
+                self.emitir(nivel, "raise AssertionError('código inalcanzable')")
+                return
+            op, arg = codigo[direccion], codigo[direccion + 1]
+            if op == CARGAR_CONST:
+                valor = constantes[arg]
+                pila.append((repr(valor), TIPOS_PYTHON[type(valor)]))
+            elif op in (CARGAR_LOCAL, CARGAR_EXTERNA):
+                variable = _variable(op, arg)
+                pila.append((_nombre(variable), self.estados[direccion][1][variable]))
+            elif op in (GUARDAR_LOCAL, GUARDAR_EXTERNA):
+                nombre = _nombre(_variable(op, arg))
+                expresion, _ = pila.pop()
+                # Lo que quede en la pila no puede ver el valor nuevo
+                patron = re.compile(rf"\b{nombre}\b")
+                if any(patron.search(e) for e, _ in pila):
+                    self.materializar(nivel, pila)
+                self.emitir(nivel, f"{nombre} = {expresion}")
+            elif op == SACAR:
+                pila.pop()
+            elif op in ARITMETICAS:
+                (b, tb), (a, ta) = pila.pop(), pila.pop()
+                tipo = ENTERO if ta == tb == ENTERO else FLOTANTE
+                pila.append((f"({a} {ARITMETICAS[op]} {b})", tipo))
+            elif op in (DIVIDIR, MODULO):
+                (b, tb), (a, ta) = pila.pop(), pila.pop()
+                pila.append(self.division(nivel, op, a, ta, b, tb, pila, direccion))
+            elif op in COMPARACIONES:
+                (b, _), (a, _) = pila.pop(), pila.pop()
+                pila.append((f"({a} {COMPARACIONES[op]} {b})", BOOLEANO_T))
+            elif op in (IGUAL, DIFERENTE):
+                (b, tb), (a, ta) = pila.pop(), pila.pop()
+                comparables = (ta in NUMERICOS and tb in NUMERICOS) or ta == tb
+                if comparables:
+                    expresion = f"({a} {'==' if op == IGUAL else '!='} {b})"
+                else:
+                    # Tipos distintos nunca son iguales (runtime_lynx.iguales)
+                    expresion = "False" if op == IGUAL else "True"
+                pila.append((expresion, BOOLEANO_T))
+            elif op == OPUESTO:
+                a, tipo = pila.pop()
+                pila.append((f"(-{a})", tipo))
+            elif op == NO:
+                a, _ = pila.pop()
+                pila.append((f"(not {a})", BOOLEANO_T))
+            elif op in (IDENTIDAD, BOOLEANO):
+                pass  # el tipo ya está garantizado
+            elif op == SALTAR:
+                if arg < direccion and not self.region.dentro(arg):
+                    # Salto hacia atrás a otro bucle: lo ejecuta (y lo cobra) la VM
+                    self.salir(nivel, direccion, pila, False)
+                    return
+                if arg < direccion:
+                    costo = (direccion + 2 - arg) >> 1
+                    self.emitir(nivel, f"if restante < {costo}:")
+                    self.salir(nivel + 1, direccion, pila, True)
+                    self.emitir(nivel, f"restante -= {costo}")
+                self.ir_a(nivel, arg, pila, direccion)
+                return
+            elif op in (SALTAR_SI_FALSO, SALTAR_SI_VERDADERO):
+                condicion, _ = pila.pop()
+                negar = "not " if op == SALTAR_SI_FALSO else ""
+                self.emitir(nivel, f"if {negar}{condicion}:")
+                self.ir_a(nivel + 1, arg, list(pila), direccion)
+            elif op in (Y_CORTO, O_CORTO):
+                condicion, _ = pila.pop()
+                negar = "not " if op == Y_CORTO else ""
+                self.emitir(nivel, f"if {negar}{condicion}:")
+                self.ir_a(nivel + 1, arg, pila + [(str(op == O_CORTO), BOOLEANO_T)], direccion)
+            direccion += 2
+            if direccion in self.bloques:
+                self.ir_a(nivel, direccion, pila, direccion)
+                return
+
+    def division(self, nivel: int, op: int, a: str, ta: str, b: str, tb: str,
+                 pila: List[Tuple[str, str]], direccion: int) -> Tuple[str, str]:
+        constante = None
+        try:
+            constante = int(b) if tb == ENTERO else float(b)
+        except ValueError:
+            pass
+        if constante is None or constante == 0:
+            # El divisor puede ser cero: la VM reporta el error con su línea
+            if not re.fullmatch(r"\w+", b):
+                self.emitir(nivel, f"d = {b}")
+                b = "d"
+            self.emitir(nivel, f"if {b} == 0:")
+            self.salir(nivel + 1, direccion, pila + [(a, ta), (b, tb)], True)
+        if ta == tb == ENTERO:
+            if constante is not None and constante > 0:
+                if not re.fullmatch(r"\w+", a):
+                    self.emitir(nivel, f"n = {a}")
+                    a = "n"
+                simbolo = "//" if op == DIVIDIR else "%"
+                return f"({a} {simbolo} {b} if {a} >= 0 else -(-{a} {simbolo} {b}))", ENTERO
+            return f"{'_dividir' if op == DIVIDIR else '_modulo'}({a}, {b})", ENTERO
+        if op == DIVIDIR:
+            return f"({a} / {b})", FLOTANTE
+        return f"_fmod({a}, {b})", FLOTANTE
+
+    def generar(self, entrada: Dict[Tuple, str], vivas: set) -> str:
+        variables = self.region.variables()
+        self.emitir(0, "def _bucle(locales, restante):")
+        profundidades = sorted({variable[1] for variable in variables if variable[0] == "e"})
+        for profundidad in range(1, max(profundidades, default=0) + 1):
+            anterior = "locales" if profundidad == 1 else f"m{profundidad - 1}"
+            self.emitir(1, f"m{profundidad} = {anterior}[0]")
+        for variable in variables:
+            marco = "locales" if variable[0] == "l" else f"m{variable[1]}"
+            self.emitir(1, f"{_nombre(variable)} = {marco}[{variable[-1]}]")
+        guardas = [
+            f"type({_nombre(variable)}) is not {NOMBRES_TIPOS[entrada[variable]]}"
+            for variable in variables if variable in vivas
+        ]
+        if guardas:
+            self.emitir(1, f"if {' or '.join(guardas)}:")
+            self.emitir(2, "return None")
+        if len(self.bloques) > 1:
+            self.emitir(1, f"b = {self.region.cabecera}")
+        self.emitir(1, "while True:")
+        if len(self.bloques) == 1:
+            self.bloque(2, self.region.cabecera)
+        else:
+            for i, inicio in enumerate(self.bloques):
+                self.emitir(2, f"{'if' if i == 0 else 'elif'} b == {inicio}:")
+                self.bloque(3, inicio)
+        return "\n".join(self.lineas) + "\n"
+
+
+def especializar(funcion: CodigoFuncion, cabecera: int, salto: int, locales: list) -> BucleEspecializado:
+    """Función especializada para el bucle [cabecera, salto] con los tipos actuales
+
+    Lanza NoEspecializable si el bucle usa algo que no se traduce o si los
+    tipos de sus variables no son estables.
+    """
+    region = _Region(funcion, cabecera, salto)
+    vivas = region.vivas_al_entrar()
+    entrada: Dict[Tuple, str] = {}
+    for variable in region.variables():
+        if variable not in vivas:
+            entrada[variable] = VARIABLE
+            continue
+        marco = locales
+        if variable[0] == "e":
+            for _ in range(variable[1]):
+                marco = marco[0]
+        tipo = TIPOS_PYTHON.get(type(marco[variable[-1]]))
+        if tipo is None:
+            raise NoEspecializable("variable viva que no es un número ni un booleano")
+        entrada[variable] = tipo
+
+    estados = _tipos(region, entrada)
+    fuente = _Generador(region, estados, region.escritas()).generar(entrada, vivas)
+    espacio: Dict[str, Any] = dict(AYUDANTES)
+    exec(compile(fuente, f"<bucle {funcion.nombre}:{cabecera}>", "exec"), espacio)
+    return BucleEspecializado(espacio["_bucle"], cabecera, fuente)
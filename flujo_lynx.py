@@ -0,0 +1,661 @@
+from collections import deque
+from typing import Any, Dict, List, Optional, Tuple
+
+# Grafo de flujo de control (CFG) sobre el AST de Lynx y un marco genérico de
+# análisis de flujo de datos. Los conjuntos de variables y de definiciones se
+# representan como enteros usados como bitsets: la unión es `|`, la
+# intersección `&` y la diferencia `a & ~b`.
+
+ADELANTE = "adelante"
+ATRAS = "atras"
+UNION = "union"
+INTERSECCION = "interseccion"
+
+_SIN_VALOR = object()
+
+
+class Variable:
+    """Variable resuelta por ámbito: cada declaración es una variable distinta"""
+
+    __slots__ = ("indice", "nombre", "linea", "columna")
+
+    def __init__(self, indice: int, nombre: str, linea: Optional[int], columna: Optional[int]):
+        self.indice = indice
+        self.nombre = nombre
+        self.linea = linea
+        self.columna = columna
+
+
+class Sentencia:
+    """Paso elemental dentro de un bloque básico"""
+
+    __slots__ = ("nodo", "linea", "usos", "definicion", "es_declaracion", "inicializa", "es_almacen")
+
+    def __init__(self, nodo, linea: Optional[int]):
+        self.nodo = nodo
+        self.linea = linea
+        self.usos = 0  # bitset de variables leídas
+        self.definicion: Optional[int] = None  # variable escrita
+        self.es_declaracion = False
+        self.inicializa = True  # False para `val x` sin valor
+        self.es_almacen = False  # asignación explícita cuyo valor puede ser inútil
+
+
+class BloqueBasico:
+    __slots__ = ("indice", "sentencias", "sucesores", "predecesores")
+
+    def __init__(self, indice: int):
+        self.indice = indice
+        self.sentencias: List[Sentencia] = []
+        self.sucesores: List[int] = []
+        self.predecesores: List[int] = []
+
+    def linea(self) -> Optional[int]:
+        for sentencia in self.sentencias:
+            if sentencia.linea:
+                return sentencia.linea
+        return None
+
+
+class GrafoFlujo:
+    def __init__(self, nombre: str = "<programa>"):
+        self.nombre = nombre
+        self.bloques: List[BloqueBasico] = []
+        self.variables: List[Variable] = []
+        self.entrada = self.nuevo_bloque().indice
+        self.salida: Optional[int] = None
+        # Variables leídas o escritas desde funciones anidadas
+        self.escapadas = 0
+        self.funciones: Dict[str, "GrafoFlujo"] = {}
+
+    def nuevo_bloque(self) -> BloqueBasico:
+        bloque = BloqueBasico(len(self.bloques))
+        self.bloques.append(bloque)
+        return bloque
+
+    def conectar(self, origen: int, destino: int):
+        if destino not in self.bloques[origen].sucesores:
+            self.bloques[origen].sucesores.append(destino)
+            self.bloques[destino].predecesores.append(origen)
+
+    def alcanzables(self) -> List[bool]:
+        visitados = [False] * len(self.bloques)
+        pila = [self.entrada]
+        visitados[self.entrada] = True
+        while pila:
+            actual = pila.pop()
+            for sucesor in self.bloques[actual].sucesores:
+                if not visitados[sucesor]:
+                    visitados[sucesor] = True
+                    pila.append(sucesor)
+        return visitados
+
+    def postorden_inverso(self) -> List[int]:
+        visitados = [False] * len(self.bloques)
+        orden: List[int] = []
+        pila: List[Tuple[int, int]] = [(self.entrada, 0)]
+        visitados[self.entrada] = True
+        while pila:
+            bloque, i = pila[-1]
+            sucesores = self.bloques[bloque].sucesores
+            if i < len(sucesores):
+                pila[-1] = (bloque, i + 1)
+                sucesor = sucesores[i]
+                if not visitados[sucesor]:
+                    visitados[sucesor] = True
+                    pila.append((sucesor, 0))
+            else:
+                orden.append(bloque)
+                pila.pop()
+        orden.reverse()
+        # Los bloques inalcanzables se agregan al final para que tengan valor
+        orden.extend(i for i in range(len(self.bloques)) if not visitados[i])
+        return orden
+
+
+def evaluar_constante(nodo) -> Any:
+    """Valor de una expresión formada solo por literales, o _SIN_VALOR"""
+    if isinstance(nodo, bool):
+        return nodo
+    if isinstance(nodo, (int, float, str)):
+        return nodo
+    clase = nodo.__class__.__name__
+    try:
+        if clase == "ExpresionBinaria":
+            izq = evaluar_constante(nodo.izq)
+            der = evaluar_constante(nodo.der)
+            if izq is _SIN_VALOR or der is _SIN_VALOR:
+                return _SIN_VALOR
+            op = nodo.op
+            if op == "y":
+                return bool(izq) and bool(der)
+            if op == "o":
+                return bool(izq) or bool(der)
+            operaciones = {
+                "+": lambda a, b: a + b,
+                "-": lambda a, b: a - b,
+                "*": lambda a, b: a * b,
+                "/": lambda a, b: a / b,
+                "%": lambda a, b: a % b,
+                "==": lambda a, b: a == b,
+                "!=": lambda a, b: a != b,
+                "<": lambda a, b: a < b,
+                ">": lambda a, b: a > b,
+                "<=": lambda a, b: a <= b,
+                ">=": lambda a, b: a >= b,
+            }
+            if op in operaciones:
+                return operaciones[op](izq, der)
+        elif clase == "ExpresionUnaria":
+            valor = evaluar_constante(nodo.expr)
+            if valor is _SIN_VALOR:
+                return _SIN_VALOR
+            if nodo.op == "-":
+                return -valor
+            if nodo.op == "+":
+                return valor
+            if nodo.op == "no":
+                return not valor
+    except (TypeError, ZeroDivisionError):
+        return _SIN_VALOR
+    return _SIN_VALOR
+
+
+class ConstructorCFG:
+    """Construye el CFG de un bloque de instrucciones resolviendo ámbitos"""
+
+    def __init__(self, grafo: GrafoFlujo, ambitos_externos: Optional[List[Dict[str, Tuple["GrafoFlujo", int]]]] = None):
+        self.grafo = grafo
+        # Cada ámbito asocia nombre -> (grafo dueño, índice de variable)
+        self.ambitos: List[Dict[str, Tuple[GrafoFlujo, int]]] = list(ambitos_externos or []) + [{}]
+        self.actual = grafo.entrada
+        # Profundidad de `intentar` abiertos: dentro, cada sentencia va en su bloque
+        self.intentos = 0
+
+    # -- Variables -----------------------------------------------------------
+
+    def declarar(self, nombre: str, linea=None, columna=None) -> int:
+        indice = len(self.grafo.variables)
+        self.grafo.variables.append(Variable(indice, nombre, linea, columna))
+        self.ambitos[-1][nombre] = (self.grafo, indice)
+        return indice
+
+    def resolver(self, nombre: str) -> Optional[int]:
+        for ambito in reversed(self.ambitos):
+            if nombre in ambito:
+                dueno, indice = ambito[nombre]
+                if dueno is self.grafo:
+                    return indice
+                # Variable de un ámbito externo usada desde una función
+                dueno.escapadas |= 1 << indice
+                return None
+        return None
+
+    def usos_de(self, nodo) -> int:
+        """Bitset de variables leídas por una expresión"""
+        usos = 0
+        pendientes = [nodo]
+        while pendientes:
+            actual = pendientes.pop()
+            if actual is None or isinstance(actual, (str, int, float, bool)):
+                continue
+            if isinstance(actual, (list, tuple)):
+                pendientes.extend(actual)
+                continue
+            clase = actual.__class__.__name__
+            if clase in ("Identificador", "AccesoArreglo", "AccesoTabla", "LlamadaFuncion"):
+                indice = self.resolver(actual.nombre)
+                if indice is not None:
+                    usos |= 1 << indice
+            if hasattr(actual, "__dict__"):
+                pendientes.extend(
+                    valor for clave, valor in actual.__dict__.items() if clave not in ("linea", "columna", "nombre")
+                )
+        return usos
+
+    # -- Bloques -------------------------------------------------------------
+
+    def agregar(self, sentencia: Sentencia):
+        # En un intento cualquier sentencia puede lanzar: el estado entre dos
+        # sentencias tiene que llegar a la captura, y eso es el fin de un bloque
+        if self.intentos and self.grafo.bloques[self.actual].sentencias:
+            self.saltar_a_nuevo()
+        self.grafo.bloques[self.actual].sentencias.append(sentencia)
+
+    def saltar_a_nuevo(self) -> int:
+        """Cerrar el bloque actual y continuar en uno nuevo"""
+        nuevo = self.grafo.nuevo_bloque().indice
+        self.grafo.conectar(self.actual, nuevo)
+        self.actual = nuevo
+        return nuevo
+
+    def construir(self, instrucciones) -> GrafoFlujo:
+        self.visitar_bloque(instrucciones)
+        salida = self.grafo.nuevo_bloque().indice
+        self.grafo.conectar(self.actual, salida)
+        self.grafo.salida = salida
+        return self.grafo
+
+    def visitar_bloque(self, instrucciones, nuevo_ambito: bool = False):
+        if nuevo_ambito:
+            self.ambitos.append({})
+        for instruccion in instrucciones or []:
+            self.visitar(instruccion)
+        if nuevo_ambito:
+            self.ambitos.pop()
+
+    def visitar(self, nodo):
+        if nodo is None:
+            return
+        if isinstance(nodo, tuple) and nodo and isinstance(nodo[0], str):
+            getattr(self, f"visitar_tupla_{nodo[0]}", self.visitar_expresion)(nodo)
+            return
+        metodo = getattr(self, f"visitar_{nodo.__class__.__name__}", self.visitar_expresion)
+        metodo(nodo)
+
+    def visitar_expresion(self, nodo, linea=None):
+        sentencia = Sentencia(nodo, linea or getattr(nodo, "linea", None))
+        sentencia.usos = self.usos_de(nodo)
+        self.agregar(sentencia)
+
+    def definir(self, nodo, nombre: str, valor, declarar: bool, linea=None, columna=None):
+        sentencia = Sentencia(nodo, linea if linea is not None else getattr(nodo, "linea", None))
+        sentencia.usos = self.usos_de(valor)
+        if declarar:
+            sentencia.definicion = self.declarar(nombre, sentencia.linea, columna)
+            sentencia.es_declaracion = True
+        else:
+            sentencia.definicion = self.resolver(nombre)
+            sentencia.es_almacen = sentencia.definicion is not None
+        self.agregar(sentencia)
+        return sentencia
+
+    def visitar_DeclaracionVariable(self, nodo):
+        sentencia = self.definir(nodo, nodo.nombre, nodo.valor, True, columna=nodo.columna)
+        sentencia.inicializa = nodo.valor is not None
+        sentencia.es_almacen = nodo.valor is not None
+
+    def visitar_AsignacionVariable(self, nodo):
+        self.definir(nodo, nodo.nombre, nodo.valor, False)
+
+    def visitar_DeclaracionArreglo(self, nodo):
+        self.definir(nodo, nodo.nombre, nodo.elementos, True, columna=nodo.columna)
+
+    def visitar_DeclaracionTabla(self, nodo):
+        self.definir(nodo, nodo.nombre, [valor for _, valor in nodo.pares], True, columna=nodo.columna)
+
+    def visitar_DeclaracionFuncion(self, nodo):
+        self.definir(nodo, nodo.nombre, None, True, columna=nodo.columna)
+        subgrafo = GrafoFlujo(nodo.nombre)
+        constructor = ConstructorCFG(subgrafo, self.ambitos)
+        for param in nodo.parametros:
+            sentencia = Sentencia(param, param.linea)
+            sentencia.definicion = constructor.declarar(param.nombre, param.linea, param.columna)
+            sentencia.es_declaracion = True
+            constructor.agregar(sentencia)
+        constructor.visitar_bloque(nodo.bloque)
+        if nodo.retorno is not None:
+            constructor.visitar_expresion(nodo.retorno, nodo.linea)
+        constructor.construir([])
+        self.grafo.funciones[nodo.nombre] = subgrafo
+
+    def condicion(self, expresion, linea) -> Any:
+        self.visitar_expresion(expresion, linea)
+        return evaluar_constante(expresion)
+
+    def visitar_EstructuraSi(self, nodo):
+        self.ramificar(nodo.condicion, nodo.bloque, nodo.sinosis, nodo.linea)
+
+    def ramificar(self, condicion, bloque, sinosis, linea):
+        valor = self.condicion(condicion, linea)
+        origen = self.actual
+        union = self.grafo.nuevo_bloque().indice
+
+        entrada_si = self.grafo.nuevo_bloque().indice
+        if valor is _SIN_VALOR or valor:
+            self.grafo.conectar(origen, entrada_si)
+        self.actual = entrada_si
+        self.visitar_bloque(bloque, nuevo_ambito=True)
+        self.grafo.conectar(self.actual, union)
+
+        entrada_sino = self.grafo.nuevo_bloque().indice
+        if valor is _SIN_VALOR or not valor:
+            self.grafo.conectar(origen, entrada_sino)
+        self.actual = entrada_sino
+        if sinosis:
+            if sinosis[0] == "sinosi":
+                _, cond, bloque_sinosi, resto = sinosis
+                self.ramificar(cond, bloque_sinosi, resto, linea)
+            else:
+                self.visitar_bloque(sinosis[1], nuevo_ambito=True)
+        self.grafo.conectar(self.actual, union)
+        self.actual = union
+
+    def bucle(self, cabecera_condicion, linea, cuerpo, incremento=None):
+        """Bucle con condición al inicio: mientras / para"""
+        cabecera = self.saltar_a_nuevo()
+        valor = self.condicion(cabecera_condicion, linea)
+        salida = self.grafo.nuevo_bloque().indice
+        cuerpo_bloque = self.grafo.nuevo_bloque().indice
+        if valor is _SIN_VALOR or valor:
+            self.grafo.conectar(cabecera, cuerpo_bloque)
+        if valor is _SIN_VALOR or not valor:
+            self.grafo.conectar(cabecera, salida)
+        self.actual = cuerpo_bloque
+        self.visitar_bloque(cuerpo, nuevo_ambito=True)
+        if incremento is not None:
+            incremento()
+        self.grafo.conectar(self.actual, cabecera)
+        self.actual = salida
+
+    def visitar_EstructuraMientras(self, nodo):
+        self.bucle(nodo.condicion, nodo.linea, nodo.bloque)
+
+    def visitar_EstructuraPara(self, nodo):
+        self.ambitos.append({})
+        self.visitar(nodo.init)
+        variable = nodo.init.nombre
+
+        def incremento():
+            # El valor del incremento se asigna a la variable del para
+            self.definir(nodo.incremento, variable, nodo.incremento, False, linea=nodo.linea)
+
+        self.bucle(nodo.condicion, nodo.linea, nodo.bloque, incremento)
+        self.ambitos.pop()
+
+    def visitar_EstructuraRepetir(self, nodo):
+        cuerpo = self.saltar_a_nuevo()
+        self.visitar_bloque(nodo.bloque, nuevo_ambito=True)
+        valor = self.condicion(nodo.condicion, nodo.linea)
+        salida = self.grafo.nuevo_bloque().indice
+        # repetir ... hasta (c): se repite mientras la condición sea falsa
+        if valor is _SIN_VALOR or not valor:
+            self.grafo.conectar(self.actual, cuerpo)
+        if valor is _SIN_VALOR or valor:
+            self.grafo.conectar(self.actual, salida)
+        self.actual = salida
+
+    def visitar_tupla_para_cada(self, nodo):
+        _, variable, coleccion, bloque = nodo
+        self.visitar_expresion(coleccion)
+        cabecera = self.saltar_a_nuevo()
+        salida = self.grafo.nuevo_bloque().indice
+        self.grafo.conectar(cabecera, salida)
+        self.actual = self.grafo.nuevo_bloque().indice
+        self.grafo.conectar(cabecera, self.actual)
+        self.ambitos.append({})
+        self.definir(variable, variable.nombre, None, True, columna=variable.columna)
+        self.visitar_bloque(bloque)
+        self.ambitos.pop()
+        self.grafo.conectar(self.actual, cabecera)
+        self.actual = salida
+
+    def visitar_EstructuraSegun(self, nodo):
+        self.visitar_expresion(nodo.expresion, nodo.linea)
+        origen = self.actual
+        union = self.grafo.nuevo_bloque().indice
+        for caso in nodo.casos:
+            self.actual = self.grafo.nuevo_bloque().indice
+            self.grafo.conectar(origen, self.actual)
+            self.visitar_expresion(caso.valor, caso.linea)
+            self.visitar_bloque(caso.bloque, nuevo_ambito=True)
+            # `parar` termina cada caso: salto a la unión
+            self.grafo.conectar(self.actual, union)
+        if nodo.predeterminado is not None:
+            self.actual = self.grafo.nuevo_bloque().indice
+            self.grafo.conectar(origen, self.actual)
+            self.visitar_bloque(nodo.predeterminado, nuevo_ambito=True)
+            self.grafo.conectar(self.actual, union)
+        else:
+            self.grafo.conectar(origen, union)
+        self.actual = union
+
+    def visitar_tupla_intentar(self, nodo):
+        _, bloque, capturar, finalmente = nodo
+        antes = self.actual
+        inicio_intento = self.saltar_a_nuevo()
+        primer_bloque = len(self.grafo.bloques) - 1
+        self.intentos += 1
+        self.visitar_bloque(bloque, nuevo_ambito=True)
+        self.intentos -= 1
+        fin_intento = self.actual
+        # La primera sentencia puede lanzar antes de cambiar nada: el estado
+        # previo al intento también llega a la captura
+        bloques_intento = [antes, inicio_intento] + list(range(primer_bloque + 1, len(self.grafo.bloques)))
+
+        union = self.grafo.nuevo_bloque().indice
+        self.grafo.conectar(fin_intento, union)
+
+        # Cualquier sentencia del intento puede lanzar una excepción
+        entrada_captura = self.grafo.nuevo_bloque().indice
+        for indice in bloques_intento:
+            self.grafo.conectar(indice, entrada_captura)
+        self.actual = entrada_captura
+        if capturar is not None:
+            _, variable, bloque_captura = capturar
+            self.ambitos.append({})
+            self.definir(variable, variable.nombre, None, True, columna=variable.columna)
+            self.visitar_bloque(bloque_captura)
+            self.ambitos.pop()
+        self.grafo.conectar(self.actual, union)
+        self.actual = union
+
+        if finalmente is not None:
+            self.visitar_bloque(finalmente[1], nuevo_ambito=True)
+
+
+def construir_cfg(ast) -> GrafoFlujo:
+    """Construir el CFG del programa y de cada función declarada"""
+    instrucciones = ast.instrucciones if hasattr(ast, "instrucciones") else ast
+    return ConstructorCFG(GrafoFlujo()).construir(instrucciones)
+
+
+# -- Marco de flujo de datos ---------------------------------------------------
+
+
+class ProblemaFlujo:
+    """Problema de flujo de datos con función de transferencia gen/kill"""
+
+    direccion = ADELANTE
+    encuentro = UNION
+
+    def __init__(self, grafo: GrafoFlujo):
+        self.grafo = grafo
+        self.universo = 0
+        self.gen: List[int] = []
+        self.kill: List[int] = []
+
+    def frontera(self) -> int:
+        """Valor en la entrada (o salida, si es hacia atrás) del grafo"""
+        return 0
+
+    def inicial(self) -> int:
+        return self.universo if self.encuentro == INTERSECCION else 0
+
+    def transferir(self, bloque: int, valor: int) -> int:
+        return self.gen[bloque] | (valor & ~self.kill[bloque])
+
+
+def resolver_flujo(problema: ProblemaFlujo) -> Tuple[List[int], List[int]]:
+    """Algoritmo de lista de trabajo; retorna (entrada, salida) por bloque"""
+    grafo = problema.grafo
+    n = len(grafo.bloques)
+    adelante = problema.direccion == ADELANTE
+    interseccion = problema.encuentro == INTERSECCION
+
+    orden = grafo.postorden_inverso()
+    if not adelante:
+        orden.reverse()
+    inicio = grafo.entrada if adelante else grafo.salida
+
+    entrada = [problema.inicial()] * n
+    salida = [problema.inicial()] * n
+    # `antes` es el valor que se combina desde los vecinos; `despues` el transferido
+    antes, despues = (entrada, salida) if adelante else (salida, entrada)
+
+    pendientes = deque(orden)
+    en_cola = [True] * n
+    while pendientes:
+        bloque = pendientes.popleft()
+        en_cola[bloque] = False
+        info = grafo.bloques[bloque]
+        vecinos = info.predecesores if adelante else info.sucesores
+
+        if bloque == inicio:
+            valor = problema.frontera()
+        elif vecinos:
+            valor = despues[vecinos[0]]
+            for vecino in vecinos[1:]:
+                valor = (valor & despues[vecino]) if interseccion else (valor | despues[vecino])
+        else:
+            valor = problema.inicial()
+        antes[bloque] = valor
+
+        nuevo = problema.transferir(bloque, valor)
+        if nuevo != despues[bloque]:
+            despues[bloque] = nuevo
+            for siguiente in info.sucesores if adelante else info.predecesores:
+                if not en_cola[siguiente]:
+                    en_cola[siguiente] = True
+                    pendientes.append(siguiente)
+    return entrada, salida
+
+
+class Vivacidad(ProblemaFlujo):
+    """Variables vivas: hacia atrás, unión; gen = usos, kill = definiciones"""
+
+    direccion = ATRAS
+    encuentro = UNION
+
+    def __init__(self, grafo: GrafoFlujo):
+        super().__init__(grafo)
+        self.universo = (1 << len(grafo.variables)) - 1
+        for bloque in grafo.bloques:
+            gen = kill = 0
+            for sentencia in reversed(bloque.sentencias):
+                if sentencia.definicion is not None:
+                    bit = 1 << sentencia.definicion
+                    gen &= ~bit
+                    kill |= bit
+                gen |= sentencia.usos
+            self.gen.append(gen)
+            self.kill.append(kill)
+
+    def frontera(self) -> int:
+        # Al salir, solo siguen vivas las variables visibles desde funciones
+        return self.grafo.escapadas
+
+
+class DefinicionesAlcanzantes(ProblemaFlujo):
+    """Definiciones alcanzantes: hacia adelante, unión sobre sitios de definición"""
+
+    direccion = ADELANTE
+    encuentro = UNION
+
+    def __init__(self, grafo: GrafoFlujo):
+        super().__init__(grafo)
+        # Cada sentencia que define una variable es un sitio de definición
+        self.sitios: List[Sentencia] = []
+        self.sitio_de: Dict[int, int] = {}
+        self.sitios_de_variable: List[int] = [0] * len(grafo.variables)
+        for bloque in grafo.bloques:
+            for sentencia in bloque.sentencias:
+                if sentencia.definicion is not None:
+                    self.sitios_de_variable[sentencia.definicion] |= 1 << len(self.sitios)
+                    self.sitio_de[id(sentencia)] = len(self.sitios)
+                    self.sitios.append(sentencia)
+        self.universo = (1 << len(self.sitios)) - 1
+
+        sitio = 0
+        for bloque in grafo.bloques:
+            gen = kill = 0
+            for sentencia in bloque.sentencias:
+                if sentencia.definicion is not None:
+                    mismos = self.sitios_de_variable[sentencia.definicion]
+                    gen = (gen & ~mismos) | (1 << sitio)
+                    kill |= mismos
+                    sitio += 1
+            self.gen.append(gen)
+            self.kill.append(kill)
+
+
+def iterar_bits(bits: int):
+    while bits:
+        bajo = bits & -bits
+        yield bajo.bit_length() - 1
+        bits ^= bajo
+
+
+class ResultadoFlujo:
+    def __init__(self):
+        # (linea,) de cada región inalcanzable
+        self.inalcanzables: List[Optional[int]] = []
+        # (nombre, linea) de lecturas posiblemente sin inicializar
+        self.no_inicializadas: List[Tuple[str, Optional[int]]] = []
+        # (nombre, linea) de asignaciones cuyo valor nunca se lee
+        self.almacenes_muertos: List[Tuple[str, Optional[int]]] = []
+
+
+def analizar_flujo(grafo: GrafoFlujo, resultado: Optional[ResultadoFlujo] = None) -> ResultadoFlujo:
+    """Detectar código inalcanzable, lecturas sin inicializar y asignaciones muertas"""
+    resultado = resultado or ResultadoFlujo()
+
+    for subgrafo in grafo.funciones.values():
+        analizar_flujo(subgrafo, resultado)
+
+    alcanzable = grafo.alcanzables()
+    for bloque in grafo.bloques:
+        if alcanzable[bloque.indice] or not bloque.sentencias:
+            continue
+        # Reportar solo el inicio de cada región inalcanzable
+        if any(not alcanzable[p] for p in bloque.predecesores):
+            continue
+        resultado.inalcanzables.append(bloque.linea())
+
+    # Lecturas con una definición "sin valor" que puede alcanzarlas
+    alcanzantes = DefinicionesAlcanzantes(grafo)
+    entrada, _ = resolver_flujo(alcanzantes)
+    sin_valor = 0
+    for i, sitio in enumerate(alcanzantes.sitios):
+        if not sitio.inicializa:
+            sin_valor |= 1 << i
+    for bloque in grafo.bloques:
+        if not alcanzable[bloque.indice]:
+            continue
+        actual = entrada[bloque.indice]
+        for sentencia in bloque.sentencias:
+            pendientes = actual & sin_valor
+            if pendientes and sentencia.usos:
+                for sitio in iterar_bits(pendientes):
+                    variable = alcanzantes.sitios[sitio].definicion
+                    if sentencia.usos >> variable & 1 and not grafo.escapadas >> variable & 1:
+                        resultado.no_inicializadas.append(
+                            (grafo.variables[variable].nombre, sentencia.linea)
+                        )
+            if sentencia.definicion is not None:
+                actual &= ~alcanzantes.sitios_de_variable[sentencia.definicion]
+                actual |= 1 << alcanzantes.sitio_de[id(sentencia)]
+
+    # Asignaciones muertas: la variable no está viva justo después
+    vivacidad = Vivacidad(grafo)
+    _, salida = resolver_flujo(vivacidad)
+    leidas = 0
+    for bloque in grafo.bloques:
+        for sentencia in bloque.sentencias:
+            leidas |= sentencia.usos
+    for bloque in grafo.bloques:
+        if not alcanzable[bloque.indice]:
+            continue
+        vivas = salida[bloque.indice]
+        for sentencia in reversed(bloque.sentencias):
+            variable = sentencia.definicion
+            if variable is not None:
+                bit = 1 << variable
+                # Las variables nunca leídas ya se reportan como no utilizadas
+                if sentencia.es_almacen and not vivas & bit and leidas & bit and not grafo.escapadas & bit:
+                    resultado.almacenes_muertos.append(
+                        (grafo.variables[variable].nombre, sentencia.linea)
+                    )
+                vivas &= ~bit
+            vivas |= sentencia.usos
+    return resultado
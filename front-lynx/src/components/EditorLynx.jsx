@@ -1,6 +1,8 @@
 import { useState, useRef, useEffect, useCallback } from 'react';
 import { Editor } from '@monaco-editor/react';
 import { AlertCircle, CheckCircle, Code, Play, FileText, Zap, TreePine, Settings, Lightbulb, Download, Upload, Copy, RotateCcw, Brain } from 'lucide-react';
+import { decodificarAst } from './astCompacto.js';
+import { SesionLynx } from './sesionLynx.js';
 
 export default function LynxEditorMejorado() {
   const [codigo, setCodigo] = useState(`// Ejemplo completo de Lynx
@@ -47,10 +49,16 @@ fun saludar(nombre) {
   const [estadoConexion, setEstadoConexion] = useState('desconocido');
   const [resultado, setResultado] = useState('');
   const [mostrarAST, setMostrarAST] = useState(false);
+  const [editorListo, setEditorListo] = useState(false);
 
   const editorRef = useRef(null);
   const monacoRef = useRef(null);
   const validationTimeoutRef = useRef(null);
+  const sesionRef = useRef(null);
+  // Identifica las peticiones de este editor: el servidor descarta las que una
+  // más nueva de la misma sesión deja obsoletas (responde 409)
+  const idEditorRef = useRef(crypto.randomUUID());
+  const validacionEnCursoRef = useRef(null);
 
   const palabrasReservadas = [
     'val', 'si', 'sino', 'sinosi', 'mientras', 'para', 'fun', 'retornar',
@@ -276,8 +284,49 @@ fun saludar(nombre) {
       }
     });
 
+    // Consultas al índice de referencias del servidor (línea base 1, columna base 0)
+    const consultarIndice = async (ruta, model, position) => {
+      try {
+        const response = await fetch(`http://localhost:8000/${ruta}`, {
+          method: 'POST',
+          headers: { 'Content-Type': 'application/json' },
+          body: JSON.stringify({
+            codigo: model.getValue(),
+            linea: position.lineNumber,
+            columna: position.column - 1,
+          }),
+        });
+        return response.ok ? await response.json() : null;
+      } catch (error) {
+        return null;
+      }
+    };
+
+    const tramoARango = (tramo) => ({
+      startLineNumber: tramo.linea,
+      startColumn: tramo.columna + 1,
+      endLineNumber: tramo.linea,
+      endColumn: tramo.columna + 1 + tramo.longitud,
+    });
+
+    monaco.languages.registerDefinitionProvider('lynx', {
+      provideDefinition: async (model, position) => {
+        const data = await consultarIndice('definicion', model, position);
+        if (!data || !data.encontrado) return null;
+        return { uri: model.uri, range: tramoARango(data.definicion) };
+      }
+    });
+
+    monaco.languages.registerReferenceProvider('lynx', {
+      provideReferences: async (model, position) => {
+        const data = await consultarIndice('referencias', model, position);
+        if (!data) return [];
+        return data.referencias.map((tramo) => ({ uri: model.uri, range: tramoARango(tramo) }));
+      }
+    });
+
     monaco.languages.registerHoverProvider('lynx', {
-      provideHover: (model, position) => {
+      provideHover: async (model, position) => {
         const word = model.getWordAtPosition(position);
         if (!word) return null;
 
@@ -288,6 +337,20 @@ fun saludar(nombre) {
           contents.push({ value: `**${wordValue}** - Palabra reservada de Lynx` });
         } else if (funcionesBuiltIn.includes(wordValue)) {
           contents.push({ value: `**${wordValue}()** - Función integrada` });
+        } else {
+          const data = await consultarIndice('hover', model, position);
+          if (data && data.encontrado) {
+            const simbolo = data.simbolo;
+            const firma = simbolo.tipo === 'funcion'
+              ? `**${simbolo.nombre}(${simbolo.parametros.join(', ')})** - Función`
+              : `**${simbolo.nombre}**: ${simbolo.tipo}`;
+            contents.push({ value: firma });
+            contents.push({ value: `Declarado en la línea ${simbolo.linea} · ${data.usos} uso(s)` });
+          }
+        }
+
+        if (contents.length > 0) {
+          return { contents };
         } else if (variablesDeclaradas.has(wordValue)) {
           contents.push({ value: `**${wordValue}** - Variable declarada` });
         } else if (funcionesDeclaradas.has(wordValue)) {
@@ -335,14 +398,65 @@ fun saludar(nombre) {
     });
   }, [variablesDeclaradas, funcionesDeclaradas]);
 
+  // Advertencias que el editor calcula por su cuenta (variables sin usar)
+  const advertenciasLocales = useCallback((codigoTexto) => {
+    const markers = [];
+    const mensajes = [];
+
+    codigoTexto.split('\n').forEach((linea, indiceLinea) => {
+      const declaracionVar = linea.match(/val\s+([a-zA-Z_][a-zA-Z0-9_]*)/);
+      if (declaracionVar) {
+        const nombreVar = declaracionVar[1];
+        const usoVar = new RegExp(`\\b${nombreVar}\\b`, 'g');
+        const usosEnCodigo = (codigoTexto.match(usoVar) || []).length;
+
+        if (usosEnCodigo <= 1) {
+          mensajes.push(`Variable '${nombreVar}' declarada pero no utilizada`);
+          markers.push({
+            severity: monacoRef.current.MarkerSeverity.Warning,
+            startLineNumber: indiceLinea + 1,
+            startColumn: 1,
+            endLineNumber: indiceLinea + 1,
+            endColumn: linea.length + 1,
+            message: `Variable '${nombreVar}' declarada pero no utilizada`,
+            source: 'lynx-analyzer'
+          });
+        }
+      }
+    });
+
+    return { markers, mensajes };
+  }, []);
+
+  const publicarMarcadores = useCallback((codigoTexto, markers) => {
+    const locales = advertenciasLocales(codigoTexto);
+    setWarnings(locales.mensajes);
+    monacoRef.current.editor.setModelMarkers(
+      editorRef.current.getModel(),
+      'lynx',
+      markers.concat(locales.markers)
+    );
+  }, [advertenciasLocales]);
+
   const validarCodigoTiempoReal = useCallback(async (codigoTexto) => {
     if (!codigoTexto.trim() || estadoConexion !== 'conectado') return;
 
+    validacionEnCursoRef.current?.abort();
+    const controlador = new AbortController();
+    validacionEnCursoRef.current = controlador;
+
     try {
-      const response = await fetch('http://localhost:8000/analizar-lexico', {
+      // Nivel rápido: solo léxico, sintaxis y resolución de ámbitos
+      const response = await fetch('http://localhost:8000/analizar-unificado', {
         method: 'POST',
         headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify({ codigo: codigoTexto }),
+        body: JSON.stringify({
+          codigo: codigoTexto,
+          nivel: 'rapido',
+          secciones: ['errores'],
+          sesion: `${idEditorRef.current}:validacion`,
+        }),
+        signal: controlador.signal,
       });
 
       if (response.ok) {
@@ -351,58 +465,67 @@ fun saludar(nombre) {
         extraerSimbolos(codigoTexto);
 
         if (editorRef.current && monacoRef.current) {
-          const markers = [];
-
-          data.errores.forEach((error, index) => {
-            markers.push({
+          const markers = data.errores.map((error) => {
+            const lineaError = Number((error.match(/línea (\d+)/) || [])[1] || 1);
+            return {
               severity: monacoRef.current.MarkerSeverity.Error,
-              startLineNumber: 1,
+              startLineNumber: lineaError,
               startColumn: 1,
-              endLineNumber: 1,
+              endLineNumber: lineaError,
               endColumn: 100,
               message: error,
-              source: 'lynx-lexer'
-            });
-          });
-
-          const lineas = codigoTexto.split('\n');
-          const warningsEncontrados = [];
-
-          lineas.forEach((linea, indiceLinea) => {
-            const declaracionVar = linea.match(/val\s+([a-zA-Z_][a-zA-Z0-9_]*)/);
-            if (declaracionVar) {
-              const nombreVar = declaracionVar[1];
-              const usoVar = new RegExp(`\\b${nombreVar}\\b`, 'g');
-              const usosEnCodigo = (codigoTexto.match(usoVar) || []).length;
-
-              if (usosEnCodigo <= 1) {
-                warningsEncontrados.push(`Variable '${nombreVar}' declarada pero no utilizada`);
-                markers.push({
-                  severity: monacoRef.current.MarkerSeverity.Warning,
-                  startLineNumber: indiceLinea + 1,
-                  startColumn: 1,
-                  endLineNumber: indiceLinea + 1,
-                  endColumn: linea.length + 1,
-                  message: `Variable '${nombreVar}' declarada pero no utilizada`,
-                  source: 'lynx-analyzer'
-                });
-              }
-            }
+              source: 'lynx-analyzer'
+            };
           });
-
-          setWarnings(warningsEncontrados);
-
-          monacoRef.current.editor.setModelMarkers(
-            editorRef.current.getModel(),
-            'lynx',
-            markers
-          );
+          publicarMarcadores(codigoTexto, markers);
         }
       }
     } catch (error) {
-      console.error('Error en validación tiempo real:', error);
+      if (error.name !== 'AbortError') {
+        console.error('Error en validación tiempo real:', error);
+      }
     }
-  }, [estadoConexion, extraerSimbolos]);
+  }, [estadoConexion, extraerSimbolos, publicarMarcadores]);
+
+  // Con la sesión abierta, cada cambio viaja como delta por /ws/sesion y
+  // vuelven solo los marcadores que cambiaron; sin ella, POST cada 800 ms
+  useEffect(() => {
+    if (!editorListo || !validacionTiempoReal || estadoConexion !== 'conectado') return;
+
+    const editor = editorRef.current;
+    const sesion = new SesionLynx(
+      'ws://localhost:8000/ws/sesion',
+      () => ({ codigo: editor.getValue(), version: editor.getModel().getVersionId() }),
+      (marcadores) => {
+        const codigoTexto = editor.getValue();
+        extraerSimbolos(codigoTexto);
+        publicarMarcadores(codigoTexto, marcadores.map((marcador) => {
+          const linea = Math.min(marcador.linea || 1, editor.getModel().getLineCount());
+          return {
+            severity: marcador.severidad === 'error'
+              ? monacoRef.current.MarkerSeverity.Error
+              : monacoRef.current.MarkerSeverity.Warning,
+            startLineNumber: linea,
+            startColumn: marcador.columna != null ? marcador.columna + 1 : 1,
+            endLineNumber: linea,
+            endColumn: editor.getModel().getLineMaxColumn(linea),
+            message: marcador.mensaje,
+            source: 'lynx-analyzer'
+          };
+        }));
+      }
+    );
+    const suscripcion = editor.onDidChangeModelContent((evento) => {
+      sesion.enviarCambios(evento.changes, editor.getModel().getVersionId());
+    });
+    sesionRef.current = sesion;
+
+    return () => {
+      suscripcion.dispose();
+      sesion.cerrar();
+      sesionRef.current = null;
+    };
+  }, [editorListo, validacionTiempoReal, estadoConexion, extraerSimbolos, publicarMarcadores]);
 
   useEffect(() => {
     if (validacionTiempoReal && codigo.trim()) {
@@ -411,7 +534,9 @@ fun saludar(nombre) {
       }
 
       validationTimeoutRef.current = setTimeout(() => {
-        validarCodigoTiempoReal(codigo);
+        if (!sesionRef.current?.activa) {
+          validarCodigoTiempoReal(codigo);
+        }
       }, 800);
     }
 
@@ -434,28 +559,36 @@ fun saludar(nombre) {
     }
 
     setCargando(true);
-    let url;
-    switch (tipo) {
-      case 'lexico':
-        url = 'http://localhost:8000/analizar-lexico';
-        break;
-      case 'sintactico':
-        url = 'http://localhost:8000/analizar-sintactico';
-        break;
-      case 'semantico':
-        url = 'http://localhost:8000/analizar-semantico';
-        break;
-      default:
-        url = 'http://localhost:8000/analizar';
-    }
+    // Una sola pasada en el servidor; cada vista pide solo lo que muestra
+    const seccionesPorTipo = {
+      lexico: ['tokens'],
+      sintactico: ['ast'],
+      semantico: ['errores'],
+      completo: ['tokens', 'ast', 'errores'],
+    };
+    const secciones = seccionesPorTipo[tipo] || seccionesPorTipo.completo;
 
     try {
-      const response = await fetch(url, {
+      // El AST llega en el formato compacto y se decodifica aquí
+      const response = await fetch('http://localhost:8000/analizar-unificado?version_ast=2', {
         method: 'POST',
         headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify({ codigo }),
+        body: JSON.stringify({ codigo, nivel: 'completo', secciones, sesion: `${idEditorRef.current}:analisis` }),
       });
 
+      // Otro análisis pedido después reemplazó a este
+      if (response.status === 409) return;
+
+      // Código fuera de los límites del servidor o servidor saturado: el
+      // motivo (`detail`) va a la lista de errores
+      if ([413, 422, 429, 503].includes(response.status)) {
+        const { detail } = await response.json();
+        const reintentar = response.headers.get('Retry-After');
+        const motivo = typeof detail === 'string' ? detail : JSON.stringify(detail);
+        setErrores([reintentar ? `${motivo} (intente de nuevo en ${reintentar} s)` : motivo]);
+        return;
+      }
+
       if (!response.ok) {
         throw new Error(`Error HTTP: ${response.status}`);
       }
@@ -467,7 +600,7 @@ fun saludar(nombre) {
       } else {
         setTokens(data.tokens || []);
         setErrores(data.errores || []);
-        setAst(data.ast || null);
+        setAst(decodificarAst(data.ast) || null);
       }
 
     } catch (error) {
@@ -616,6 +749,7 @@ fun saludar(nombre) {
     monacoRef.current = monaco;
     configurarLynxAvanzado(monaco);
     extraerSimbolos(codigo);
+    setEditorListo(true);
   };
 
   const getEstadoConexionStyle = () => {
@@ -0,0 +1,50 @@
+// Decodificador del AST compacto (versión 2) que el backend devuelve con
+// `?version_ast=2` o `Accept: application/vnd.lynx.ast.v2+json`.
+//
+// Un nodo es [tipo, linea, columna, ...campos]: `tipos[tipo]` es su clase y
+// `campos[tipo]` los nombres de sus campos. Las cadenas son un índice en
+// `cadenas`; null, true y false van tal cual; el resto son arreglos con una
+// etiqueta negativa al principio. `decodificarAst` lo devuelve en la forma de
+// siempre (la de ast_to_dict), que es la que dibuja el editor.
+
+const LISTA = -1;
+const TUPLA = -2;
+const ENTERO = -3;
+const FLOTANTE = -4;
+const OTRO = -5;
+
+export function decodificarAst(ast) {
+  if (!ast || ast.version !== 2) return ast;
+  const { tipos, campos, cadenas } = ast;
+
+  const valor = (contenido) => {
+    if (contenido === null) return null;
+    if (typeof contenido === 'boolean') return { valor: contenido, tipo_primitivo: 'bool' };
+    if (typeof contenido === 'number') return { valor: cadenas[contenido], tipo_primitivo: 'str' };
+
+    const etiqueta = contenido[0];
+    switch (etiqueta) {
+      case LISTA:
+        return { tipo: 'lista', elementos: contenido.slice(1).map(valor) };
+      case TUPLA:
+        return { tipo: 'tupla', elementos: contenido.slice(1).map(valor) };
+      case ENTERO:
+        return { valor: contenido[1], tipo_primitivo: 'int' };
+      case FLOTANTE:
+        return { valor: contenido[1], tipo_primitivo: 'float' };
+      case OTRO:
+        return { valor: cadenas[contenido[1]], tipo_primitivo: 'string' };
+      default: {
+        const nodo = { tipo: tipos[etiqueta], linea: contenido[1] };
+        if (contenido[2] !== null) nodo.columna = contenido[2];
+        const nombres = campos[etiqueta];
+        for (let i = 0; i < nombres.length; i++) {
+          nodo[nombres[i]] = valor(contenido[3 + i]);
+        }
+        return nodo;
+      }
+    }
+  };
+
+  return valor(ast.raiz);
+}
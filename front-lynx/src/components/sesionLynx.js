@@ -0,0 +1,70 @@
+// Cliente de /ws/sesion (validación en vivo): manda los cambios de Monaco tal
+// como llegan en onDidChangeModelContent y recibe solo los marcadores que
+// aparecieron y los que desaparecieron. El protocolo está en sesiones_lynx.py.
+//
+// `obtenerModelo()` devuelve { codigo, version } del editor: se manda completo
+// al conectar y cuando el servidor pide `reiniciar` (sesión expulsada o
+// desincronizada). `alCambiarMarcadores(marcadores)` recibe la lista completa
+// cada vez que cambia. Si la conexión se cierra, `activa` queda en false y el
+// editor vuelve a validar con POST.
+
+export class SesionLynx {
+  constructor(url, obtenerModelo, alCambiarMarcadores, nivel = 'rapido') {
+    this.obtenerModelo = obtenerModelo;
+    this.alCambiarMarcadores = alCambiarMarcadores;
+    this.nivel = nivel;
+    this.marcadores = new Map();
+    this.activa = false;
+
+    this.socket = new WebSocket(url);
+    this.socket.onopen = () => {
+      this.activa = true;
+      this.abrir();
+    };
+    this.socket.onclose = () => {
+      this.activa = false;
+    };
+    this.socket.onmessage = (evento) => this.recibir(JSON.parse(evento.data));
+  }
+
+  abrir() {
+    const { codigo, version } = this.obtenerModelo();
+    this.marcadores.clear();
+    this.enviar({ tipo: 'abrir', codigo, version, nivel: this.nivel });
+  }
+
+  enviarCambios(cambios, version) {
+    if (!this.activa) return;
+    this.enviar({
+      tipo: 'cambios',
+      version,
+      cambios: cambios.map(({ rangeOffset, rangeLength, text }) => ({ rangeOffset, rangeLength, text })),
+    });
+  }
+
+  enviar(mensaje) {
+    if (this.socket.readyState === WebSocket.OPEN) {
+      this.socket.send(JSON.stringify(mensaje));
+    }
+  }
+
+  recibir(mensaje) {
+    switch (mensaje.tipo) {
+      case 'diagnosticos':
+        mensaje.eliminados.forEach((id) => this.marcadores.delete(id));
+        mensaje.agregados.forEach((marcador) => this.marcadores.set(marcador.id, marcador));
+        this.alCambiarMarcadores(Array.from(this.marcadores.values()));
+        break;
+      case 'reiniciar':
+        this.abrir();
+        break;
+      default:
+        console.error('Sesión de validación:', mensaje.mensaje);
+    }
+  }
+
+  cerrar() {
+    this.activa = false;
+    this.socket.close();
+  }
+}
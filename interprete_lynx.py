@@ -0,0 +1,772 @@
+import operator
+import sys
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypedDict
+
+from parser_lynx import analizar_sintactico
+from semantic_lynx import AnalizadorSemantico
+from runtime_lynx import (
+    OPERACIONES_BINARIAS,
+    OPERACIONES_UNARIAS,
+    ErrorEjecucion,
+    a_cadena,
+    booleano,
+    iguales,
+    indexar,
+    iterar,
+    plano,
+    tipo_de,
+    verificar_aridad,
+)
+
+# Compilador del AST a clausuras anidadas. Cada nodo se traduce una sola vez
+# a una función de Python que recibe el marco de ejecución; las variables se
+# resuelven en compilación a (profundidad, ranura) con la información de
+# ámbitos que produce AnalizadorSemantico.
+#
+# Un marco es una lista: la ranura 0 guarda el marco de la función que
+# encierra a la actual (None en el programa principal) y el resto son las
+# variables locales, con los parámetros primero.
+
+# Operadores con atajo para dos enteros; el resto pasa siempre por runtime_lynx
+OPERADORES_ENTEROS: Dict[str, Callable[[Any, Any], Any]] = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    ">": operator.gt,
+    "<=": operator.le,
+    ">=": operator.ge,
+}
+
+Clausura = Callable[[list], Any]
+
+
+class ErrorCompilacion(Exception):
+    """El programa no se puede compilar: errores de sintaxis o de resolución"""
+
+    def __init__(self, errores: List[str]):
+        super().__init__("\n".join(errores))
+        self.errores = errores
+
+
+class ResultadoEjecucion(TypedDict):
+    salida: List[str]
+    errores: List[str]
+
+
+class Funcion:
+    """Valor de función en ejecución: código compilado más su entorno"""
+
+    __slots__ = ("nombre", "aridad", "tamano_marco", "cuerpo", "retorno", "entorno")
+
+    def __init__(self, nombre, aridad, tamano_marco, cuerpo, retorno, entorno):
+        self.nombre = nombre
+        self.aridad = aridad
+        self.tamano_marco = tamano_marco
+        self.cuerpo = cuerpo
+        self.retorno = retorno
+        self.entorno = entorno
+
+
+class Salida:
+    """Destino de `imprimir`; se fija en cada ejecución"""
+
+    def __init__(self):
+        self.escribir: Callable[[str], Any] = print
+
+
+class ContextoFuncion:
+    """Ranuras de la función que se está compilando"""
+
+    def __init__(self, nivel: int):
+        self.nivel = nivel
+        self.tamano = 1  # la ranura 0 es el marco del entorno
+        self.nombres: List[str] = ["<entorno>"]
+
+    def reservar(self, nombre: str = "") -> int:
+        ranura = self.tamano
+        self.tamano += 1
+        self.nombres.append(nombre)
+        return ranura
+
+
+class ProgramaCompilado:
+    def __init__(self, cuerpo: Optional[Clausura], tamano_marco: int, salida: Salida):
+        self.cuerpo = cuerpo
+        self.tamano_marco = tamano_marco
+        self.salida = salida
+
+    def ejecutar(self, escribir: Optional[Callable[[str], Any]] = None):
+        """Ejecutar el programa; `escribir` recibe cada línea de `imprimir`"""
+        self.salida.escribir = escribir or print
+        marco = [None] * self.tamano_marco
+        if self.cuerpo is None:
+            return
+        try:
+            self.cuerpo(marco)
+        except RecursionError:
+            raise ErrorEjecucion("Recursión demasiado profunda")
+
+
+def es_literal(nodo) -> bool:
+    return nodo is None or isinstance(nodo, (str, int, float, bool))
+
+
+def constante(valor) -> Clausura:
+    return lambda marco: valor
+
+
+class ResolucionRanuras:
+    """Asignación de ranuras a los símbolos resueltos por el analizador semántico"""
+
+    def __init__(self, resoluciones: Dict[int, Any]):
+        self.resoluciones = resoluciones
+        # id(simbolo) -> (nivel de la función dueña, ranura)
+        self.ubicaciones: Dict[int, Tuple[int, int]] = {}
+        self.funcion = ContextoFuncion(0)
+
+    def simbolo_de(self, nodo, nombre: str):
+        simbolo = self.resoluciones.get(id(nodo))
+        if simbolo is None:
+            linea = getattr(nodo, "linea", None)
+            raise ErrorCompilacion([f"No se pudo resolver '{nombre}' (línea {linea})"])
+        return simbolo
+
+    def declarar(self, nodo, nombre: str) -> int:
+        """Reservar una ranura local para el símbolo que declara `nodo`"""
+        simbolo = self.simbolo_de(nodo, nombre)
+        ranura = self.funcion.reservar(nombre)
+        self.ubicaciones[id(simbolo)] = (self.funcion.nivel, ranura)
+        return ranura
+
+    def ubicar(self, nodo, nombre: str) -> Tuple[int, int]:
+        """(profundidad, ranura) del símbolo al que se refiere `nodo`"""
+        simbolo = self.simbolo_de(nodo, nombre)
+        ubicacion = self.ubicaciones.get(id(simbolo))
+        if ubicacion is None:
+            raise ErrorCompilacion(
+                [f"'{nombre}' se usa antes de su declaración (línea {getattr(nodo, 'linea', None)})"]
+            )
+        nivel, ranura = ubicacion
+        return self.funcion.nivel - nivel, ranura
+
+
+class CompiladorClausuras(ResolucionRanuras):
+    def __init__(self, resoluciones: Dict[int, Any]):
+        super().__init__(resoluciones)
+        self.salida = Salida()
+
+    def cargar(self, nodo, nombre: str) -> Clausura:
+        profundidad, ranura = self.ubicar(nodo, nombre)
+        if profundidad == 0:
+            return operator.itemgetter(ranura)
+        if profundidad == 1:
+            return lambda marco: marco[0][ranura]
+
+        def cargar_lejana(marco):
+            for _ in range(profundidad):
+                marco = marco[0]
+            return marco[ranura]
+
+        return cargar_lejana
+
+    # Programa y bloques
+
+    def compilar_programa(self, ast) -> ProgramaCompilado:
+        cuerpo = self.bloque(ast or [])
+        return ProgramaCompilado(cuerpo, self.funcion.tamano, self.salida)
+
+    def bloque(self, instrucciones) -> Optional[Clausura]:
+        if instrucciones is None:
+            return None
+        if not isinstance(instrucciones, list):
+            instrucciones = [instrucciones]
+        sentencias = tuple(
+            s for s in (self.sentencia(i) for i in instrucciones) if s is not None
+        )
+        if not sentencias:
+            return None
+        if len(sentencias) == 1:
+            return sentencias[0]
+        if len(sentencias) == 2:
+            primera, segunda = sentencias
+
+            def bloque_doble(marco):
+                primera(marco)
+                segunda(marco)
+
+            return bloque_doble
+
+        def bloque(marco):
+            for sentencia in sentencias:
+                sentencia(marco)
+
+        return bloque
+
+    def sentencia(self, nodo) -> Optional[Clausura]:
+        if es_literal(nodo):
+            return None
+        if isinstance(nodo, tuple):
+            return getattr(self, f"compilar_{nodo[0]}")(nodo)
+        clase = nodo.__class__.__name__
+        metodo = getattr(self, f"compilar_{clase}", None)
+        if metodo is not None:
+            return metodo(nodo)
+        if clase == "Identificador":
+            # Sin efectos: solo se valida que esté declarado
+            self.ubicar(nodo, nodo.nombre)
+            return None
+        return self.sentencia_expresion(nodo)
+
+    def sentencia_expresion(self, nodo) -> Clausura:
+        evaluar = self.expresion(nodo)
+        linea = getattr(nodo, "linea", None)
+
+        def sentencia_expresion(marco):
+            try:
+                evaluar(marco)
+            except ErrorEjecucion as error:
+                error.ubicar(linea)
+                raise
+
+        return sentencia_expresion
+
+    # Expresiones
+
+    def expresion(self, nodo) -> Clausura:
+        if es_literal(nodo):
+            return constante(nodo)
+        clase = nodo.__class__.__name__
+        if clase == "Identificador":
+            return self.cargar(nodo, nodo.nombre)
+        if clase == "ExpresionBinaria":
+            return self.binaria(nodo)
+        if clase == "ExpresionUnaria":
+            return self.unaria(nodo)
+        if clase in ("AccesoArreglo", "AccesoTabla"):
+            return self.acceso(nodo)
+        if clase == "LlamadaFuncion":
+            return self.llamada(nodo)
+        raise ErrorCompilacion([f"Expresión no soportada: {clase}"])
+
+    def binaria(self, nodo) -> Clausura:
+        op = nodo.op
+        if op in ("y", "o"):
+            return self.logica(nodo)
+
+        lento = OPERACIONES_BINARIAS[op]
+        if es_literal(nodo.izq) and es_literal(nodo.der):
+            try:
+                return constante(lento(nodo.izq, nodo.der))
+            except ErrorEjecucion:
+                pass  # el error se reporta al ejecutar, con su línea
+
+        izq = self.expresion(nodo.izq)
+        der = self.expresion(nodo.der)
+        rapido = OPERADORES_ENTEROS.get(op)
+        if rapido is None:
+            return lambda marco: lento(izq(marco), der(marco))
+
+        if type(nodo.der) is int:
+            # Caso típico de los bucles: `i < 10`, `i + 1`
+            c = nodo.der
+
+            def binaria_constante(marco):
+                a = izq(marco)
+                if type(a) is int:
+                    return rapido(a, c)
+                return lento(a, c)
+
+            return binaria_constante
+
+        def binaria(marco):
+            a = izq(marco)
+            b = der(marco)
+            if type(a) is int and type(b) is int:
+                return rapido(a, b)
+            return lento(a, b)
+
+        return binaria
+
+    def logica(self, nodo) -> Clausura:
+        izq = self.expresion(nodo.izq)
+        der = self.expresion(nodo.der)
+        op = nodo.op
+        izquierdo = f"Operando izquierdo de '{op}'"
+        derecho = f"Operando derecho de '{op}'"
+
+        if op == "y":
+            def conjuncion(marco):
+                a = izq(marco)
+                if a is not True and not booleano(a, izquierdo):
+                    return False
+                b = der(marco)
+                return b if b is True or b is False else booleano(b, derecho)
+
+            return conjuncion
+
+        def disyuncion(marco):
+            a = izq(marco)
+            if a is True or booleano(a, izquierdo):
+                return True
+            b = der(marco)
+            return b if b is True or b is False else booleano(b, derecho)
+
+        return disyuncion
+
+    def unaria(self, nodo) -> Clausura:
+        operacion = OPERACIONES_UNARIAS[nodo.op]
+        operando = self.expresion(nodo.expr)
+        if nodo.op == "no":
+            def negacion(marco):
+                valor = operando(marco)
+                if valor is True:
+                    return False
+                if valor is False:
+                    return True
+                return operacion(valor)
+
+            return negacion
+        return lambda marco: operacion(operando(marco))
+
+    def acceso(self, nodo) -> Clausura:
+        contenedor = self.cargar(nodo, nodo.nombre)
+        clave = nodo.indice if hasattr(nodo, "indice") else nodo.clave
+        if es_literal(clave):
+            return lambda marco: indexar(contenedor(marco), clave)
+        indice = self.expresion(clave)
+        return lambda marco: indexar(contenedor(marco), indice(marco))
+
+    def llamada(self, nodo) -> Clausura:
+        nombre = nodo.nombre
+        funcion = self.cargar(nodo, nombre)
+        argumentos = tuple(self.expresion(arg) for arg in nodo.argumentos)
+        cantidad = len(argumentos)
+
+        def llamada(marco):
+            f = funcion(marco)
+            if type(f) is not Funcion:
+                raise ErrorEjecucion(f"'{nombre}' no es una función ({tipo_de(f)})")
+            if f.aridad != cantidad:
+                verificar_aridad(nombre, f.aridad, cantidad)
+            nuevo = [None] * f.tamano_marco
+            nuevo[0] = f.entorno
+            i = 1
+            for argumento in argumentos:
+                nuevo[i] = argumento(marco)
+                i += 1
+            if f.cuerpo is not None:
+                f.cuerpo(nuevo)
+            if f.retorno is not None:
+                return f.retorno(nuevo)
+            return None
+
+        return llamada
+
+    def condicion(self, nodo, estructura: str) -> Tuple[Clausura, str]:
+        """Clausura de la condición y el mensaje si no resulta booleana"""
+        return self.expresion(nodo), f"La condición de '{estructura}'"
+
+    # Declaraciones y asignaciones
+
+    def compilar_DeclaracionVariable(self, nodo) -> Clausura:
+        valor = self.expresion(nodo.valor)
+        ranura = self.declarar(nodo, nodo.nombre)
+        linea = nodo.linea
+        if es_literal(nodo.valor):
+            c = nodo.valor
+
+            def declarar_constante(marco):
+                marco[ranura] = c
+
+            return declarar_constante
+
+        def declarar(marco):
+            try:
+                marco[ranura] = valor(marco)
+            except ErrorEjecucion as error:
+                error.ubicar(linea)
+                raise
+
+        return declarar
+
+    def compilar_AsignacionVariable(self, nodo) -> Clausura:
+        valor = self.expresion(nodo.valor)
+        profundidad, ranura = self.ubicar(nodo, nodo.nombre)
+        linea = nodo.linea
+        if profundidad == 0:
+            def asignar(marco):
+                try:
+                    marco[ranura] = valor(marco)
+                except ErrorEjecucion as error:
+                    error.ubicar(linea)
+                    raise
+
+            return asignar
+
+        def asignar_externa(marco):
+            try:
+                resultado = valor(marco)
+            except ErrorEjecucion as error:
+                error.ubicar(linea)
+                raise
+            destino = marco
+            for _ in range(profundidad):
+                destino = destino[0]
+            destino[ranura] = resultado
+
+        return asignar_externa
+
+    def compilar_DeclaracionArreglo(self, nodo) -> Clausura:
+        elementos = nodo.elementos
+        linea = nodo.linea
+        if all(es_literal(e) for e in elementos):
+            # Los arreglos no se modifican en Lynx: se puede compartir la lista
+            valor = list(elementos)
+            ranura = self.declarar(nodo, nodo.nombre)
+
+            def declarar_arreglo_constante(marco):
+                marco[ranura] = valor
+
+            return declarar_arreglo_constante
+
+        evaluadores = tuple(self.expresion(e) for e in elementos)
+        ranura = self.declarar(nodo, nodo.nombre)
+
+        def declarar_arreglo(marco):
+            try:
+                marco[ranura] = [evaluar(marco) for evaluar in evaluadores]
+            except ErrorEjecucion as error:
+                error.ubicar(linea)
+                raise
+
+        return declarar_arreglo
+
+    def compilar_DeclaracionTabla(self, nodo) -> Clausura:
+        pares = tuple((clave, self.expresion(valor)) for clave, valor in nodo.pares)
+        ranura = self.declarar(nodo, nodo.nombre)
+        linea = nodo.linea
+
+        def declarar_tabla(marco):
+            try:
+                marco[ranura] = {clave: evaluar(marco) for clave, evaluar in pares}
+            except ErrorEjecucion as error:
+                error.ubicar(linea)
+                raise
+
+        return declarar_tabla
+
+    def compilar_DeclaracionFuncion(self, nodo) -> Clausura:
+        ranura = self.declarar(nodo, nodo.nombre)
+        anterior = self.funcion
+        contexto = ContextoFuncion(anterior.nivel + 1)
+        self.funcion = contexto
+        try:
+            for parametro in nodo.parametros:
+                self.declarar(parametro, parametro.nombre)
+            cuerpo = self.bloque(nodo.bloque)
+            retorno = None
+            if getattr(nodo, "retorno", None) is not None:
+                retorno = self.expresion(nodo.retorno)
+                linea_retorno = getattr(nodo.retorno, "linea", None) or nodo.linea
+                retorno = self.ubicado(retorno, linea_retorno)
+        finally:
+            self.funcion = anterior
+
+        nombre = nodo.nombre
+        aridad = len(nodo.parametros)
+        tamano = contexto.tamano
+
+        def declarar_funcion(marco):
+            marco[ranura] = Funcion(nombre, aridad, tamano, cuerpo, retorno, marco)
+
+        return declarar_funcion
+
+    def ubicado(self, evaluar: Clausura, linea) -> Clausura:
+        def ubicado(marco):
+            try:
+                return evaluar(marco)
+            except ErrorEjecucion as error:
+                error.ubicar(linea)
+                raise
+
+        return ubicado
+
+    def compilar_Imprimir(self, nodo) -> Clausura:
+        evaluadores = tuple(self.expresion(e) for e in nodo.elementos)
+        salida = self.salida
+        linea = nodo.linea
+        if len(evaluadores) == 1:
+            unico = evaluadores[0]
+
+            def imprimir_uno(marco):
+                try:
+                    texto = a_cadena(unico(marco))
+                except ErrorEjecucion as error:
+                    error.ubicar(linea)
+                    raise
+                salida.escribir(texto)
+
+            return imprimir_uno
+
+        def imprimir(marco):
+            try:
+                texto = " ".join([a_cadena(evaluar(marco)) for evaluar in evaluadores])
+            except ErrorEjecucion as error:
+                error.ubicar(linea)
+                raise
+            salida.escribir(texto)
+
+        return imprimir
+
+    # Estructuras de control
+
+    def compilar_EstructuraSi(self, nodo) -> Clausura:
+        ramas = [(self.condicion(nodo.condicion, "si"), self.bloque(nodo.bloque))]
+        sino = None
+        siguiente = nodo.sinosis
+        while siguiente:
+            if siguiente[0] == "sinosi":
+                _, condicion, bloque, siguiente = siguiente
+                ramas.append((self.condicion(condicion, "sinosi"), self.bloque(bloque)))
+            else:
+                sino = self.bloque(siguiente[1])
+                siguiente = None
+        ramas = tuple((evaluar, mensaje, bloque) for (evaluar, mensaje), bloque in ramas)
+        linea = nodo.linea
+
+        def si(marco):
+            try:
+                for evaluar, mensaje, bloque in ramas:
+                    c = evaluar(marco)
+                    if c is True:
+                        if bloque is not None:
+                            bloque(marco)
+                        return
+                    if c is not False:
+                        booleano(c, mensaje)
+                if sino is not None:
+                    sino(marco)
+            except ErrorEjecucion as error:
+                error.ubicar(linea)
+                raise
+
+        return si
+
+    def compilar_EstructuraMientras(self, nodo) -> Clausura:
+        condicion, mensaje = self.condicion(nodo.condicion, "mientras")
+        cuerpo = self.bloque(nodo.bloque) or (lambda marco: None)
+        linea = nodo.linea
+
+        def mientras(marco):
+            try:
+                while True:
+                    c = condicion(marco)
+                    if c is not True:
+                        if c is False:
+                            break
+                        booleano(c, mensaje)
+                    cuerpo(marco)
+            except ErrorEjecucion as error:
+                error.ubicar(linea)
+                raise
+
+        return mientras
+
+    def compilar_EstructuraPara(self, nodo) -> Clausura:
+        inicial = self.expresion(nodo.init.valor)
+        ranura = self.declarar(nodo.init, nodo.init.nombre)
+        condicion, mensaje = self.condicion(nodo.condicion, "para")
+        incremento = self.expresion(nodo.incremento)
+        cuerpo = self.bloque(nodo.bloque) or (lambda marco: None)
+        linea = nodo.linea
+
+        def para(marco):
+            try:
+                marco[ranura] = inicial(marco)
+                while True:
+                    c = condicion(marco)
+                    if c is not True:
+                        if c is False:
+                            break
+                        booleano(c, mensaje)
+                    cuerpo(marco)
+                    # El valor del incremento se asigna a la variable del para
+                    marco[ranura] = incremento(marco)
+            except ErrorEjecucion as error:
+                error.ubicar(linea)
+                raise
+
+        return para
+
+    def compilar_EstructuraRepetir(self, nodo) -> Clausura:
+        cuerpo = self.bloque(nodo.bloque) or (lambda marco: None)
+        condicion, mensaje = self.condicion(nodo.condicion, "repetir-hasta")
+        linea = nodo.linea
+
+        def repetir(marco):
+            try:
+                while True:
+                    cuerpo(marco)
+                    c = condicion(marco)
+                    if c is True:
+                        break
+                    if c is not False:
+                        booleano(c, mensaje)
+            except ErrorEjecucion as error:
+                error.ubicar(linea)
+                raise
+
+        return repetir
+
+    def compilar_para_cada(self, nodo) -> Clausura:
+        _, variable, coleccion, bloque = nodo
+        obtener = self.expresion(coleccion)
+        ranura = self.declarar(variable, variable.nombre)
+        cuerpo = self.bloque(bloque) or (lambda marco: None)
+        linea = variable.linea
+
+        def para_cada(marco):
+            try:
+                for elemento in iterar(obtener(marco)):
+                    marco[ranura] = elemento
+                    cuerpo(marco)
+            except ErrorEjecucion as error:
+                error.ubicar(linea)
+                raise
+
+        return para_cada
+
+    def compilar_EstructuraSegun(self, nodo) -> Clausura:
+        valor = self.expresion(nodo.expresion)
+        casos = [(caso.valor, self.bloque(caso.bloque)) for caso in nodo.casos]
+        predeterminado = self.bloque(nodo.predeterminado)
+        linea = nodo.linea
+
+        if all(es_literal(v) for v, _ in casos):
+            # Casos constantes: despacho con un diccionario
+            tabla: Dict[Any, Any] = {}
+            for v, bloque in casos:
+                tabla.setdefault(clave_caso(v), bloque)
+
+            def segun_tabla(marco):
+                try:
+                    bloque = tabla.get(clave_caso(valor(marco)), predeterminado)
+                    if bloque is not None:
+                        bloque(marco)
+                except ErrorEjecucion as error:
+                    error.ubicar(linea)
+                    raise
+
+            return segun_tabla
+
+        casos = tuple((self.expresion(v), bloque) for v, bloque in casos)
+
+        def segun(marco):
+            try:
+                actual = valor(marco)
+                for evaluar, bloque in casos:
+                    if iguales(actual, evaluar(marco)):
+                        if bloque is not None:
+                            bloque(marco)
+                        return
+                if predeterminado is not None:
+                    predeterminado(marco)
+            except ErrorEjecucion as error:
+                error.ubicar(linea)
+                raise
+
+        return segun
+
+    def compilar_intentar(self, nodo) -> Clausura:
+        _, bloque, capturar, finalmente = nodo
+        intento = self.bloque(bloque)
+        _, variable, bloque_captura = capturar
+        ranura = self.declarar(variable, variable.nombre)
+        captura = self.bloque(bloque_captura)
+        final = self.bloque(finalmente[1]) if finalmente else None
+
+        def intentar(marco):
+            try:
+                if intento is not None:
+                    intento(marco)
+            except ErrorEjecucion as error:
+                marco[ranura] = error.mensaje
+                if captura is not None:
+                    captura(marco)
+            finally:
+                if final is not None:
+                    final(marco)
+
+        return intentar
+
+
+def clave_caso(valor: Any) -> Tuple[str, Any]:
+    """Clave de despacho de `segun` coherente con `iguales` (1 == 1.0, 1 != verdadero)"""
+    if type(valor) is int or type(valor) is float:
+        return ("numero", valor)
+    valor = plano(valor)
+    if isinstance(valor, (str, bool)) or valor is None:
+        return (type(valor).__name__, valor)
+    return ("valor", id(valor))
+
+
+def resolver(ast, codigo: str = "") -> Dict[int, Any]:
+    """Resolver ámbitos con el analizador semántico; falla si hay errores"""
+    analizador = AnalizadorSemantico(nivel="rapido", habilitar=["pureza"])
+    resultado = analizador.analizar(ast, codigo)
+    if resultado["errores"]:
+        raise ErrorCompilacion(resultado["errores"])
+    return analizador.resoluciones
+
+
+def analizar_programa(codigo: str):
+    """AST de un programa listo para compilar"""
+    ast, errores = analizar_sintactico(codigo)
+    if errores:
+        raise ErrorCompilacion(errores)
+    return ast
+
+
+def compilar(ast, codigo: str = "") -> ProgramaCompilado:
+    """Resolver ámbitos y compilar a clausuras"""
+    return CompiladorClausuras(resolver(ast, codigo)).compilar_programa(ast)
+
+
+def compilar_codigo(codigo: str) -> ProgramaCompilado:
+    return compilar(analizar_programa(codigo), codigo)
+
+
+def ejecutar_codigo(codigo: str) -> ResultadoEjecucion:
+    """Compilar y ejecutar un programa, capturando su salida y sus errores"""
+    salida: List[str] = []
+    try:
+        programa = compilar_codigo(codigo)
+        programa.ejecutar(salida.append)
+    except ErrorCompilacion as e:
+        return {"salida": salida, "errores": e.errores}
+    except ErrorEjecucion as e:
+        return {"salida": salida, "errores": [str(e)]}
+    return {"salida": salida, "errores": []}
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("Uso: python interprete_lynx.py <archivo.lynx>")
+        sys.exit(1)
+
+    with open(sys.argv[1], "r", encoding="utf-8") as archivo:
+        contenido = archivo.read()
+
+    try:
+        programa = compilar_codigo(contenido)
+        programa.ejecutar()
+    except ErrorCompilacion as e:
+        for error in e.errores:
+            print(error, file=sys.stderr)
+        sys.exit(1)
+    except ErrorEjecucion as e:
+        print(e, file=sys.stderr)
+        sys.exit(1)
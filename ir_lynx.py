@@ -0,0 +1,783 @@
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from interprete_lynx import (
+    ContextoFuncion,
+    ErrorCompilacion,
+    ResolucionRanuras,
+    analizar_programa,
+    es_literal,
+    resolver,
+)
+from runtime_lynx import (
+    OPERACIONES_BINARIAS,
+    OPERACIONES_UNARIAS,
+    ErrorEjecucion,
+    a_cadena,
+    booleano,
+    indexar,
+    iterar,
+    representar,
+    tipo_de,
+    verificar_aridad,
+)
+
+# Representación intermedia de tres direcciones. Cada instrucción escribe a lo
+# sumo un destino y lee operandos simples:
+#
+#   ("c", valor)                 constante
+#   ("l", ranura)                ranura del marco de la función actual
+#   ("e", profundidad, ranura)   ranura de un marco que la encierra
+#
+# Las variables de Lynx y los temporales comparten el marco (mismo modelo que
+# el intérprete de clausuras: la ranura 0 es el marco del entorno). El flujo
+# de control usa etiquetas explícitas; `ensamblar` las traduce a índices.
+#
+# Operaciones (destino = op args):
+#   copiar a | binaria a b (extra: operador) | unaria a (extra: operador)
+#   indexar a b | llamar f args... (extra: nombre) | arreglo args...
+#   tabla args... (extra: claves) | funcion (extra: FuncionIR) | iterar a
+#   siguiente it (extra: etiqueta de fin) | capturar (extra: "mensaje"/"error")
+# Sin destino:
+#   imprimir args... | booleano a (extra: mensaje) | saltar (extra: etiqueta)
+#   si_falso a / si_verdadero a (extra: (etiqueta, mensaje)) | etiqueta
+#   retornar a | intentar (extra: etiqueta del manejador) | fin_intentar
+#   relanzar a | verificar args... (falla si un cálculo adelantado falló)
+
+Operando = tuple
+
+NULO = ("c", None)
+
+# Operaciones sin efectos: repetirlas o moverlas no cambia el programa, aunque
+# pueden fallar (el error se conserva en su sitio original)
+OPERACIONES_PURAS = {"binaria", "unaria", "indexar"}
+# Operaciones que nunca fallan ni tienen efectos
+OPERACIONES_INOCUAS = {"copiar", "funcion", "arreglo", "tabla"}
+SALTOS = {"saltar", "si_falso", "si_verdadero", "siguiente"}
+TERMINALES = {"saltar", "retornar", "relanzar"}
+
+
+class Instruccion:
+    __slots__ = ("op", "destino", "args", "extra", "linea", "especulativa")
+
+    def __init__(self, op: str, destino: Optional[Operando] = None, args=(), extra: Any = None,
+                 linea: Optional[int] = None):
+        self.op = op
+        self.destino = destino
+        self.args: List[Operando] = list(args)
+        self.extra = extra
+        self.linea = linea
+        # Adelantada fuera de un bucle: un error se guarda y se lanza en `verificar`
+        self.especulativa = False
+
+    def etiqueta_destino(self) -> Optional[str]:
+        if self.op in ("saltar", "siguiente", "intentar"):
+            return self.extra
+        if self.op in ("si_falso", "si_verdadero"):
+            return self.extra[0]
+        return None
+
+    def __repr__(self):
+        return formatear_instruccion(self)
+
+
+class FuncionIR:
+    """Código de tres direcciones de una función (o del programa principal)"""
+
+    def __init__(self, nombre: str, aridad: int, contexto: ContextoFuncion):
+        self.nombre = nombre
+        self.aridad = aridad
+        self.contexto = contexto
+        self.instrucciones: List[Instruccion] = []
+        self.temporales: Set[int] = set()
+        # Ranuras asignadas desde funciones anidadas: su valor puede cambiar en
+        # cualquier llamada, no se propagan ni se mueven
+        self.volatiles: Set[int] = set()
+        # Ranuras leídas desde funciones anidadas: siempre vivas
+        self.capturadas: Set[int] = set()
+        # (etiqueta de cabecera, etiqueta de salida) de cada bucle
+        self.bucles: List[Tuple[str, str]] = []
+        self.etiquetas = 0
+
+    @property
+    def num_ranuras(self) -> int:
+        return self.contexto.tamano
+
+    def nombre_ranura(self, ranura: int) -> str:
+        return self.contexto.nombres[ranura] or f"%{ranura}"
+
+    def temporal(self) -> Operando:
+        ranura = self.contexto.reservar(f"%t{len(self.temporales) + 1}")
+        self.temporales.add(ranura)
+        return ("l", ranura)
+
+    def etiqueta(self, prefijo: str = "L") -> str:
+        self.etiquetas += 1
+        return f"{prefijo}{self.etiquetas}"
+
+    def funciones_anidadas(self) -> List["FuncionIR"]:
+        return [i.extra for i in self.instrucciones if i.op == "funcion"]
+
+    def todas(self) -> List["FuncionIR"]:
+        """Esta función y todas las anidadas, de adentro hacia afuera"""
+        resultado = []
+        for anidada in self.funciones_anidadas():
+            resultado.extend(anidada.todas())
+        resultado.append(self)
+        return resultado
+
+
+def clave_operando(operando: Operando) -> tuple:
+    """Clave comparable de un operando (1, 1.0 y verdadero son constantes distintas)"""
+    if operando[0] == "c":
+        return ("c", type(operando[1]).__name__, operando[1])
+    return operando
+
+
+def es_constante(operando: Operando) -> bool:
+    return operando[0] == "c"
+
+
+def es_entero(operando: Operando) -> bool:
+    return operando[0] == "c" and type(operando[1]) is int
+
+
+# -- Traducción del AST -------------------------------------------------------
+
+
+class GeneradorIR(ResolucionRanuras):
+    def __init__(self, resoluciones: Dict[int, Any]):
+        super().__init__(resoluciones)
+        self.actual = FuncionIR("<programa>", 0, self.funcion)
+        # Funciones que se están generando, por nivel de anidamiento
+        self.pila: List[FuncionIR] = [self.actual]
+
+    def emitir(self, op: str, destino=None, args=(), extra=None, linea=None) -> Instruccion:
+        instruccion = Instruccion(op, destino, args, extra, linea)
+        self.actual.instrucciones.append(instruccion)
+        return instruccion
+
+    def marcar(self, etiqueta: str):
+        self.emitir("etiqueta", extra=etiqueta)
+
+    def generar_programa(self, ast) -> FuncionIR:
+        self.bloque(ast or [])
+        self.emitir("retornar", args=[NULO])
+        return self.actual
+
+    # Variables
+
+    def variable(self, nodo, nombre: str) -> Operando:
+        profundidad, ranura = self.ubicar(nodo, nombre)
+        if profundidad == 0:
+            return ("l", ranura)
+        self.pila[-1 - profundidad].capturadas.add(ranura)
+        return ("e", profundidad, ranura)
+
+    def asignar(self, destino: Operando, valor: Operando, linea):
+        """Guardar `valor` en `destino`, reutilizando la instrucción que lo calculó"""
+        anterior = self.actual.instrucciones[-1] if self.actual.instrucciones else None
+        if (
+            anterior is not None
+            and anterior.destino == valor
+            and valor[0] == "l"
+            and valor[1] in self.actual.temporales
+            and anterior.op not in ("capturar", "siguiente")
+        ):
+            anterior.destino = destino
+            anterior.linea = anterior.linea or linea
+            return
+        self.emitir("copiar", destino, [valor], linea=linea)
+
+    # Sentencias
+
+    def bloque(self, instrucciones):
+        if instrucciones is None:
+            return
+        if not isinstance(instrucciones, list):
+            instrucciones = [instrucciones]
+        for instruccion in instrucciones:
+            self.sentencia(instruccion)
+
+    def sentencia(self, nodo):
+        if es_literal(nodo):
+            return
+        if isinstance(nodo, tuple):
+            getattr(self, f"generar_{nodo[0]}")(nodo)
+            return
+        clase = nodo.__class__.__name__
+        metodo = getattr(self, f"generar_{clase}", None)
+        if metodo is not None:
+            metodo(nodo)
+        elif clase == "Identificador":
+            self.ubicar(nodo, nodo.nombre)
+        else:
+            self.expresion(nodo, getattr(nodo, "linea", None))
+
+    def generar_DeclaracionVariable(self, nodo):
+        valor = self.expresion(nodo.valor, nodo.linea)
+        self.asignar(("l", self.declarar(nodo, nodo.nombre)), valor, nodo.linea)
+
+    def generar_AsignacionVariable(self, nodo):
+        valor = self.expresion(nodo.valor, nodo.linea)
+        profundidad, ranura = self.ubicar(nodo, nodo.nombre)
+        if profundidad > 0:
+            self.pila[-1 - profundidad].volatiles.add(ranura)
+        self.asignar(self.variable(nodo, nodo.nombre), valor, nodo.linea)
+
+    def generar_DeclaracionArreglo(self, nodo):
+        elementos = self.operandos(nodo.elementos, nodo.linea)
+        self.emitir("arreglo", ("l", self.declarar(nodo, nodo.nombre)), elementos, linea=nodo.linea)
+
+    def generar_DeclaracionTabla(self, nodo):
+        claves = tuple(clave for clave, _ in nodo.pares)
+        valores = self.operandos([valor for _, valor in nodo.pares], nodo.linea)
+        destino = ("l", self.declarar(nodo, nodo.nombre))
+        self.emitir("tabla", destino, valores, extra=claves, linea=nodo.linea)
+
+    def generar_DeclaracionFuncion(self, nodo):
+        ranura = self.declarar(nodo, nodo.nombre)
+        anterior_contexto, anterior = self.funcion, self.actual
+        self.funcion = ContextoFuncion(anterior_contexto.nivel + 1)
+        self.actual = FuncionIR(nodo.nombre, len(nodo.parametros), self.funcion)
+        self.pila.append(self.actual)
+        try:
+            for parametro in nodo.parametros:
+                self.declarar(parametro, parametro.nombre)
+            self.bloque(nodo.bloque)
+            retorno = getattr(nodo, "retorno", None)
+            if retorno is not None:
+                linea = getattr(retorno, "linea", None) or nodo.linea
+                self.emitir("retornar", args=[self.expresion(retorno, linea)], linea=linea)
+            else:
+                self.emitir("retornar", args=[NULO], linea=nodo.linea)
+            funcion = self.actual
+        finally:
+            self.pila.pop()
+            self.funcion, self.actual = anterior_contexto, anterior
+        self.emitir("funcion", ("l", ranura), extra=funcion, linea=nodo.linea)
+
+    def generar_Imprimir(self, nodo):
+        self.emitir("imprimir", args=self.operandos(nodo.elementos, nodo.linea), linea=nodo.linea)
+
+    def condicion(self, nodo, estructura: str, linea) -> Tuple[Operando, str]:
+        return self.expresion(nodo, linea), f"La condición de '{estructura}'"
+
+    def generar_EstructuraSi(self, nodo):
+        fin = self.actual.etiqueta()
+        ramas = [(nodo.condicion, nodo.bloque, "si")]
+        sino = None
+        siguiente = nodo.sinosis
+        while siguiente:
+            if siguiente[0] == "sinosi":
+                _, condicion, bloque, siguiente = siguiente
+                ramas.append((condicion, bloque, "sinosi"))
+            else:
+                sino = siguiente[1]
+                siguiente = None
+
+        for condicion, bloque, estructura in ramas:
+            otra = self.actual.etiqueta()
+            valor, mensaje = self.condicion(condicion, estructura, nodo.linea)
+            self.emitir("si_falso", args=[valor], extra=(otra, mensaje), linea=nodo.linea)
+            self.bloque(bloque)
+            self.emitir("saltar", extra=fin)
+            self.marcar(otra)
+        self.bloque(sino)
+        self.marcar(fin)
+
+    def bucle(self) -> Tuple[str, str]:
+        cabecera = self.actual.etiqueta("B")
+        salida = self.actual.etiqueta()
+        self.actual.bucles.append((cabecera, salida))
+        return cabecera, salida
+
+    def generar_EstructuraMientras(self, nodo):
+        cabecera, salida = self.bucle()
+        self.marcar(cabecera)
+        valor, mensaje = self.condicion(nodo.condicion, "mientras", nodo.linea)
+        self.emitir("si_falso", args=[valor], extra=(salida, mensaje), linea=nodo.linea)
+        self.bloque(nodo.bloque)
+        self.emitir("saltar", extra=cabecera)
+        self.marcar(salida)
+
+    def generar_EstructuraPara(self, nodo):
+        inicial = self.expresion(nodo.init.valor, nodo.linea)
+        variable = ("l", self.declarar(nodo.init, nodo.init.nombre))
+        self.asignar(variable, inicial, nodo.linea)
+        cabecera, salida = self.bucle()
+        self.marcar(cabecera)
+        valor, mensaje = self.condicion(nodo.condicion, "para", nodo.linea)
+        self.emitir("si_falso", args=[valor], extra=(salida, mensaje), linea=nodo.linea)
+        self.bloque(nodo.bloque)
+        # El valor del incremento se asigna a la variable del para
+        self.asignar(variable, self.expresion(nodo.incremento, nodo.linea), nodo.linea)
+        self.emitir("saltar", extra=cabecera)
+        self.marcar(salida)
+
+    def generar_EstructuraRepetir(self, nodo):
+        cabecera, salida = self.bucle()
+        self.marcar(cabecera)
+        self.bloque(nodo.bloque)
+        valor, mensaje = self.condicion(nodo.condicion, "repetir-hasta", nodo.linea)
+        self.emitir("si_falso", args=[valor], extra=(cabecera, mensaje), linea=nodo.linea)
+        self.marcar(salida)
+
+    def generar_para_cada(self, nodo):
+        _, variable, coleccion, bloque = nodo
+        linea = variable.linea
+        iterador = self.actual.temporal()
+        self.emitir("iterar", iterador, [self.expresion(coleccion, linea)], linea=linea)
+        elemento = ("l", self.declarar(variable, variable.nombre))
+        cabecera, salida = self.bucle()
+        self.marcar(cabecera)
+        self.emitir("siguiente", elemento, [iterador], extra=salida, linea=linea)
+        self.bloque(bloque)
+        self.emitir("saltar", extra=cabecera)
+        self.marcar(salida)
+
+    def generar_EstructuraSegun(self, nodo):
+        # Los casos se comparan con el valor original aunque un caso lo cambie
+        valor = self.copia(self.expresion(nodo.expresion, nodo.linea), nodo.linea)
+
+        fin = self.actual.etiqueta()
+        etiquetas = []
+        for caso in nodo.casos:
+            etiqueta = self.actual.etiqueta()
+            etiquetas.append(etiqueta)
+            comparacion = self.actual.temporal()
+            caso_valor = self.expresion(caso.valor, nodo.linea)
+            self.emitir("binaria", comparacion, [valor, caso_valor], extra="==", linea=nodo.linea)
+            self.emitir("si_verdadero", args=[comparacion], extra=(etiqueta, ""), linea=nodo.linea)
+        self.bloque(nodo.predeterminado)
+        self.emitir("saltar", extra=fin)
+        for caso, etiqueta in zip(nodo.casos, etiquetas):
+            self.marcar(etiqueta)
+            self.bloque(caso.bloque)
+            self.emitir("saltar", extra=fin)
+        self.marcar(fin)
+
+    def generar_intentar(self, nodo):
+        _, bloque, capturar, finalmente = nodo
+        _, variable, bloque_captura = capturar
+        final = finalmente[1] if finalmente else None
+        manejador = self.actual.etiqueta("H")
+        fin = self.actual.etiqueta()
+
+        self.emitir("intentar", extra=manejador)
+        self.bloque(bloque)
+        self.emitir("fin_intentar")
+        self.emitir("saltar", extra=fin)
+
+        self.marcar(manejador)
+        destino = ("l", self.declarar(variable, variable.nombre))
+        self.emitir("capturar", destino, extra="mensaje", linea=variable.linea)
+        if final is None:
+            self.bloque(bloque_captura)
+            self.marcar(fin)
+            return
+
+        manejador_final = self.actual.etiqueta("H")
+        self.emitir("intentar", extra=manejador_final)
+        self.bloque(bloque_captura)
+        self.emitir("fin_intentar")
+        self.emitir("saltar", extra=fin)
+        # Un error dentro de capturar ejecuta finalmente y se propaga
+        self.marcar(manejador_final)
+        error = self.actual.temporal()
+        self.emitir("capturar", error, extra="error")
+        self.bloque(final)
+        self.emitir("relanzar", args=[error])
+        self.marcar(fin)
+        self.bloque(final)
+
+    # Expresiones
+
+    def copia(self, operando: Operando, linea) -> Operando:
+        """Fijar el valor actual de una variable en un temporal"""
+        if operando[0] == "c" or (operando[0] == "l" and operando[1] in self.actual.temporales):
+            return operando
+        copia = self.actual.temporal()
+        self.emitir("copiar", copia, [operando], linea=linea)
+        return copia
+
+    def operandos(self, nodos, linea) -> List[Operando]:
+        """Operandos evaluados en orden; una llamada posterior no altera los anteriores"""
+        resultado = []
+        for i, nodo in enumerate(nodos):
+            operando = self.expresion(nodo, linea)
+            if any(tiene_llamadas(siguiente) for siguiente in nodos[i + 1:]):
+                operando = self.copia(operando, linea)
+            resultado.append(operando)
+        return resultado
+
+    def expresion(self, nodo, linea) -> Operando:
+        if es_literal(nodo):
+            return ("c", nodo)
+        clase = nodo.__class__.__name__
+        if clase == "Identificador":
+            return self.variable(nodo, nodo.nombre)
+        if clase == "ExpresionBinaria":
+            if nodo.op in ("y", "o"):
+                return self.logica(nodo, linea)
+            destino = self.actual.temporal()
+            args = self.operandos([nodo.izq, nodo.der], linea)
+            self.emitir("binaria", destino, args, extra=nodo.op, linea=linea)
+            return destino
+        if clase == "ExpresionUnaria":
+            operando = self.expresion(nodo.expr, linea)
+            destino = self.actual.temporal()
+            self.emitir("unaria", destino, [operando], extra=nodo.op, linea=linea)
+            return destino
+        if clase in ("AccesoArreglo", "AccesoTabla"):
+            clave = nodo.indice if clase == "AccesoArreglo" else nodo.clave
+            contenedor = self.variable(nodo, nodo.nombre)
+            if tiene_llamadas(clave):
+                contenedor = self.copia(contenedor, linea)
+            destino = self.actual.temporal()
+            self.emitir("indexar", destino, [contenedor, self.expresion(clave, linea)], linea=linea)
+            return destino
+        if clase == "LlamadaFuncion":
+            funcion = self.variable(nodo, nodo.nombre)
+            args = self.operandos(nodo.argumentos, linea)
+            destino = self.actual.temporal()
+            self.emitir("llamar", destino, [funcion] + args, extra=nodo.nombre, linea=linea)
+            return destino
+        raise ErrorCompilacion([f"Expresión no soportada: {clase}"])
+
+    def logica(self, nodo, linea) -> Operando:
+        op = nodo.op
+        resultado = self.actual.temporal()
+        fin = self.actual.etiqueta()
+        self.emitir("copiar", resultado, [self.expresion(nodo.izq, linea)], linea=linea)
+        salto = "si_falso" if op == "y" else "si_verdadero"
+        self.emitir(salto, args=[resultado], extra=(fin, f"Operando izquierdo de '{op}'"), linea=linea)
+        self.emitir("copiar", resultado, [self.expresion(nodo.der, linea)], linea=linea)
+        self.emitir("booleano", args=[resultado], extra=f"Operando derecho de '{op}'", linea=linea)
+        self.marcar(fin)
+        return resultado
+
+
+def tiene_llamadas(nodo) -> bool:
+    if es_literal(nodo):
+        return False
+    clase = nodo.__class__.__name__
+    if clase == "LlamadaFuncion":
+        return True
+    if clase == "ExpresionBinaria":
+        return tiene_llamadas(nodo.izq) or tiene_llamadas(nodo.der)
+    if clase == "ExpresionUnaria":
+        return tiene_llamadas(nodo.expr)
+    if clase == "AccesoArreglo":
+        return tiene_llamadas(nodo.indice)
+    return False
+
+
+def generar_ir(ast, codigo: str = "") -> FuncionIR:
+    """Resolver ámbitos y traducir el programa a IR"""
+    return GeneradorIR(resolver(ast, codigo)).generar_programa(ast)
+
+
+# -- Texto ----------------------------------------------------------------------
+
+
+def formatear_operando(operando: Operando, funcion: Optional[FuncionIR] = None) -> str:
+    if operando[0] == "c":
+        return representar(operando[1])
+    if operando[0] == "l":
+        return funcion.nombre_ranura(operando[1]) if funcion else f"%{operando[1]}"
+    return f"^{operando[1]}:{operando[2]}"
+
+
+def formatear_instruccion(instruccion: Instruccion, funcion: Optional[FuncionIR] = None) -> str:
+    args = ", ".join(formatear_operando(a, funcion) for a in instruccion.args)
+    op = instruccion.op
+    if op == "etiqueta":
+        return f"{instruccion.extra}:"
+    if op == "binaria":
+        a, b = (formatear_operando(x, funcion) for x in instruccion.args)
+        texto = f"{a} {instruccion.extra} {b}"
+    elif op == "unaria":
+        texto = f"{instruccion.extra} {args}"
+    elif op == "copiar":
+        texto = args
+    elif op == "funcion":
+        texto = f"funcion <{instruccion.extra.nombre}>"
+    elif op == "llamar":
+        texto = f"llamar {instruccion.extra} ({args})"
+    elif op == "tabla":
+        pares = ", ".join(
+            f'"{clave}" = {formatear_operando(a, funcion)}' for clave, a in zip(instruccion.extra, instruccion.args)
+        )
+        texto = f"tabla {{{pares}}}"
+    elif op in ("si_falso", "si_verdadero"):
+        texto = f"{op} {args} -> {instruccion.extra[0]}"
+    elif instruccion.extra is not None and op not in ("booleano", "capturar"):
+        texto = f"{op} {args} -> {instruccion.extra}" if args else f"{op} -> {instruccion.extra}"
+    else:
+        texto = f"{op} {args}".rstrip()
+    if instruccion.destino is not None:
+        texto = f"{formatear_operando(instruccion.destino, funcion)} = {texto}"
+    if instruccion.especulativa:
+        texto += "  (especulativa)"
+    return "    " + texto
+
+
+def formatear_ir(funcion: FuncionIR) -> str:
+    partes = []
+    for actual in reversed(funcion.todas()):
+        lineas = [f"== {actual.nombre} (aridad {actual.aridad}, {actual.num_ranuras} ranuras) =="]
+        lineas.extend(formatear_instruccion(i, actual) for i in actual.instrucciones)
+        partes.append("\n".join(lineas))
+    return "\n\n".join(partes)
+
+
+# -- Ejecución --------------------------------------------------------------------
+
+
+class Fallo:
+    """Resultado de un cálculo adelantado que falló; se lanza en `verificar`"""
+
+    __slots__ = ("error",)
+
+    def __init__(self, error: ErrorEjecucion):
+        self.error = error
+
+
+class Constante:
+    __slots__ = ("valor",)
+
+    def __init__(self, valor):
+        self.valor = valor
+
+
+class CodigoEnsamblado:
+    """Instrucciones con los saltos resueltos a índices, listas para ejecutar"""
+
+    def __init__(self, funcion: FuncionIR):
+        self.nombre = funcion.nombre
+        self.aridad = funcion.aridad
+        self.num_ranuras = funcion.num_ranuras
+        posiciones: Dict[str, int] = {}
+        utiles = []
+        for instruccion in funcion.instrucciones:
+            if instruccion.op == "etiqueta":
+                posiciones[instruccion.extra] = len(utiles)
+            else:
+                utiles.append(instruccion)
+
+        self.codigo = []
+        for instruccion in utiles:
+            extra = instruccion.extra
+            op = instruccion.op
+            if op in ("saltar", "siguiente", "intentar"):
+                extra = posiciones[extra]
+            elif op in ("si_falso", "si_verdadero"):
+                extra = (posiciones[extra[0]], extra[1])
+            elif op == "funcion":
+                extra = CodigoEnsamblado(extra)
+            elif op == "binaria":
+                extra = OPERACIONES_BINARIAS[extra]
+            elif op == "unaria":
+                extra = OPERACIONES_UNARIAS[extra]
+            self.codigo.append((
+                op,
+                ensamblar_operando(instruccion.destino) if instruccion.destino else None,
+                tuple(ensamblar_operando(a) for a in instruccion.args),
+                extra,
+                instruccion.linea,
+                instruccion.especulativa,
+            ))
+
+
+def ensamblar_operando(operando: Operando):
+    # Ranura local -> int; constante -> Constante; externa -> (profundidad, ranura)
+    if operando[0] == "l":
+        return operando[1]
+    if operando[0] == "c":
+        return Constante(operando[1])
+    return (operando[1], operando[2])
+
+
+class FuncionEjecutable:
+    __slots__ = ("codigo", "entorno")
+
+    def __init__(self, codigo: CodigoEnsamblado, entorno: list):
+        self.codigo = codigo
+        self.entorno = entorno
+
+    @property
+    def nombre(self) -> str:
+        return self.codigo.nombre
+
+    @property
+    def aridad(self) -> int:
+        return self.codigo.aridad
+
+
+def leer(operando, marco: list):
+    if type(operando) is int:
+        return marco[operando]
+    if type(operando) is Constante:
+        return operando.valor
+    profundidad, ranura = operando
+    for _ in range(profundidad):
+        marco = marco[0]
+    return marco[ranura]
+
+
+def escribir_en(operando, marco: list, valor):
+    if type(operando) is int:
+        marco[operando] = valor
+        return
+    profundidad, ranura = operando
+    for _ in range(profundidad):
+        marco = marco[0]
+    marco[ranura] = valor
+
+
+class InterpreteIR:
+    """Intérprete directo de la IR, usado para comparar la IR antes y después de optimizar"""
+
+    def __init__(self, escribir: Optional[Callable[[str], Any]] = None):
+        self.escribir = escribir or print
+
+    def ejecutar(self, funcion: FuncionIR):
+        programa = CodigoEnsamblado(funcion)
+        marco = [None] * programa.num_ranuras
+        try:
+            return self.correr(programa, marco)
+        except RecursionError:
+            raise ErrorEjecucion("Recursión demasiado profunda")
+
+    def correr(self, programa: CodigoEnsamblado, marco: list):
+        codigo = programa.codigo
+        manejadores: List[int] = []
+        pc = 0
+        while True:
+            op, destino, args, extra, linea, especulativa = codigo[pc]
+            pc += 1
+            try:
+                if op == "binaria":
+                    a = args[0]
+                    a = marco[a] if type(a) is int else leer(a, marco)
+                    b = args[1]
+                    b = marco[b] if type(b) is int else leer(b, marco)
+                    if especulativa:
+                        try:
+                            valor = extra(a, b)
+                        except ErrorEjecucion as error:
+                            valor = Fallo(error)
+                    else:
+                        valor = extra(a, b)
+                    if type(destino) is int:
+                        marco[destino] = valor
+                    else:
+                        escribir_en(destino, marco, valor)
+                elif op == "copiar":
+                    a = args[0]
+                    valor = marco[a] if type(a) is int else leer(a, marco)
+                    if type(destino) is int:
+                        marco[destino] = valor
+                    else:
+                        escribir_en(destino, marco, valor)
+                elif op == "si_falso":
+                    a = args[0]
+                    c = marco[a] if type(a) is int else leer(a, marco)
+                    if c is False:
+                        pc = extra[0]
+                    elif c is not True:
+                        booleano(c, extra[1])
+                elif op == "saltar":
+                    pc = extra
+                elif op == "si_verdadero":
+                    a = args[0]
+                    c = marco[a] if type(a) is int else leer(a, marco)
+                    if c is True:
+                        pc = extra[0]
+                    elif c is not False:
+                        booleano(c, extra[1])
+                elif op == "indexar":
+                    contenedor = leer(args[0], marco)
+                    indice = leer(args[1], marco)
+                    if especulativa:
+                        try:
+                            valor = indexar(contenedor, indice)
+                        except ErrorEjecucion as error:
+                            valor = Fallo(error)
+                    else:
+                        valor = indexar(contenedor, indice)
+                    escribir_en(destino, marco, valor)
+                elif op == "verificar":
+                    for a in args:
+                        valor = leer(a, marco)
+                        if type(valor) is Fallo:
+                            raise valor.error
+                elif op == "llamar":
+                    valor = self.llamar(leer(args[0], marco), extra, [leer(a, marco) for a in args[1:]])
+                    escribir_en(destino, marco, valor)
+                elif op == "unaria":
+                    a = leer(args[0], marco)
+                    if especulativa:
+                        try:
+                            valor = extra(a)
+                        except ErrorEjecucion as error:
+                            valor = Fallo(error)
+                    else:
+                        valor = extra(a)
+                    escribir_en(destino, marco, valor)
+                elif op == "booleano":
+                    booleano(leer(args[0], marco), extra)
+                elif op == "retornar":
+                    return leer(args[0], marco)
+                elif op == "imprimir":
+                    self.escribir(" ".join([a_cadena(leer(a, marco)) for a in args]))
+                elif op == "siguiente":
+                    try:
+                        escribir_en(destino, marco, next(leer(args[0], marco)))
+                    except StopIteration:
+                        pc = extra
+                elif op == "iterar":
+                    escribir_en(destino, marco, iter(iterar(leer(args[0], marco))))
+                elif op == "arreglo":
+                    escribir_en(destino, marco, [leer(a, marco) for a in args])
+                elif op == "tabla":
+                    escribir_en(destino, marco, {c: leer(a, marco) for c, a in zip(extra, args)})
+                elif op == "funcion":
+                    escribir_en(destino, marco, FuncionEjecutable(extra, marco))
+                elif op == "intentar":
+                    manejadores.append(extra)
+                elif op == "fin_intentar":
+                    manejadores.pop()
+                elif op == "capturar":
+                    pass  # el manejador ya dejó el error en el destino
+                elif op == "relanzar":
+                    raise leer(args[0], marco)
+                else:
+                    raise RuntimeError(f"Operación de IR desconocida: {op}")
+            except ErrorEjecucion as error:
+                error.ubicar(linea)
+                if not manejadores:
+                    raise
+                pc = manejadores.pop()
+                captura = codigo[pc]
+                valor = error.mensaje if captura[3] == "mensaje" else error
+                escribir_en(captura[1], marco, valor)
+                pc += 1
+
+    def llamar(self, funcion, nombre: str, argumentos: list):
+        if type(funcion) is not FuncionEjecutable:
+            raise ErrorEjecucion(f"'{nombre}' no es una función ({tipo_de(funcion)})")
+        codigo = funcion.codigo
+        verificar_aridad(nombre, codigo.aridad, len(argumentos))
+        marco = [None] * codigo.num_ranuras
+        marco[0] = funcion.entorno
+        marco[1:len(argumentos) + 1] = argumentos
+        return self.correr(codigo, marco)
+
+
+def generar_ir_codigo(codigo: str) -> FuncionIR:
+    return generar_ir(analizar_programa(codigo), codigo)
+
+
+def ejecutar_ir(funcion: FuncionIR, escribir=None):
+    return InterpreteIR(escribir).ejecutar(funcion)
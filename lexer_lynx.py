@@ -1,7 +1,13 @@
+import bisect
+import itertools
+import time
 import ply.lex as lex
 from collections import defaultdict
 import sys
 
+import metricas_lynx
+import trazas_lynx
+
 reserved = {
     'y': 'Y',
     'salir': 'SALIR',
@@ -103,9 +109,12 @@ def t_newline(t):
     t.lexer.lineno += len(t.value)
 
 def t_error(t):
-    linea = t.lineno
-    columna = obtener_columna(t.lexer.lexdata, t)
-    print(f"Error léxico: caracter no reconocido '{t.value[0]}' en la línea {linea}, columna {columna}")
+    trazas_lynx.evento(
+        trazas_lynx.ERROR,
+        lambda: f"Error léxico: caracter no reconocido '{t.value[0]}' en la línea {t.lineno}, "
+                f"columna {obtener_columna(t.lexer.lexdata, t)}",
+    )
+    metricas_lynx.errores.sumar("lexico")
     t.lexer.skip(1)
 
 def obtener_columna(input_text, token):
@@ -114,26 +123,94 @@ def obtener_columna(input_text, token):
         last_newline = -1
     return len(input_text[last_newline+1:token.lexpos])
 
-def crear_lexer():
-    return lex.lex()
+# Lexer de referencia: sus expresiones regulares se compilan una sola vez
+_lexer_base = None
 
-def analizar_lexico(entrada):
+def crear_lexer():
+    """Lexer nuevo, clonado del de referencia (lex.lex() solo corre la primera vez)"""
+    global _lexer_base
+    if _lexer_base is None:
+        _lexer_base = lex.lex()
+    return _lexer_base.clone()
+
+def tokenizar(entrada, max_tokens=None):
+    """Par (lexer, tokens de PLY) de la entrada y los errores léxicos
+
+    El par se puede pasar a analizar_sintactico para no volver a tokenizar.
+    Con `max_tokens` se deja de tokenizar al pasarlo: vuelven `max_tokens + 1`
+    tokens y el resto de la entrada no se mira.
+    """
+    inicio = time.perf_counter()
+    with trazas_lynx.tramo("lexico", caracteres=len(entrada)) as tramo:
+        lexer = crear_lexer()
+        lexer.input(entrada)
+        errores = []
+        if max_tokens is not None:
+            tokens_ply = list(itertools.islice(lexer, max_tokens + 1))
+        else:
+            tokens_ply = list(lexer)
+        tramo.anotar(tokens=len(tokens_ply))
+    metricas_lynx.lexico_segundos.observar(time.perf_counter() - inicio)
+    metricas_lynx.entrada_caracteres.observar(len(entrada))
+    metricas_lynx.entrada_tokens.observar(len(tokens_ply))
+    return (lexer, tokens_ply), errores
+
+def retokenizar(tokens_viejos, entrada, inicio, fin_nuevo, fin_viejo):
+    """Par (lexer, tokens) de `entrada` reusando los tokens anteriores, o None
+
+    Solo cambió el tramo [inicio, fin_nuevo) de `entrada`, que antes era
+    [inicio, fin_viejo). Se vuelve a tokenizar desde el último token que empieza
+    antes del cambio hasta que un token nuevo cae donde empezaba uno viejo;
+    desde ahí los viejos se corren en el lugar (lexpos y lineno). Un cambio con
+    comillas o `*/` puede cerrar una cadena o comentario abierto más atrás: se
+    devuelve None y hay que tokenizar todo.
+    """
+    ventana = entrada[max(0, inicio - 1):fin_nuevo + 1]
+    if '"' in ventana or "'" in ventana or '*/' in ventana:
+        return None
+
+    # El lexer no tiene estados: desde el inicio de un token, con su línea,
+    # produce lo mismo que antes mientras el texto no cambie
+    k = bisect.bisect_left(tokens_viejos, inicio, key=lambda token: token.lexpos) - 1
     lexer = crear_lexer()
     lexer.input(entrada)
-    
-    tokens_resultado = []
-    errores = []
-    
+    if k >= 0:
+        lexer.lexpos, lexer.lineno = tokens_viejos[k].lexpos, tokens_viejos[k].lineno
+    else:
+        k = 0
+
+    desplazamiento = fin_nuevo - fin_viejo
+    j = bisect.bisect_left(tokens_viejos, fin_viejo, key=lambda token: token.lexpos)
+    nuevos = tokens_viejos[:k]
     for token in lexer:
-        columna = obtener_columna(entrada, token)
-        tokens_resultado.append({
+        while j < len(tokens_viejos) and tokens_viejos[j].lexpos + desplazamiento < token.lexpos:
+            j += 1
+        if (token.lexpos >= fin_nuevo and j < len(tokens_viejos)
+                and tokens_viejos[j].lexpos + desplazamiento == token.lexpos):
+            lineas = token.lineno - tokens_viejos[j].lineno
+            resto = tokens_viejos[j:]
+            for viejo in resto:
+                viejo.lexpos += desplazamiento
+                viejo.lineno += lineas
+            nuevos.extend(resto)
+            break
+        nuevos.append(token)
+    return lexer, nuevos
+
+def tokens_a_dicts(entrada, tokens_ply):
+    return [
+        {
             'lexema': str(token.value),
             'tipo': token.type,
             'linea': token.lineno,
-            'columna': columna
-        })
-    
-    return tokens_resultado, errores
+            'columna': obtener_columna(entrada, token)
+        }
+        for token in tokens_ply
+    ]
+
+def analizar_lexico(entrada):
+    (_, tokens_ply), errores = tokenizar(entrada)
+    return tokens_a_dicts(entrada, tokens_ply), errores
 
 if __name__ == "__main__":
     if len(sys.argv) != 2:
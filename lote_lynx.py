@@ -0,0 +1,199 @@
+"""Análisis de lotes de programas Lynx con resultados en NDJSON
+
+Un lote llega como lista de programas o como archivo tar/zip (se analizan
+los `.lynx` que contenga). Cada programa pasa por léxico, sintáctico y
+semántico en el EjecutorAnalisis, con a lo sumo `concurrencia` programas del
+lote en vuelo a la vez, y su resultado se emite en cuanto termina, como una
+línea JSON con los tiempos de cada fase. La última línea resume el lote.
+
+Si el ejecutor rechaza un programa porque su cola está llena, el lote espera
+y lo vuelve a intentar: un lote grande no debe fallar por la carga de otros
+clientes, y su concurrencia ya acota cuánto ocupa de la cola.
+"""
+import asyncio
+import io
+import tarfile
+import time
+import zipfile
+from typing import Any, AsyncIterator, Dict, List, NamedTuple, Optional
+
+from admision_lynx import LimiteExcedido, tokenizar_admitido, verificar_ast
+from parser_lynx import analizar_sintactico
+from semantic_lynx import AnalizadorSemantico
+from serializacion_lynx import a_json
+from servicio_lynx import CODIGO_VACIO, ColaLlena, EjecutorAnalisis
+
+MAX_PROGRAMAS_LOTE = 10_000
+MAX_BYTES_PROGRAMA = 1024 * 1024
+# Total descomprimido de un archivo: todos los programas se leen antes de analizar
+MAX_BYTES_DESCOMPRIMIDOS = 256 * 1024 * 1024
+MAX_CONCURRENCIA_LOTE = 32
+# Espera antes de reintentar un programa que el ejecutor rechazó
+ESPERA_COLA_LLENA = 0.05
+
+TIPOS_ZIP = ("application/zip", "application/x-zip-compressed")
+TIPOS_TAR = ("application/x-tar", "application/gzip", "application/x-gzip", "application/x-gtar")
+
+
+class ErrorLote(ValueError):
+    """Lote mal formado: archivo ilegible, vacío o con demasiados programas"""
+
+
+class ProgramaLote(NamedTuple):
+    nombre: str
+    codigo: Optional[str]
+    # Motivo por el que no se analiza (demasiado grande, no es UTF-8)
+    error: Optional[str] = None
+
+
+def _ms(segundos: float) -> float:
+    return round(segundos * 1000, 3)
+
+
+def analisis_programa(codigo: str, nivel: str = "completo") -> Dict[str, Any]:
+    """Errores, advertencias y tiempos por fase de un programa del lote"""
+    inicio = time.perf_counter()
+    tiempos = {"lexico": 0.0, "sintactico": 0.0, "semantico": 0.0}
+    advertencias: List[str] = []
+    if not codigo.strip():
+        tiempos["total"] = 0.0
+        return {"exito": False, "errores": [CODIGO_VACIO], "advertencias": advertencias, "tiempos_ms": tiempos}
+
+    lexico, errores = tokenizar_admitido(codigo)
+    fin_lexico = time.perf_counter()
+    tiempos["lexico"] = _ms(fin_lexico - inicio)
+    if not errores:
+        ast, errores = analizar_sintactico(codigo, lexico=lexico)
+        fin_sintactico = time.perf_counter()
+        tiempos["sintactico"] = _ms(fin_sintactico - fin_lexico)
+        if not errores:
+            verificar_ast(ast)
+            resultado = AnalizadorSemantico(nivel=nivel).analizar(ast, codigo)
+            errores, advertencias = resultado["errores"], resultado["advertencias"]
+            tiempos["semantico"] = _ms(time.perf_counter() - fin_sintactico)
+    tiempos["total"] = _ms(time.perf_counter() - inicio)
+    return {"exito": not errores, "errores": errores, "advertencias": advertencias, "tiempos_ms": tiempos}
+
+
+def _programa(nombre: str, datos: bytes) -> ProgramaLote:
+    try:
+        return ProgramaLote(nombre, datos.decode("utf-8-sig"))
+    except UnicodeDecodeError:
+        return ProgramaLote(nombre, None, "El archivo no está en UTF-8")
+
+
+def _demasiado_grande(nombre: str, tamano: int) -> ProgramaLote:
+    return ProgramaLote(nombre, None, f"El programa ocupa {tamano} bytes; el máximo es {MAX_BYTES_PROGRAMA}")
+
+
+def _contar(programas: List[ProgramaLote]):
+    if len(programas) > MAX_PROGRAMAS_LOTE:
+        raise ErrorLote(f"El lote tiene más de {MAX_PROGRAMAS_LOTE} programas")
+
+
+def _descomprimir(total: int, tamano: int, maximo: int) -> int:
+    total += tamano
+    if total > maximo:
+        raise ErrorLote(f"El archivo ocupa más de {maximo} bytes descomprimido")
+    return total
+
+
+def programas_de_archivo(
+    datos: bytes, tipo: str, max_bytes: int = MAX_BYTES_DESCOMPRIMIDOS
+) -> List[ProgramaLote]:
+    """Los `.lynx` de un zip o tar (comprimido o no), en el orden del archivo
+
+    Nada se escribe a disco. Los miembros demasiado grandes no se
+    descomprimen: quedan como programas con error. ErrorLote si lo que se
+    descomprime suma más de `max_bytes`, antes de leer el miembro que lo pasa.
+    En un tar comprimido saltar un miembro también lo descomprime, así que
+    cuentan todos, no solo los `.lynx`.
+    """
+    programas: List[ProgramaLote] = []
+    total = 0
+    try:
+        if tipo in TIPOS_ZIP:
+            with zipfile.ZipFile(io.BytesIO(datos)) as archivo:
+                for miembro in archivo.infolist():
+                    if miembro.is_dir() or not miembro.filename.endswith(".lynx"):
+                        continue
+                    if miembro.file_size > MAX_BYTES_PROGRAMA:
+                        programas.append(_demasiado_grande(miembro.filename, miembro.file_size))
+                    else:
+                        total = _descomprimir(total, miembro.file_size, max_bytes)
+                        programas.append(_programa(miembro.filename, archivo.read(miembro)))
+                    _contar(programas)
+        elif tipo in TIPOS_TAR:
+            with tarfile.open(fileobj=io.BytesIO(datos), mode="r:*") as archivo:
+                for miembro in archivo:
+                    if not miembro.isfile():
+                        continue
+                    if not miembro.name.endswith(".lynx"):
+                        total = _descomprimir(total, miembro.size, max_bytes)
+                        continue
+                    if miembro.size > MAX_BYTES_PROGRAMA:
+                        programas.append(_demasiado_grande(miembro.name, miembro.size))
+                    else:
+                        total = _descomprimir(total, miembro.size, max_bytes)
+                        programas.append(_programa(miembro.name, archivo.extractfile(miembro).read()))
+                    _contar(programas)
+        else:
+            raise ErrorLote(f"Tipo de contenido no soportado: {tipo}")
+    except (zipfile.BadZipFile, tarfile.TarError, EOFError, OSError) as e:
+        raise ErrorLote(f"No se pudo leer el archivo: {e}")
+    if not programas:
+        raise ErrorLote("El archivo no contiene programas .lynx")
+    return programas
+
+
+def _linea(datos: Dict[str, Any]) -> bytes:
+    return a_json(datos) + b"\n"
+
+
+async def analizar_lote(
+    ejecutor: EjecutorAnalisis,
+    programas: List[ProgramaLote],
+    nivel: str = "completo",
+    concurrencia: int = 2,
+) -> AsyncIterator[bytes]:
+    """Líneas NDJSON: un resultado por programa en orden de llegada y el resumen al final"""
+    inicio = time.perf_counter()
+    semaforo = asyncio.Semaphore(max(1, min(concurrencia, MAX_CONCURRENCIA_LOTE)))
+
+    async def analizar(indice: int, programa: ProgramaLote) -> Dict[str, Any]:
+        encabezado = {"indice": indice, "nombre": programa.nombre}
+        if programa.error is not None:
+            return dict(encabezado, exito=False, errores=[programa.error], advertencias=[], tiempos_ms=None)
+        async with semaforo:
+            while True:
+                try:
+                    resultado = await ejecutor.ejecutar(analisis_programa, programa.codigo, nivel)
+                    break
+                except ColaLlena:
+                    await asyncio.sleep(ESPERA_COLA_LLENA)
+                except LimiteExcedido as e:
+                    resultado = {"exito": False, "errores": [str(e)], "advertencias": [], "tiempos_ms": None}
+                    break
+                except Exception as e:
+                    resultado = {"exito": False, "errores": [f"Error interno: {e}"], "advertencias": [],
+                                 "tiempos_ms": None}
+                    break
+        return dict(encabezado, **resultado)
+
+    tareas = [asyncio.ensure_future(analizar(indice, programa)) for indice, programa in enumerate(programas)]
+    exitosos = 0
+    try:
+        for siguiente in asyncio.as_completed(tareas):
+            resultado = await siguiente
+            exitosos += resultado["exito"]
+            yield _linea(resultado)
+    finally:
+        # El cliente cortó la conexión: no seguir analizando para nadie
+        for tarea in tareas:
+            tarea.cancel()
+    yield _linea({"resumen": {
+        "programas": len(programas),
+        "exitosos": exitosos,
+        "fallidos": len(programas) - exitosos,
+        "total_ms": _ms(time.perf_counter() - inicio),
+    }})
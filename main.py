@@ -1,16 +1,94 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import Depends, FastAPI, HTTPException, Query, Request, Response, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import List, Dict, Any, Optional
-from semantic_lynx import AnalizadorSemantico, ResultadoAnalisisSemantico
+from pydantic import BaseModel, Field, ValidationError
+from typing import List, Dict, Any, Optional, Literal
+import asyncio
+import contextlib
+import functools
+import os
 import traceback
 
 # Importar nuestros analizadores
-from lexer_lynx import analizar_lexico
-from parser_lynx import analizar_sintactico
-from semantic_lynx import AnalizadorSemantico
+import admision_lynx
+import metricas_lynx
+import servicio_lynx
+import trazas_lynx
+from admision_lynx import PROFUNDIDAD, ControlAdmision, LimiteExcedido, Limites, segundos_reintento
+from servicio_lynx import AnalisisCancelado, ColaLlena, EjecutorAnalisis
+from sesiones_lynx import GestorSesiones
+from lote_lynx import TIPOS_TAR, TIPOS_ZIP, ErrorLote, ProgramaLote, analizar_lote, programas_de_archivo
+from sandbox_lynx import OK, GrupoEjecucion
 
-app = FastAPI(title="Analizador Lynx", version="1.0.0")
+# Trabajadores pre-creados para /ejecutar; se inician con la aplicación
+grupo_ejecucion = GrupoEjecucion(trabajadores=int(os.environ.get("LYNX_TRABAJADORES", "2")))
+
+# Hilos o procesos para el análisis léxico, sintáctico y semántico; el bucle
+# de eventos queda libre para /health y el resto de los clientes
+ejecutor_analisis = EjecutorAnalisis(
+    modo=os.environ.get("LYNX_ANALISIS_MODO", "procesos"),
+    trabajadores=int(os.environ.get("LYNX_ANALISIS_TRABAJADORES", "2")),
+    max_cola=int(os.environ.get("LYNX_ANALISIS_COLA", "64")),
+)
+
+# Límites de cada código analizado (ver admision_lynx); los procesos del
+# ejecutor los reciben al iniciarse
+admision_lynx.fijar_limites(Limites(
+    bytes=int(os.environ.get("LYNX_MAX_BYTES_CODIGO", str(admision_lynx.MAX_BYTES_CODIGO))),
+    tokens=int(os.environ.get("LYNX_MAX_TOKENS", str(admision_lynx.MAX_TOKENS))),
+    profundidad=int(os.environ.get("LYNX_MAX_PROFUNDIDAD", str(admision_lynx.MAX_PROFUNDIDAD))),
+))
+
+# Trazas en JSON por stderr: `LYNX_TRAZAS` es el nivel (depuracion, info,
+# advertencia, error; sin definir no hay trazas) y `LYNX_TRAZAS_MUESTREO` la
+# fracción de pedidos que se escriben
+trazas_lynx.configurar(
+    os.environ.get("LYNX_TRAZAS") or None,
+    float(os.environ.get("LYNX_TRAZAS_MUESTREO", "1")),
+)
+
+# Sesiones de /ws/sesion: se expulsan tras `LYNX_SESIONES_INACTIVIDAD` segundos
+# sin uso o, pasado el presupuesto de memoria, las usadas hace más tiempo
+gestor_sesiones = GestorSesiones(
+    inactividad=float(os.environ.get("LYNX_SESIONES_INACTIVIDAD", "600")),
+    max_bytes=int(os.environ.get("LYNX_SESIONES_MAX_BYTES", str(256 * 1024 * 1024))),
+    trabajadores=int(os.environ.get("LYNX_SESIONES_TRABAJADORES", "1")),
+)
+
+@contextlib.asynccontextmanager
+async def ciclo_de_vida(app: FastAPI):
+    ejecutor_analisis.iniciar()
+    grupo_ejecucion.iniciar()
+    gestor_sesiones.iniciar()
+    barrido = asyncio.create_task(gestor_sesiones.barrer_periodicamente())
+    try:
+        yield
+    finally:
+        barrido.cancel()
+        gestor_sesiones.cerrar()
+        grupo_ejecucion.cerrar()
+        ejecutor_analisis.cerrar()
+
+app = FastAPI(title="Analizador Lynx", version="1.0.0", lifespan=ciclo_de_vida)
+
+# Tope del cuerpo de /analizar-lote (lista o archivo)
+MAX_BYTES_LOTE = int(os.environ.get("LYNX_MAX_BYTES_LOTE", str(64 * 1024 * 1024)))
+# Tope de lo que un archivo del lote puede ocupar descomprimido
+MAX_BYTES_DESCOMPRIMIDOS = 4 * MAX_BYTES_LOTE
+# Tope del cuerpo del resto de los POST: con los escapes de JSON, el código
+# puede ocupar hasta el doble
+MAX_BYTES_CUERPO = int(os.environ.get("LYNX_MAX_BYTES_CUERPO", str(2 * admision_lynx.limites.bytes + 64 * 1024)))
+
+# Antes de leer el cuerpo: 413 si es demasiado grande, 429 si el cliente ya
+# tiene `LYNX_MAX_POR_CLIENTE` pedidos en curso. Va dentro de CORS para que
+# el navegador pueda leer el rechazo.
+app.add_middleware(
+    ControlAdmision,
+    max_bytes_cuerpo=MAX_BYTES_CUERPO,
+    max_por_cliente=int(os.environ.get("LYNX_MAX_POR_CLIENTE", "8")),
+    max_bytes_ruta={"/analizar-lote": MAX_BYTES_LOTE},
+    espera=lambda: ejecutor_analisis.espera_estimada(),
+)
 
 # Configurar CORS
 app.add_middleware(
@@ -19,11 +97,20 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Retry-After"],
 )
 
+# Por fuera de todo: el tramo de un pedido incluye los rechazos de admisión
+app.add_middleware(trazas_lynx.TrazasASGI)
+
 # Modelos Pydantic
 class CodigoRequest(BaseModel):
     codigo: str
+    # `rapido` para validación en vivo, `completo` para el análisis explícito
+    nivel: Literal["rapido", "completo"] = "completo"
+    # Serie de peticiones de la que solo interesa la última (por ejemplo, la
+    # validación de un editor): una nueva reemplaza a la que siga en curso
+    sesion: Optional[str] = None
 
 class Token(BaseModel):
     lexema: str
@@ -53,32 +140,97 @@ class AnalisisSemanticoResponse(BaseModel):
     tabla_simbolos: Optional[Dict[str, Any]] = None  # Agregamos la tabla de s├¡mbolos
     advertencias: List[str] = []  # Agregamos advertencias
 
-def ast_to_dict(node) -> Optional[Dict[str, Any]]:
-    if node is None:
-        return None
-    if isinstance(node, (str, int, float, bool)):
-        return {"valor": node, "tipo_primitivo": type(node).__name__}
-    if isinstance(node, list):
-        return {"tipo": "lista", "elementos": [ast_to_dict(item) for item in node]}
-    if isinstance(node, tuple):
-        return {"tipo": "tupla", "elementos": [ast_to_dict(item) for item in node]}
-    if hasattr(node, '__dict__'):
-        result = {'tipo': node.__class__.__name__, 'linea': node.linea}
-        for key, value in node.__dict__.items():
-            if key == 'linea':
-                continue
-            if isinstance(value, (str, int, float, bool)):
-                result[key] = {"valor": value, "tipo_primitivo": type(value).__name__}
-            elif isinstance(value, (list, tuple)):
-                result[key] = ast_to_dict(value)
-            elif hasattr(value, '__dict__'):
-                result[key] = ast_to_dict(value)
-            elif value is None:
-                result[key] = None
-            else:
-                result[key] = {"valor": str(value), "tipo_primitivo": "string"}
-        return result
-    return {"valor": str(node), "tipo_primitivo": "string"}
+class AnalisisUnificadoRequest(CodigoRequest):
+    # Lo que no se pide no se calcula; `errores` implica las tres fases
+    secciones: List[Literal["tokens", "ast", "errores", "tabla_simbolos", "advertencias"]] = list(
+        servicio_lynx.SECCIONES
+    )
+
+class AnalisisUnificadoResponse(BaseModel):
+    tokens: Optional[List[Token]] = None
+    ast: Optional[Dict[str, Any]] = None
+    errores: List[str]
+    tabla_simbolos: Optional[Dict[str, Any]] = None
+    advertencias: Optional[List[str]] = None
+    exito: bool
+    # Fases que corrieron, en orden: lexico, sintactico, semantico
+    fases: List[str]
+
+class ConsultaPosicionRequest(BaseModel):
+    codigo: str
+    linea: int  # Base 1
+    columna: int  # Base 0, igual que en los tokens
+
+class EjecucionRequest(BaseModel):
+    codigo: str
+    # Opcionales; nunca superan los límites del servidor
+    max_instrucciones: Optional[int] = Field(None, gt=0)
+    tiempo_maximo: Optional[float] = Field(None, gt=0)
+    # Incluir el perfil por línea y función (y las pilas colapsadas) en la respuesta
+    perfilar: bool = False
+
+class EjecucionResponse(BaseModel):
+    salida: List[str]
+    errores: List[str]
+    estado: str
+    exito: bool
+    tiempo_ms: float
+    instrucciones: int
+    perfil: Optional[Dict[str, Any]] = None
+
+class DefinicionResponse(BaseModel):
+    encontrado: bool
+    nombre: Optional[str] = None
+    definicion: Optional[Dict[str, int]] = None
+
+class ReferenciasResponse(BaseModel):
+    referencias: List[Dict[str, int]]
+
+class HoverResponse(BaseModel):
+    encontrado: bool
+    simbolo: Optional[Dict[str, Any]] = None
+    definicion: Optional[Dict[str, int]] = None
+    usos: int = 0
+
+class ProgramaLoteRequest(BaseModel):
+    codigo: str
+    nombre: Optional[str] = None
+
+class LoteRequest(BaseModel):
+    programas: List[ProgramaLoteRequest]
+    nivel: Literal["rapido", "completo"] = "completo"
+    # Programas del lote analizándose a la vez; por omisión, uno por trabajador
+    concurrencia: Optional[int] = None
+
+def esquema_en_linea(modelo) -> Dict[str, Any]:
+    """Esquema JSON del modelo con sus `$defs` resueltos, para `openapi_extra`"""
+    esquema = modelo.model_json_schema()
+    definiciones = esquema.pop("$defs", {})
+
+    def resolver(nodo):
+        if isinstance(nodo, dict):
+            if "$ref" in nodo:
+                return resolver(definiciones[nodo["$ref"].rsplit("/", 1)[-1]])
+            return {clave: resolver(valor) for clave, valor in nodo.items()}
+        if isinstance(nodo, list):
+            return [resolver(valor) for valor in nodo]
+        return nodo
+
+    return resolver(esquema)
+
+# Tipo de contenido para pedir el AST compacto por Accept (igual que ?version_ast=2)
+TIPO_AST_COMPACTO = "application/vnd.lynx.ast.v2+json"
+
+def version_ast_pedida(
+    request: Request,
+    version_ast: Optional[int] = Query(
+        None, ge=1, le=2, description="1: AST de siempre; 2: formato compacto (ver serializacion_lynx)"
+    ),
+) -> int:
+    """Versión del AST de la respuesta: la de la URL, si no la del Accept, si no la 1"""
+    if version_ast is not None:
+        return version_ast
+    return 2 if TIPO_AST_COMPACTO in request.headers.get("accept", "") else 1
 
 @app.get("/")
 async def root():
@@ -88,41 +240,109 @@ async def root():
 async def health_check():
     return {"status": "ok", "servicio": "Analizador Lynx"}
 
+def metricas_estado() -> List[str]:
+    """Lo que no se observa en el análisis: cola del ejecutor, sesiones y ejecuciones"""
+    familia = metricas_lynx.familia
+    ejecutor = ejecutor_analisis
+    eventos = {k: v for k, v in ejecutor.estadisticas.items() if k != "max_pendientes"}
+    return [
+        familia("lynx_ejecutor_pendientes", "gauge", "Análisis en curso o en cola", {(): ejecutor.pendientes}),
+        familia("lynx_ejecutor_en_cola", "gauge", "Análisis esperando un trabajador", {(): ejecutor.en_cola}),
+        familia("lynx_ejecutor_max_pendientes", "gauge", "Máximo de análisis pendientes a la vez",
+                {(): ejecutor.estadisticas["max_pendientes"]}),
+        familia("lynx_ejecutor_trabajadores", "gauge", "Trabajadores del ejecutor", {(): ejecutor.trabajadores}),
+        familia("lynx_ejecutor_espera_estimada_segundos", "gauge", "Segundos estimados para vaciar la cola",
+                {(): ejecutor.espera_estimada()}),
+        familia("lynx_ejecutor_total", "counter", "Pedidos al ejecutor por evento",
+                {(("evento", evento),): valor for evento, valor in eventos.items()}),
+        familia("lynx_sesiones_abiertas", "gauge", "Sesiones de /ws/sesion abiertas",
+                {(): len(gestor_sesiones.sesiones)}),
+        familia("lynx_sesiones_bytes", "gauge", "Memoria estimada de las sesiones", {(): gestor_sesiones.bytes}),
+        familia("lynx_sesiones_total", "counter", "Eventos de las sesiones",
+                {(("evento", evento),): valor for evento, valor in gestor_sesiones.estadisticas.items()}),
+        familia("lynx_ejecucion_total", "counter", "Eventos de /ejecutar",
+                {(("evento", evento),): valor for evento, valor in grupo_ejecucion.estadisticas.items()}),
+    ]
+
+@app.get("/metrics")
+async def metricas():
+    return Response(metricas_lynx.exponer(metricas_estado()), media_type="text/plain; version=0.0.4")
+
+def clave_analisis(funcion, argumentos, opciones=None):
+    """Misma función, mismo código y mismas opciones: mismo resultado"""
+    return (
+        funcion,
+        tuple(tuple(argumento) if isinstance(argumento, list) else argumento for argumento in argumentos),
+        tuple(sorted((opciones or {}).items())),
+    )
+
+async def analizar_en_ejecutor(funcion, *argumentos, sesion: Optional[str] = None, clave=None):
+    """Correr una función de servicio_lynx en el ejecutor; el primer argumento es el código
+
+    Pedidos iguales en curso (misma `clave`) comparten el cálculo. 413 si el
+    código pasa los límites de bytes o tokens y 422 si anida demasiado; 503
+    si la cola está llena; 409 si otro pedido de la misma `sesion` reemplazó
+    a este.
+    """
+    try:
+        admision_lynx.verificar_bytes(argumentos[0])
+        return await ejecutor_analisis.ejecutar(funcion, *argumentos, sesion=sesion, clave=clave)
+    except LimiteExcedido as e:
+        raise HTTPException(status_code=422 if e.limite == PROFUNDIDAD else 413, detail=str(e))
+    except ColaLlena as e:
+        raise HTTPException(
+            status_code=503, detail=str(e), headers={"Retry-After": segundos_reintento(e.espera)}
+        )
+    except AnalisisCancelado:
+        raise HTTPException(status_code=409, detail="Reemplazado por un análisis más reciente de la misma sesión")
+
+async def consultar_indice(request: ConsultaPosicionRequest, consulta: str):
+    """`definicion`, `referencias` o `hover` en la posición; None si el código no se analiza
+
+    El índice se guarda en la caché de este proceso: con trabajadores de
+    procesos, la de cada trabajador no la vería el pedido siguiente.
+    """
+    indice = servicio_lynx.cache_indices.obtener(request.codigo)
+    if indice is None:
+        argumentos = (request.codigo,)
+        indice = await analizar_en_ejecutor(
+            servicio_lynx.indice_referencias, *argumentos,
+            clave=clave_analisis(servicio_lynx.indice_referencias, argumentos),
+        )
+        if indice is None:
+            return None
+        servicio_lynx.cache_indices.guardar(request.codigo, indice)
+    return getattr(indice, consulta)(request.linea, request.columna)
+
+async def responder_json(funcion, *argumentos, sesion: Optional[str] = None, **opciones) -> Response:
+    """Respuesta escrita como JSON en el ejecutor
+
+    Devolver un Response evita que FastAPI valide y convierta la respuesta en
+    el bucle de eventos; `response_model` sigue documentando su forma.
+    """
+    contenido = await analizar_en_ejecutor(
+        functools.partial(servicio_lynx.como_json, funcion, **opciones), *argumentos,
+        sesion=sesion, clave=clave_analisis(funcion, argumentos, opciones),
+    )
+    return Response(content=contenido, media_type="application/json")
+
+async def responder_con_ast(funcion, version_ast: int, *argumentos, sesion: Optional[str] = None) -> Response:
+    """responder_json para las respuestas con AST, en la versión pedida"""
+    respuesta = await responder_json(funcion, *argumentos, sesion=sesion, para_json=True, version_ast=version_ast)
+    respuesta.headers["Vary"] = "Accept"
+    return respuesta
+
 @app.post("/analizar", response_model=AnalisisResponse)
-async def analizar_codigo(request: CodigoRequest):
+async def analizar_codigo(request: CodigoRequest, version_ast: int = Depends(version_ast_pedida)):
     try:
-        if not request.codigo.strip():
-            return AnalisisResponse(
-                tokens=[],
-                errores=["El código no puede estar vacío"],
-                ast=None,
-                exito=False
-            )
-        
-        tokens_data, errores_lexicos = analizar_lexico(request.codigo)
-        tokens = [Token(**token_data) for token_data in tokens_data]
-        errores_totales = errores_lexicos.copy()
-        ast_dict = None
-        
-        if not errores_lexicos:
-            try:
-                ast, errores_sintacticos = analizar_sintactico(request.codigo)
-                errores_totales.extend(errores_sintacticos)
-                if ast is not None:
-                    ast_dict = ast_to_dict(ast)
-            except Exception as e:
-                errores_totales.append(f"Error en análisis sintáctico: {str(e)}")
-                print(f"Error sintáctico detallado: {traceback.format_exc()}")
-        
-        return AnalisisResponse(
-            tokens=tokens,
-            errores=errores_totales,
-            ast=ast_dict,
-            exito=len(errores_totales) == 0
+        return await responder_con_ast(
+            servicio_lynx.analisis_completo, version_ast, request.codigo, request.nivel, sesion=request.sesion
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
-        print(f"Error general: {traceback.format_exc()}")
+        trazas_lynx.evento(trazas_lynx.ERROR, lambda: f"Error general: {traceback.format_exc()}")
         raise HTTPException(
             status_code=500, 
             detail=f"Error interno del servidor: {str(e)}"
@@ -131,58 +351,30 @@ async def analizar_codigo(request: CodigoRequest):
 @app.post("/analizar-lexico", response_model=AnalisisLexicoResponse)
 async def analizar_solo_lexico(request: CodigoRequest):
     try:
-        if not request.codigo.strip():
-            return AnalisisLexicoResponse(
-                tokens=[],
-                errores=["El código no puede estar vacío"],
-                exito=False
-            )
-        
-        tokens_data, errores = analizar_lexico(request.codigo)
-        tokens = [Token(**token_data) for token_data in tokens_data]
-        
-        return AnalisisLexicoResponse(
-            tokens=tokens,
-            errores=errores,
-            exito=len(errores) == 0
+        return await responder_json(
+            servicio_lynx.analisis_lexico, request.codigo, sesion=request.sesion, para_json=True
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
-        print(f"Error en análisis léxico: {traceback.format_exc()}")
+        trazas_lynx.evento(trazas_lynx.ERROR, lambda: f"Error en análisis léxico: {traceback.format_exc()}")
         raise HTTPException(
             status_code=500,
             detail=f"Error en análisis léxico: {str(e)}"
         )
 
 @app.post("/analizar-sintactico", response_model=AnalisisSintacticoResponse)
-async def analizar_solo_sintactico(request: CodigoRequest):
+async def analizar_solo_sintactico(request: CodigoRequest, version_ast: int = Depends(version_ast_pedida)):
     try:
-        if not request.codigo.strip():
-            return AnalisisSintacticoResponse(
-                ast=None,
-                errores=["El código no puede estar vacío"],
-                exito=False
-            )
-        
-        _, errores_lexicos = analizar_lexico(request.codigo)
-        if errores_lexicos:
-            return AnalisisSintacticoResponse(
-                ast=None,
-                errores=["No se puede realizar análisis sintáctico: existen errores léxicos"] + errores_lexicos,
-                exito=False
-            )
-        
-        ast, errores_sintacticos = analizar_sintactico(request.codigo)
-        ast_dict = ast_to_dict(ast) if ast is not None else None
-        
-        return AnalisisSintacticoResponse(
-            ast=ast_dict,
-            errores=errores_sintacticos,
-            exito=len(errores_sintacticos) == 0
+        return await responder_con_ast(
+            servicio_lynx.analisis_sintactico, version_ast, request.codigo, sesion=request.sesion
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
-        print(f"Error en análisis sintáctico: {traceback.format_exc()}")
+        trazas_lynx.evento(trazas_lynx.ERROR, lambda: f"Error en análisis sintáctico: {traceback.format_exc()}")
         raise HTTPException(
             status_code=500,
             detail=f"Error en análisis sintáctico: {str(e)}"
@@ -191,59 +383,147 @@ async def analizar_solo_sintactico(request: CodigoRequest):
 
 @app.post("/analizar-semantico", response_model=AnalisisSemanticoResponse)
 async def analizar_solo_semantico(request: CodigoRequest):
-    try:
-        if not request.codigo.strip():
-            return AnalisisSemanticoResponse(
-                errores=["El código no puede estar vacío"],
-                exito=False,
-                tabla_simbolos={},
-                advertencias=[]
-            )
-        
-        print("Analizando código:", request.codigo)  # Debug log
-        
-        # Análisis léxico y sintáctico
-        tokens, errores_lexicos = analizar_lexico(request.codigo)
-        if errores_lexicos:
-            return AnalisisSemanticoResponse(
-                errores=["No se puede realizar análisis semántico: existen errores léxicos"] + errores_lexicos,
-                exito=False,
-                tabla_simbolos={},
-                advertencias=[]
-            )
-        
-        ast, errores_sintacticos = analizar_sintactico(request.codigo)
-        print("AST generado:", ast_to_dict(ast))  # Debug log
-        
-        if errores_sintacticos:
-            return AnalisisSemanticoResponse(
-                errores=["No se puede realizar análisis semántico: existen errores sintácticos"] + errores_sintacticos,
-                exito=False,
-                tabla_simbolos={},
-                advertencias=[]
-            )
+    return await responder_json(
+        servicio_lynx.analisis_semantico, request.codigo, request.nivel, sesion=request.sesion
+    )
 
-        # Análisis semántico
-        analizador = AnalizadorSemantico()
-        resultado = analizador.analizar(ast, request.codigo)
-        
-        print("Resultado del análisis semántico:", resultado)  # Debug log
-        
-        return AnalisisSemanticoResponse(
-            errores=resultado['errores'],
-            advertencias=resultado['advertencias'],
-            tabla_simbolos=resultado['tabla_simbolos'],
-            exito=len(resultado['errores']) == 0
+@app.post("/analizar-unificado", response_model=AnalisisUnificadoResponse)
+async def analizar_unificado(request: AnalisisUnificadoRequest, version_ast: int = Depends(version_ast_pedida)):
+    """Léxico, sintáctico y semántico en una pasada; solo vienen las `secciones` pedidas"""
+    try:
+        return await responder_con_ast(
+            servicio_lynx.analisis_unificado, version_ast, request.codigo, request.secciones, request.nivel,
+            sesion=request.sesion,
         )
+
+    except HTTPException:
+        raise
     except Exception as e:
-        print(f"Error en análisis semántico: {traceback.format_exc()}")
-        return AnalisisSemanticoResponse(
-            errores=[f"Error interno: {str(e)}"],
-            exito=False,
-            tabla_simbolos={},
-            advertencias=[]
+        trazas_lynx.evento(trazas_lynx.ERROR, lambda: f"Error en análisis unificado: {traceback.format_exc()}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error interno del servidor: {str(e)}"
         )
 
+@app.post("/definicion", response_model=DefinicionResponse)
+async def ir_a_definicion(request: ConsultaPosicionRequest):
+    resultado = await consultar_indice(request, "definicion")
+    if resultado is None:
+        return DefinicionResponse(encontrado=False)
+    return DefinicionResponse(encontrado=True, **resultado)
+
+@app.post("/referencias", response_model=ReferenciasResponse)
+async def buscar_referencias(request: ConsultaPosicionRequest):
+    resultado = await consultar_indice(request, "referencias")
+    return ReferenciasResponse(referencias=resultado or [])
+
+@app.post("/hover", response_model=HoverResponse)
+async def informacion_hover(request: ConsultaPosicionRequest):
+    resultado = await consultar_indice(request, "hover")
+    if resultado is None:
+        return HoverResponse(encontrado=False)
+    return HoverResponse(encontrado=True, **resultado)
+
+@app.post(
+    "/analizar-lote",
+    response_class=StreamingResponse,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": dict(
+                {"application/json": {"schema": esquema_en_linea(LoteRequest)}},
+                **{tipo: {"schema": {"type": "string", "format": "binary"}} for tipo in TIPOS_ZIP + TIPOS_TAR},
+            ),
+        },
+        "responses": {"200": {"content": {"application/x-ndjson": {}}}},
+    },
+)
+async def analizar_lote_programas(request: Request, nivel: Literal["rapido", "completo"] = "completo",
+                                  concurrencia: Optional[int] = None):
+    """Analizar muchos programas: una línea NDJSON por programa, en cuanto termina
+
+    El cuerpo es un LoteRequest en JSON o un archivo zip/tar con programas
+    `.lynx`; para un archivo, `nivel` y `concurrencia` van en la URL.
+    """
+    cuerpo = bytearray()
+    async for trozo in request.stream():
+        cuerpo += trozo
+        if len(cuerpo) > MAX_BYTES_LOTE:
+            raise HTTPException(status_code=413, detail=f"El lote supera los {MAX_BYTES_LOTE} bytes")
+
+    tipo = request.headers.get("content-type", "application/json").split(";")[0].strip().lower()
+    try:
+        if tipo == "application/json":
+            lote = LoteRequest.model_validate_json(bytes(cuerpo))
+            programas = [
+                ProgramaLote(programa.nombre or f"programa_{indice}", programa.codigo)
+                for indice, programa in enumerate(lote.programas)
+            ]
+            nivel, concurrencia = lote.nivel, lote.concurrencia
+        elif tipo in TIPOS_ZIP + TIPOS_TAR:
+            programas = await asyncio.to_thread(
+                programas_de_archivo, bytes(cuerpo), tipo, MAX_BYTES_DESCOMPRIMIDOS
+            )
+        else:
+            raise HTTPException(status_code=415, detail=f"Tipo de contenido no soportado: {tipo}")
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=e.errors(include_url=False, include_input=False))
+    except ErrorLote as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return StreamingResponse(
+        analizar_lote(ejecutor_analisis, programas, nivel, concurrencia or ejecutor_analisis.trabajadores),
+        media_type="application/x-ndjson",
+    )
+
+@app.websocket("/ws/sesion")
+async def sesion_en_vivo(websocket: WebSocket):
+    """Validación en vivo: llegan los cambios de Monaco, salen los marcadores agregados y eliminados
+
+    El protocolo está descrito en sesiones_lynx. Mientras se analiza una
+    versión se siguen recibiendo cambios; al terminar se analiza la última.
+    """
+    await websocket.accept()
+    sesion = gestor_sesiones.crear()
+    hay_version_nueva = asyncio.Event()
+
+    async def analizar():
+        while True:
+            await hay_version_nueva.wait()
+            hay_version_nueva.clear()
+            respuesta = await gestor_sesiones.analizar(sesion)
+            if respuesta is not None:
+                await websocket.send_json(respuesta)
+
+    analisis = asyncio.create_task(analizar())
+    try:
+        while True:
+            try:
+                mensaje = await websocket.receive_json()
+            except ValueError:
+                await websocket.send_json({"tipo": "error", "mensaje": "El mensaje no es JSON válido"})
+                continue
+            respuesta = gestor_sesiones.recibir(sesion, mensaje)
+            if respuesta is None:
+                hay_version_nueva.set()
+            else:
+                await websocket.send_json(respuesta)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        analisis.cancel()
+        gestor_sesiones.cerrar_sesion(sesion)
+
+@app.post("/ejecutar", response_model=EjecucionResponse)
+async def ejecutar_programa(request: EjecucionRequest):
+    if not request.codigo.strip():
+        return EjecucionResponse(salida=[], errores=["El código no puede estar vacío"], estado="error_compilacion",
+                                 exito=False, tiempo_ms=0, instrucciones=0)
+    resultado = await grupo_ejecucion.ejecutar_async(
+        request.codigo, request.max_instrucciones, request.tiempo_maximo, request.perfilar
+    )
+    return EjecucionResponse(exito=resultado["estado"] == OK, **resultado)
+
 if __name__ == "__main__":
     import uvicorn
     print("Iniciando servidor FastAPI para Analizador Lynx...")
@@ -0,0 +1,211 @@
+"""Métricas del análisis en el formato de texto de Prometheus (/metrics)
+
+Histogramas del tiempo de cada fase (léxico, sintáctico, semántico y
+serialización), del tamaño de la entrada y de la cantidad de tokens;
+contadores de errores por fase, de consultas a cachés y de límites de
+admisión excedidos.
+
+Observar no toma candados: cada hilo suma en su propia fila de números y
+solo la primera vez toma uno para registrarla. Un trabajador de procesos
+escribe en su fila de la memoria compartida del EjecutorAnalisis
+(usar_memoria_compartida). `exponer` suma todas las filas cuando alguien
+pide /metrics; una métrica leída a mitad de una observación puede venir con
+esa observación de menos, que llega en la próxima lectura.
+"""
+import bisect
+import threading
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Límites superiores de los baldes
+SEGUNDOS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+CARACTERES = (64, 256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+CANTIDAD_TOKENS = (16, 64, 256, 1024, 4096, 16384, 65536, 262144)
+
+_metricas: List["_Metrica"] = []
+_tamano = 0
+
+
+class _Metrica:
+    """Una familia de series: `etiquetas` son los nombres, `series` las combinaciones de valores"""
+
+    tipo = ""
+    ancho = 1
+
+    def __init__(self, nombre: str, ayuda: str, etiquetas: Sequence[str] = (),
+                 series: Iterable[Tuple[str, ...]] = ((),)):
+        global _tamano
+        self.nombre = nombre
+        self.ayuda = ayuda
+        self.etiquetas = tuple(etiquetas)
+        self.series = [tuple(serie) for serie in series]
+        self.inicio = _tamano
+        self._bases = {serie: self.inicio + i * self.ancho for i, serie in enumerate(self.series)}
+        _tamano += len(self.series) * self.ancho
+        _metricas.append(self)
+
+    def _etiquetas(self, serie: Tuple[str, ...], extra: str = "") -> str:
+        pares = [f'{nombre}="{valor}"' for nombre, valor in zip(self.etiquetas, serie)]
+        if extra:
+            pares.append(extra)
+        return "{" + ",".join(pares) + "}" if pares else ""
+
+
+class Contador(_Metrica):
+    tipo = "counter"
+
+    def sumar(self, *serie: str, cantidad: float = 1):
+        _fila()[self._bases[serie]] += cantidad
+
+    def _lineas(self, fila: List[float]) -> Iterable[str]:
+        for serie, base in self._bases.items():
+            yield f"{self.nombre}{self._etiquetas(serie)} {_numero(fila[base])}"
+
+
+class Histograma(_Metrica):
+    """Baldes sin acumular (el último es +Inf) y la suma; la cuenta es el total de los baldes"""
+
+    tipo = "histogram"
+
+    def __init__(self, nombre: str, ayuda: str, limites: Sequence[float], etiquetas: Sequence[str] = (),
+                 series: Iterable[Tuple[str, ...]] = ((),)):
+        self.limites = tuple(limites)
+        self.ancho = len(self.limites) + 2
+        super().__init__(nombre, ayuda, etiquetas, series)
+
+    def observar(self, valor: float, *serie: str):
+        fila = _fila()
+        base = self._bases[serie]
+        fila[base + bisect.bisect_left(self.limites, valor)] += 1
+        fila[base + self.ancho - 1] += valor
+
+    def _lineas(self, fila: List[float]) -> Iterable[str]:
+        for serie, base in self._bases.items():
+            acumulado = 0.0
+            for limite, cantidad in zip(self.limites + ("+Inf",), fila[base:base + self.ancho - 1]):
+                acumulado += cantidad
+                le = f'le="{limite}"'
+                yield f"{self.nombre}_bucket{self._etiquetas(serie, le)} {_numero(acumulado)}"
+            yield f"{self.nombre}_sum{self._etiquetas(serie)} {_numero(fila[base + self.ancho - 1])}"
+            yield f"{self.nombre}_count{self._etiquetas(serie)} {_numero(acumulado)}"
+
+
+def _numero(valor: float) -> str:
+    return str(int(valor)) if valor == int(valor) else repr(valor)
+
+
+FASES = ("lexico", "sintactico", "semantico")
+CACHES = ("indices", "tokens_sesion")
+
+lexico_segundos = Histograma("lynx_lexico_segundos", "Tiempo de tokenizar una entrada completa", SEGUNDOS)
+sintactico_segundos = Histograma("lynx_sintactico_segundos", "Tiempo de parsear", SEGUNDOS)
+semantico_segundos = Histograma("lynx_semantico_segundos", "Tiempo del análisis semántico", SEGUNDOS)
+serializacion_segundos = Histograma(
+    "lynx_serializacion_segundos", "Tiempo de convertir tokens y AST y de escribir el JSON de la respuesta",
+    SEGUNDOS, ("etapa",), [("tokens",), ("ast",), ("json",)],
+)
+entrada_caracteres = Histograma("lynx_entrada_caracteres", "Tamaño del código tokenizado", CARACTERES)
+entrada_tokens = Histograma("lynx_entrada_tokens", "Tokens del código tokenizado", CANTIDAD_TOKENS)
+errores = Contador("lynx_errores_total", "Errores reportados, por fase", ("fase",), [(fase,) for fase in FASES])
+cache_consultas = Contador(
+    "lynx_cache_consultas_total", "Consultas a cachés: índices de referencias y tokens de una sesión",
+    ("cache", "resultado"), [(cache, resultado) for cache in CACHES for resultado in ("acierto", "fallo")],
+)
+limites_excedidos = Contador(
+    "lynx_limites_excedidos_total", "Códigos rechazados por un límite de admisión",
+    ("limite",), [("bytes",), ("tokens",), ("profundidad",)],
+)
+rechazos_admision = Contador(
+    "lynx_admision_rechazos_total", "Pedidos rechazados por ControlAdmision antes de leer el cuerpo",
+    ("motivo",), [("cuerpo_grande",), ("por_cliente",)],
+)
+
+# Tamaño de una fila: todas las métricas ya están definidas
+TAMANO = _tamano
+
+_local = threading.local()
+_filas: List[List[float]] = []
+_candado = threading.Lock()
+# En un trabajador de procesos: su fila en la memoria compartida
+_fila_proceso = None
+_memorias: list = []
+
+
+def _fila():
+    try:
+        return _local.fila
+    except AttributeError:
+        pass
+    fila = _fila_proceso
+    if fila is None:
+        fila = [0.0] * TAMANO
+        with _candado:
+            _filas.append(fila)
+    _local.fila = fila
+    return fila
+
+
+def memoria_compartida(contexto, trabajadores: int):
+    """Filas para `trabajadores` procesos y el contador que reparte una a cada uno"""
+    memoria = contexto.Array("d", trabajadores * TAMANO, lock=False)
+    with _candado:
+        _memorias.append((memoria, trabajadores))
+    return memoria, contexto.Value("i", 0)
+
+
+def usar_memoria_compartida(memoria, siguiente):
+    """En el arranque de un trabajador: tomar la próxima fila libre de `memoria`
+
+    Si ya no quedan (un trabajador de reemplazo) se sigue con una fila propia,
+    que no se ve desde /metrics.
+    """
+    global _fila_proceso
+    with siguiente.get_lock():
+        indice = siguiente.value
+        siguiente.value += 1
+    if (indice + 1) * TAMANO > len(memoria):
+        return
+    vista = memoryview(memoria).cast("B").cast("d")
+    _fila_proceso = vista[indice * TAMANO:(indice + 1) * TAMANO]
+
+
+def _sumar_filas() -> List[float]:
+    total = [0.0] * TAMANO
+    with _candado:
+        filas = list(_filas)
+        memorias = list(_memorias)
+    for memoria, trabajadores in memorias:
+        valores = memoria[:]
+        filas.extend(valores[i * TAMANO:(i + 1) * TAMANO] for i in range(trabajadores))
+    for fila in filas:
+        for i, valor in enumerate(fila):
+            total[i] += valor
+    return total
+
+
+def familia(nombre: str, tipo: str, ayuda: str, muestras: Dict[Tuple[Tuple[str, str], ...], float]) -> str:
+    """Texto de una familia que no se observa aquí (la profundidad de la cola, por ejemplo)"""
+    lineas = [f"# HELP {nombre} {ayuda}", f"# TYPE {nombre} {tipo}"]
+    for etiquetas, valor in muestras.items():
+        texto = "{" + ",".join(f'{clave}="{v}"' for clave, v in etiquetas) + "}" if etiquetas else ""
+        lineas.append(f"{nombre}{texto} {_numero(float(valor))}")
+    return "\n".join(lineas) + "\n"
+
+
+def exponer(adicionales: Optional[Iterable[str]] = None) -> str:
+    """Todas las métricas en formato de texto de Prometheus, más las `adicionales` ya escritas con familia"""
+    total = _sumar_filas()
+    partes = []
+    for metrica in _metricas:
+        partes.append(f"# HELP {metrica.nombre} {metrica.ayuda}\n# TYPE {metrica.nombre} {metrica.tipo}\n")
+        partes.append("\n".join(metrica._lineas(total)) + "\n")
+
+    proporciones = {}
+    for cache in CACHES:
+        aciertos = total[cache_consultas._bases[(cache, "acierto")]]
+        consultas = aciertos + total[cache_consultas._bases[(cache, "fallo")]]
+        proporciones[(("cache", cache),)] = aciertos / consultas if consultas else 0.0
+    partes.append(familia(
+        "lynx_cache_proporcion_aciertos", "gauge", "Aciertos sobre consultas de cada caché", proporciones
+    ))
+    partes.extend(adicionales or ())
+    return "".join(partes)
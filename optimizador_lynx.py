@@ -0,0 +1,739 @@
+import sys
+import time
+from collections import Counter, defaultdict
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+from flujo_lynx import (
+    ADELANTE,
+    ATRAS,
+    INTERSECCION,
+    UNION,
+    GrafoFlujo,
+    ProblemaFlujo,
+    iterar_bits,
+    resolver_flujo,
+)
+from interprete_lynx import ErrorCompilacion, analizar_programa
+from ir_lynx import (
+    OPERACIONES_INOCUAS,
+    OPERACIONES_PURAS,
+    SALTOS,
+    TERMINALES,
+    FuncionIR,
+    Instruccion,
+    clave_operando,
+    es_constante,
+    es_entero,
+    formatear_ir,
+    generar_ir,
+)
+from runtime_lynx import OPERACIONES_BINARIAS, OPERACIONES_UNARIAS, ErrorEjecucion
+
+# Pases de optimización sobre la IR de ir_lynx. Cada pase recibe una FuncionIR
+# (las anidadas se optimizan por separado), la modifica en su lugar y retorna
+# un contador de cambios. Los pases respetan la semántica de errores de Lynx:
+# una operación que puede fallar solo se elimina si su resultado es constante,
+# y si se adelanta fuera de un bucle su error se lanza en el sitio original.
+
+ESCALARES = (int, float, str, bool, type(None))
+
+COMPARACIONES = {"==", "!=", "<", ">", "<=", ">="}
+
+
+# -- Consultas sobre instrucciones ------------------------------------------------
+
+
+def ranura_definida(instruccion: Instruccion) -> Optional[int]:
+    destino = instruccion.destino
+    if destino is not None and destino[0] == "l":
+        return destino[1]
+    return None
+
+
+def ranuras_leidas(instruccion: Instruccion) -> List[int]:
+    return [a[1] for a in instruccion.args if a[0] == "l"]
+
+
+def bits_leidos(instruccion: Instruccion) -> int:
+    bits = 0
+    for ranura in ranuras_leidas(instruccion):
+        bits |= 1 << ranura
+    return bits
+
+
+def definiciones(funcion: FuncionIR) -> Dict[int, List[Instruccion]]:
+    resultado: Dict[int, List[Instruccion]] = defaultdict(list)
+    for instruccion in funcion.instrucciones:
+        ranura = ranura_definida(instruccion)
+        if ranura is not None:
+            resultado[ranura].append(instruccion)
+    return resultado
+
+
+def ranuras_enteras(funcion: FuncionIR) -> Set[int]:
+    """Ranuras que solo pueden contener enteros: definidas con constantes enteras
+    o con +, -, * entre enteros (punto fijo optimista)"""
+    defs = definiciones(funcion)
+    candidatas = {
+        ranura for ranura in defs
+        if ranura > funcion.aridad and ranura not in funcion.volatiles
+    }
+
+    def entero(operando) -> bool:
+        return es_entero(operando) or (operando[0] == "l" and operando[1] in candidatas)
+
+    cambio = True
+    while cambio:
+        cambio = False
+        for ranura in list(candidatas):
+            for instruccion in defs[ranura]:
+                if instruccion.op == "copiar" and entero(instruccion.args[0]):
+                    continue
+                if (
+                    instruccion.op == "binaria"
+                    and instruccion.extra in ("+", "-", "*")
+                    and all(entero(a) for a in instruccion.args)
+                ):
+                    continue
+                candidatas.discard(ranura)
+                cambio = True
+                break
+    return candidatas
+
+
+def ranuras_booleanas(funcion: FuncionIR) -> Set[int]:
+    """Ranuras que solo pueden contener booleanos (comparaciones, `no`, constantes)"""
+    defs = definiciones(funcion)
+    candidatas = {
+        ranura for ranura in defs
+        if ranura > funcion.aridad and ranura not in funcion.volatiles
+    }
+
+    def booleano(operando) -> bool:
+        if operando[0] == "c":
+            return type(operando[1]) is bool
+        return operando[0] == "l" and operando[1] in candidatas
+
+    cambio = True
+    while cambio:
+        cambio = False
+        for ranura in list(candidatas):
+            for instruccion in defs[ranura]:
+                if instruccion.op == "copiar" and booleano(instruccion.args[0]):
+                    continue
+                if instruccion.op == "binaria" and instruccion.extra in COMPARACIONES:
+                    continue
+                if instruccion.op == "unaria" and instruccion.extra == "no":
+                    continue
+                candidatas.discard(ranura)
+                cambio = True
+                break
+    return candidatas
+
+
+def es_operando_entero(operando, enteros: Set[int]) -> bool:
+    return es_entero(operando) or (operando[0] == "l" and operando[1] in enteros)
+
+
+def puede_fallar(instruccion: Instruccion, enteros: Set[int]) -> bool:
+    op = instruccion.op
+    if op in OPERACIONES_INOCUAS:
+        return False
+    if op == "binaria":
+        if instruccion.extra in ("==", "!="):
+            return False
+        if instruccion.extra in ("+", "-", "*", "<", ">", "<=", ">="):
+            return not all(es_operando_entero(a, enteros) for a in instruccion.args)
+        return True
+    if op == "unaria":
+        return instruccion.extra == "no" or not es_operando_entero(instruccion.args[0], enteros)
+    return True
+
+
+def protegidas(funcion: FuncionIR) -> Set[int]:
+    """Ranuras cuyo valor se observa fuera del flujo normal de la función"""
+    ranuras = funcion.capturadas | funcion.volatiles
+    if any(i.op == "intentar" for i in funcion.instrucciones):
+        # Un manejador puede leer cualquier variable desde cualquier punto del intento
+        ranuras |= set(range(1, funcion.num_ranuras)) - funcion.temporales
+    return ranuras
+
+
+# -- Grafo de flujo ---------------------------------------------------------------
+
+
+def construir_grafo(funcion: FuncionIR) -> GrafoFlujo:
+    """Bloques básicos de la IR; las sentencias de cada bloque son instrucciones
+
+    El bloque de entrada queda vacío y tiene una arista a cada manejador, así un
+    análisis de intersección no supone nada al entrar a `capturar`.
+    """
+    grafo = GrafoFlujo(funcion.nombre)
+    actual = grafo.nuevo_bloque()
+    grafo.conectar(grafo.entrada, actual.indice)
+    bloque_de_etiqueta: Dict[str, int] = {}
+    manejador_de: Dict[int, Optional[str]] = {}
+    manejadores: List[str] = []
+    cae: Dict[int, bool] = {}
+
+    def nuevo(continua: bool):
+        nonlocal actual
+        cae[actual.indice] = continua
+        actual = grafo.nuevo_bloque()
+        manejador_de[actual.indice] = manejadores[-1] if manejadores else None
+
+    manejador_de[actual.indice] = None
+    for instruccion in funcion.instrucciones:
+        op = instruccion.op
+        if op == "etiqueta":
+            if any(i.op != "etiqueta" for i in actual.sentencias):
+                nuevo(True)
+            bloque_de_etiqueta[instruccion.extra] = actual.indice
+            actual.sentencias.append(instruccion)
+            continue
+        if op in ("intentar", "fin_intentar"):
+            if any(i.op != "etiqueta" for i in actual.sentencias):
+                nuevo(True)
+            actual.sentencias.append(instruccion)
+            if op == "intentar":
+                manejadores.append(instruccion.extra)
+            else:
+                manejadores.pop()
+            nuevo(True)
+            continue
+        actual.sentencias.append(instruccion)
+        if op in SALTOS or op in TERMINALES:
+            nuevo(op not in TERMINALES)
+    cae[actual.indice] = False
+
+    salida = grafo.nuevo_bloque()
+    grafo.salida = salida.indice
+    for bloque in grafo.bloques[1:-1]:
+        ultima = bloque.sentencias[-1] if bloque.sentencias else None
+        if ultima is not None:
+            etiqueta = ultima.etiqueta_destino()
+            if etiqueta is not None and ultima.op != "intentar":
+                grafo.conectar(bloque.indice, bloque_de_etiqueta[etiqueta])
+            if ultima.op in ("retornar", "relanzar"):
+                grafo.conectar(bloque.indice, salida.indice)
+        if cae.get(bloque.indice) and bloque.indice + 1 < salida.indice:
+            grafo.conectar(bloque.indice, bloque.indice + 1)
+        manejador = manejador_de.get(bloque.indice)
+        if manejador is not None:
+            grafo.conectar(bloque.indice, bloque_de_etiqueta[manejador])
+            grafo.conectar(grafo.entrada, bloque_de_etiqueta[manejador])
+    return grafo
+
+
+def aplanar(funcion: FuncionIR, grafo: GrafoFlujo, quitar: Set[int]):
+    """Volver a la lista de instrucciones, sin las marcadas por id"""
+    funcion.instrucciones = [
+        instruccion
+        for bloque in grafo.bloques
+        for instruccion in bloque.sentencias
+        if id(instruccion) not in quitar
+    ]
+
+
+class CopiasDisponibles(ProblemaFlujo):
+    """Copias `x = y` que siguen valiendo: hacia adelante, intersección"""
+
+    direccion = ADELANTE
+    encuentro = INTERSECCION
+
+    def __init__(self, grafo: GrafoFlujo, copias: List[Instruccion], menciones: Dict[int, int]):
+        super().__init__(grafo)
+        self.universo = (1 << len(copias)) - 1
+        indice = {id(copia): i for i, copia in enumerate(copias)}
+        for bloque in grafo.bloques:
+            gen = kill = 0
+            for instruccion in bloque.sentencias:
+                ranura = ranura_definida(instruccion)
+                if ranura is not None:
+                    mencion = menciones.get(ranura, 0)
+                    gen &= ~mencion
+                    kill |= mencion
+                if id(instruccion) in indice:
+                    gen |= 1 << indice[id(instruccion)]
+            self.gen.append(gen)
+            self.kill.append(kill)
+
+
+class VivasIR(ProblemaFlujo):
+    """Ranuras vivas: hacia atrás, unión"""
+
+    direccion = ATRAS
+    encuentro = UNION
+
+    def __init__(self, grafo: GrafoFlujo, siempre_vivas: int):
+        super().__init__(grafo)
+        self.siempre_vivas = siempre_vivas
+        for bloque in grafo.bloques:
+            gen = kill = 0
+            for instruccion in reversed(bloque.sentencias):
+                ranura = ranura_definida(instruccion)
+                if ranura is not None:
+                    gen &= ~(1 << ranura)
+                    kill |= 1 << ranura
+                gen |= bits_leidos(instruccion)
+            self.gen.append(gen)
+            self.kill.append(kill & ~siempre_vivas)
+
+    def frontera(self) -> int:
+        return self.siempre_vivas
+
+
+# -- Pases --------------------------------------------------------------------------
+
+
+def plegar(instruccion: Instruccion) -> Optional[str]:
+    """Evaluar en compilación una instrucción con operandos constantes
+
+    Retorna "plegada" si cambió, "quitar" si ya no hace falta, None si no aplica.
+    """
+    op = instruccion.op
+    args = instruccion.args
+    if not args or not all(es_constante(a) for a in args):
+        return None
+    if op in ("binaria", "unaria") and not instruccion.especulativa:
+        valores = [a[1] for a in args]
+        try:
+            if op == "binaria":
+                valor = OPERACIONES_BINARIAS[instruccion.extra](*valores)
+            else:
+                valor = OPERACIONES_UNARIAS[instruccion.extra](*valores)
+        except ErrorEjecucion:
+            return None  # el error se produce al ejecutar, en su línea
+        if not isinstance(valor, ESCALARES):
+            return None
+        instruccion.op = "copiar"
+        instruccion.args = [("c", valor)]
+        instruccion.extra = None
+        return "plegada"
+    if op in ("si_falso", "si_verdadero", "booleano"):
+        valor = args[0][1]
+        if valor is not True and valor is not False:
+            return None  # falla al ejecutar
+        if op == "booleano":
+            return "quitar"
+        if valor is (op == "si_verdadero"):
+            instruccion.op = "saltar"
+            instruccion.extra = instruccion.extra[0]
+            instruccion.args = []
+            return "plegada"
+        return "quitar"
+    if op == "verificar":
+        return "quitar"
+    return None
+
+
+def propagar_copias(funcion: FuncionIR) -> Dict[str, int]:
+    """Reemplazar lecturas de `x` por `y` donde la copia `x = y` sigue vigente,
+    y plegar las operaciones que quedan con operandos constantes"""
+    cambios = Counter()
+    volatiles = funcion.volatiles
+    grafo = construir_grafo(funcion)
+
+    def es_copia(instruccion: Instruccion) -> bool:
+        if instruccion.op != "copiar":
+            return False
+        destino = ranura_definida(instruccion)
+        fuente = instruccion.args[0]
+        if destino is None or destino in volatiles:
+            return False
+        if fuente[0] == "c":
+            return True
+        return fuente[0] == "l" and fuente[1] not in volatiles and fuente[1] != destino
+
+    copias = [i for b in grafo.bloques for i in b.sentencias if es_copia(i)]
+    menciones: Dict[int, int] = defaultdict(int)
+    for n, copia in enumerate(copias):
+        menciones[copia.destino[1]] |= 1 << n
+        if copia.args[0][0] == "l":
+            menciones[copia.args[0][1]] |= 1 << n
+    entrada, _ = resolver_flujo(CopiasDisponibles(grafo, copias, menciones))
+
+    quitar: Set[int] = set()
+    for bloque in grafo.bloques:
+        vigentes = {copias[n].destino[1]: copias[n].args[0] for n in iterar_bits(entrada[bloque.indice])}
+        for instruccion in bloque.sentencias:
+            for i, operando in enumerate(instruccion.args):
+                if operando[0] == "l" and operando[1] in vigentes:
+                    instruccion.args[i] = vigentes[operando[1]]
+                    cambios["reemplazos"] += 1
+            resultado = plegar(instruccion)
+            if resultado == "quitar":
+                quitar.add(id(instruccion))
+                cambios["quitadas"] += 1
+                continue
+            if resultado == "plegada":
+                cambios["plegadas"] += 1
+
+            ranura = ranura_definida(instruccion)
+            if ranura is not None:
+                for destino in [d for d, f in vigentes.items() if d == ranura or f == ("l", ranura)]:
+                    del vigentes[destino]
+                if es_copia(instruccion):
+                    vigentes[ranura] = instruccion.args[0]
+    aplanar(funcion, grafo, quitar)
+    return cambios
+
+
+def eliminar_subexpresiones(funcion: FuncionIR) -> Dict[str, int]:
+    """CSE local: una operación pura repetida en el mismo bloque reutiliza el
+    resultado anterior mientras ninguno de sus operandos cambie"""
+    cambios = Counter()
+    volatiles = funcion.volatiles
+    grafo = construir_grafo(funcion)
+    for bloque in grafo.bloques:
+        disponibles: Dict[tuple, tuple] = {}
+        for instruccion in bloque.sentencias:
+            clave = None
+            if (
+                instruccion.op in OPERACIONES_PURAS
+                and not instruccion.especulativa
+                and ranura_definida(instruccion) is not None
+                and ranura_definida(instruccion) not in volatiles
+                and all(a[0] == "c" or (a[0] == "l" and a[1] not in volatiles) for a in instruccion.args)
+            ):
+                clave = (instruccion.op, instruccion.extra, tuple(clave_operando(a) for a in instruccion.args))
+                anterior = disponibles.get(clave)
+                if anterior is not None:
+                    instruccion.op = "copiar"
+                    instruccion.args = [anterior]
+                    instruccion.extra = None
+                    cambios["reutilizadas"] += 1
+                    clave = None
+
+            ranura = ranura_definida(instruccion)
+            if ranura is not None:
+                leida = ("l", ranura)
+                for vieja in [
+                    k for k, destino in disponibles.items() if destino == leida or leida in k[2]
+                ]:
+                    del disponibles[vieja]
+                if clave is not None and leida not in clave[2]:
+                    disponibles[clave] = instruccion.destino
+    return cambios
+
+
+def posiciones_etiquetas(funcion: FuncionIR) -> Dict[str, int]:
+    return {
+        instruccion.extra: i
+        for i, instruccion in enumerate(funcion.instrucciones)
+        if instruccion.op == "etiqueta"
+    }
+
+
+def bucles_de_adentro_hacia_afuera(funcion: FuncionIR) -> List[tuple]:
+    posiciones = posiciones_etiquetas(funcion)
+    bucles = [b for b in funcion.bucles if b[0] in posiciones and b[1] in posiciones]
+    return sorted(bucles, key=lambda b: posiciones[b[1]] - posiciones[b[0]])
+
+
+def reducir_fuerza(funcion: FuncionIR) -> Dict[str, int]:
+    """Operaciones enteras más baratas: x * 2 -> x + x, x * 1 -> x, y los
+    productos `i * k` de una variable de inducción se mantienen con sumas"""
+    cambios = Counter()
+    enteros = ranuras_enteras(funcion)
+
+    for instruccion in funcion.instrucciones:
+        if instruccion.op != "binaria" or not all(es_operando_entero(a, enteros) for a in instruccion.args):
+            continue
+        a, b = instruccion.args
+        op = instruccion.extra
+        if op == "*" and es_entero(a) and not es_entero(b):
+            a, b = b, a
+        if not es_entero(b) or es_entero(a):
+            continue
+        k = b[1]
+        if op == "*" and k == 2:
+            instruccion.extra = "+"
+            instruccion.args = [a, a]
+        elif (op == "*" and k == 1) or (op in ("+", "-") and k == 0):
+            instruccion.op, instruccion.args, instruccion.extra = "copiar", [a], None
+        elif op == "*" and k == 0:
+            instruccion.op, instruccion.args, instruccion.extra = "copiar", [("c", 0)], None
+        else:
+            continue
+        cambios["algebraicas"] += 1
+
+    cuentas = Counter(ranura_definida(i) for i in funcion.instrucciones)
+    for cabecera, salida in bucles_de_adentro_hacia_afuera(funcion):
+        posiciones = posiciones_etiquetas(funcion)
+        inicio, fin = posiciones[cabecera], posiciones[salida]
+        region = funcion.instrucciones[inicio + 1:fin]
+
+        defs_region: Dict[int, List[Instruccion]] = defaultdict(list)
+        for instruccion in region:
+            ranura = ranura_definida(instruccion)
+            if ranura is not None:
+                defs_region[ranura].append(instruccion)
+
+        def paso(instruccion: Instruccion, ranura: int) -> Optional[int]:
+            """Incremento constante de `ranura = ranura ± c`"""
+            if instruccion.op != "binaria" or instruccion.extra not in ("+", "-"):
+                return None
+            a, b = instruccion.args
+            if instruccion.extra == "+" and es_entero(a) and b == ("l", ranura):
+                a, b = b, a
+            if a == ("l", ranura) and es_entero(b):
+                return b[1] if instruccion.extra == "+" else -b[1]
+            return None
+
+        induccion = {
+            ranura for ranura, defs in defs_region.items()
+            if ranura in enteros and all(paso(d, ranura) is not None for d in defs)
+        }
+        if not induccion:
+            continue
+
+        derivadas: Dict[tuple, tuple] = {}
+        preambulo: List[Instruccion] = []
+        for instruccion in region:
+            destino = ranura_definida(instruccion)
+            if instruccion.op != "binaria" or instruccion.extra != "*" or cuentas[destino] != 1:
+                continue
+            a, b = instruccion.args
+            if es_entero(a):
+                a, b = b, a
+            if not (a[0] == "l" and a[1] in induccion and es_entero(b)):
+                continue
+            clave = (a[1], b[1])
+            if clave not in derivadas:
+                acumulado = funcion.temporal()
+                enteros.add(acumulado[1])
+                derivadas[clave] = acumulado
+                preambulo.append(Instruccion("binaria", acumulado, [a, b], "*", instruccion.linea))
+            instruccion.op, instruccion.args, instruccion.extra = "copiar", [derivadas[clave]], None
+            cambios["induccion"] += 1
+        if not derivadas:
+            continue
+
+        nueva_region: List[Instruccion] = []
+        for instruccion in region:
+            nueva_region.append(instruccion)
+            ranura = ranura_definida(instruccion)
+            if ranura in induccion:
+                for (variable, k), acumulado in derivadas.items():
+                    if variable == ranura:
+                        nueva_region.append(Instruccion(
+                            "binaria", acumulado, [acumulado, ("c", paso(instruccion, ranura) * k)],
+                            "+", instruccion.linea,
+                        ))
+        funcion.instrucciones[inicio:fin] = (
+            preambulo + [funcion.instrucciones[inicio]] + nueva_region
+        )
+    return cambios
+
+
+def mover_invariantes(funcion: FuncionIR) -> Dict[str, int]:
+    """LICM: adelantar al preámbulo del bucle las operaciones puras cuyos
+    operandos no cambian dentro de él. Si pueden fallar se calculan de forma
+    especulativa y un `verificar` en el sitio original lanza el error."""
+    cambios = Counter()
+    enteros = ranuras_enteras(funcion)
+    no_movibles = funcion.volatiles | funcion.capturadas
+    cuentas = Counter(ranura_definida(i) for i in funcion.instrucciones)
+
+    for cabecera, salida in bucles_de_adentro_hacia_afuera(funcion):
+        posiciones = posiciones_etiquetas(funcion)
+        inicio, fin = posiciones[cabecera], posiciones[salida]
+        region = funcion.instrucciones[inicio + 1:fin]
+        definidas = {ranura_definida(i) for i in region} - {None}
+
+        invariantes: Set[int] = set()
+        movidas: List[Instruccion] = []
+        for instruccion in region:
+            destino = ranura_definida(instruccion)
+            if (
+                instruccion.op in OPERACIONES_PURAS
+                and destino is not None
+                and destino not in no_movibles
+                and cuentas[destino] == 1
+                and all(
+                    a[0] == "c"
+                    or (a[0] == "l" and a[1] not in funcion.volatiles
+                        and (a[1] not in definidas or a[1] in invariantes))
+                    for a in instruccion.args
+                )
+            ):
+                movidas.append(instruccion)
+                invariantes.add(destino)
+        if not movidas:
+            continue
+
+        nueva_region: List[Instruccion] = []
+        movidas_ids = {id(i) for i in movidas}
+        for instruccion in region:
+            if id(instruccion) not in movidas_ids:
+                nueva_region.append(instruccion)
+                continue
+            if instruccion.especulativa or not puede_fallar(instruccion, enteros):
+                continue  # ya tiene su `verificar` (bucle interno) o no falla
+            instruccion.especulativa = True
+            anterior = nueva_region[-1] if nueva_region else None
+            if anterior is not None and anterior.op == "verificar" and anterior.linea == instruccion.linea:
+                anterior.args.append(instruccion.destino)
+            else:
+                nueva_region.append(Instruccion("verificar", None, [instruccion.destino], None, instruccion.linea))
+        cambios["movidas"] += len(movidas)
+        funcion.instrucciones[inicio:fin] = movidas + [funcion.instrucciones[inicio]] + nueva_region
+    return cambios
+
+
+def eliminar_codigo_muerto(funcion: FuncionIR) -> Dict[str, int]:
+    """Quitar código inalcanzable, resultados que nadie lee y saltos a la
+    instrucción siguiente"""
+    cambios = Counter()
+    grafo = construir_grafo(funcion)
+    quitar: Set[int] = set()
+
+    alcanzable = grafo.alcanzables()
+    for bloque in grafo.bloques:
+        if not alcanzable[bloque.indice]:
+            for instruccion in bloque.sentencias:
+                if instruccion.op != "etiqueta":
+                    quitar.add(id(instruccion))
+                    cambios["inalcanzables"] += 1
+
+    enteros = ranuras_enteras(funcion)
+    booleanas = ranuras_booleanas(funcion)
+    fijas = protegidas(funcion)
+    siempre_vivas = 0
+    for ranura in fijas:
+        siempre_vivas |= 1 << ranura
+    _, salida = resolver_flujo(VivasIR(grafo, siempre_vivas))
+    for bloque in grafo.bloques:
+        if not alcanzable[bloque.indice]:
+            continue
+        vivas = salida[bloque.indice]
+        for instruccion in reversed(bloque.sentencias):
+            if instruccion.op == "booleano" and instruccion.args[0][0] == "l" and instruccion.args[0][1] in booleanas:
+                # La comprobación no puede fallar
+                quitar.add(id(instruccion))
+                cambios["comprobaciones"] += 1
+                continue
+            ranura = ranura_definida(instruccion)
+            if (
+                ranura is not None
+                and ranura not in fijas
+                and not (vivas >> ranura) & 1
+                and (instruccion.op in OPERACIONES_INOCUAS
+                     or (instruccion.op in OPERACIONES_PURAS and not puede_fallar(instruccion, enteros)))
+            ):
+                quitar.add(id(instruccion))
+                cambios["resultados_muertos"] += 1
+                continue
+            if ranura is not None:
+                vivas &= ~(1 << ranura)
+            vivas |= bits_leidos(instruccion)
+    aplanar(funcion, grafo, quitar)
+
+    # Saltos a la etiqueta que sigue inmediatamente
+    instrucciones = funcion.instrucciones
+    resultado: List[Instruccion] = []
+    for i, instruccion in enumerate(instrucciones):
+        if instruccion.op == "saltar":
+            j = i + 1
+            siguientes = set()
+            while j < len(instrucciones) and instrucciones[j].op == "etiqueta":
+                siguientes.add(instrucciones[j].extra)
+                j += 1
+            if instruccion.extra in siguientes:
+                cambios["saltos"] += 1
+                continue
+        resultado.append(instruccion)
+    funcion.instrucciones = resultado
+    return cambios
+
+
+# -- Gestor de pases ------------------------------------------------------------------
+
+PASES: Dict[str, Callable[[FuncionIR], Dict[str, int]]] = {
+    "copias": propagar_copias,
+    "cse": eliminar_subexpresiones,
+    "reduccion": reducir_fuerza,
+    "licm": mover_invariantes,
+    "dce": eliminar_codigo_muerto,
+}
+
+# Las copias que dejan CSE, reducción y LICM se propagan de nuevo antes de DCE
+ORDEN_POR_DEFECTO = ("copias", "cse", "reduccion", "licm", "copias", "dce")
+
+
+def contar_instrucciones(programa: FuncionIR) -> int:
+    return sum(
+        sum(1 for i in funcion.instrucciones if i.op != "etiqueta")
+        for funcion in programa.todas()
+    )
+
+
+class GestorPases:
+    """Ejecuta una secuencia de pases sobre un programa y mide cada uno"""
+
+    def __init__(self, pases: Optional[Iterable[str]] = None, deshabilitar: Iterable[str] = ()):
+        pases = list(ORDEN_POR_DEFECTO if pases is None else pases)
+        deshabilitar = set(deshabilitar)
+        desconocidos = (set(pases) | deshabilitar) - set(PASES)
+        if desconocidos:
+            raise ValueError(f"Pases desconocidos: {sorted(desconocidos)}")
+        self.pases = [p for p in pases if p not in deshabilitar]
+        self.estadisticas: List[Dict[str, object]] = []
+
+    def ejecutar(self, programa: FuncionIR) -> List[Dict[str, object]]:
+        self.estadisticas = []
+        for nombre in self.pases:
+            antes = contar_instrucciones(programa)
+            inicio = time.perf_counter()
+            cambios = Counter()
+            for funcion in programa.todas():
+                cambios.update(PASES[nombre](funcion))
+            self.estadisticas.append({
+                "pase": nombre,
+                "tiempo_ms": (time.perf_counter() - inicio) * 1000,
+                "instrucciones_antes": antes,
+                "instrucciones_despues": contar_instrucciones(programa),
+                "cambios": dict(cambios),
+            })
+        return self.estadisticas
+
+
+def optimizar(programa: FuncionIR, pases=None, deshabilitar=()) -> List[Dict[str, object]]:
+    return GestorPases(pases, deshabilitar).ejecutar(programa)
+
+
+def formatear_estadisticas(estadisticas: List[Dict[str, object]]) -> str:
+    lineas = [f"{'pase':<10} {'ms':>8} {'antes':>6} {'después':>8}  cambios"]
+    for fila in estadisticas:
+        cambios = ", ".join(f"{k}={v}" for k, v in sorted(fila["cambios"].items())) or "-"
+        lineas.append(
+            f"{fila['pase']:<10} {fila['tiempo_ms']:>8.3f} {fila['instrucciones_antes']:>6} "
+            f"{fila['instrucciones_despues']:>8}  {cambios}"
+        )
+    return "\n".join(lineas)
+
+
+if __name__ == "__main__":
+    argumentos = sys.argv[1:]
+    pases = None
+    if len(argumentos) == 3 and argumentos[0] == "--pases":
+        pases = [p for p in argumentos[1].split(",") if p]
+        argumentos = argumentos[2:]
+    if len(argumentos) != 1:
+        print("Uso: python optimizador_lynx.py [--pases copias,cse,reduccion,licm,dce] <archivo.lynx>")
+        sys.exit(1)
+
+    with open(argumentos[0], "r", encoding="utf-8") as archivo:
+        contenido = archivo.read()
+
+    try:
+        programa = generar_ir(analizar_programa(contenido), contenido)
+        estadisticas = optimizar(programa, pases)
+    except ErrorCompilacion as e:
+        for error in e.errores:
+            print(error, file=sys.stderr)
+        sys.exit(1)
+    print(formatear_ir(programa))
+    print()
+    print(formatear_estadisticas(estadisticas))
@@ -1,5 +1,19 @@
+import functools
+import threading
+import time
+
+import ply.lex as lex
 import ply.yacc as yacc
-from lexer_lynx import tokens, crear_lexer
+from lexer_lynx import crear_lexer, reserved, tokens as tokens_lexer
+import metricas_lynx
+import trazas_lynx
+
+# Un salto de línea termina la sentencia. El lexer no emite los saltos, así que
+# _tokens_parser le da otro tipo a `+`, `-` y `(` cuando siguen una expresión
+# en la misma línea (o dentro de paréntesis, corchetes o una tabla): operador
+# binario o llamada. Al empezar una línea quedan como signo o agrupación y
+# abren una sentencia nueva: `x` y en la línea siguiente `-1` son dos.
+tokens = tokens_lexer + ['MAS_BINARIO', 'MENOS_BINARIO', 'PAREN_LLAMADA']
 
 # Precedencia de operadores
 precedence = (
@@ -8,7 +22,7 @@ precedence = (
     ('right', 'NO'),
     ('left', 'IGUAL', 'DIFERENTE'),
     ('left', 'MENOR', 'MAYOR', 'MENOR_IGUAL', 'MAYOR_IGUAL'),
-    ('left', 'MAS', 'MENOS'),
+    ('left', 'MAS_BINARIO', 'MENOS_BINARIO'),
     ('left', 'POR', 'DIV', 'MOD'),
     ('right', 'UMINUS', 'UPLUS'),
 )
@@ -16,35 +30,41 @@ precedence = (
 # AST Node classes
 # Reglas de gramátic# AST Node classes
 class ASTNode:
-    def __init__(self, linea=None):
+    def __init__(self, linea=None, columna=None):
         self.linea = linea
+        self.columna = columna
 
 class Programa(ASTNode):
     def __init__(self, instrucciones, linea=None):
         super().__init__(linea)
         self.instrucciones = instrucciones
 
+class Identificador(ASTNode):
+    def __init__(self, nombre, linea=None, columna=None):
+        super().__init__(linea, columna)
+        self.nombre = nombre
+
 class DeclaracionVariable(ASTNode):
-    def __init__(self, nombre, valor=None, linea=None):
-        super().__init__(linea)
+    def __init__(self, nombre, valor=None, linea=None, columna=None):
+        super().__init__(linea, columna)
         self.nombre = nombre
         self.valor = valor
 
 class AsignacionVariable(ASTNode):
-    def __init__(self, nombre, valor, linea=None):
-        super().__init__(linea)
+    def __init__(self, nombre, valor, linea=None, columna=None):
+        super().__init__(linea, columna)
         self.nombre = nombre
         self.valor = valor
 
 class DeclaracionArreglo(ASTNode):
-    def __init__(self, nombre, elementos, linea=None):
-        super().__init__(linea)
+    def __init__(self, nombre, elementos, linea=None, columna=None):
+        super().__init__(linea, columna)
         self.nombre = nombre
         self.elementos = elementos
 
 class DeclaracionTabla(ASTNode):
-    def __init__(self, nombre, pares, linea=None):
-        super().__init__(linea)
+    def __init__(self, nombre, pares, linea=None, columna=None):
+        super().__init__(linea, columna)
         self.nombre = nombre
         self.pares = pares
 
@@ -89,8 +109,8 @@ class Caso(ASTNode):
         self.bloque = bloque
 
 class DeclaracionFuncion(ASTNode):
-    def __init__(self, nombre, parametros, bloque, retorno=None, linea=None):
-        super().__init__(linea)
+    def __init__(self, nombre, parametros, bloque, retorno=None, linea=None, columna=None):
+        super().__init__(linea, columna)
         self.nombre = nombre
         self.parametros = parametros
         self.bloque = bloque
@@ -115,17 +135,64 @@ class ExpresionUnaria(ASTNode):
         self.expr = expr
 
 class AccesoArreglo(ASTNode):
-    def __init__(self, nombre, indice, linea=None):
-        super().__init__(linea)
+    def __init__(self, nombre, indice, linea=None, columna=None):
+        super().__init__(linea, columna)
         self.nombre = nombre
         self.indice = indice
 
 class AccesoTabla(ASTNode):
-    def __init__(self, nombre, clave, linea=None):
-        super().__init__(linea)
+    def __init__(self, nombre, clave, linea=None, columna=None):
+        super().__init__(linea, columna)
         self.nombre = nombre
         self.clave = clave
 
+class LlamadaFuncion(ASTNode):
+    def __init__(self, nombre, argumentos, linea=None, columna=None):
+        super().__init__(linea, columna)
+        self.nombre = nombre
+        self.argumentos = argumentos
+
+def columna_token(p, n):
+    """Columna (base 0) del símbolo n de la producción"""
+    inicio_linea = p.lexer.lexdata.rfind('\n', 0, p.lexpos(n)) + 1
+    return p.lexpos(n) - inicio_linea
+
+def identificador(p, n):
+    """Construir un nodo Identificador con su posición en el código"""
+    return Identificador(p[n], linea=p.lineno(n), columna=columna_token(p, n))
+
+# Solo se comparten expresiones sin nombres: un nodo compartido tiene una sola
+# posición, y cada uso de un nombre necesita la suya (diagnósticos, índice de
+# referencias) y puede resolverse a otro símbolo según el ámbito
+NODOS_COMPARTIBLES = ('ExpresionBinaria', 'ExpresionUnaria')
+# La línea entra en la clave: los diagnósticos de cada aparición salen en la suya
+CAMPOS_POSICION = ('columna',)
+
+def compartir(p, nodo):
+    """Hash-consing: retornar el nodo canónico estructuralmente igual a `nodo`
+
+    Solo se activa si el parser tiene una tabla `subexpresiones`. Como los hijos
+    se construyen antes que el padre, basta comparar su identidad; un hijo que
+    no se compartió (un nombre, una llamada) deja al padre sin compartir.
+    """
+    tabla = getattr(p.parser, 'subexpresiones', None)
+    if tabla is None or nodo.__class__.__name__ not in NODOS_COMPARTIBLES:
+        return nodo
+    clave = [nodo.__class__.__name__]
+    for campo, valor in nodo.__dict__.items():
+        if campo in CAMPOS_POSICION:
+            continue
+        if isinstance(valor, ASTNode):
+            if id(valor) not in p.parser.compartidos:
+                return nodo
+            valor = id(valor)
+        else:
+            valor = (type(valor).__name__, valor)
+        clave.append((campo, valor))
+    canonico = tabla.setdefault(tuple(clave), nodo)
+    p.parser.compartidos.add(id(canonico))
+    return canonico
+
 def p_bloque_codigo(p):
     '''bloque_codigo : instruccion_list
                     | empty'''
@@ -145,7 +212,6 @@ def p_instruccion_list(p):
 def p_instruccion(p):
     '''instruccion : declaraciones
                   | estructurasbase
-                  | accesos
                   | expresion
                   | imprimir'''
     p[0] = p[1]
@@ -168,199 +234,121 @@ def p_estructurasbase(p):
                       | estructura_intentar'''
     p[0] = p[1]
 
-def p_accesos(p):
-    '''accesos : acceso_arreglo
-              | acceso_tabla'''
-    p[0] = p[1]
-
 # Declaraciones
 def p_declaracion_simple(p):
     '''declaracion_simple : VAL ID'''
-    p[0] = DeclaracionVariable(p[2])
+    p[0] = DeclaracionVariable(p[2], linea=p.lineno(2), columna=columna_token(p, 2))
 
 def p_asignacion_variable(p):
     '''asignacion_variable : ID ASIGNACION valor'''
-    p[0] = AsignacionVariable(p[1], p[3], linea=p.lineno(1))
+    p[0] = AsignacionVariable(p[1], p[3], linea=p.lineno(1), columna=columna_token(p, 1))
 
 
 def p_declaracion_variable(p):
     '''declaracion_variable : VAL ID ASIGNACION valor
                            | declaracion_simple'''
     if len(p) == 5:
-        p[0] = DeclaracionVariable(p[2], p[4], linea=p.lineno(1))
+        p[0] = DeclaracionVariable(p[2], p[4], linea=p.lineno(1), columna=columna_token(p, 2))
     else:
         p[0] = p[1]
 
 # Valores
 def p_valor(p):
-    '''valor : numero
-            | CADENA
-            | ID
-            | expresion_concatenacion
-            | expresion_aritmetica'''  # Agregar esta línea
+    '''valor : expresion'''
     p[0] = p[1]
 
-def p_numero(p):
-    '''numero : NUMERO
-             | FLOTANTE
-             | MENOS NUMERO %prec UMINUS
-             | MENOS FLOTANTE %prec UMINUS'''
-    if len(p) == 2:
-        p[0] = p[1]
-    else:
+# Expresiones: una sola gramática con precedencia de operadores
+def p_expresion_binaria(p):
+    '''expresion : expresion O expresion
+                | expresion Y expresion
+                | expresion IGUAL expresion
+                | expresion DIFERENTE expresion
+                | expresion MAYOR expresion
+                | expresion MENOR expresion
+                | expresion MAYOR_IGUAL expresion
+                | expresion MENOR_IGUAL expresion
+                | expresion MAS_BINARIO expresion
+                | expresion MENOS_BINARIO expresion
+                | expresion POR expresion
+                | expresion DIV expresion
+                | expresion MOD expresion'''
+    p[0] = compartir(p, ExpresionBinaria(p[1], p[2], p[3], linea=p.lineno(2)))
+
+def p_expresion_unaria(p):
+    '''expresion : NO expresion
+                | MENOS expresion %prec UMINUS
+                | MAS expresion %prec UPLUS'''
+    es_numero = isinstance(p[2], (int, float)) and not isinstance(p[2], bool)
+    if p[1] == '-' and es_numero:
+        # Los literales negativos se pliegan como antes: -5 es un número
         p[0] = -p[2]
-
-# Expresiones
-def p_expresion(p):
-    '''expresion : expresion_logica
-                | expresion_aritmetica'''  # Agregar esta línea
-    p[0] = p[1]
-
-def p_expresion_logica(p):
-    '''expresion_logica : expresion_relacional
-                       | expresion_logica Y expresion_relacional
-                       | expresion_logica O expresion_relacional
-                       | NO expresion_relacional'''
-    if len(p) == 2:
-        p[0] = p[1]
-    elif len(p) == 3:
-        p[0] = ExpresionUnaria(p[1], p[2])
-    else:
-        p[0] = ExpresionBinaria(p[1], p[2], p[3])
-
-def p_expresion_relacional(p):
-    '''expresion_relacional : termino_relacional
-                           | termino_relacional IGUAL termino_relacional
-                           | termino_relacional DIFERENTE termino_relacional
-                           | termino_relacional MAYOR termino_relacional
-                           | termino_relacional MENOR termino_relacional
-                           | termino_relacional MAYOR_IGUAL termino_relacional
-                           | termino_relacional MENOR_IGUAL termino_relacional'''
-    if len(p) == 2:
-        p[0] = p[1]
+    elif p[1] == '+' and es_numero:
+        p[0] = p[2]
     else:
-        p[0] = ExpresionBinaria(p[1], p[2], p[3])
+        p[0] = compartir(p, ExpresionUnaria(p[1], p[2], linea=p.lineno(1)))
 
-def p_termino_relacional(p):
-    '''termino_relacional : expresion_simple
-                         | PAREN_ABRIR expresion_aritmetica PAREN_CERRAR'''
-    if len(p) == 2:
-        p[0] = p[1]
-    else:
-        p[0] = p[2]
+def p_expresion_agrupada(p):
+    '''expresion : PAREN_ABRIR expresion PAREN_CERRAR'''
+    p[0] = p[2]
 
-def p_expresion_simple(p):
-    '''expresion_simple : numero
-                       | CADENA
-                       | ID
-                       | acceso_arreglo
-                       | acceso_tabla
-                       | expresion_concatenacion'''
+def p_expresion_literal(p):
+    '''expresion : NUMERO
+                | FLOTANTE
+                | CADENA'''
     p[0] = p[1]
 
-def p_expresion_aritmetica(p):
-    '''expresion_aritmetica : termino
-                           | expresion_aritmetica MAS termino
-                           | expresion_aritmetica MENOS termino'''
-    if len(p) == 2:
-        p[0] = p[1]
-    else:
-        p[0] = ExpresionBinaria(p[1], p[2], p[3], linea=p.lineno(2))
+def p_expresion_booleana(p):
+    '''expresion : VERDADERO
+                | FALSO'''
+    p[0] = p.slice[1].type == 'VERDADERO'
 
-def p_termino(p):
-    '''termino : factor
-              | termino POR factor
-              | termino DIV factor
-              | termino MOD factor'''
-    if len(p) == 2:
-        p[0] = p[1]
-    else:
-        p[0] = ExpresionBinaria(p[1], p[2], p[3])
+def p_expresion_nulo(p):
+    '''expresion : NULO'''
+    p[0] = None
 
-def p_factor(p):
-    '''factor : expresion_simple
-             | PAREN_ABRIR expresion PAREN_CERRAR
-             | MENOS factor %prec UMINUS
-             | MAS factor %prec UPLUS'''
-    if len(p) == 2:
-        p[0] = p[1]
-    elif len(p) == 3:
-        p[0] = ExpresionUnaria(p[1], p[2])
-    else:
-        p[0] = p[2]
+def p_expresion_identificador(p):
+    '''expresion : ID'''
+    p[0] = identificador(p, 1)
 
-# Concatenación
-def p_expresion_concatenacion(p):
-    '''expresion_concatenacion : elemento_concatenable
-                              | expresion_concatenacion MAS elemento_concatenable'''
-    if len(p) == 2:
-        p[0] = p[1]
-    else:
-        p[0] = ExpresionBinaria(p[1], p[2], p[3])
-
-def p_elemento_concatenable(p):
-    '''elemento_concatenable : CADENA
-                            | numero
-                            | ID
-                            | acceso_arreglo
-                            | acceso_tabla
-                            | PAREN_ABRIR expresion_concatenacion PAREN_CERRAR'''
-    if len(p) == 2:
-        p[0] = p[1]
-    else:
-        p[0] = p[2]
+def p_expresion_acceso(p):
+    '''expresion : acceso
+                | llamada_funcion'''
+    p[0] = p[1]
 
 # Imprimir
 def p_imprimir(p):
-    '''imprimir : IMPRIMIR PAREN_ABRIR elemento_imprimir_list PAREN_CERRAR'''
+    '''imprimir : IMPRIMIR PAREN_ABRIR expresion_list PAREN_CERRAR'''
     p[0] = Imprimir(p[3], linea=p.lineno(1))
 
-def p_elemento_imprimir_list(p):
-    '''elemento_imprimir_list : elemento_imprimir_list SEPARADOR elemento_imprimir
-                             | elemento_imprimir'''
+def p_expresion_list(p):
+    '''expresion_list : expresion_list SEPARADOR expresion
+                      | expresion'''
     if len(p) == 2:
         p[0] = [p[1]]
     else:
-        p[0] = p[1] + [p[3]]
-
-# Cambiar esta función:
-def p_elemento_imprimir(p):
-    '''elemento_imprimir : CADENA
-                        | numero
-                        | ID
-                        | acceso_arreglo
-                        | acceso_tabla
-                        | expresion_concatenacion'''
-    p[0] = p[1]
+        # Extender en el lugar: concatenar copiaría la lista en cada elemento
+        p[1].append(p[3])
+        p[0] = p[1]
 
 # Arreglos
 def p_declaracion_arreglo(p):
-    '''declaracion_arreglo : VAL ID ASIGNACION CORCHETE_ABRIR elemento_arreglo_list CORCHETE_CERRAR'''
-    p[0] = DeclaracionArreglo(p[2], p[5])
-
-def p_elemento_arreglo_list(p):
-    '''elemento_arreglo_list : elemento_arreglo_list SEPARADOR elemento_arreglo
-                            | elemento_arreglo'''
-    if len(p) == 2:
-        p[0] = [p[1]]
+    '''declaracion_arreglo : VAL ID ASIGNACION CORCHETE_ABRIR expresion_list CORCHETE_CERRAR'''
+    p[0] = DeclaracionArreglo(p[2], p[5], linea=p.lineno(1), columna=columna_token(p, 2))
+
+def p_acceso(p):
+    '''acceso : ID CORCHETE_ABRIR expresion CORCHETE_CERRAR'''
+    # Con una clave de cadena literal es un acceso a tabla; con cualquier
+    # otra expresión, a arreglo (el analizador semántico acepta tablas)
+    if isinstance(p[3], str):
+        nodo = AccesoTabla(p[1], p[3], linea=p.lineno(1), columna=columna_token(p, 1))
     else:
-        p[0] = p[1] + [p[3]]
-
-def p_elemento_arreglo(p):
-    '''elemento_arreglo : numero
-                       | CADENA
-                       | ID
-                       | expresion_concatenacion'''
-    p[0] = p[1]
-
-def p_acceso_arreglo(p):
-    '''acceso_arreglo : ID CORCHETE_ABRIR NUMERO CORCHETE_CERRAR'''
-    p[0] = AccesoArreglo(p[1], p[3])
+        nodo = AccesoArreglo(p[1], p[3], linea=p.lineno(1), columna=columna_token(p, 1))
+    p[0] = nodo
 
 # Tablas
 def p_declaracion_tabla(p):
     '''declaracion_tabla : VAL ID ASIGNACION LLAVE_ABRIR par_clave_valor_list LLAVE_CERRAR'''
-    p[0] = DeclaracionTabla(p[2], p[5])
+    p[0] = DeclaracionTabla(p[2], p[5], linea=p.lineno(1), columna=columna_token(p, 2))
 
 def p_par_clave_valor_list(p):
     '''par_clave_valor_list : par_clave_valor_list SEPARADOR par_clave_valor
@@ -374,10 +362,6 @@ def p_par_clave_valor(p):
     '''par_clave_valor : CADENA ASIGNACION valor'''
     p[0] = (p[1], p[3])
 
-def p_acceso_tabla(p):
-    '''acceso_tabla : ID CORCHETE_ABRIR CADENA CORCHETE_CERRAR'''
-    p[0] = AccesoTabla(p[1], p[3])
-
 # Estructuras de control
 def p_estructura_si(p):
     '''estructura_si : SI PAREN_ABRIR expresion PAREN_CERRAR LLAVE_ABRIR bloque_codigo LLAVE_CERRAR sinosis_opt'''
@@ -402,20 +386,20 @@ def p_estructura_mientras(p):
 
 def p_estructura_para(p):
     '''estructura_para : PARA PAREN_ABRIR VAL ID ASIGNACION expresion PUNTO_COMA expresion PUNTO_COMA expresion PAREN_CERRAR LLAVE_ABRIR bloque_codigo LLAVE_CERRAR'''
-    init = DeclaracionVariable(p[4], p[6])
-    p[0] = EstructuraPara(init, p[8], p[10], p[13])
+    init = DeclaracionVariable(p[4], p[6], linea=p.lineno(4), columna=columna_token(p, 4))
+    p[0] = EstructuraPara(init, p[8], p[10], p[13], linea=p.lineno(1))
 
 def p_estructura_repetir(p):
     '''estructura_repetir : REPETIR LLAVE_ABRIR bloque_codigo LLAVE_CERRAR HASTA PAREN_ABRIR expresion PAREN_CERRAR'''
-    p[0] = EstructuraRepetir(p[3], p[7])
+    p[0] = EstructuraRepetir(p[3], p[7], linea=p.lineno(1))
 
 def p_estructura_para_cada(p):
     '''estructura_para_cada : PARA PAREN_ABRIR ID EN ID PAREN_CERRAR LLAVE_ABRIR bloque_codigo LLAVE_CERRAR'''
-    p[0] = ('para_cada', p[3], p[5], p[8])
+    p[0] = ('para_cada', identificador(p, 3), identificador(p, 5), p[8])
 
 def p_estructura_segun(p):
     '''estructura_segun : SEGUN PAREN_ABRIR expresion PAREN_CERRAR LLAVE_ABRIR casos caso_predeterminado_opt LLAVE_CERRAR'''
-    p[0] = EstructuraSegun(p[3], p[6], p[7])
+    p[0] = EstructuraSegun(p[3], p[6], p[7], linea=p.lineno(1))
 
 def p_casos(p):
     '''casos : casos caso
@@ -427,7 +411,7 @@ def p_casos(p):
 
 def p_caso(p):
     '''caso : CASO valor CASE_LIMITADOR bloque_codigo PARAR'''
-    p[0] = Caso(p[2], p[4])
+    p[0] = Caso(p[2], p[4], linea=p.lineno(1))
 
 def p_caso_predeterminado_opt(p):
     '''caso_predeterminado_opt : PREDETERMINADO CASE_LIMITADOR bloque_codigo
@@ -443,7 +427,7 @@ def p_estructura_intentar(p):
 
 def p_bloque_capturar(p):
     '''bloque_capturar : CAPTURAR PAREN_ABRIR ID PAREN_CERRAR LLAVE_ABRIR bloque_codigo LLAVE_CERRAR'''
-    p[0] = ('capturar', p[3], p[6])
+    p[0] = ('capturar', identificador(p, 3), p[6])
 
 def p_bloque_finalmente_opt(p):
     '''bloque_finalmente_opt : FINALMENTE LLAVE_ABRIR bloque_codigo LLAVE_CERRAR
@@ -456,7 +440,7 @@ def p_bloque_finalmente_opt(p):
 # Funciones
 def p_declaracion_funcion(p):
     '''declaracion_funcion : FUN ID PAREN_ABRIR parametros_opt PAREN_CERRAR LLAVE_ABRIR bloque_codigo retorno_funcion_opt LLAVE_CERRAR'''
-    p[0] = DeclaracionFuncion(p[2], p[4], p[7], p[8], linea=p.lineno(1))
+    p[0] = DeclaracionFuncion(p[2], p[4], p[7], p[8], linea=p.lineno(1), columna=columna_token(p, 2))
 
 def p_parametros_opt(p):
     '''parametros_opt : parametros
@@ -467,9 +451,18 @@ def p_parametros(p):
     '''parametros : parametros SEPARADOR ID
                  | ID'''
     if len(p) == 2:
-        p[0] = [p[1]]
+        p[0] = [identificador(p, 1)]
     else:
-        p[0] = p[1] + [p[3]]
+        p[0] = p[1] + [identificador(p, 3)]
+
+def p_llamada_funcion(p):
+    '''llamada_funcion : ID PAREN_LLAMADA argumentos_opt PAREN_CERRAR'''
+    p[0] = LlamadaFuncion(p[1], p[3], linea=p.lineno(1), columna=columna_token(p, 1))
+
+def p_argumentos_opt(p):
+    '''argumentos_opt : expresion_list
+                     | empty'''
+    p[0] = p[1] if p[1] is not None else []
 
 def p_retorno_funcion_opt(p):
     '''retorno_funcion_opt : RETORNAR expresion
@@ -489,17 +482,83 @@ def p_error(p):
     else:
         raise SyntaxError("Error de sintaxis: final inesperado del archivo")
 
+_BINARIOS = {'MAS': 'MAS_BINARIO', 'MENOS': 'MENOS_BINARIO'}
+_CIERRAN_EXPRESION = {'ID', 'NUMERO', 'FLOTANTE', 'CADENA', 'VERDADERO', 'FALSO', 'NULO'}
+_PALABRAS_RESERVADAS = frozenset(reserved.values())
+_CIERRES = {'PAREN_CERRAR', 'CORCHETE_CERRAR', 'LLAVE_CERRAR'}
+
+def _tokens_parser(fuente):
+    """Los tokens de `fuente` con los `+`/`-` binarios y el `(` de las llamadas retipados
+
+    Los tokens nuevos son copias: los del lexer se reusan entre sesiones.
+    """
+    # Por cada apertura sin cerrar: "bloque" (sentencias), "expresion" (su
+    # cierre termina una expresión) u "otro" (condiciones, arreglos, tablas)
+    aperturas = []
+    previo = None
+    linea = 0
+    cierra_expresion = False
+    for token in fuente:
+        tipo = token.type
+        if cierra_expresion and (tipo in _BINARIOS or (tipo == 'PAREN_ABRIR' and previo == 'ID')):
+            if token.lineno == linea or (aperturas and aperturas[-1] != "bloque"):
+                copia = lex.LexToken()
+                copia.type = _BINARIOS.get(tipo, 'PAREN_LLAMADA')
+                copia.value, copia.lineno, copia.lexpos = token.value, token.lineno, token.lexpos
+                token = copia
+        if tipo == 'PAREN_ABRIR':
+            aperturas.append("otro" if previo in _PALABRAS_RESERVADAS else "expresion")
+        elif tipo == 'CORCHETE_ABRIR':
+            aperturas.append("expresion" if previo == 'ID' else "otro")
+        elif tipo == 'LLAVE_ABRIR':
+            aperturas.append("otro" if previo == 'ASIGNACION' else "bloque")
+        if tipo in _CIERRES:
+            cierra_expresion = aperturas.pop() == "expresion" if aperturas else False
+        elif tipo == 'ID':
+            # El nombre que se declara no es una expresión
+            cierra_expresion = previo not in ('VAL', 'FUN')
+        else:
+            cierra_expresion = tipo in _CIERRAN_EXPRESION
+        previo, linea = tipo, token.lineno
+        yield token
+
+# Un parser por hilo: LRParser guarda sus pilas en el objeto durante parse()
+_parsers = threading.local()
+
 def crear_parser():
-    return yacc.yacc()
-
-def analizar_sintactico(codigo):
-    try:
-        lexer = crear_lexer()
-        parser = crear_parser()
-        
-        ast = parser.parse(codigo, lexer=lexer)
-        return ast, []
-    except SyntaxError as e:
-        return None, [str(e)]
-    except Exception as e:
-        return None, [f"Error inesperado: {str(e)}"]
+    """Parser del hilo actual; yacc.yacc() lee las tablas solo la primera vez"""
+    parser = getattr(_parsers, "parser", None)
+    if parser is None:
+        parser = _parsers.parser = yacc.yacc()
+    return parser
+
+def analizar_sintactico(codigo, compartir_subexpresiones=False, lexico=None):
+    """AST del código; `lexico` es el par de lexer_lynx.tokenizar si ya se tokenizó"""
+    inicio = time.perf_counter()
+    tramo = trazas_lynx.tramo("sintactico")
+    with tramo:
+        try:
+            parser = crear_parser()
+            # Tabla de hash-consing y sus nodos; None desactiva el modo compartido
+            parser.subexpresiones = {} if compartir_subexpresiones else None
+            parser.compartidos = set()
+
+            if lexico is None:
+                lexer = crear_lexer()
+                lexer.input(codigo)
+                fuente = iter(lexer.token, None)
+            else:
+                lexer, tokens_ply = lexico
+                fuente = iter(tokens_ply)
+            ast = parser.parse(lexer=lexer, tokenfunc=functools.partial(next, _tokens_parser(fuente), None))
+            return ast, []
+        except SyntaxError as e:
+            metricas_lynx.errores.sumar("sintactico")
+            tramo.anotar(error=str(e))
+            return None, [str(e)]
+        except Exception as e:
+            metricas_lynx.errores.sumar("sintactico")
+            tramo.anotar(error=f"Error inesperado: {str(e)}")
+            return None, [f"Error inesperado: {str(e)}"]
+        finally:
+            metricas_lynx.sintactico_segundos.observar(time.perf_counter() - inicio)
@@ -6,9 +6,9 @@ _tabversion = '3.10'
 
 _lr_method = 'LALR'
 
-_lr_signature = 'leftOleftYrightNOleftIGUALDIFERENTEleftMENORMAYORMENOR_IGUALMAYOR_IGUALleftMASMENOSleftPORDIVMODrightUMINUSUPLUSASIGNACION CADENA CAPTURAR CASE_LIMITADOR CASO COMENTARIO_BLOQUE COMENTARIO_LINEA CORCHETE_ABRIR CORCHETE_CERRAR DIFERENTE DIV EN ENTONCES FALSO FINALMENTE FLOTANTE FUN HACER HASTA ID IGUAL IMPRIMIR INTENTAR LLAVE_ABRIR LLAVE_CERRAR MAS MAYOR MAYOR_IGUAL MENOR MENOR_IGUAL MENOS MIENTRAS MOD NO NULO NUMERO O PARA PARAR PAREN_ABRIR PAREN_CERRAR POR PREDETERMINADO PUNTO_COMA REPETIR RETORNAR SALIR SEGUN SEPARADOR SI SINO SINOSI VAL VERDADERO Ybloque_codigo : instruccion_list\n                    | emptyinstruccion_list : instruccion_list instruccion\n                       | instruccioninstruccion : declaraciones\n                  | estructurasbase\n                  | accesos\n                  | expresion\n                  | imprimirdeclaraciones : declaracion_variable\n                    | asignacion_variable\n                    | declaracion_arreglo\n                    | declaracion_tabla\n                    | declaracion_funcionestructurasbase : estructura_si\n                      | estructura_mientras\n                      | estructura_para\n                      | estructura_repetir\n                      | estructura_para_cada\n                      | estructura_segun\n                      | estructura_intentaraccesos : acceso_arreglo\n              | acceso_tabladeclaracion_simple : VAL IDasignacion_variable : ID ASIGNACION valordeclaracion_variable : VAL ID ASIGNACION valor\n                           | declaracion_simplevalor : numero\n            | CADENA\n            | ID\n            | expresion_concatenacion\n            | expresion_aritmeticanumero : NUMERO\n             | FLOTANTE\n             | MENOS NUMERO %prec UMINUS\n             | MENOS FLOTANTE %prec UMINUSexpresion : expresion_logica\n                | expresion_aritmeticaexpresion_logica : expresion_relacional\n                       | expresion_logica Y expresion_relacional\n                       | expresion_logica O expresion_relacional\n                       | NO expresion_relacionalexpresion_relacional : termino_relacional\n                           | termino_relacional IGUAL termino_relacional\n                           | termino_relacional DIFERENTE termino_relacional\n                           | termino_relacional MAYOR termino_relacional\n                           | termino_relacional MENOR termino_relacional\n                           | termino_relacional MAYOR_IGUAL termino_relacional\n                           | termino_relacional MENOR_IGUAL termino_relacionaltermino_relacional : expresion_simple\n                         | PAREN_ABRIR expresion_aritmetica PAREN_CERRARexpresion_simple : numero\n                       | CADENA\n                       | ID\n                       | acceso_arreglo\n                       | acceso_tabla\n                       | expresion_concatenacionexpresion_aritmetica : termino\n                           | expresion_aritmetica MAS termino\n                           | expresion_aritmetica MENOS terminotermino : factor\n              | termino POR factor\n              | termino DIV factor\n              | termino MOD factorfactor : expresion_simple\n             | PAREN_ABRIR expresion PAREN_CERRAR\n             | MENOS factor %prec UMINUS\n             | MAS factor %prec UPLUSexpresion_concatenacion : elemento_concatenable\n                              | expresion_concatenacion MAS elemento_concatenableelemento_concatenable : CADENA\n                            | numero\n                            | ID\n                            | acceso_arreglo\n                            | acceso_tabla\n                            | PAREN_ABRIR expresion_concatenacion PAREN_CERRARimprimir : IMPRIMIR PAREN_ABRIR elemento_imprimir_list PAREN_CERRARelemento_imprimir_list : elemento_imprimir_list SEPARADOR elemento_imprimir\n                             | elemento_imprimirelemento_imprimir : CADENA\n                        | numero\n                        | ID\n                        | acceso_arreglo\n                        | acceso_tabla\n                        | expresion_concatenaciondeclaracion_arreglo : VAL ID ASIGNACION CORCHETE_ABRIR elemento_arreglo_list CORCHETE_CERRARelemento_arreglo_list : elemento_arreglo_list SEPARADOR elemento_arreglo\n                            | elemento_arregloelemento_arreglo : numero\n                       | CADENA\n                       | ID\n                       | expresion_concatenacionacceso_arreglo : ID CORCHETE_ABRIR NUMERO CORCHETE_CERRARdeclaracion_tabla : VAL ID ASIGNACION LLAVE_ABRIR par_clave_valor_list LLAVE_CERRARpar_clave_valor_list : par_clave_valor_list SEPARADOR par_clave_valor\n                           | par_clave_valorpar_clave_valor : CADENA ASIGNACION valoracceso_tabla : ID CORCHETE_ABRIR CADENA CORCHETE_CERRARestructura_si : SI PAREN_ABRIR expresion PAREN_CERRAR LLAVE_ABRIR bloque_codigo LLAVE_CERRAR sinosis_optsinosis_opt : sinosis\n                  | emptysinosis : SINOSI PAREN_ABRIR expresion PAREN_CERRAR LLAVE_ABRIR bloque_codigo LLAVE_CERRAR sinosis_opt\n              | SINO LLAVE_ABRIR bloque_codigo LLAVE_CERRARestructura_mientras : MIENTRAS PAREN_ABRIR expresion PAREN_CERRAR LLAVE_ABRIR bloque_codigo LLAVE_CERRARestructura_para : PARA PAREN_ABRIR VAL ID ASIGNACION expresion PUNTO_COMA expresion PUNTO_COMA expresion PAREN_CERRAR LLAVE_ABRIR bloque_codigo LLAVE_CERRARestructura_repetir : REPETIR LLAVE_ABRIR bloque_codigo LLAVE_CERRAR HASTA PAREN_ABRIR expresion PAREN_CERRARestructura_para_cada : PARA PAREN_ABRIR ID EN ID PAREN_CERRAR LLAVE_ABRIR bloque_codigo LLAVE_CERRARestructura_segun : SEGUN PAREN_ABRIR expresion PAREN_CERRAR LLAVE_ABRIR casos caso_predeterminado_opt LLAVE_CERRARcasos : casos caso\n            | casocaso : CASO valor CASE_LIMITADOR bloque_codigo PARARcaso_predeterminado_opt : PREDETERMINADO CASE_LIMITADOR bloque_codigo\n                              | emptyestructura_intentar : INTENTAR LLAVE_ABRIR bloque_codigo LLAVE_CERRAR bloque_capturar bloque_finalmente_optbloque_capturar : CAPTURAR PAREN_ABRIR ID PAREN_CERRAR LLAVE_ABRIR bloque_codigo LLAVE_CERRARbloque_finalmente_opt : FINALMENTE LLAVE_ABRIR bloque_codigo LLAVE_CERRAR\n                            | emptydeclaracion_funcion : FUN ID PAREN_ABRIR parametros_opt PAREN_CERRAR LLAVE_ABRIR bloque_codigo retorno_funcion_opt LLAVE_CERRARparametros_opt : parametros\n                     | emptyparametros : parametros SEPARADOR ID\n                 | IDretorno_funcion_opt : RETORNAR expresion\n                          | emptyempty :'
+_lr_signature = 'leftOleftYrightNOleftIGUALDIFERENTEleftMENORMAYORMENOR_IGUALMAYOR_IGUALleftMAS_BINARIOMENOS_BINARIOleftPORDIVMODrightUMINUSUPLUSASIGNACION CADENA CAPTURAR CASE_LIMITADOR CASO COMENTARIO_BLOQUE COMENTARIO_LINEA CORCHETE_ABRIR CORCHETE_CERRAR DIFERENTE DIV EN ENTONCES FALSO FINALMENTE FLOTANTE FUN HACER HASTA ID IGUAL IMPRIMIR INTENTAR LLAVE_ABRIR LLAVE_CERRAR MAS MAS_BINARIO MAYOR MAYOR_IGUAL MENOR MENOR_IGUAL MENOS MENOS_BINARIO MIENTRAS MOD NO NULO NUMERO O PARA PARAR PAREN_ABRIR PAREN_CERRAR PAREN_LLAMADA POR PREDETERMINADO PUNTO_COMA REPETIR RETORNAR SALIR SEGUN SEPARADOR SI SINO SINOSI VAL VERDADERO Ybloque_codigo : instruccion_list\n                    | emptyinstruccion_list : instruccion_list instruccion\n                       | instruccioninstruccion : declaraciones\n                  | estructurasbase\n                  | expresion\n                  | imprimirdeclaraciones : declaracion_variable\n                    | asignacion_variable\n                    | declaracion_arreglo\n                    | declaracion_tabla\n                    | declaracion_funcionestructurasbase : estructura_si\n                      | estructura_mientras\n                      | estructura_para\n                      | estructura_repetir\n                      | estructura_para_cada\n                      | estructura_segun\n                      | estructura_intentardeclaracion_simple : VAL IDasignacion_variable : ID ASIGNACION valordeclaracion_variable : VAL ID ASIGNACION valor\n                           | declaracion_simplevalor : expresionexpresion : expresion O expresion\n                | expresion Y expresion\n                | expresion IGUAL expresion\n                | expresion DIFERENTE expresion\n                | expresion MAYOR expresion\n                | expresion MENOR expresion\n                | expresion MAYOR_IGUAL expresion\n                | expresion MENOR_IGUAL expresion\n                | expresion MAS_BINARIO expresion\n                | expresion MENOS_BINARIO expresion\n                | expresion POR expresion\n                | expresion DIV expresion\n                | expresion MOD expresionexpresion : NO expresion\n                | MENOS expresion %prec UMINUS\n                | MAS expresion %prec UPLUSexpresion : PAREN_ABRIR expresion PAREN_CERRARexpresion : NUMERO\n                | FLOTANTE\n                | CADENAexpresion : VERDADERO\n                | FALSOexpresion : NULOexpresion : IDexpresion : acceso\n                | llamada_funcionimprimir : IMPRIMIR PAREN_ABRIR expresion_list PAREN_CERRARexpresion_list : expresion_list SEPARADOR expresion\n                      | expresiondeclaracion_arreglo : VAL ID ASIGNACION CORCHETE_ABRIR expresion_list CORCHETE_CERRARacceso : ID CORCHETE_ABRIR expresion CORCHETE_CERRARdeclaracion_tabla : VAL ID ASIGNACION LLAVE_ABRIR par_clave_valor_list LLAVE_CERRARpar_clave_valor_list : par_clave_valor_list SEPARADOR par_clave_valor\n                           | par_clave_valorpar_clave_valor : CADENA ASIGNACION valorestructura_si : SI PAREN_ABRIR expresion PAREN_CERRAR LLAVE_ABRIR bloque_codigo LLAVE_CERRAR sinosis_optsinosis_opt : sinosis\n                  | emptysinosis : SINOSI PAREN_ABRIR expresion PAREN_CERRAR LLAVE_ABRIR bloque_codigo LLAVE_CERRAR sinosis_opt\n              | SINO LLAVE_ABRIR bloque_codigo LLAVE_CERRARestructura_mientras : MIENTRAS PAREN_ABRIR expresion PAREN_CERRAR LLAVE_ABRIR bloque_codigo LLAVE_CERRARestructura_para : PARA PAREN_ABRIR VAL ID ASIGNACION expresion PUNTO_COMA expresion PUNTO_COMA expresion PAREN_CERRAR LLAVE_ABRIR bloque_codigo LLAVE_CERRARestructura_repetir : REPETIR LLAVE_ABRIR bloque_codigo LLAVE_CERRAR HASTA PAREN_ABRIR expresion PAREN_CERRARestructura_para_cada : PARA PAREN_ABRIR ID EN ID PAREN_CERRAR LLAVE_ABRIR bloque_codigo LLAVE_CERRARestructura_segun : SEGUN PAREN_ABRIR expresion PAREN_CERRAR LLAVE_ABRIR casos caso_predeterminado_opt LLAVE_CERRARcasos : casos caso\n            | casocaso : CASO valor CASE_LIMITADOR bloque_codigo PARARcaso_predeterminado_opt : PREDETERMINADO CASE_LIMITADOR bloque_codigo\n                              | emptyestructura_intentar : INTENTAR LLAVE_ABRIR bloque_codigo LLAVE_CERRAR bloque_capturar bloque_finalmente_optbloque_capturar : CAPTURAR PAREN_ABRIR ID PAREN_CERRAR LLAVE_ABRIR bloque_codigo LLAVE_CERRARbloque_finalmente_opt : FINALMENTE LLAVE_ABRIR bloque_codigo LLAVE_CERRAR\n                            | emptydeclaracion_funcion : FUN ID PAREN_ABRIR parametros_opt PAREN_CERRAR LLAVE_ABRIR bloque_codigo retorno_funcion_opt LLAVE_CERRARparametros_opt : parametros\n                     | emptyparametros : parametros SEPARADOR ID\n                 | IDllamada_funcion : ID PAREN_LLAMADA argumentos_opt PAREN_CERRARargumentos_opt : expresion_list\n                     | emptyretorno_funcion_opt : RETORNAR expresion\n                          | emptyempty :'
     
-_lr_action_items = {'$end':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,29,30,38,39,40,42,45,46,47,48,49,50,51,52,65,66,68,78,79,81,82,83,88,89,91,92,93,101,102,103,104,116,117,118,120,121,122,123,124,125,138,139,140,141,142,144,145,146,147,148,149,150,151,152,153,154,155,157,159,162,163,193,195,197,210,212,218,219,233,234,235,240,241,246,251,254,262,264,269,270,271,],[-125,0,-1,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-37,-38,-54,-27,-33,-53,-39,-58,-43,-61,-50,-52,-57,-34,-69,-3,-55,-56,-24,-42,-50,-54,-55,-56,-68,-65,-67,-33,-34,-40,-41,-59,-60,-51,-66,-76,-30,-25,-28,-29,-31,-32,-35,-36,-62,-63,-64,-44,-45,-46,-47,-48,-49,-70,-71,-72,-73,-74,-75,-77,-26,-93,-98,-125,-86,-94,-114,-117,-125,-104,-99,-100,-101,-106,-108,-118,-107,-116,-103,-115,-125,-105,-102,]),'IMPRIMIR':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,29,30,38,39,40,42,45,46,47,48,49,50,51,52,65,66,68,75,77,78,79,81,82,83,88,89,91,92,93,101,102,103,104,116,117,118,120,121,122,123,124,125,138,139,140,141,142,144,145,146,147,148,149,150,151,152,153,154,155,157,159,162,163,187,188,193,195,197,200,210,212,218,219,221,228,233,234,235,240,241,242,243,246,249,251,254,255,262,264,265,266,269,270,271,],[26,26,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-37,-38,-54,-27,-33,-53,-39,-58,-43,-61,-50,-52,-57,-34,-69,-3,-55,-56,-24,26,26,-42,-50,-54,-55,-56,-68,-65,-67,-33,-34,-40,-41,-59,-60,-51,-66,-76,-30,-25,-28,-29,-31,-32,-35,-36,-62,-63,-64,-44,-45,-46,-47,-48,-49,-70,-71,-72,-73,-74,-75,-77,-26,-93,-98,26,26,-125,-86,-94,26,-114,-117,-125,-104,26,26,-99,-100,-101,-106,-108,26,26,-118,26,-107,-116,26,-103,-115,26,26,-125,-105,-102,]),'VAL':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,29,30,38,39,40,42,45,46,47,48,49,50,51,52,65,66,68,74,75,77,78,79,81,82,83,88,89,91,92,93,101,102,103,104,116,117,118,120,121,122,123,124,125,138,139,140,141,142,144,145,146,147,148,149,150,151,152,153,154,155,157,159,162,163,187,188,193,195,197,200,210,212,218,219,221,228,233,234,235,240,241,242,243,246,249,251,254,255,262,264,265,266,269,270,271,],[28,28,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-37,-38,-54,-27,-33,-53,-39,-58,-43,-61,-50,-52,-57,-34,-69,-3,-55,-56,-24,132,28,28,-42,-50,-54,-55,-56,-68,-65,-67,-33,-34,-40,-41,-59,-60,-51,-66,-76,-30,-25,-28,-29,-31,-32,-35,-36,-62,-63,-64,-44,-45,-46,-47,-48,-49,-70,-71,-72,-73,-74,-75,-77,-26,-93,-98,28,28,-125,-86,-94,28,-114,-117,-125,-104,28,28,-99,-100,-101,-106,-108,28,28,-118,28,-107,-116,28,-103,-115,28,28,-125,-105,-102,]),'ID':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,27,28,29,30,31,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,65,66,68,69,72,73,74,75,76,77,78,79,80,81,82,83,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,115,116,117,118,119,120,121,122,123,124,125,126,129,132,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,157,158,159,160,162,163,171,186,187,188,189,193,195,196,197,199,200,206,209,210,212,213,218,219,220,221,228,231,233,234,235,240,241,242,243,246,248,249,250,251,254,255,262,264,265,266,269,270,271,],[29,29,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-37,-38,64,68,-54,-27,71,-33,-53,-39,81,-58,81,81,-43,-61,-50,-52,-57,-34,-69,-3,81,81,81,81,110,64,-55,-56,-24,120,81,81,133,29,81,29,-42,-50,64,-54,-55,-56,81,81,81,-68,-65,64,-67,-33,-34,81,81,81,81,81,81,153,-40,-41,-59,-60,153,81,-51,-66,-76,120,-30,-25,-28,-29,-31,-32,64,164,170,-35,-36,-62,-63,-64,64,-44,-45,-46,-47,-48,-49,-70,-71,-72,-73,-74,-75,-77,110,-26,176,-93,-98,190,201,29,29,81,-125,-86,176,-94,120,29,81,120,-114,-117,229,-125,-104,81,29,29,81,-99,-100,-101,-106,-108,29,29,-118,81,29,81,-107,-116,29,-103,-115,29,29,-125,-105,-102,]),'FUN':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,29,30,38,39,40,42,45,46,47,48,49,50,51,52,65,66,68,75,77,78,79,81,82,83,88,89,91,92,93,101,102,103,104,116,117,118,120,121,122,123,124,125,138,139,140,141,142,144,145,146,147,148,149,150,151,152,153,154,155,157,159,162,163,187,188,193,195,197,200,210,212,218,219,221,228,233,234,235,240,241,242,243,246,249,251,254,255,262,264,265,266,269,270,271,],[31,31,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-37,-38,-54,-27,-33,-53,-39,-58,-43,-61,-50,-52,-57,-34,-69,-3,-55,-56,-24,31,31,-42,-50,-54,-55,-56,-68,-65,-67,-33,-34,-40,-41,-59,-60,-51,-66,-76,-30,-25,-28,-29,-31,-32,-35,-36,-62,-63,-64,-44,-45,-46,-47,-48,-49,-70,-71,-72,-73,-74,-75,-77,-26,-93,-98,31,31,-125,-86,-94,31,-114,-117,-125,-104,31,31,-99,-100,-101,-106,-108,31,31,-118,31,-107,-116,31,-103,-115,31,31,-125,-105,-102,]),'SI':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,29,30,38,39,40,42,45,46,47,48,49,50,51,52,65,66,68,75,77,78,79,81,82,83,88,89,91,92,93,101,102,103,104,116,117,118,120,121,122,123,124,125,138,139,140,141,142,144,145,146,147,148,149,150,151,152,153,154,155,157,159,162,163,187,188,193,195,197,200,210,212,218,219,221,228,233,234,235,240,241,242,243,246,249,251,254,255,262,264,265,266,269,270,271,],[32,32,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-37,-38,-54,-27,-33,-53,-39,-58,-43,-61,-50,-52,-57,-34,-69,-3,-55,-56,-24,32,32,-42,-50,-54,-55,-56,-68,-65,-67,-33,-34,-40,-41,-59,-60,-51,-66,-76,-30,-25,-28,-29,-31,-32,-35,-36,-62,-63,-64,-44,-45,-46,-47,-48,-49,-70,-71,-72,-73,-74,-75,-77,-26,-93,-98,32,32,-125,-86,-94,32,-114,-117,-125,-104,32,32,-99,-100,-101,-106,-108,32,32,-118,32,-107,-116,32,-103,-115,32,32,-125,-105,-102,]),'MIENTRAS':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,29,30,38,39,40,42,45,46,47,48,49,50,51,52,65,66,68,75,77,78,79,81,82,83,88,89,91,92,93,101,102,103,104,116,117,118,120,121,122,123,124,125,138,139,140,141,142,144,145,146,147,148,149,150,151,152,153,154,155,157,159,162,163,187,188,193,195,197,200,210,212,218,219,221,228,233,234,235,240,241,242,243,246,249,251,254,255,262,264,265,266,269,270,271,],[33,33,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-37,-38,-54,-27,-33,-53,-39,-58,-43,-61,-50,-52,-57,-34,-69,-3,-55,-56,-24,33,33,-42,-50,-54,-55,-56,-68,-65,-67,-33,-34,-40,-41,-59,-60,-51,-66,-76,-30,-25,-28,-29,-31,-32,-35,-36,-62,-63,-64,-44,-45,-46,-47,-48,-49,-70,-71,-72,-73,-74,-75,-77,-26,-93,-98,33,33,-125,-86,-94,33,-114,-117,-125,-104,33,33,-99,-100,-101,-106,-108,33,33,-118,33,-107,-116,33,-103,-115,33,33,-125,-105,-102,]),'PARA':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,29,30,38,39,40,42,45,46,47,48,49,50,51,52,65,66,68,75,77,78,79,81,82,83,88,89,91,92,93,101,102,103,104,116,117,118,120,121,122,123,124,125,138,139,140,141,142,144,145,146,147,148,149,150,151,152,153,154,155,157,159,162,163,187,188,193,195,197,200,210,212,218,219,221,228,233,234,235,240,241,242,243,246,249,251,254,255,262,264,265,266,269,270,271,],[34,34,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-37,-38,-54,-27,-33,-53,-39,-58,-43,-61,-50,-52,-57,-34,-69,-3,-55,-56,-24,34,34,-42,-50,-54,-55,-56,-68,-65,-67,-33,-34,-40,-41,-59,-60,-51,-66,-76,-30,-25,-28,-29,-31,-32,-35,-36,-62,-63,-64,-44,-45,-46,-47,-48,-49,-70,-71,-72,-73,-74,-75,-77,-26,-93,-98,34,34,-125,-86,-94,34,-114,-117,-125,-104,34,34,-99,-100,-101,-106,-108,34,34,-118,34,-107,-116,34,-103,-115,34,34,-125,-105,-102,]),'REPETIR':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,29,30,38,39,40,42,45,46,47,48,49,50,51,52,65,66,68,75,77,78,79,81,82,83,88,89,91,92,93,101,102,103,104,116,117,118,120,121,122,123,124,125,138,139,140,141,142,144,145,146,147,148,149,150,151,152,153,154,155,157,159,162,163,187,188,193,195,197,200,210,212,218,219,221,228,233,234,235,240,241,242,243,246,249,251,254,255,262,264,265,266,269,270,271,],[35,35,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-37,-38,-54,-27,-33,-53,-39,-58,-43,-61,-50,-52,-57,-34,-69,-3,-55,-56,-24,35,35,-42,-50,-54,-55,-56,-68,-65,-67,-33,-34,-40,-41,-59,-60,-51,-66,-76,-30,-25,-28,-29,-31,-32,-35,-36,-62,-63,-64,-44,-45,-46,-47,-48,-49,-70,-71,-72,-73,-74,-75,-77,-26,-93,-98,35,35,-125,-86,-94,35,-114,-117,-125,-104,35,35,-99,-100,-101,-106,-108,35,35,-118,35,-107,-116,35,-103,-115,35,35,-125,-105,-102,]),'SEGUN':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,29,30,38,39,40,42,45,46,47,48,49,50,51,52,65,66,68,75,77,78,79,81,82,83,88,89,91,92,93,101,102,103,104,116,117,118,120,121,122,123,124,125,138,139,140,141,142,144,145,146,147,148,149,150,151,152,153,154,155,157,159,162,163,187,188,193,195,197,200,210,212,218,219,221,228,233,234,235,240,241,242,243,246,249,251,254,255,262,264,265,266,269,270,271,],[36,36,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-37,-38,-54,-27,-33,-53,-39,-58,-43,-61,-50,-52,-57,-34,-69,-3,-55,-56,-24,36,36,-42,-50,-54,-55,-56,-68,-65,-67,-33,-34,-40,-41,-59,-60,-51,-66,-76,-30,-25,-28,-29,-31,-32,-35,-36,-62,-63,-64,-44,-45,-46,-47,-48,-49,-70,-71,-72,-73,-74,-75,-77,-26,-93,-98,36,36,-125,-86,-94,36,-114,-117,-125,-104,36,36,-99,-100,-101,-106,-108,36,36,-118,36,-107,-116,36,-103,-115,36,36,-125,-105,-102,]),'INTENTAR':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,29,30,38,39,40,42,45,46,47,48,49,50,51,52,65,66,68,75,77,78,79,81,82,83,88,89,91,92,93,101,102,103,104,116,117,118,120,121,122,123,124,125,138,139,140,141,142,144,145,146,147,148,149,150,151,152,153,154,155,157,159,162,163,187,188,193,195,197,200,210,212,218,219,221,228,233,234,235,240,241,242,243,246,249,251,254,255,262,264,265,266,269,270,271,],[37,37,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-37,-38,-54,-27,-33,-53,-39,-58,-43,-61,-50,-52,-57,-34,-69,-3,-55,-56,-24,37,37,-42,-50,-54,-55,-56,-68,-65,-67,-33,-34,-40,-41,-59,-60,-51,-66,-76,-30,-25,-28,-29,-31,-32,-35,-36,-62,-63,-64,-44,-45,-46,-47,-48,-49,-70,-71,-72,-73,-74,-75,-77,-26,-93,-98,37,37,-125,-86,-94,37,-114,-117,-125,-104,37,37,-99,-100,-101,-106,-108,37,37,-118,37,-107,-116,37,-103,-115,37,37,-125,-105,-102,]),'NO':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,27,29,30,38,39,40,42,45,46,47,48,49,50,51,52,58,65,66,68,72,73,75,76,77,78,79,81,82,83,88,89,90,91,92,93,101,102,103,104,116,117,118,120,121,122,123,124,125,126,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,157,159,162,163,187,188,189,193,195,197,200,206,210,212,218,219,220,221,228,231,233,234,235,240,241,242,243,246,248,249,250,251,254,255,262,264,265,266,269,270,271,],[41,41,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-37,-38,41,-54,-27,-33,-53,-39,-58,-43,-61,-50,-52,-57,-34,-69,-3,41,-55,-56,-24,41,41,41,41,41,-42,-50,-54,-55,-56,-68,-65,41,-67,-33,-34,-40,-41,-59,-60,-51,-66,-76,-30,-25,-28,-29,-31,-32,41,-35,-36,-62,-63,-64,41,-44,-45,-46,-47,-48,-49,-70,-71,-72,-73,-74,-75,-77,-26,-93,-98,41,41,41,-125,-86,-94,41,41,-114,-117,-125,-104,41,41,41,41,-99,-100,-101,-106,-108,41,41,-118,41,41,41,-107,-116,41,-103,-115,41,41,-125,-105,-102,]),'PAREN_ABRIR':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,29,30,32,33,34,36,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,65,66,68,69,71,72,73,75,76,77,78,79,80,81,82,83,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,115,116,117,118,119,120,121,122,123,124,125,126,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,157,158,159,160,162,163,187,188,189,191,193,194,195,196,197,199,200,206,209,210,212,218,219,220,221,228,231,233,234,235,236,240,241,242,243,246,248,249,250,251,254,255,262,264,265,266,269,270,271,],[27,27,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-37,-38,57,58,-54,-27,72,73,74,76,-33,-53,-39,80,-58,90,90,-43,-61,-50,-52,-57,-34,-69,-3,80,80,90,90,105,58,-55,-56,-24,126,129,27,27,27,27,27,-42,-50,126,-54,-55,-56,90,90,90,-68,-65,143,-67,-33,-34,80,80,80,80,80,80,105,-40,-41,-59,-60,105,90,-51,-66,-76,126,-30,-25,-28,-29,-31,-32,143,-35,-36,-62,-63,-64,58,-44,-45,-46,-47,-48,-49,-70,-71,-72,-73,-74,-75,-77,105,-26,105,-93,-98,27,27,27,206,-125,213,-86,105,-94,126,27,27,126,-114,-117,-125,-104,27,27,27,27,-99,-100,-101,248,-106,-108,27,27,-118,27,27,27,-107,-116,27,-103,-115,27,27,-125,-105,-102,]),'MENOS':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,27,29,30,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,61,62,63,64,65,66,67,68,69,72,73,75,76,77,78,79,80,81,82,83,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,114,115,116,117,118,119,120,121,122,123,124,125,126,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,157,158,159,160,162,163,187,188,189,193,195,196,197,199,200,206,209,210,212,218,219,220,221,228,231,233,234,235,240,241,242,243,246,248,249,250,251,254,255,262,264,265,266,269,270,271,],[44,44,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-37,56,44,-54,-27,-33,-53,-39,84,-58,44,44,-43,-61,-50,-52,-57,-34,-69,-3,84,84,44,44,84,115,56,-57,-53,-52,-54,-55,-56,-65,-24,115,44,44,44,44,44,-42,-50,44,-54,-55,-56,44,44,44,-68,-65,115,-67,-33,-34,84,84,84,84,84,84,84,-40,-41,-59,-60,84,56,44,-51,-66,-76,115,-30,-25,-28,-29,-31,56,115,56,-35,-36,-62,-63,-64,115,-44,-45,-46,-47,-48,-49,-70,-71,-72,-73,-74,-75,-77,84,-26,84,-93,-98,44,44,44,-125,-86,84,-94,115,44,44,115,-114,-117,-125,-104,44,44,44,44,-99,-100,-101,-106,-108,44,44,-118,44,44,44,-107,-116,44,-103,-115,44,44,-125,-105,-102,]),'MAS':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,27,29,30,38,39,40,42,43,44,45,46,47,48,49,50,51,52,55,56,58,59,61,62,63,64,65,66,67,68,69,72,73,75,76,77,78,79,80,81,82,83,85,86,87,88,89,90,91,92,93,101,102,103,104,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,159,162,163,176,179,180,181,187,188,189,193,195,197,199,200,206,209,210,212,218,219,220,221,228,231,233,234,235,240,241,242,243,246,248,249,250,251,254,255,262,264,265,266,269,270,271,],[43,43,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-37,55,43,-54,-27,-33,-53,-39,-58,43,43,-43,-61,-50,-52,100,-34,-69,-3,43,43,43,55,100,-53,-52,-54,-55,-56,-65,-24,43,43,43,43,43,43,-42,-50,43,-54,-55,-56,43,43,43,-68,-65,43,-67,-33,-34,-40,-41,-59,-60,-71,-72,-73,-74,-75,100,55,43,-51,-66,-76,43,-30,-25,-28,-29,100,55,43,55,-35,-36,-62,-63,-64,43,-44,-45,-46,-47,-48,-49,-70,-71,-72,-73,-74,-75,100,-77,-26,-93,-98,-73,-72,-71,100,43,43,43,-125,-86,-94,43,43,43,43,-114,-117,-125,-104,43,43,43,43,-99,-100,-101,-106,-108,43,43,-118,43,43,43,-107,-116,43,-103,-115,43,43,-125,-105,-102,]),'CADENA':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,27,29,30,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,65,66,68,69,70,72,73,75,76,77,78,79,80,81,82,83,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,115,116,117,118,119,120,121,122,123,124,125,126,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,157,158,159,160,161,162,163,187,188,189,193,195,196,197,198,199,200,206,209,210,212,218,219,220,221,228,231,233,234,235,240,241,242,243,246,248,249,250,251,254,255,262,264,265,266,269,270,271,],[39,39,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-37,-38,62,-54,-27,-33,-53,-39,39,-58,39,39,-43,-61,-50,-52,-57,-34,-69,-3,39,39,39,39,108,62,-55,-56,-24,123,128,39,39,39,39,39,-42,-50,62,-54,-55,-56,39,39,39,-68,-65,62,-67,-33,-34,39,39,39,39,39,39,151,-40,-41,-59,-60,151,39,-51,-66,-76,123,-30,-25,-28,-29,-31,-32,62,-35,-36,-62,-63,-64,62,-44,-45,-46,-47,-48,-49,-70,-71,-72,-73,-74,-75,-77,108,-26,180,184,-93,-98,39,39,39,-125,-86,180,-94,184,123,39,39,123,-114,-117,-125,-104,39,39,39,39,-99,-100,-101,-106,-108,39,39,-118,39,39,39,-107,-116,39,-103,-115,39,39,-125,-105,-102,]),'NUMERO':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,27,29,30,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,65,66,68,69,70,72,73,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,115,116,117,118,119,120,121,122,123,124,125,126,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,157,158,159,160,162,163,187,188,189,193,195,196,197,199,200,206,209,210,212,218,219,220,221,228,231,233,234,235,240,241,242,243,246,248,249,250,251,254,255,262,264,265,266,269,270,271,],[38,38,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-37,-38,38,-54,-27,-33,-53,-39,38,-58,38,92,-43,-61,-50,-52,-57,-34,-69,-3,38,38,38,38,38,38,-55,-56,-24,38,127,38,38,38,38,38,-42,-50,38,-54,-55,-56,138,38,38,38,-68,-65,38,-67,-33,-34,38,38,38,38,38,38,38,-40,-41,-59,-60,38,92,-51,-66,-76,38,-30,-25,-28,-29,-31,-32,38,-35,-36,-62,-63,-64,38,-44,-45,-46,-47,-48,-49,-70,-71,-72,-73,-74,-75,-77,38,-26,38,-93,-98,38,38,38,-125,-86,38,-94,38,38,38,38,-114,-117,-125,-104,38,38,38,38,-99,-100,-101,-106,-108,38,38,-118,38,38,38,-107,-116,38,-103,-115,38,38,-125,-105,-102,]),'FLOTANTE':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,27,29,30,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,65,66,68,69,72,73,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,115,116,117,118,119,120,121,122,123,124,125,126,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,157,158,159,160,162,163,187,188,189,193,195,196,197,199,200,206,209,210,212,218,219,220,221,228,231,233,234,235,240,241,242,243,246,248,249,250,251,254,255,262,264,265,266,269,270,271,],[50,50,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-37,-38,50,-54,-27,-33,-53,-39,50,-58,50,93,-43,-61,-50,-52,-57,-34,-69,-3,50,50,50,50,50,50,-55,-56,-24,50,50,50,50,50,50,-42,-50,50,-54,-55,-56,139,50,50,50,-68,-65,50,-67,-33,-34,50,50,50,50,50,50,50,-40,-41,-59,-60,50,93,-51,-66,-76,50,-30,-25,-28,-29,-31,-32,50,-35,-36,-62,-63,-64,50,-44,-45,-46,-47,-48,-49,-70,-71,-72,-73,-74,-75,-77,50,-26,50,-93,-98,50,50,50,-125,-86,50,-94,50,50,50,50,-114,-117,-125,-104,50,50,50,50,-99,-100,-101,-106,-108,50,50,-118,50,50,50,-107,-116,50,-103,-115,50,50,-125,-105,-102,]),'LLAVE_CERRAR':([2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,29,30,38,39,40,42,45,46,47,48,49,50,51,52,65,66,68,75,77,78,79,81,82,83,88,89,91,92,93,101,102,103,104,116,117,118,120,121,122,123,124,125,134,136,138,139,140,141,142,144,145,146,147,148,149,150,151,152,153,154,155,157,159,162,163,182,183,187,188,193,195,197,200,202,203,207,208,210,212,215,216,217,218,219,221,223,224,226,228,230,232,233,234,235,239,240,241,242,244,246,247,249,251,252,254,255,257,259,260,262,264,265,266,267,268,269,270,271,],[-1,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-37,-38,-54,-27,-33,-53,-39,-58,-43,-61,-50,-52,-57,-34,-69,-3,-55,-56,-24,-125,-125,-42,-50,-54,-55,-56,-68,-65,-67,-33,-34,-40,-41,-59,-60,-51,-66,-76,-30,-25,-28,-29,-31,-32,172,174,-35,-36,-62,-63,-64,-44,-45,-46,-47,-48,-49,-70,-71,-72,-73,-74,-75,-77,-26,-93,-98,197,-96,-125,-125,-125,-86,-94,-125,218,219,-125,-110,-114,-117,-95,-97,-125,-125,-104,-125,241,-109,-113,-125,246,-124,-99,-100,-101,251,-106,-108,-125,254,-118,-123,-125,-107,-112,-116,-125,262,-111,264,-103,-115,-125,-125,269,270,-125,-105,-102,]),'RETORNAR':([2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,29,30,38,39,40,42,45,46,47,48,49,50,51,52,65,66,68,78,79,81,82,83,88,89,91,92,93,101,102,103,104,116,117,118,120,121,122,123,124,125,138,139,140,141,142,144,145,146,147,148,149,150,151,152,153,154,155,157,159,162,163,193,195,197,200,210,212,217,218,219,233,234,235,240,241,246,251,254,262,264,269,270,271,],[-1,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-37,-38,-54,-27,-33,-53,-39,-58,-43,-61,-50,-52,-57,-34,-69,-3,-55,-56,-24,-42,-50,-54,-55,-56,-68,-65,-67,-33,-34,-40,-41,-59,-60,-51,-66,-76,-30,-25,-28,-29,-31,-32,-35,-36,-62,-63,-64,-44,-45,-46,-47,-48,-49,-70,-71,-72,-73,-74,-75,-77,-26,-93,-98,-125,-86,-94,-125,-114,-117,231,-125,-104,-99,-100,-101,-106,-108,-118,-107,-116,-103,-115,-125,-105,-102,]),'PARAR':([2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,29,30,38,39,40,42,45,46,47,48,49,50,51,52,65,66,68,78,79,81,82,83,88,89,91,92,93,101,102,103,104,116,117,118,120,121,122,123,124,125,138,139,140,141,142,144,145,146,147,148,149,150,151,152,153,154,155,157,159,162,163,193,195,197,210,212,218,219,233,234,235,240,241,243,246,251,253,254,262,264,269,270,271,],[-1,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-37,-38,-54,-27,-33,-53,-39,-58,-43,-61,-50,-52,-57,-34,-69,-3,-55,-56,-24,-42,-50,-54,-55,-56,-68,-65,-67,-33,-34,-40,-41,-59,-60,-51,-66,-76,-30,-25,-28,-29,-31,-32,-35,-36,-62,-63,-64,-44,-45,-46,-47,-48,-49,-70,-71,-72,-73,-74,-75,-77,-26,-93,-98,-125,-86,-94,-114,-117,-125,-104,-99,-100,-101,-106,-108,-125,-118,-107,259,-116,-103,-115,-125,-105,-102,]),'IGUAL':([22,23,29,38,39,45,47,48,49,50,51,61,62,63,64,65,66,67,79,81,82,83,92,93,116,118,138,139,150,151,152,153,154,155,162,163,],[-55,-56,-54,-33,-53,94,-50,-52,-57,-34,-69,-57,-53,-52,-54,-55,-56,-50,-50,-54,-55,-56,-35,-36,-51,-76,-35,-36,-70,-71,-72,-73,-74,-75,-93,-98,]),'DIFERENTE':([22,23,29,38,39,45,47,48,49,50,51,61,62,63,64,65,66,67,79,81,82,83,92,93,116,118,138,139,150,151,152,153,154,155,162,163,],[-55,-56,-54,-33,-53,95,-50,-52,-57,-34,-69,-57,-53,-52,-54,-55,-56,-50,-50,-54,-55,-56,-35,-36,-51,-76,-35,-36,-70,-71,-72,-73,-74,-75,-93,-98,]),'MAYOR':([22,23,29,38,39,45,47,48,49,50,51,61,62,63,64,65,66,67,79,81,82,83,92,93,116,118,138,139,150,151,152,153,154,155,162,163,],[-55,-56,-54,-33,-53,96,-50,-52,-57,-34,-69,-57,-53,-52,-54,-55,-56,-50,-50,-54,-55,-56,-35,-36,-51,-76,-35,-36,-70,-71,-72,-73,-74,-75,-93,-98,]),'MENOR':([22,23,29,38,39,45,47,48,49,50,51,61,62,63,64,65,66,67,79,81,82,83,92,93,116,118,138,139,150,151,152,153,154,155,162,163,],[-55,-56,-54,-33,-53,97,-50,-52,-57,-34,-69,-57,-53,-52,-54,-55,-56,-50,-50,-54,-55,-56,-35,-36,-51,-76,-35,-36,-70,-71,-72,-73,-74,-75,-93,-98,]),'MAYOR_IGUAL':([22,23,29,38,39,45,47,48,49,50,51,61,62,63,64,65,66,67,79,81,82,83,92,93,116,118,138,139,150,151,152,153,154,155,162,163,],[-55,-56,-54,-33,-53,98,-50,-52,-57,-34,-69,-57,-53,-52,-54,-55,-56,-50,-50,-54,-55,-56,-35,-36,-51,-76,-35,-36,-70,-71,-72,-73,-74,-75,-93,-98,]),'MENOR_IGUAL':([22,23,29,38,39,45,47,48,49,50,51,61,62,63,64,65,66,67,79,81,82,83,92,93,116,118,138,139,150,151,152,153,154,155,162,163,],[-55,-56,-54,-33,-53,99,-50,-52,-57,-34,-69,-57,-53,-52,-54,-55,-56,-50,-50,-54,-55,-56,-35,-36,-51,-76,-35,-36,-70,-71,-72,-73,-74,-75,-93,-98,]),'Y':([22,23,24,29,38,39,40,45,47,48,49,50,51,61,62,63,64,65,66,67,78,79,81,82,83,92,93,101,102,116,118,138,139,144,145,146,147,148,149,150,151,152,153,154,155,162,163,],[-55,-56,53,-54,-33,-53,-39,-43,-50,-52,-57,-34,-69,-57,-53,-52,-54,-55,-56,-50,-42,-50,-54,-55,-56,-35,-36,-40,-41,-51,-76,-35,-36,-44,-45,-46,-47,-48,-49,-70,-71,-72,-73,-74,-75,-93,-98,]),'O':([22,23,24,29,38,39,40,45,47,48,49,50,51,61,62,63,64,65,66,67,78,79,81,82,83,92,93,101,102,116,118,138,139,144,145,146,147,148,149,150,151,152,153,154,155,162,163,],[-55,-56,54,-54,-33,-53,-39,-43,-50,-52,-57,-34,-69,-57,-53,-52,-54,-55,-56,-50,-42,-50,-54,-55,-56,-35,-36,-40,-41,-51,-76,-35,-36,-44,-45,-46,-47,-48,-49,-70,-71,-72,-73,-74,-75,-93,-98,]),'POR':([22,23,29,38,39,42,46,47,48,49,50,51,61,62,63,64,65,66,67,81,82,83,88,89,91,92,93,103,104,117,118,120,122,123,124,138,139,140,141,142,150,151,152,153,154,155,162,163,],[-55,-56,-54,-33,-53,85,-61,-65,-52,-57,-34,-69,-57,-53,-52,-54,-55,-56,-65,-54,-55,-56,-68,-65,-67,-33,-34,85,85,-66,-76,-54,-52,-53,-57,-35,-36,-62,-63,-64,-70,-71,-72,-73,-74,-75,-93,-98,]),'DIV':([22,23,29,38,39,42,46,47,48,49,50,51,61,62,63,64,65,66,67,81,82,83,88,89,91,92,93,103,104,117,118,120,122,123,124,138,139,140,141,142,150,151,152,153,154,155,162,163,],[-55,-56,-54,-33,-53,86,-61,-65,-52,-57,-34,-69,-57,-53,-52,-54,-55,-56,-65,-54,-55,-56,-68,-65,-67,-33,-34,86,86,-66,-76,-54,-52,-53,-57,-35,-36,-62,-63,-64,-70,-71,-72,-73,-74,-75,-93,-98,]),'MOD':([22,23,29,38,39,42,46,47,48,49,50,51,61,62,63,64,65,66,67,81,82,83,88,89,91,92,93,103,104,117,118,120,122,123,124,138,139,140,141,142,150,151,152,153,154,155,162,163,],[-55,-56,-54,-33,-53,87,-61,-65,-52,-57,-34,-69,-57,-53,-52,-54,-55,-56,-65,-54,-55,-56,-68,-65,-67,-33,-34,87,87,-66,-76,-54,-52,-53,-57,-35,-36,-62,-63,-64,-70,-71,-72,-73,-74,-75,-93,-98,]),'PAREN_CERRAR':([24,25,38,39,40,42,45,46,47,48,49,50,51,59,60,61,62,63,64,65,66,67,78,79,81,82,83,88,89,91,92,93,101,102,103,104,106,107,108,109,110,111,112,113,114,116,117,118,129,130,131,135,137,138,139,140,141,142,144,145,146,147,148,149,150,151,152,153,154,155,156,162,163,164,165,166,167,175,190,201,222,229,256,258,],[-37,-38,-33,-53,-39,-58,-43,-61,-50,-52,-57,-34,-69,116,117,118,-53,-52,-54,-55,-56,-50,-42,-50,-54,-55,-56,-68,-65,-67,-33,-34,-40,-41,-59,-60,157,-79,-71,-72,-73,-74,-75,-85,116,-51,-66,-76,-125,168,169,173,116,-35,-36,-62,-63,-64,-44,-45,-46,-47,-48,-49,-70,-71,-72,-73,-74,-75,118,-93,-98,-122,185,-119,-120,-78,205,-121,240,245,261,263,]),'PUNTO_COMA':([24,25,38,39,40,42,45,46,47,48,49,50,51,78,79,81,82,83,88,89,91,92,93,101,102,103,104,116,117,118,138,139,140,141,142,144,145,146,147,148,149,150,151,152,153,154,155,162,163,204,238,],[-37,-38,-33,-53,-39,-58,-43,-61,-50,-52,-57,-34,-69,-42,-50,-54,-55,-56,-68,-65,-67,-33,-34,-40,-41,-59,-60,-51,-66,-76,-35,-36,-62,-63,-64,-44,-45,-46,-47,-48,-49,-70,-71,-72,-73,-74,-75,-93,-98,220,250,]),'ASIGNACION':([29,68,170,184,],[69,119,189,199,]),'CORCHETE_ABRIR':([29,64,81,110,119,120,153,176,],[70,70,70,70,160,70,70,70,]),'LLAVE_ABRIR':([35,37,119,168,169,173,185,205,211,237,245,261,263,],[75,77,161,187,188,192,200,221,228,249,255,265,266,]),'SEPARADOR':([38,39,42,46,48,49,50,51,65,66,81,82,83,88,89,91,92,93,103,104,106,107,108,109,110,111,112,113,117,118,120,122,123,124,125,138,139,140,141,142,150,151,152,153,154,155,162,163,164,166,175,176,177,178,179,180,181,182,183,201,214,215,216,],[-33,-53,-58,-61,-52,-57,-34,-69,-55,-56,-54,-55,-56,-68,-65,-67,-33,-34,-59,-60,158,-79,-71,-72,-73,-74,-75,-85,-66,-76,-30,-28,-29,-31,-32,-35,-36,-62,-63,-64,-70,-71,-72,-73,-74,-75,-93,-98,-122,186,-78,-73,196,-88,-72,-71,-92,198,-96,-121,-87,-95,-97,]),'CASE_LIMITADOR':([38,39,42,46,48,49,50,51,65,66,81,82,83,88,89,91,92,93,103,104,117,118,120,122,123,124,125,138,139,140,141,142,150,151,152,153,154,155,162,163,225,227,],[-33,-53,-58,-61,-52,-57,-34,-69,-55,-56,-54,-55,-56,-68,-65,-67,-33,-34,-59,-60,-66,-76,-30,-28,-29,-31,-32,-35,-36,-62,-63,-64,-70,-71,-72,-73,-74,-75,-93,-98,242,243,]),'CORCHETE_CERRAR':([38,50,51,118,127,128,138,139,150,151,152,153,154,155,162,163,176,177,178,179,180,181,214,],[-33,-34,-69,-76,162,163,-35,-36,-70,-71,-72,-73,-74,-75,-93,-98,-73,195,-88,-72,-71,-92,-87,]),'EN':([133,],[171,]),'HASTA':([172,],[191,]),'CAPTURAR':([174,],[194,]),'CASO':([192,207,208,224,259,],[209,209,-110,-109,-111,]),'FINALMENTE':([193,264,],[211,-115,]),'PREDETERMINADO':([207,208,224,259,],[225,-110,-109,-111,]),'SINOSI':([218,269,],[236,236,]),'SINO':([218,269,],[237,237,]),}
+_lr_action_items = {'$end':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,25,26,27,28,29,30,31,32,33,36,44,58,59,60,61,67,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,106,107,109,110,137,139,140,153,155,160,161,175,176,177,182,183,188,193,196,204,206,211,212,213,],[-90,0,-1,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-43,-44,-45,-46,-47,-48,-49,-50,-51,-24,-3,-39,-49,-40,-41,-21,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-42,-22,-25,-56,-85,-52,-23,-90,-55,-57,-76,-79,-90,-66,-61,-62,-63,-68,-70,-80,-69,-78,-65,-77,-90,-67,-64,]),'NO':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,36,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,63,64,65,66,67,69,70,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,97,106,107,108,109,110,111,131,132,133,137,139,140,142,143,149,152,153,155,160,161,162,163,170,173,175,176,177,182,183,184,185,188,190,191,192,193,196,197,204,206,207,208,211,212,213,],[21,21,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,21,21,21,21,-43,-44,-45,-46,-47,-48,-49,-50,-51,-24,-3,21,21,21,21,21,21,21,21,21,21,21,21,21,-39,-49,-40,-41,21,21,21,21,-21,21,21,21,21,21,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-42,-22,-25,21,-56,-85,21,-52,-23,21,21,21,21,-90,-55,-57,21,21,21,21,-76,-79,-90,-66,21,21,21,21,-61,-62,-63,-68,-70,21,21,-80,21,21,21,-69,-78,21,-65,-77,21,21,-90,-67,-64,]),'MENOS':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,36,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,63,64,65,66,67,69,70,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,97,106,107,108,109,110,111,131,132,133,137,139,140,142,143,149,152,153,155,160,161,162,163,170,173,175,176,177,182,183,184,185,188,190,191,192,193,196,197,204,206,207,208,211,212,213,],[22,22,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,22,22,22,22,-43,-44,-45,-46,-47,-48,-49,-50,-51,-24,-3,22,22,22,22,22,22,22,22,22,22,22,22,22,-39,-49,-40,-41,22,22,22,22,-21,22,22,22,22,22,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-42,-22,-25,22,-56,-85,22,-52,-23,22,22,22,22,-90,-55,-57,22,22,22,22,-76,-79,-90,-66,22,22,22,22,-61,-62,-63,-68,-70,22,22,-80,22,22,22,-69,-78,22,-65,-77,22,22,-90,-67,-64,]),'MAS':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,36,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,63,64,65,66,67,69,70,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,97,106,107,108,109,110,111,131,132,133,137,139,140,142,143,149,152,153,155,160,161,162,163,170,173,175,176,177,182,183,184,185,188,190,191,192,193,196,197,204,206,207,208,211,212,213,],[23,23,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,23,23,23,23,-43,-44,-45,-46,-47,-48,-49,-50,-51,-24,-3,23,23,23,23,23,23,23,23,23,23,23,23,23,-39,-49,-40,-41,23,23,23,23,-21,23,23,23,23,23,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-42,-22,-25,23,-56,-85,23,-52,-23,23,23,23,23,-90,-55,-57,23,23,23,23,-76,-79,-90,-66,23,23,23,23,-61,-62,-63,-68,-70,23,23,-80,23,23,23,-69,-78,23,-65,-77,23,23,-90,-67,-64,]),'PAREN_ABRIR':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,36,38,39,40,42,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,63,64,65,66,67,68,69,70,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,97,106,107,108,109,110,111,131,132,133,135,137,138,139,140,142,143,149,152,153,155,160,161,162,163,170,173,175,176,177,178,182,183,184,185,188,190,191,192,193,196,197,204,206,207,208,211,212,213,],[24,24,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,24,24,24,24,-43,-44,-45,-46,-47,-48,-49,-50,-51,66,-24,69,70,71,73,-3,24,24,24,24,24,24,24,24,24,24,24,24,24,-39,-49,-40,-41,24,24,24,24,-21,98,24,24,24,24,24,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-42,-22,-25,24,-56,-85,24,-52,-23,24,24,24,24,149,-90,156,-55,-57,24,24,24,24,-76,-79,-90,-66,24,24,24,24,-61,-62,-63,190,-68,-70,24,24,-80,24,24,24,-69,-78,24,-65,-77,24,24,-90,-67,-64,]),'NUMERO':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,36,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,63,64,65,66,67,69,70,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,97,106,107,108,109,110,111,131,132,133,137,139,140,142,143,149,152,153,155,160,161,162,163,170,173,175,176,177,182,183,184,185,188,190,191,192,193,196,197,204,206,207,208,211,212,213,],[25,25,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,25,25,25,25,-43,-44,-45,-46,-47,-48,-49,-50,-51,-24,-3,25,25,25,25,25,25,25,25,25,25,25,25,25,-39,-49,-40,-41,25,25,25,25,-21,25,25,25,25,25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-42,-22,-25,25,-56,-85,25,-52,-23,25,25,25,25,-90,-55,-57,25,25,25,25,-76,-79,-90,-66,25,25,25,25,-61,-62,-63,-68,-70,25,25,-80,25,25,25,-69,-78,25,-65,-77,25,25,-90,-67,-64,]),'FLOTANTE':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,36,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,63,64,65,66,67,69,70,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,97,106,107,108,109,110,111,131,132,133,137,139,140,142,143,149,152,153,155,160,161,162,163,170,173,175,176,177,182,183,184,185,188,190,191,192,193,196,197,204,206,207,208,211,212,213,],[26,26,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,26,26,26,26,-43,-44,-45,-46,-47,-48,-49,-50,-51,-24,-3,26,26,26,26,26,26,26,26,26,26,26,26,26,-39,-49,-40,-41,26,26,26,26,-21,26,26,26,26,26,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-42,-22,-25,26,-56,-85,26,-52,-23,26,26,26,26,-90,-55,-57,26,26,26,26,-76,-79,-90,-66,26,26,26,26,-61,-62,-63,-68,-70,26,26,-80,26,26,26,-69,-78,26,-65,-77,26,26,-90,-67,-64,]),'CADENA':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,36,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,63,64,65,66,67,69,70,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,97,106,107,108,109,110,111,112,131,132,133,137,139,140,141,142,143,149,152,153,155,160,161,162,163,170,173,175,176,177,182,183,184,185,188,190,191,192,193,196,197,204,206,207,208,211,212,213,],[27,27,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,27,27,27,27,-43,-44,-45,-46,-47,-48,-49,-50,-51,-24,-3,27,27,27,27,27,27,27,27,27,27,27,27,27,-39,-49,-40,-41,27,27,27,27,-21,27,27,27,27,27,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-42,-22,-25,27,-56,-85,27,-52,-23,27,128,27,27,27,-90,-55,-57,128,27,27,27,27,-76,-79,-90,-66,27,27,27,27,-61,-62,-63,-68,-70,27,27,-80,27,27,27,-69,-78,27,-65,-77,27,27,-90,-67,-64,]),'VERDADERO':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,36,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,63,64,65,66,67,69,70,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,97,106,107,108,109,110,111,131,132,133,137,139,140,142,143,149,152,153,155,160,161,162,163,170,173,175,176,177,182,183,184,185,188,190,191,192,193,196,197,204,206,207,208,211,212,213,],[28,28,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,28,28,28,28,-43,-44,-45,-46,-47,-48,-49,-50,-51,-24,-3,28,28,28,28,28,28,28,28,28,28,28,28,28,-39,-49,-40,-41,28,28,28,28,-21,28,28,28,28,28,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-42,-22,-25,28,-56,-85,28,-52,-23,28,28,28,28,-90,-55,-57,28,28,28,28,-76,-79,-90,-66,28,28,28,28,-61,-62,-63,-68,-70,28,28,-80,28,28,28,-69,-78,28,-65,-77,28,28,-90,-67,-64,]),'FALSO':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,36,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,63,64,65,66,67,69,70,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,97,106,107,108,109,110,111,131,132,133,137,139,140,142,143,149,152,153,155,160,161,162,163,170,173,175,176,177,182,183,184,185,188,190,191,192,193,196,197,204,206,207,208,211,212,213,],[29,29,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,29,29,29,29,-43,-44,-45,-46,-47,-48,-49,-50,-51,-24,-3,29,29,29,29,29,29,29,29,29,29,29,29,29,-39,-49,-40,-41,29,29,29,29,-21,29,29,29,29,29,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-42,-22,-25,29,-56,-85,29,-52,-23,29,29,29,29,-90,-55,-57,29,29,29,29,-76,-79,-90,-66,29,29,29,29,-61,-62,-63,-68,-70,29,29,-80,29,29,29,-69,-78,29,-65,-77,29,29,-90,-67,-64,]),'NULO':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,36,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,63,64,65,66,67,69,70,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,97,106,107,108,109,110,111,131,132,133,137,139,140,142,143,149,152,153,155,160,161,162,163,170,173,175,176,177,182,183,184,185,188,190,191,192,193,196,197,204,206,207,208,211,212,213,],[30,30,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,30,30,30,30,-43,-44,-45,-46,-47,-48,-49,-50,-51,-24,-3,30,30,30,30,30,30,30,30,30,30,30,30,30,-39,-49,-40,-41,30,30,30,30,-21,30,30,30,30,30,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-42,-22,-25,30,-56,-85,30,-52,-23,30,30,30,30,-90,-55,-57,30,30,30,30,-76,-79,-90,-66,30,30,30,30,-61,-62,-63,-68,-70,30,30,-80,30,30,30,-69,-78,30,-65,-77,30,30,-90,-67,-64,]),'ID':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,35,36,37,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,63,64,65,66,67,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,97,98,101,106,107,108,109,110,111,120,130,131,132,133,137,139,140,142,143,149,152,153,155,156,160,161,162,163,170,173,175,176,177,182,183,184,185,188,190,191,192,193,196,197,204,206,207,208,211,212,213,],[31,31,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,59,59,59,59,-43,-44,-45,-46,-47,-48,-49,-50,-51,67,-24,68,-3,59,59,59,59,59,59,59,59,59,59,59,59,59,-39,-49,-40,-41,59,59,59,59,-21,59,59,102,31,59,31,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-42,-22,-25,59,113,119,-56,-85,59,-52,-23,59,134,144,31,31,59,-90,-55,-57,59,31,59,59,-76,-79,171,-90,-66,59,31,31,59,-61,-62,-63,-68,-70,31,31,-80,59,31,59,-69,-78,31,-65,-77,31,31,-90,-67,-64,]),'IMPRIMIR':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,25,26,27,28,29,30,31,32,33,36,44,58,59,60,61,67,72,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,106,107,109,110,131,132,137,139,140,143,153,155,160,161,163,170,175,176,177,182,183,184,185,188,191,193,196,197,204,206,207,208,211,212,213,],[34,34,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-43,-44,-45,-46,-47,-48,-49,-50,-51,-24,-3,-39,-49,-40,-41,-21,34,34,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-42,-22,-25,-56,-85,-52,-23,34,34,-90,-55,-57,34,-76,-79,-90,-66,34,34,-61,-62,-63,-68,-70,34,34,-80,34,-69,-78,34,-65,-77,34,34,-90,-67,-64,]),'VAL':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,25,26,27,28,29,30,31,32,33,36,44,58,59,60,61,67,71,72,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,106,107,109,110,131,132,137,139,140,143,153,155,160,161,163,170,175,176,177,182,183,184,185,188,191,193,196,197,204,206,207,208,211,212,213,],[35,35,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-43,-44,-45,-46,-47,-48,-49,-50,-51,-24,-3,-39,-49,-40,-41,-21,101,35,35,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-42,-22,-25,-56,-85,-52,-23,35,35,-90,-55,-57,35,-76,-79,-90,-66,35,35,-61,-62,-63,-68,-70,35,35,-80,35,-69,-78,35,-65,-77,35,35,-90,-67,-64,]),'FUN':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,25,26,27,28,29,30,31,32,33,36,44,58,59,60,61,67,72,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,106,107,109,110,131,132,137,139,140,143,153,155,160,161,163,170,175,176,177,182,183,184,185,188,191,193,196,197,204,206,207,208,211,212,213,],[37,37,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-43,-44,-45,-46,-47,-48,-49,-50,-51,-24,-3,-39,-49,-40,-41,-21,37,37,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-42,-22,-25,-56,-85,-52,-23,37,37,-90,-55,-57,37,-76,-79,-90,-66,37,37,-61,-62,-63,-68,-70,37,37,-80,37,-69,-78,37,-65,-77,37,37,-90,-67,-64,]),'SI':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,25,26,27,28,29,30,31,32,33,36,44,58,59,60,61,67,72,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,106,107,109,110,131,132,137,139,140,143,153,155,160,161,163,170,175,176,177,182,183,184,185,188,191,193,196,197,204,206,207,208,211,212,213,],[38,38,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-43,-44,-45,-46,-47,-48,-49,-50,-51,-24,-3,-39,-49,-40,-41,-21,38,38,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-42,-22,-25,-56,-85,-52,-23,38,38,-90,-55,-57,38,-76,-79,-90,-66,38,38,-61,-62,-63,-68,-70,38,38,-80,38,-69,-78,38,-65,-77,38,38,-90,-67,-64,]),'MIENTRAS':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,25,26,27,28,29,30,31,32,33,36,44,58,59,60,61,67,72,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,106,107,109,110,131,132,137,139,140,143,153,155,160,161,163,170,175,176,177,182,183,184,185,188,191,193,196,197,204,206,207,208,211,212,213,],[39,39,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-43,-44,-45,-46,-47,-48,-49,-50,-51,-24,-3,-39,-49,-40,-41,-21,39,39,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-42,-22,-25,-56,-85,-52,-23,39,39,-90,-55,-57,39,-76,-79,-90,-66,39,39,-61,-62,-63,-68,-70,39,39,-80,39,-69,-78,39,-65,-77,39,39,-90,-67,-64,]),'PARA':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,25,26,27,28,29,30,31,32,33,36,44,58,59,60,61,67,72,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,106,107,109,110,131,132,137,139,140,143,153,155,160,161,163,170,175,176,177,182,183,184,185,188,191,193,196,197,204,206,207,208,211,212,213,],[40,40,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-43,-44,-45,-46,-47,-48,-49,-50,-51,-24,-3,-39,-49,-40,-41,-21,40,40,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-42,-22,-25,-56,-85,-52,-23,40,40,-90,-55,-57,40,-76,-79,-90,-66,40,40,-61,-62,-63,-68,-70,40,40,-80,40,-69,-78,40,-65,-77,40,40,-90,-67,-64,]),'REPETIR':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,25,26,27,28,29,30,31,32,33,36,44,58,59,60,61,67,72,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,106,107,109,110,131,132,137,139,140,143,153,155,160,161,163,170,175,176,177,182,183,184,185,188,191,193,196,197,204,206,207,208,211,212,213,],[41,41,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-43,-44,-45,-46,-47,-48,-49,-50,-51,-24,-3,-39,-49,-40,-41,-21,41,41,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-42,-22,-25,-56,-85,-52,-23,41,41,-90,-55,-57,41,-76,-79,-90,-66,41,41,-61,-62,-63,-68,-70,41,41,-80,41,-69,-78,41,-65,-77,41,41,-90,-67,-64,]),'SEGUN':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,25,26,27,28,29,30,31,32,33,36,44,58,59,60,61,67,72,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,106,107,109,110,131,132,137,139,140,143,153,155,160,161,163,170,175,176,177,182,183,184,185,188,191,193,196,197,204,206,207,208,211,212,213,],[42,42,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-43,-44,-45,-46,-47,-48,-49,-50,-51,-24,-3,-39,-49,-40,-41,-21,42,42,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-42,-22,-25,-56,-85,-52,-23,42,42,-90,-55,-57,42,-76,-79,-90,-66,42,42,-61,-62,-63,-68,-70,42,42,-80,42,-69,-78,42,-65,-77,42,42,-90,-67,-64,]),'INTENTAR':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,25,26,27,28,29,30,31,32,33,36,44,58,59,60,61,67,72,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,106,107,109,110,131,132,137,139,140,143,153,155,160,161,163,170,175,176,177,182,183,184,185,188,191,193,196,197,204,206,207,208,211,212,213,],[43,43,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-43,-44,-45,-46,-47,-48,-49,-50,-51,-24,-3,-39,-49,-40,-41,-21,43,43,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-42,-22,-25,-56,-85,-52,-23,43,43,-90,-55,-57,43,-76,-79,-90,-66,43,43,-61,-62,-63,-68,-70,43,43,-80,43,-69,-78,43,-65,-77,43,43,-90,-67,-64,]),'LLAVE_CERRAR':([2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,25,26,27,28,29,30,31,32,33,36,44,58,59,60,61,67,72,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,103,105,106,107,109,110,126,127,131,132,137,139,140,143,145,146,150,151,153,155,157,158,159,160,161,163,165,166,168,170,172,174,175,176,177,181,182,183,184,186,188,189,191,193,194,196,197,199,201,202,204,206,207,208,209,210,211,212,213,],[-1,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-43,-44,-45,-46,-47,-48,-49,-50,-51,-24,-3,-39,-49,-40,-41,-21,-90,-90,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-42,-22,-25,121,123,-56,-85,-52,-23,140,-59,-90,-90,-90,-55,-57,-90,160,161,-90,-72,-76,-79,-58,-60,-90,-90,-66,-90,183,-71,-75,-90,188,-89,-61,-62,-63,193,-68,-70,-90,196,-80,-88,-90,-69,-74,-78,-90,204,-73,206,-65,-77,-90,-90,211,212,-90,-67,-64,]),'RETORNAR':([2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,25,26,27,28,29,30,31,32,33,36,44,58,59,60,61,67,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,106,107,109,110,137,139,140,143,153,155,159,160,161,175,176,177,182,183,188,193,196,204,206,211,212,213,],[-1,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-43,-44,-45,-46,-47,-48,-49,-50,-51,-24,-3,-39,-49,-40,-41,-21,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-42,-22,-25,-56,-85,-52,-23,-90,-55,-57,-90,-76,-79,173,-90,-66,-61,-62,-63,-68,-70,-80,-69,-78,-65,-77,-90,-67,-64,]),'PARAR':([2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,25,26,27,28,29,30,31,32,33,36,44,58,59,60,61,67,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,106,107,109,110,137,139,140,153,155,160,161,175,176,177,182,183,185,188,193,195,196,204,206,211,212,213,],[-1,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-43,-44,-45,-46,-47,-48,-49,-50,-51,-24,-3,-39,-49,-40,-41,-21,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-42,-22,-25,-56,-85,-52,-23,-90,-55,-57,-76,-79,-90,-66,-61,-62,-63,-68,-70,-90,-80,-69,201,-78,-65,-77,-90,-67,-64,]),'O':([7,25,26,27,28,29,30,31,32,33,58,59,60,61,62,75,76,77,78,79,80,81,82,83,84,85,86,87,88,90,91,95,99,100,104,106,107,124,147,164,180,189,198,200,],[45,-43,-44,-45,-46,-47,-48,-49,-50,-51,-39,-49,-40,-41,45,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-42,45,45,45,45,45,45,-56,-85,45,45,45,45,45,45,45,]),'Y':([7,25,26,27,28,29,30,31,32,33,58,59,60,61,62,75,76,77,78,79,80,81,82,83,84,85,86,87,88,90,91,95,99,100,104,106,107,124,147,164,180,189,198,200,],[46,-43,-44,-45,-46,-47,-48,-49,-50,-51,-39,-49,-40,-41,46,46,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-42,46,46,46,46,46,46,-56,-85,46,46,46,46,46,46,46,]),'IGUAL':([7,25,26,27,28,29,30,31,32,33,58,59,60,61,62,75,76,77,78,79,80,81,82,83,84,85,86,87,88,90,91,95,99,100,104,106,107,124,147,164,180,189,198,200,],[47,-43,-44,-45,-46,-47,-48,-49,-50,-51,47,-49,-40,-41,47,47,47,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-42,47,47,47,47,47,47,-56,-85,47,47,47,47,47,47,47,]),'DIFERENTE':([7,25,26,27,28,29,30,31,32,33,58,59,60,61,62,75,76,77,78,79,80,81,82,83,84,85,86,87,88,90,91,95,99,100,104,106,107,124,147,164,180,189,198,200,],[48,-43,-44,-45,-46,-47,-48,-49,-50,-51,48,-49,-40,-41,48,48,48,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-42,48,48,48,48,48,48,-56,-85,48,48,48,48,48,48,48,]),'MAYOR':([7,25,26,27,28,29,30,31,32,33,58,59,60,61,62,75,76,77,78,79,80,81,82,83,84,85,86,87,88,90,91,95,99,100,104,106,107,124,147,164,180,189,198,200,],[49,-43,-44,-45,-46,-47,-48,-49,-50,-51,49,-49,-40,-41,49,49,49,49,49,-30,-31,-32,-33,-34,-35,-36,-37,-38,-42,49,49,49,49,49,49,-56,-85,49,49,49,49,49,49,49,]),'MENOR':([7,25,26,27,28,29,30,31,32,33,58,59,60,61,62,75,76,77,78,79,80,81,82,83,84,85,86,87,88,90,91,95,99,100,104,106,107,124,147,164,180,189,198,200,],[50,-43,-44,-45,-46,-47,-48,-49,-50,-51,50,-49,-40,-41,50,50,50,50,50,-30,-31,-32,-33,-34,-35,-36,-37,-38,-42,50,50,50,50,50,50,-56,-85,50,50,50,50,50,50,50,]),'MAYOR_IGUAL':([7,25,26,27,28,29,30,31,32,33,58,59,60,61,62,75,76,77,78,79,80,81,82,83,84,85,86,87,88,90,91,95,99,100,104,106,107,124,147,164,180,189,198,200,],[51,-43,-44,-45,-46,-47,-48,-49,-50,-51,51,-49,-40,-41,51,51,51,51,51,-30,-31,-32,-33,-34,-35,-36,-37,-38,-42,51,51,51,51,51,51,-56,-85,51,51,51,51,51,51,51,]),'MENOR_IGUAL':([7,25,26,27,28,29,30,31,32,33,58,59,60,61,62,75,76,77,78,79,80,81,82,83,84,85,86,87,88,90,91,95,99,100,104,106,107,124,147,164,180,189,198,200,],[52,-43,-44,-45,-46,-47,-48,-49,-50,-51,52,-49,-40,-41,52,52,52,52,52,-30,-31,-32,-33,-34,-35,-36,-37,-38,-42,52,52,52,52,52,52,-56,-85,52,52,52,52,52,52,52,]),'MAS_BINARIO':([7,25,26,27,28,29,30,31,32,33,58,59,60,61,62,75,76,77,78,79,80,81,82,83,84,85,86,87,88,90,91,95,99,100,104,106,107,124,147,164,180,189,198,200,],[53,-43,-44,-45,-46,-47,-48,-49,-50,-51,53,-49,-40,-41,53,53,53,53,53,53,53,53,53,-34,-35,-36,-37,-38,-42,53,53,53,53,53,53,-56,-85,53,53,53,53,53,53,53,]),'MENOS_BINARIO':([7,25,26,27,28,29,30,31,32,33,58,59,60,61,62,75,76,77,78,79,80,81,82,83,84,85,86,87,88,90,91,95,99,100,104,106,107,124,147,164,180,189,198,200,],[54,-43,-44,-45,-46,-47,-48,-49,-50,-51,54,-49,-40,-41,54,54,54,54,54,54,54,54,54,-34,-35,-36,-37,-38,-42,54,54,54,54,54,54,-56,-85,54,54,54,54,54,54,54,]),'POR':([7,25,26,27,28,29,30,31,32,33,58,59,60,61,62,75,76,77,78,79,80,81,82,83,84,85,86,87,88,90,91,95,99,100,104,106,107,124,147,164,180,189,198,200,],[55,-43,-44,-45,-46,-47,-48,-49,-50,-51,55,-49,-40,-41,55,55,55,55,55,55,55,55,55,55,55,-36,-37,-38,-42,55,55,55,55,55,55,-56,-85,55,55,55,55,55,55,55,]),'DIV':([7,25,26,27,28,29,30,31,32,33,58,59,60,61,62,75,76,77,78,79,80,81,82,83,84,85,86,87,88,90,91,95,99,100,104,106,107,124,147,164,180,189,198,200,],[56,-43,-44,-45,-46,-47,-48,-49,-50,-51,56,-49,-40,-41,56,56,56,56,56,56,56,56,56,56,56,-36,-37,-38,-42,56,56,56,56,56,56,-56,-85,56,56,56,56,56,56,56,]),'MOD':([7,25,26,27,28,29,30,31,32,33,58,59,60,61,62,75,76,77,78,79,80,81,82,83,84,85,86,87,88,90,91,95,99,100,104,106,107,124,147,164,180,189,198,200,],[57,-43,-44,-45,-46,-47,-48,-49,-50,-51,57,-49,-40,-41,57,57,57,57,57,57,57,57,57,57,57,-36,-37,-38,-42,57,57,57,57,57,57,-56,-85,57,57,57,57,57,57,57,]),'PAREN_CERRAR':([25,26,27,28,29,30,32,33,58,59,60,61,62,65,75,76,77,78,79,80,81,82,83,84,85,86,87,88,92,93,94,95,96,98,99,100,104,106,107,113,114,115,116,124,134,144,164,171,198,200,],[-43,-44,-45,-46,-47,-48,-50,-51,-39,-49,-40,-41,88,-90,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-42,107,-86,-87,-54,109,-90,117,118,122,-56,-85,-84,129,-81,-82,-53,148,-83,182,187,203,205,]),'CORCHETE_CERRAR':([25,26,27,28,29,30,32,33,58,59,60,61,75,76,77,78,79,80,81,82,83,84,85,86,87,88,91,95,106,107,124,125,],[-43,-44,-45,-46,-47,-48,-50,-51,-39,-49,-40,-41,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-42,106,-54,-56,-85,-53,139,]),'SEPARADOR':([25,26,27,28,29,30,32,33,58,59,60,61,75,76,77,78,79,80,81,82,83,84,85,86,87,88,90,93,95,96,106,107,113,115,124,125,126,127,144,157,158,],[-43,-44,-45,-46,-47,-48,-50,-51,-39,-49,-40,-41,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-42,-25,108,-54,108,-56,-85,-84,130,-53,108,141,-59,-83,-58,-60,]),'PUNTO_COMA':([25,26,27,28,29,30,32,33,58,59,60,61,75,76,77,78,79,80,81,82,83,84,85,86,87,88,106,107,147,180,],[-43,-44,-45,-46,-47,-48,-50,-51,-39,-49,-40,-41,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-42,-56,-85,162,192,]),'CASE_LIMITADOR':([25,26,27,28,29,30,32,33,58,59,60,61,75,76,77,78,79,80,81,82,83,84,85,86,87,88,90,106,107,167,169,],[-43,-44,-45,-46,-47,-48,-50,-51,-39,-49,-40,-41,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-42,-25,-56,-85,184,185,]),'ASIGNACION':([31,67,119,128,],[63,97,133,142,]),'CORCHETE_ABRIR':([31,59,97,],[64,64,111,]),'PAREN_LLAMADA':([31,59,],[65,65,]),'LLAVE_ABRIR':([41,43,97,117,118,122,129,148,154,179,187,203,205,],[72,74,112,131,132,136,143,163,170,191,197,207,208,]),'EN':([102,],[120,]),'HASTA':([121,],[135,]),'CAPTURAR':([123,],[138,]),'CASO':([136,150,151,166,201,],[152,152,-72,-71,-73,]),'FINALMENTE':([137,206,],[154,-77,]),'PREDETERMINADO':([150,151,166,201,],[167,-72,-71,-73,]),'SINOSI':([160,211,],[178,178,]),'SINO':([160,211,],[179,179,]),}
 
 _lr_action = {}
 for _k, _v in _lr_action_items.items():
@@ -17,7 +17,7 @@ for _k, _v in _lr_action_items.items():
       _lr_action[_x][_k] = _y
 del _lr_action_items
 
-_lr_goto_items = {'bloque_codigo':([0,75,77,187,188,200,221,228,242,243,249,255,265,266,],[1,134,136,202,203,217,239,244,252,253,257,260,267,268,]),'instruccion_list':([0,75,77,187,188,200,221,228,242,243,249,255,265,266,],[2,2,2,2,2,2,2,2,2,2,2,2,2,2,]),'empty':([0,75,77,129,187,188,193,200,207,217,218,221,228,242,243,249,255,265,266,269,],[3,3,3,167,3,3,212,3,226,232,235,3,3,3,3,3,3,3,3,235,]),'instruccion':([0,2,75,77,187,188,200,221,228,242,243,249,255,265,266,],[4,52,4,4,4,4,4,4,4,4,4,4,4,4,4,]),'declaraciones':([0,2,75,77,187,188,200,221,228,242,243,249,255,265,266,],[5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,]),'estructurasbase':([0,2,75,77,187,188,200,221,228,242,243,249,255,265,266,],[6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,]),'accesos':([0,2,75,77,187,188,200,221,228,242,243,249,255,265,266,],[7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,]),'expresion':([0,2,27,58,72,73,75,76,77,90,126,143,187,188,189,200,206,220,221,228,231,242,243,248,249,250,255,265,266,],[8,8,60,60,130,131,8,135,8,60,60,60,8,8,204,8,222,238,8,8,247,8,8,256,8,258,8,8,8,]),'imprimir':([0,2,75,77,187,188,200,221,228,242,243,249,255,265,266,],[9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,]),'declaracion_variable':([0,2,75,77,187,188,200,221,228,242,243,249,255,265,266,],[10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,]),'asignacion_variable':([0,2,75,77,187,188,200,221,228,242,243,249,255,265,266,],[11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,]),'declaracion_arreglo':([0,2,75,77,187,188,200,221,228,242,243,249,255,265,266,],[12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,]),'declaracion_tabla':([0,2,75,77,187,188,200,221,228,242,243,249,255,265,266,],[13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,]),'declaracion_funcion':([0,2,75,77,187,188,200,221,228,242,243,249,255,265,266,],[14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,]),'estructura_si':([0,2,75,77,187,188,200,221,228,242,243,249,255,265,266,],[15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,]),'estructura_mientras':([0,2,75,77,187,188,200,221,228,242,243,249,255,265,266,],[16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,]),'estructura_para':([0,2,75,77,187,188,200,221,228,242,243,249,255,265,266,],[17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,]),'estructura_repetir':([0,2,75,77,187,188,200,221,228,242,243,249,255,265,266,],[18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,]),'estructura_para_cada':([0,2,75,77,187,188,200,221,228,242,243,249,255,265,266,],[19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,]),'estructura_segun':([0,2,75,77,187,188,200,221,228,242,243,249,255,265,266,],[20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,]),'estructura_intentar':([0,2,75,77,187,188,200,221,228,242,243,249,255,265,266,],[21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,]),'acceso_arreglo':([0,2,27,41,43,44,53,54,55,56,57,58,69,72,73,75,76,77,80,85,86,87,90,94,95,96,97,98,99,100,105,115,119,126,143,158,160,187,188,189,196,199,200,206,209,220,221,228,231,242,243,248,249,250,255,265,266,],[22,22,65,82,82,82,82,82,82,82,111,65,65,82,82,22,82,22,65,82,82,82,65,82,82,82,82,82,82,154,154,82,65,65,65,111,154,22,22,82,154,65,22,82,65,82,22,22,82,22,22,82,22,82,22,22,22,]),'acceso_tabla':([0,2,27,41,43,44,53,54,55,56,57,58,69,72,73,75,76,77,80,85,86,87,90,94,95,96,97,98,99,100,105,115,119,126,143,158,160,187,188,189,196,199,200,206,209,220,221,228,231,242,243,248,249,250,255,265,266,],[23,23,66,83,83,83,83,83,83,83,112,66,66,83,83,23,83,23,66,83,83,83,66,83,83,83,83,83,83,155,155,83,66,66,66,112,155,23,23,83,155,66,23,83,66,83,23,23,83,23,23,83,23,83,23,23,23,]),'expresion_logica':([0,2,27,58,72,73,75,76,77,90,126,143,187,188,189,200,206,220,221,228,231,242,243,248,249,250,255,265,266,],[24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,]),'expresion_aritmetica':([0,2,27,58,69,72,73,75,76,77,80,90,119,126,143,187,188,189,199,200,206,209,220,221,228,231,242,243,248,249,250,255,265,266,],[25,25,59,114,125,25,25,25,25,25,137,25,125,25,59,25,25,25,125,25,25,125,25,25,25,25,25,25,25,25,25,25,25,25,]),'declaracion_simple':([0,2,75,77,187,188,200,221,228,242,243,249,255,265,266,],[30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,]),'expresion_relacional':([0,2,27,41,53,54,58,72,73,75,76,77,90,126,143,187,188,189,200,206,220,221,228,231,242,243,248,249,250,255,265,266,],[40,40,40,78,101,102,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,]),'termino':([0,2,27,55,56,58,69,72,73,75,76,77,80,90,119,126,143,187,188,189,199,200,206,209,220,221,228,231,242,243,248,249,250,255,265,266,],[42,42,42,103,104,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,]),'termino_relacional':([0,2,27,41,53,54,58,72,73,75,76,77,90,94,95,96,97,98,99,126,143,187,188,189,200,206,220,221,228,231,242,243,248,249,250,255,265,266,],[45,45,45,45,45,45,45,45,45,45,45,45,45,144,145,146,147,148,149,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,]),'factor':([0,2,27,43,44,55,56,58,69,72,73,75,76,77,80,85,86,87,90,115,119,126,143,187,188,189,199,200,206,209,220,221,228,231,242,243,248,249,250,255,265,266,],[46,46,46,88,91,46,46,46,46,46,46,46,46,46,46,140,141,142,46,91,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,]),'expresion_simple':([0,2,27,41,43,44,53,54,55,56,58,69,72,73,75,76,77,80,85,86,87,90,94,95,96,97,98,99,115,119,126,143,187,188,189,199,200,206,209,220,221,228,231,242,243,248,249,250,255,265,266,],[47,47,67,79,89,89,79,79,89,89,67,89,47,47,47,47,47,89,89,89,89,47,79,79,79,79,79,79,89,89,47,67,47,47,47,89,47,47,89,47,47,47,47,47,47,47,47,47,47,47,47,]),'numero':([0,2,27,41,43,44,53,54,55,56,57,58,69,72,73,75,76,77,80,85,86,87,90,94,95,96,97,98,99,100,105,115,119,126,143,158,160,187,188,189,196,199,200,206,209,220,221,228,231,242,243,248,249,250,255,265,266,],[48,48,63,48,48,48,48,48,48,48,109,63,122,48,48,48,48,48,63,48,48,48,63,48,48,48,48,48,48,152,152,48,122,63,63,109,179,48,48,48,179,122,48,48,122,48,48,48,48,48,48,48,48,48,48,48,48,]),'expresion_concatenacion':([0,2,27,41,43,44,53,54,55,56,57,58,69,72,73,75,76,77,80,85,86,87,90,94,95,96,97,98,99,105,115,119,126,143,158,160,187,188,189,196,199,200,206,209,220,221,228,231,242,243,248,249,250,255,265,266,],[49,49,61,49,49,49,49,49,49,49,113,61,124,49,49,49,49,49,61,49,49,49,61,49,49,49,49,49,49,156,49,124,61,61,113,181,49,49,49,181,124,49,49,124,49,49,49,49,49,49,49,49,49,49,49,49,]),'elemento_concatenable':([0,2,27,41,43,44,53,54,55,56,57,58,69,72,73,75,76,77,80,85,86,87,90,94,95,96,97,98,99,100,105,115,119,126,143,158,160,187,188,189,196,199,200,206,209,220,221,228,231,242,243,248,249,250,255,265,266,],[51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,150,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,]),'elemento_imprimir_list':([57,],[106,]),'elemento_imprimir':([57,158,],[107,175,]),'valor':([69,119,199,209,],[121,159,216,227,]),'parametros_opt':([129,],[165,]),'parametros':([129,],[166,]),'elemento_arreglo_list':([160,],[177,]),'elemento_arreglo':([160,196,],[178,214,]),'par_clave_valor_list':([161,],[182,]),'par_clave_valor':([161,198,],[183,215,]),'bloque_capturar':([174,],[193,]),'casos':([192,],[207,]),'caso':([192,207,],[208,224,]),'bloque_finalmente_opt':([193,],[210,]),'caso_predeterminado_opt':([207,],[223,]),'retorno_funcion_opt':([217,],[230,]),'sinosis_opt':([218,269,],[233,271,]),'sinosis':([218,269,],[234,234,]),}
+_lr_goto_items = {'bloque_codigo':([0,72,74,131,132,143,163,170,184,185,191,197,207,208,],[1,103,105,145,146,159,181,186,194,195,199,202,209,210,]),'instruccion_list':([0,72,74,131,132,143,163,170,184,185,191,197,207,208,],[2,2,2,2,2,2,2,2,2,2,2,2,2,2,]),'empty':([0,65,72,74,98,131,132,137,143,150,159,160,163,170,184,185,191,197,207,208,211,],[3,94,3,3,116,3,3,155,3,168,174,177,3,3,3,3,3,3,3,3,177,]),'instruccion':([0,2,72,74,131,132,143,163,170,184,185,191,197,207,208,],[4,44,4,4,4,4,4,4,4,4,4,4,4,4,4,]),'declaraciones':([0,2,72,74,131,132,143,163,170,184,185,191,197,207,208,],[5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,]),'estructurasbase':([0,2,72,74,131,132,143,163,170,184,185,191,197,207,208,],[6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,]),'expresion':([0,2,21,22,23,24,45,46,47,48,49,50,51,52,53,54,55,56,57,63,64,65,66,69,70,72,73,74,97,108,111,131,132,133,142,143,149,152,162,163,170,173,184,185,190,191,192,197,207,208,],[7,7,58,60,61,62,75,76,77,78,79,80,81,82,83,84,85,86,87,90,91,95,95,99,100,7,104,7,90,124,95,7,7,147,90,7,164,90,180,7,7,189,7,7,198,7,200,7,7,7,]),'imprimir':([0,2,72,74,131,132,143,163,170,184,185,191,197,207,208,],[8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,]),'declaracion_variable':([0,2,72,74,131,132,143,163,170,184,185,191,197,207,208,],[9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,]),'asignacion_variable':([0,2,72,74,131,132,143,163,170,184,185,191,197,207,208,],[10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,]),'declaracion_arreglo':([0,2,72,74,131,132,143,163,170,184,185,191,197,207,208,],[11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,]),'declaracion_tabla':([0,2,72,74,131,132,143,163,170,184,185,191,197,207,208,],[12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,]),'declaracion_funcion':([0,2,72,74,131,132,143,163,170,184,185,191,197,207,208,],[13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,]),'estructura_si':([0,2,72,74,131,132,143,163,170,184,185,191,197,207,208,],[14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,]),'estructura_mientras':([0,2,72,74,131,132,143,163,170,184,185,191,197,207,208,],[15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,]),'estructura_para':([0,2,72,74,131,132,143,163,170,184,185,191,197,207,208,],[16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,]),'estructura_repetir':([0,2,72,74,131,132,143,163,170,184,185,191,197,207,208,],[17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,]),'estructura_para_cada':([0,2,72,74,131,132,143,163,170,184,185,191,197,207,208,],[18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,]),'estructura_segun':([0,2,72,74,131,132,143,163,170,184,185,191,197,207,208,],[19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,]),'estructura_intentar':([0,2,72,74,131,132,143,163,170,184,185,191,197,207,208,],[20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,]),'acceso':([0,2,21,22,23,24,45,46,47,48,49,50,51,52,53,54,55,56,57,63,64,65,66,69,70,72,73,74,97,108,111,131,132,133,142,143,149,152,162,163,170,173,184,185,190,191,192,197,207,208,],[32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,]),'llamada_funcion':([0,2,21,22,23,24,45,46,47,48,49,50,51,52,53,54,55,56,57,63,64,65,66,69,70,72,73,74,97,108,111,131,132,133,142,143,149,152,162,163,170,173,184,185,190,191,192,197,207,208,],[33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,]),'declaracion_simple':([0,2,72,74,131,132,143,163,170,184,185,191,197,207,208,],[36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,]),'valor':([63,97,142,152,],[89,110,158,169,]),'argumentos_opt':([65,],[92,]),'expresion_list':([65,66,111,],[93,96,125,]),'parametros_opt':([98,],[114,]),'parametros':([98,],[115,]),'par_clave_valor_list':([112,],[126,]),'par_clave_valor':([112,141,],[127,157,]),'bloque_capturar':([123,],[137,]),'casos':([136,],[150,]),'caso':([136,150,],[151,166,]),'bloque_finalmente_opt':([137,],[153,]),'caso_predeterminado_opt':([150,],[165,]),'retorno_funcion_opt':([159,],[172,]),'sinosis_opt':([160,211,],[175,213,]),'sinosis':([160,211,],[176,176,]),}
 
 _lr_goto = {}
 for _k, _v in _lr_goto_items.items():
@@ -27,129 +27,94 @@ for _k, _v in _lr_goto_items.items():
 del _lr_goto_items
 _lr_productions = [
   ("S' -> bloque_codigo","S'",1,None,None,None),
-  ('bloque_codigo -> instruccion_list','bloque_codigo',1,'p_bloque_codigo','parser_lynx.py',112),
-  ('bloque_codigo -> empty','bloque_codigo',1,'p_bloque_codigo','parser_lynx.py',113),
-  ('instruccion_list -> instruccion_list instruccion','instruccion_list',2,'p_instruccion_list','parser_lynx.py',120),
-  ('instruccion_list -> instruccion','instruccion_list',1,'p_instruccion_list','parser_lynx.py',121),
-  ('instruccion -> declaraciones','instruccion',1,'p_instruccion','parser_lynx.py',128),
-  ('instruccion -> estructurasbase','instruccion',1,'p_instruccion','parser_lynx.py',129),
-  ('instruccion -> accesos','instruccion',1,'p_instruccion','parser_lynx.py',130),
-  ('instruccion -> expresion','instruccion',1,'p_instruccion','parser_lynx.py',131),
-  ('instruccion -> imprimir','instruccion',1,'p_instruccion','parser_lynx.py',132),
-  ('declaraciones -> declaracion_variable','declaraciones',1,'p_declaraciones','parser_lynx.py',136),
-  ('declaraciones -> asignacion_variable','declaraciones',1,'p_declaraciones','parser_lynx.py',137),
-  ('declaraciones -> declaracion_arreglo','declaraciones',1,'p_declaraciones','parser_lynx.py',138),
-  ('declaraciones -> declaracion_tabla','declaraciones',1,'p_declaraciones','parser_lynx.py',139),
-  ('declaraciones -> declaracion_funcion','declaraciones',1,'p_declaraciones','parser_lynx.py',140),
-  ('estructurasbase -> estructura_si','estructurasbase',1,'p_estructurasbase','parser_lynx.py',144),
-  ('estructurasbase -> estructura_mientras','estructurasbase',1,'p_estructurasbase','parser_lynx.py',145),
-  ('estructurasbase -> estructura_para','estructurasbase',1,'p_estructurasbase','parser_lynx.py',146),
-  ('estructurasbase -> estructura_repetir','estructurasbase',1,'p_estructurasbase','parser_lynx.py',147),
-  ('estructurasbase -> estructura_para_cada','estructurasbase',1,'p_estructurasbase','parser_lynx.py',148),
-  ('estructurasbase -> estructura_segun','estructurasbase',1,'p_estructurasbase','parser_lynx.py',149),
-  ('estructurasbase -> estructura_intentar','estructurasbase',1,'p_estructurasbase','parser_lynx.py',150),
-  ('accesos -> acceso_arreglo','accesos',1,'p_accesos','parser_lynx.py',154),
-  ('accesos -> acceso_tabla','accesos',1,'p_accesos','parser_lynx.py',155),
-  ('declaracion_simple -> VAL ID','declaracion_simple',2,'p_declaracion_simple','parser_lynx.py',160),
-  ('asignacion_variable -> ID ASIGNACION valor','asignacion_variable',3,'p_asignacion_variable','parser_lynx.py',164),
-  ('declaracion_variable -> VAL ID ASIGNACION valor','declaracion_variable',4,'p_declaracion_variable','parser_lynx.py',168),
-  ('declaracion_variable -> declaracion_simple','declaracion_variable',1,'p_declaracion_variable','parser_lynx.py',169),
-  ('valor -> numero','valor',1,'p_valor','parser_lynx.py',177),
-  ('valor -> CADENA','valor',1,'p_valor','parser_lynx.py',178),
-  ('valor -> ID','valor',1,'p_valor','parser_lynx.py',179),
-  ('valor -> expresion_concatenacion','valor',1,'p_valor','parser_lynx.py',180),
-  ('valor -> expresion_aritmetica','valor',1,'p_valor','parser_lynx.py',181),
-  ('numero -> NUMERO','numero',1,'p_numero','parser_lynx.py',185),
-  ('numero -> FLOTANTE','numero',1,'p_numero','parser_lynx.py',186),
-  ('numero -> MENOS NUMERO','numero',2,'p_numero','parser_lynx.py',187),
-  ('numero -> MENOS FLOTANTE','numero',2,'p_numero','parser_lynx.py',188),
-  ('expresion -> expresion_logica','expresion',1,'p_expresion','parser_lynx.py',196),
-  ('expresion -> expresion_aritmetica','expresion',1,'p_expresion','parser_lynx.py',197),
-  ('expresion_logica -> expresion_relacional','expresion_logica',1,'p_expresion_logica','parser_lynx.py',201),
-  ('expresion_logica -> expresion_logica Y expresion_relacional','expresion_logica',3,'p_expresion_logica','parser_lynx.py',202),
-  ('expresion_logica -> expresion_logica O expresion_relacional','expresion_logica',3,'p_expresion_logica','parser_lynx.py',203),
-  ('expresion_logica -> NO expresion_relacional','expresion_logica',2,'p_expresion_logica','parser_lynx.py',204),
-  ('expresion_relacional -> termino_relacional','expresion_relacional',1,'p_expresion_relacional','parser_lynx.py',213),
-  ('expresion_relacional -> termino_relacional IGUAL termino_relacional','expresion_relacional',3,'p_expresion_relacional','parser_lynx.py',214),
-  ('expresion_relacional -> termino_relacional DIFERENTE termino_relacional','expresion_relacional',3,'p_expresion_relacional','parser_lynx.py',215),
-  ('expresion_relacional -> termino_relacional MAYOR termino_relacional','expresion_relacional',3,'p_expresion_relacional','parser_lynx.py',216),
-  ('expresion_relacional -> termino_relacional MENOR termino_relacional','expresion_relacional',3,'p_expresion_relacional','parser_lynx.py',217),
-  ('expresion_relacional -> termino_relacional MAYOR_IGUAL termino_relacional','expresion_relacional',3,'p_expresion_relacional','parser_lynx.py',218),
-  ('expresion_relacional -> termino_relacional MENOR_IGUAL termino_relacional','expresion_relacional',3,'p_expresion_relacional','parser_lynx.py',219),
-  ('termino_relacional -> expresion_simple','termino_relacional',1,'p_termino_relacional','parser_lynx.py',226),
-  ('termino_relacional -> PAREN_ABRIR expresion_aritmetica PAREN_CERRAR','termino_relacional',3,'p_termino_relacional','parser_lynx.py',227),
-  ('expresion_simple -> numero','expresion_simple',1,'p_expresion_simple','parser_lynx.py',234),
-  ('expresion_simple -> CADENA','expresion_simple',1,'p_expresion_simple','parser_lynx.py',235),
-  ('expresion_simple -> ID','expresion_simple',1,'p_expresion_simple','parser_lynx.py',236),
-  ('expresion_simple -> acceso_arreglo','expresion_simple',1,'p_expresion_simple','parser_lynx.py',237),
-  ('expresion_simple -> acceso_tabla','expresion_simple',1,'p_expresion_simple','parser_lynx.py',238),
-  ('expresion_simple -> expresion_concatenacion','expresion_simple',1,'p_expresion_simple','parser_lynx.py',239),
-  ('expresion_aritmetica -> termino','expresion_aritmetica',1,'p_expresion_aritmetica','parser_lynx.py',243),
-  ('expresion_aritmetica -> expresion_aritmetica MAS termino','expresion_aritmetica',3,'p_expresion_aritmetica','parser_lynx.py',244),
-  ('expresion_aritmetica -> expresion_aritmetica MENOS termino','expresion_aritmetica',3,'p_expresion_aritmetica','parser_lynx.py',245),
-  ('termino -> factor','termino',1,'p_termino','parser_lynx.py',252),
-  ('termino -> termino POR factor','termino',3,'p_termino','parser_lynx.py',253),
-  ('termino -> termino DIV factor','termino',3,'p_termino','parser_lynx.py',254),
-  ('termino -> termino MOD factor','termino',3,'p_termino','parser_lynx.py',255),
-  ('factor -> expresion_simple','factor',1,'p_factor','parser_lynx.py',262),
-  ('factor -> PAREN_ABRIR expresion PAREN_CERRAR','factor',3,'p_factor','parser_lynx.py',263),
-  ('factor -> MENOS factor','factor',2,'p_factor','parser_lynx.py',264),
-  ('factor -> MAS factor','factor',2,'p_factor','parser_lynx.py',265),
-  ('expresion_concatenacion -> elemento_concatenable','expresion_concatenacion',1,'p_expresion_concatenacion','parser_lynx.py',275),
-  ('expresion_concatenacion -> expresion_concatenacion MAS elemento_concatenable','expresion_concatenacion',3,'p_expresion_concatenacion','parser_lynx.py',276),
-  ('elemento_concatenable -> CADENA','elemento_concatenable',1,'p_elemento_concatenable','parser_lynx.py',283),
-  ('elemento_concatenable -> numero','elemento_concatenable',1,'p_elemento_concatenable','parser_lynx.py',284),
-  ('elemento_concatenable -> ID','elemento_concatenable',1,'p_elemento_concatenable','parser_lynx.py',285),
-  ('elemento_concatenable -> acceso_arreglo','elemento_concatenable',1,'p_elemento_concatenable','parser_lynx.py',286),
-  ('elemento_concatenable -> acceso_tabla','elemento_concatenable',1,'p_elemento_concatenable','parser_lynx.py',287),
-  ('elemento_concatenable -> PAREN_ABRIR expresion_concatenacion PAREN_CERRAR','elemento_concatenable',3,'p_elemento_concatenable','parser_lynx.py',288),
-  ('imprimir -> IMPRIMIR PAREN_ABRIR elemento_imprimir_list PAREN_CERRAR','imprimir',4,'p_imprimir','parser_lynx.py',296),
-  ('elemento_imprimir_list -> elemento_imprimir_list SEPARADOR elemento_imprimir','elemento_imprimir_list',3,'p_elemento_imprimir_list','parser_lynx.py',300),
-  ('elemento_imprimir_list -> elemento_imprimir','elemento_imprimir_list',1,'p_elemento_imprimir_list','parser_lynx.py',301),
-  ('elemento_imprimir -> CADENA','elemento_imprimir',1,'p_elemento_imprimir','parser_lynx.py',309),
-  ('elemento_imprimir -> numero','elemento_imprimir',1,'p_elemento_imprimir','parser_lynx.py',310),
-  ('elemento_imprimir -> ID','elemento_imprimir',1,'p_elemento_imprimir','parser_lynx.py',311),
-  ('elemento_imprimir -> acceso_arreglo','elemento_imprimir',1,'p_elemento_imprimir','parser_lynx.py',312),
-  ('elemento_imprimir -> acceso_tabla','elemento_imprimir',1,'p_elemento_imprimir','parser_lynx.py',313),
-  ('elemento_imprimir -> expresion_concatenacion','elemento_imprimir',1,'p_elemento_imprimir','parser_lynx.py',314),
-  ('declaracion_arreglo -> VAL ID ASIGNACION CORCHETE_ABRIR elemento_arreglo_list CORCHETE_CERRAR','declaracion_arreglo',6,'p_declaracion_arreglo','parser_lynx.py',319),
-  ('elemento_arreglo_list -> elemento_arreglo_list SEPARADOR elemento_arreglo','elemento_arreglo_list',3,'p_elemento_arreglo_list','parser_lynx.py',323),
-  ('elemento_arreglo_list -> elemento_arreglo','elemento_arreglo_list',1,'p_elemento_arreglo_list','parser_lynx.py',324),
-  ('elemento_arreglo -> numero','elemento_arreglo',1,'p_elemento_arreglo','parser_lynx.py',331),
-  ('elemento_arreglo -> CADENA','elemento_arreglo',1,'p_elemento_arreglo','parser_lynx.py',332),
-  ('elemento_arreglo -> ID','elemento_arreglo',1,'p_elemento_arreglo','parser_lynx.py',333),
-  ('elemento_arreglo -> expresion_concatenacion','elemento_arreglo',1,'p_elemento_arreglo','parser_lynx.py',334),
-  ('acceso_arreglo -> ID CORCHETE_ABRIR NUMERO CORCHETE_CERRAR','acceso_arreglo',4,'p_acceso_arreglo','parser_lynx.py',338),
-  ('declaracion_tabla -> VAL ID ASIGNACION LLAVE_ABRIR par_clave_valor_list LLAVE_CERRAR','declaracion_tabla',6,'p_declaracion_tabla','parser_lynx.py',343),
-  ('par_clave_valor_list -> par_clave_valor_list SEPARADOR par_clave_valor','par_clave_valor_list',3,'p_par_clave_valor_list','parser_lynx.py',347),
-  ('par_clave_valor_list -> par_clave_valor','par_clave_valor_list',1,'p_par_clave_valor_list','parser_lynx.py',348),
-  ('par_clave_valor -> CADENA ASIGNACION valor','par_clave_valor',3,'p_par_clave_valor','parser_lynx.py',355),
-  ('acceso_tabla -> ID CORCHETE_ABRIR CADENA CORCHETE_CERRAR','acceso_tabla',4,'p_acceso_tabla','parser_lynx.py',359),
-  ('estructura_si -> SI PAREN_ABRIR expresion PAREN_CERRAR LLAVE_ABRIR bloque_codigo LLAVE_CERRAR sinosis_opt','estructura_si',8,'p_estructura_si','parser_lynx.py',364),
-  ('sinosis_opt -> sinosis','sinosis_opt',1,'p_sinosis_opt','parser_lynx.py',368),
-  ('sinosis_opt -> empty','sinosis_opt',1,'p_sinosis_opt','parser_lynx.py',369),
-  ('sinosis -> SINOSI PAREN_ABRIR expresion PAREN_CERRAR LLAVE_ABRIR bloque_codigo LLAVE_CERRAR sinosis_opt','sinosis',8,'p_sinosis','parser_lynx.py',373),
-  ('sinosis -> SINO LLAVE_ABRIR bloque_codigo LLAVE_CERRAR','sinosis',4,'p_sinosis','parser_lynx.py',374),
-  ('estructura_mientras -> MIENTRAS PAREN_ABRIR expresion PAREN_CERRAR LLAVE_ABRIR bloque_codigo LLAVE_CERRAR','estructura_mientras',7,'p_estructura_mientras','parser_lynx.py',381),
-  ('estructura_para -> PARA PAREN_ABRIR VAL ID ASIGNACION expresion PUNTO_COMA expresion PUNTO_COMA expresion PAREN_CERRAR LLAVE_ABRIR bloque_codigo LLAVE_CERRAR','estructura_para',14,'p_estructura_para','parser_lynx.py',385),
-  ('estructura_repetir -> REPETIR LLAVE_ABRIR bloque_codigo LLAVE_CERRAR HASTA PAREN_ABRIR expresion PAREN_CERRAR','estructura_repetir',8,'p_estructura_repetir','parser_lynx.py',390),
-  ('estructura_para_cada -> PARA PAREN_ABRIR ID EN ID PAREN_CERRAR LLAVE_ABRIR bloque_codigo LLAVE_CERRAR','estructura_para_cada',9,'p_estructura_para_cada','parser_lynx.py',394),
-  ('estructura_segun -> SEGUN PAREN_ABRIR expresion PAREN_CERRAR LLAVE_ABRIR casos caso_predeterminado_opt LLAVE_CERRAR','estructura_segun',8,'p_estructura_segun','parser_lynx.py',398),
-  ('casos -> casos caso','casos',2,'p_casos','parser_lynx.py',402),
-  ('casos -> caso','casos',1,'p_casos','parser_lynx.py',403),
-  ('caso -> CASO valor CASE_LIMITADOR bloque_codigo PARAR','caso',5,'p_caso','parser_lynx.py',410),
-  ('caso_predeterminado_opt -> PREDETERMINADO CASE_LIMITADOR bloque_codigo','caso_predeterminado_opt',3,'p_caso_predeterminado_opt','parser_lynx.py',414),
-  ('caso_predeterminado_opt -> empty','caso_predeterminado_opt',1,'p_caso_predeterminado_opt','parser_lynx.py',415),
-  ('estructura_intentar -> INTENTAR LLAVE_ABRIR bloque_codigo LLAVE_CERRAR bloque_capturar bloque_finalmente_opt','estructura_intentar',6,'p_estructura_intentar','parser_lynx.py',422),
-  ('bloque_capturar -> CAPTURAR PAREN_ABRIR ID PAREN_CERRAR LLAVE_ABRIR bloque_codigo LLAVE_CERRAR','bloque_capturar',7,'p_bloque_capturar','parser_lynx.py',426),
-  ('bloque_finalmente_opt -> FINALMENTE LLAVE_ABRIR bloque_codigo LLAVE_CERRAR','bloque_finalmente_opt',4,'p_bloque_finalmente_opt','parser_lynx.py',430),
-  ('bloque_finalmente_opt -> empty','bloque_finalmente_opt',1,'p_bloque_finalmente_opt','parser_lynx.py',431),
-  ('declaracion_funcion -> FUN ID PAREN_ABRIR parametros_opt PAREN_CERRAR LLAVE_ABRIR bloque_codigo retorno_funcion_opt LLAVE_CERRAR','declaracion_funcion',9,'p_declaracion_funcion','parser_lynx.py',439),
-  ('parametros_opt -> parametros','parametros_opt',1,'p_parametros_opt','parser_lynx.py',443),
-  ('parametros_opt -> empty','parametros_opt',1,'p_parametros_opt','parser_lynx.py',444),
-  ('parametros -> parametros SEPARADOR ID','parametros',3,'p_parametros','parser_lynx.py',448),
-  ('parametros -> ID','parametros',1,'p_parametros','parser_lynx.py',449),
-  ('retorno_funcion_opt -> RETORNAR expresion','retorno_funcion_opt',2,'p_retorno_funcion_opt','parser_lynx.py',456),
-  ('retorno_funcion_opt -> empty','retorno_funcion_opt',1,'p_retorno_funcion_opt','parser_lynx.py',457),
-  ('empty -> <empty>','empty',0,'p_empty','parser_lynx.py',464),
+  ('bloque_codigo -> instruccion_list','bloque_codigo',1,'p_bloque_codigo','parser_lynx.py',193),
+  ('bloque_codigo -> empty','bloque_codigo',1,'p_bloque_codigo','parser_lynx.py',194),
+  ('instruccion_list -> instruccion_list instruccion','instruccion_list',2,'p_instruccion_list','parser_lynx.py',201),
+  ('instruccion_list -> instruccion','instruccion_list',1,'p_instruccion_list','parser_lynx.py',202),
+  ('instruccion -> declaraciones','instruccion',1,'p_instruccion','parser_lynx.py',209),
+  ('instruccion -> estructurasbase','instruccion',1,'p_instruccion','parser_lynx.py',210),
+  ('instruccion -> expresion','instruccion',1,'p_instruccion','parser_lynx.py',211),
+  ('instruccion -> imprimir','instruccion',1,'p_instruccion','parser_lynx.py',212),
+  ('declaraciones -> declaracion_variable','declaraciones',1,'p_declaraciones','parser_lynx.py',216),
+  ('declaraciones -> asignacion_variable','declaraciones',1,'p_declaraciones','parser_lynx.py',217),
+  ('declaraciones -> declaracion_arreglo','declaraciones',1,'p_declaraciones','parser_lynx.py',218),
+  ('declaraciones -> declaracion_tabla','declaraciones',1,'p_declaraciones','parser_lynx.py',219),
+  ('declaraciones -> declaracion_funcion','declaraciones',1,'p_declaraciones','parser_lynx.py',220),
+  ('estructurasbase -> estructura_si','estructurasbase',1,'p_estructurasbase','parser_lynx.py',224),
+  ('estructurasbase -> estructura_mientras','estructurasbase',1,'p_estructurasbase','parser_lynx.py',225),
+  ('estructurasbase -> estructura_para','estructurasbase',1,'p_estructurasbase','parser_lynx.py',226),
+  ('estructurasbase -> estructura_repetir','estructurasbase',1,'p_estructurasbase','parser_lynx.py',227),
+  ('estructurasbase -> estructura_para_cada','estructurasbase',1,'p_estructurasbase','parser_lynx.py',228),
+  ('estructurasbase -> estructura_segun','estructurasbase',1,'p_estructurasbase','parser_lynx.py',229),
+  ('estructurasbase -> estructura_intentar','estructurasbase',1,'p_estructurasbase','parser_lynx.py',230),
+  ('declaracion_simple -> VAL ID','declaracion_simple',2,'p_declaracion_simple','parser_lynx.py',235),
+  ('asignacion_variable -> ID ASIGNACION valor','asignacion_variable',3,'p_asignacion_variable','parser_lynx.py',239),
+  ('declaracion_variable -> VAL ID ASIGNACION valor','declaracion_variable',4,'p_declaracion_variable','parser_lynx.py',244),
+  ('declaracion_variable -> declaracion_simple','declaracion_variable',1,'p_declaracion_variable','parser_lynx.py',245),
+  ('valor -> expresion','valor',1,'p_valor','parser_lynx.py',253),
+  ('expresion -> expresion O expresion','expresion',3,'p_expresion_binaria','parser_lynx.py',258),
+  ('expresion -> expresion Y expresion','expresion',3,'p_expresion_binaria','parser_lynx.py',259),
+  ('expresion -> expresion IGUAL expresion','expresion',3,'p_expresion_binaria','parser_lynx.py',260),
+  ('expresion -> expresion DIFERENTE expresion','expresion',3,'p_expresion_binaria','parser_lynx.py',261),
+  ('expresion -> expresion MAYOR expresion','expresion',3,'p_expresion_binaria','parser_lynx.py',262),
+  ('expresion -> expresion MENOR expresion','expresion',3,'p_expresion_binaria','parser_lynx.py',263),
+  ('expresion -> expresion MAYOR_IGUAL expresion','expresion',3,'p_expresion_binaria','parser_lynx.py',264),
+  ('expresion -> expresion MENOR_IGUAL expresion','expresion',3,'p_expresion_binaria','parser_lynx.py',265),
+  ('expresion -> expresion MAS_BINARIO expresion','expresion',3,'p_expresion_binaria','parser_lynx.py',266),
+  ('expresion -> expresion MENOS_BINARIO expresion','expresion',3,'p_expresion_binaria','parser_lynx.py',267),
+  ('expresion -> expresion POR expresion','expresion',3,'p_expresion_binaria','parser_lynx.py',268),
+  ('expresion -> expresion DIV expresion','expresion',3,'p_expresion_binaria','parser_lynx.py',269),
+  ('expresion -> expresion MOD expresion','expresion',3,'p_expresion_binaria','parser_lynx.py',270),
+  ('expresion -> NO expresion','expresion',2,'p_expresion_unaria','parser_lynx.py',274),
+  ('expresion -> MENOS expresion','expresion',2,'p_expresion_unaria','parser_lynx.py',275),
+  ('expresion -> MAS expresion','expresion',2,'p_expresion_unaria','parser_lynx.py',276),
+  ('expresion -> PAREN_ABRIR expresion PAREN_CERRAR','expresion',3,'p_expresion_agrupada','parser_lynx.py',287),
+  ('expresion -> NUMERO','expresion',1,'p_expresion_literal','parser_lynx.py',291),
+  ('expresion -> FLOTANTE','expresion',1,'p_expresion_literal','parser_lynx.py',292),
+  ('expresion -> CADENA','expresion',1,'p_expresion_literal','parser_lynx.py',293),
+  ('expresion -> VERDADERO','expresion',1,'p_expresion_booleana','parser_lynx.py',297),
+  ('expresion -> FALSO','expresion',1,'p_expresion_booleana','parser_lynx.py',298),
+  ('expresion -> NULO','expresion',1,'p_expresion_nulo','parser_lynx.py',302),
+  ('expresion -> ID','expresion',1,'p_expresion_identificador','parser_lynx.py',306),
+  ('expresion -> acceso','expresion',1,'p_expresion_acceso','parser_lynx.py',310),
+  ('expresion -> llamada_funcion','expresion',1,'p_expresion_acceso','parser_lynx.py',311),
+  ('imprimir -> IMPRIMIR PAREN_ABRIR expresion_list PAREN_CERRAR','imprimir',4,'p_imprimir','parser_lynx.py',316),
+  ('expresion_list -> expresion_list SEPARADOR expresion','expresion_list',3,'p_expresion_list','parser_lynx.py',320),
+  ('expresion_list -> expresion','expresion_list',1,'p_expresion_list','parser_lynx.py',321),
+  ('declaracion_arreglo -> VAL ID ASIGNACION CORCHETE_ABRIR expresion_list CORCHETE_CERRAR','declaracion_arreglo',6,'p_declaracion_arreglo','parser_lynx.py',331),
+  ('acceso -> ID CORCHETE_ABRIR expresion CORCHETE_CERRAR','acceso',4,'p_acceso','parser_lynx.py',335),
+  ('declaracion_tabla -> VAL ID ASIGNACION LLAVE_ABRIR par_clave_valor_list LLAVE_CERRAR','declaracion_tabla',6,'p_declaracion_tabla','parser_lynx.py',346),
+  ('par_clave_valor_list -> par_clave_valor_list SEPARADOR par_clave_valor','par_clave_valor_list',3,'p_par_clave_valor_list','parser_lynx.py',350),
+  ('par_clave_valor_list -> par_clave_valor','par_clave_valor_list',1,'p_par_clave_valor_list','parser_lynx.py',351),
+  ('par_clave_valor -> CADENA ASIGNACION valor','par_clave_valor',3,'p_par_clave_valor','parser_lynx.py',358),
+  ('estructura_si -> SI PAREN_ABRIR expresion PAREN_CERRAR LLAVE_ABRIR bloque_codigo LLAVE_CERRAR sinosis_opt','estructura_si',8,'p_estructura_si','parser_lynx.py',363),
+  ('sinosis_opt -> sinosis','sinosis_opt',1,'p_sinosis_opt','parser_lynx.py',367),
+  ('sinosis_opt -> empty','sinosis_opt',1,'p_sinosis_opt','parser_lynx.py',368),
+  ('sinosis -> SINOSI PAREN_ABRIR expresion PAREN_CERRAR LLAVE_ABRIR bloque_codigo LLAVE_CERRAR sinosis_opt','sinosis',8,'p_sinosis','parser_lynx.py',372),
+  ('sinosis -> SINO LLAVE_ABRIR bloque_codigo LLAVE_CERRAR','sinosis',4,'p_sinosis','parser_lynx.py',373),
+  ('estructura_mientras -> MIENTRAS PAREN_ABRIR expresion PAREN_CERRAR LLAVE_ABRIR bloque_codigo LLAVE_CERRAR','estructura_mientras',7,'p_estructura_mientras','parser_lynx.py',380),
+  ('estructura_para -> PARA PAREN_ABRIR VAL ID ASIGNACION expresion PUNTO_COMA expresion PUNTO_COMA expresion PAREN_CERRAR LLAVE_ABRIR bloque_codigo LLAVE_CERRAR','estructura_para',14,'p_estructura_para','parser_lynx.py',384),
+  ('estructura_repetir -> REPETIR LLAVE_ABRIR bloque_codigo LLAVE_CERRAR HASTA PAREN_ABRIR expresion PAREN_CERRAR','estructura_repetir',8,'p_estructura_repetir','parser_lynx.py',389),
+  ('estructura_para_cada -> PARA PAREN_ABRIR ID EN ID PAREN_CERRAR LLAVE_ABRIR bloque_codigo LLAVE_CERRAR','estructura_para_cada',9,'p_estructura_para_cada','parser_lynx.py',393),
+  ('estructura_segun -> SEGUN PAREN_ABRIR expresion PAREN_CERRAR LLAVE_ABRIR casos caso_predeterminado_opt LLAVE_CERRAR','estructura_segun',8,'p_estructura_segun','parser_lynx.py',397),
+  ('casos -> casos caso','casos',2,'p_casos','parser_lynx.py',401),
+  ('casos -> caso','casos',1,'p_casos','parser_lynx.py',402),
+  ('caso -> CASO valor CASE_LIMITADOR bloque_codigo PARAR','caso',5,'p_caso','parser_lynx.py',409),
+  ('caso_predeterminado_opt -> PREDETERMINADO CASE_LIMITADOR bloque_codigo','caso_predeterminado_opt',3,'p_caso_predeterminado_opt','parser_lynx.py',413),
+  ('caso_predeterminado_opt -> empty','caso_predeterminado_opt',1,'p_caso_predeterminado_opt','parser_lynx.py',414),
+  ('estructura_intentar -> INTENTAR LLAVE_ABRIR bloque_codigo LLAVE_CERRAR bloque_capturar bloque_finalmente_opt','estructura_intentar',6,'p_estructura_intentar','parser_lynx.py',421),
+  ('bloque_capturar -> CAPTURAR PAREN_ABRIR ID PAREN_CERRAR LLAVE_ABRIR bloque_codigo LLAVE_CERRAR','bloque_capturar',7,'p_bloque_capturar','parser_lynx.py',425),
+  ('bloque_finalmente_opt -> FINALMENTE LLAVE_ABRIR bloque_codigo LLAVE_CERRAR','bloque_finalmente_opt',4,'p_bloque_finalmente_opt','parser_lynx.py',429),
+  ('bloque_finalmente_opt -> empty','bloque_finalmente_opt',1,'p_bloque_finalmente_opt','parser_lynx.py',430),
+  ('declaracion_funcion -> FUN ID PAREN_ABRIR parametros_opt PAREN_CERRAR LLAVE_ABRIR bloque_codigo retorno_funcion_opt LLAVE_CERRAR','declaracion_funcion',9,'p_declaracion_funcion','parser_lynx.py',438),
+  ('parametros_opt -> parametros','parametros_opt',1,'p_parametros_opt','parser_lynx.py',442),
+  ('parametros_opt -> empty','parametros_opt',1,'p_parametros_opt','parser_lynx.py',443),
+  ('parametros -> parametros SEPARADOR ID','parametros',3,'p_parametros','parser_lynx.py',447),
+  ('parametros -> ID','parametros',1,'p_parametros','parser_lynx.py',448),
+  ('llamada_funcion -> ID PAREN_LLAMADA argumentos_opt PAREN_CERRAR','llamada_funcion',4,'p_llamada_funcion','parser_lynx.py',455),
+  ('argumentos_opt -> expresion_list','argumentos_opt',1,'p_argumentos_opt','parser_lynx.py',459),
+  ('argumentos_opt -> empty','argumentos_opt',1,'p_argumentos_opt','parser_lynx.py',460),
+  ('retorno_funcion_opt -> RETORNAR expresion','retorno_funcion_opt',2,'p_retorno_funcion_opt','parser_lynx.py',464),
+  ('retorno_funcion_opt -> empty','retorno_funcion_opt',1,'p_retorno_funcion_opt','parser_lynx.py',465),
+  ('empty -> <empty>','empty',0,'p_empty','parser_lynx.py',472),
 ]
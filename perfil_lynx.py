@@ -0,0 +1,225 @@
+"""Perfilador por línea para programas Lynx
+
+El compilador de bytecode, con `perfilar=True`, emite marcas al empezar cada
+sentencia, al entrar a una función y antes de retornar; la VM se las pasa a un
+`Perfil`. Sin `perfilar` esas instrucciones no existen y la VM no paga nada.
+
+Por línea se cuentan visitas (sentencias que empiezan en ella y vueltas de
+los bucles con la cabecera en ella), tiempo propio y acumulado (que incluye
+las funciones que llama); por función, llamadas y los mismos dos
+tiempos. En llamadas recursivas el acumulado solo cuenta la activación más
+externa, para no sumar dos veces el mismo intervalo.
+"""
+import json
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+from bytecode_lynx import compilar_codigo_bytecode
+from interprete_lynx import ErrorCompilacion
+from runtime_lynx import ErrorEjecucion
+from vm_lynx import MaquinaVirtual
+
+PROGRAMA = "<programa>"
+
+# Más allá de esta profundidad las pilas colapsadas dejan de crecer: una
+# recursión de miles de niveles haría cuadrático el tamaño del archivo
+MAX_PROFUNDIDAD_PILAS = 128
+
+
+class _Activacion:
+    __slots__ = ("nombre", "linea", "inicio", "inicio_linea", "prefijo")
+
+    def __init__(self, nombre: str, inicio: float, prefijo: str):
+        self.nombre = nombre
+        self.linea = 0
+        self.inicio = inicio
+        self.inicio_linea = inicio
+        self.prefijo = prefijo
+
+
+class Perfil:
+    """Receptor de las marcas de la VM; los tiempos se guardan en segundos"""
+
+    def __init__(self, reloj=time.perf_counter):
+        self.reloj = reloj
+        inicio = reloj()
+        # linea -> [visitas, propio, acumulado]
+        self.lineas: Dict[int, List[float]] = {}
+        # nombre -> [llamadas, propio, acumulado]
+        self.funciones: Dict[str, List[float]] = {PROGRAMA: [1, 0.0, 0.0]}
+        # pila colapsada ("<programa>:3;fib:2") -> tiempo propio
+        self.pilas: Dict[str, float] = {}
+        self._pila = [_Activacion(PROGRAMA, inicio, "")]
+        self._ultimo = inicio
+        self._lineas_activas: Dict[int, int] = {}
+        self._funciones_activas: Dict[str, int] = {PROGRAMA: 1}
+
+    # Marcas de la VM
+
+    def linea(self, linea: int, profundidad: int):
+        ahora = self._cobrar()
+        while len(self._pila) > profundidad + 1:
+            self._sacar(ahora)
+        activa = self._pila[-1]
+        self._cerrar_linea(activa, ahora)
+        activa.linea = linea
+        activa.inicio_linea = ahora
+        datos = self.lineas.get(linea)
+        if datos is None:
+            datos = self.lineas[linea] = [0, 0.0, 0.0]
+        datos[0] += 1
+        self._lineas_activas[linea] = self._lineas_activas.get(linea, 0) + 1
+
+    def entrar(self, nombre: str, profundidad: int):
+        ahora = self._cobrar()
+        while len(self._pila) > profundidad:
+            self._sacar(ahora)
+        llamador = self._pila[-1]
+        prefijo = llamador.prefijo
+        if len(self._pila) < MAX_PROFUNDIDAD_PILAS:
+            prefijo += f"{llamador.nombre}:{llamador.linea};"
+        self._pila.append(_Activacion(nombre, ahora, prefijo))
+        datos = self.funciones.get(nombre)
+        if datos is None:
+            datos = self.funciones[nombre] = [0, 0.0, 0.0]
+        datos[0] += 1
+        self._funciones_activas[nombre] = self._funciones_activas.get(nombre, 0) + 1
+
+    def salir(self, profundidad: int):
+        ahora = self._cobrar()
+        while len(self._pila) > profundidad:
+            self._sacar(ahora)
+
+    def terminar(self):
+        """Cerrar las activaciones pendientes (fin del programa o error sin capturar)"""
+        if self._pila:
+            self.salir(0)
+
+    # Contabilidad
+
+    def _cobrar(self) -> float:
+        """Asignar el tiempo desde la marca anterior a la línea en curso"""
+        ahora = self.reloj()
+        transcurrido = ahora - self._ultimo
+        self._ultimo = ahora
+        if self._pila:
+            activa = self._pila[-1]
+            self.funciones[activa.nombre][1] += transcurrido
+            if activa.linea:
+                self.lineas[activa.linea][1] += transcurrido
+            clave = f"{activa.prefijo}{activa.nombre}:{activa.linea}"
+            self.pilas[clave] = self.pilas.get(clave, 0.0) + transcurrido
+        return ahora
+
+    def _cerrar_linea(self, activa: _Activacion, ahora: float):
+        linea = activa.linea
+        if not linea:
+            return
+        self._lineas_activas[linea] -= 1
+        if not self._lineas_activas[linea]:
+            self.lineas[linea][2] += ahora - activa.inicio_linea
+
+    def _sacar(self, ahora: float):
+        activa = self._pila.pop()
+        self._cerrar_linea(activa, ahora)
+        self._funciones_activas[activa.nombre] -= 1
+        if not self._funciones_activas[activa.nombre]:
+            self.funciones[activa.nombre][2] += ahora - activa.inicio
+
+    # Resultados
+
+    def resumen(self) -> Dict[str, Any]:
+        """Datos estructurados, con tiempos en milisegundos"""
+        return {
+            "lineas": [
+                {"linea": linea, "visitas": visitas, "propio_ms": propio * 1000, "acumulado_ms": acumulado * 1000}
+                for linea, (visitas, propio, acumulado) in sorted(self.lineas.items())
+            ],
+            "funciones": [
+                {"nombre": nombre, "llamadas": llamadas, "propio_ms": propio * 1000, "acumulado_ms": acumulado * 1000}
+                for nombre, (llamadas, propio, acumulado) in sorted(
+                    self.funciones.items(), key=lambda par: -par[1][1]
+                )
+            ],
+        }
+
+    def pilas_colapsadas(self) -> str:
+        """Formato de flamegraph.pl / speedscope: una pila por línea, peso en microsegundos"""
+        return "\n".join(
+            f"{pila} {round(tiempo * 1_000_000)}"
+            for pila, tiempo in sorted(self.pilas.items())
+            if round(tiempo * 1_000_000) > 0
+        )
+
+
+def perfilar_codigo(codigo: str, escribir=None) -> Perfil:
+    """Compilar con marcas de perfilado y ejecutar; los errores de ejecución se propagan"""
+    programa = compilar_codigo_bytecode(codigo, perfilar=True)
+    perfil = Perfil()
+    MaquinaVirtual(escribir, perfil=perfil).ejecutar(programa)
+    return perfil
+
+
+def formatear_perfil(perfil: Perfil, fuente: str = "") -> str:
+    """Tabla legible: líneas con su código y funciones ordenadas por tiempo propio"""
+    texto = fuente.splitlines()
+    resumen = perfil.resumen()
+    lineas = [f"{'Línea':>6} {'Visitas':>10} {'Propio ms':>11} {'Acum. ms':>11}  Código"]
+    for datos in resumen["lineas"]:
+        numero = datos["linea"]
+        codigo = texto[numero - 1].strip() if 0 < numero <= len(texto) else ""
+        lineas.append(
+            f"{numero:>6} {datos['visitas']:>10} {datos['propio_ms']:>11.3f} "
+            f"{datos['acumulado_ms']:>11.3f}  {codigo}"
+        )
+    lineas.append("")
+    lineas.append(f"{'Función':<20} {'Llamadas':>10} {'Propio ms':>11} {'Acum. ms':>11}")
+    for datos in resumen["funciones"]:
+        lineas.append(
+            f"{datos['nombre']:<20} {datos['llamadas']:>10} {datos['propio_ms']:>11.3f} "
+            f"{datos['acumulado_ms']:>11.3f}"
+        )
+    return "\n".join(lineas)
+
+
+def main(argumentos: List[str]) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="perfil_lynx.py", description="Perfilar un programa Lynx por línea")
+    parser.add_argument("archivo")
+    parser.add_argument("--json", action="store_true", help="imprimir el perfil como JSON")
+    parser.add_argument("--pilas", metavar="ARCHIVO", help="escribir las pilas colapsadas para un flamegraph")
+    opciones = parser.parse_args(argumentos)
+
+    with open(opciones.archivo, "r", encoding="utf-8") as archivo:
+        contenido = archivo.read()
+
+    # La salida del programa va a stderr para no mezclarse con el perfil
+    escribir = lambda linea: print(linea, file=sys.stderr)
+    perfil: Optional[Perfil] = None
+    codigo_salida = 0
+    try:
+        programa = compilar_codigo_bytecode(contenido, perfilar=True)
+        perfil = Perfil()
+        MaquinaVirtual(escribir, perfil=perfil).ejecutar(programa)
+    except ErrorCompilacion as e:
+        for error in e.errores:
+            print(error, file=sys.stderr)
+        return 1
+    except ErrorEjecucion as e:
+        print(e, file=sys.stderr)
+        codigo_salida = 1
+
+    if opciones.json:
+        print(json.dumps(perfil.resumen(), ensure_ascii=False, indent=2))
+    else:
+        print(formatear_perfil(perfil, contenido))
+    if opciones.pilas:
+        with open(opciones.pilas, "w", encoding="utf-8") as archivo:
+            archivo.write(perfil.pilas_colapsadas() + "\n")
+    return codigo_salida
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
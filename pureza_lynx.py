@@ -0,0 +1,154 @@
+"""Análisis de pureza de funciones Lynx
+
+Una función es pura si su resultado depende solo de sus argumentos y no tiene
+efectos: su cuerpo no imprime, no declara funciones, solo asigna variables
+propias (parámetros y locales), solo lee variables propias o funciones que
+nunca se reasignan, y solo llama a funciones puras. La recursión, directa o
+mutua, está permitida.
+
+El análisis corre sobre el AST con las resoluciones del analizador semántico
+y marca `es_pura` en los símbolos de función; la VM memoiza las llamadas a
+funciones puras (ver vm_lynx.MemoLlamadas).
+"""
+from typing import Any, Dict, List
+
+# Nodos que declaran el símbolo al que se resuelven
+DECLARACIONES = frozenset(("DeclaracionVariable", "DeclaracionArreglo", "DeclaracionTabla"))
+# Nodos que leen el símbolo al que se resuelven
+LECTURAS = frozenset(("Identificador", "AccesoArreglo", "AccesoTabla"))
+
+
+class _Funcion:
+    """Lo que el cuerpo de una función declara, lee, asigna y llama"""
+
+    __slots__ = ("simbolo", "propios", "leidos", "asignados", "llamados", "efectos")
+
+    def __init__(self, simbolo):
+        self.simbolo = simbolo
+        self.propios: set = set()
+        self.leidos: set = set()
+        self.asignados: set = set()
+        self.llamados: set = set()
+        self.efectos = False
+
+
+class _Recolector:
+    def __init__(self, resoluciones: Dict[int, Any]):
+        self.resoluciones = resoluciones
+        self.funciones: List[_Funcion] = []
+        self.asignados_programa: set = set()
+        self._pila: List[_Funcion] = []
+
+    def simbolo(self, nodo):
+        simbolo = self.resoluciones.get(id(nodo))
+        if simbolo is None and self._pila:
+            # Sin resolución no se puede probar nada
+            self._pila[-1].efectos = True
+        return simbolo
+
+    def declarar(self, nodo):
+        simbolo = self.simbolo(nodo)
+        if simbolo is not None and self._pila:
+            self._pila[-1].propios.add(id(simbolo))
+
+    def visitar(self, nodo):
+        if isinstance(nodo, tuple) and nodo and nodo[0] in ("para_cada", "capturar"):
+            self.declarar(nodo[1])
+            for hijo in nodo[2:]:
+                self.visitar(hijo)
+            return
+        if isinstance(nodo, (list, tuple)):
+            for hijo in nodo:
+                self.visitar(hijo)
+            return
+        if not hasattr(nodo, "__dict__"):
+            return
+
+        clase = nodo.__class__.__name__
+        actual = self._pila[-1] if self._pila else None
+        if clase == "DeclaracionFuncion":
+            self.funcion(nodo)
+            return
+        if clase in DECLARACIONES:
+            self.declarar(nodo)
+        elif clase in LECTURAS:
+            simbolo = self.simbolo(nodo)
+            if simbolo is not None and actual is not None:
+                actual.leidos.add(id(simbolo))
+        elif clase == "LlamadaFuncion":
+            simbolo = self.simbolo(nodo)
+            if simbolo is not None and actual is not None:
+                actual.llamados.add(id(simbolo))
+        elif clase == "AsignacionVariable":
+            simbolo = self.simbolo(nodo)
+            if simbolo is not None:
+                self.asignados_programa.add(id(simbolo))
+                if actual is not None:
+                    actual.asignados.add(id(simbolo))
+        elif clase == "Imprimir" and actual is not None:
+            actual.efectos = True
+
+        for campo, hijo in vars(nodo).items():
+            if campo not in ("linea", "columna"):
+                self.visitar(hijo)
+
+    def funcion(self, nodo):
+        if self._pila:
+            # Crear una clausura en cada llamada no es un valor memoizable
+            self._pila[-1].efectos = True
+        simbolo = self.resoluciones.get(id(nodo))
+        funcion = _Funcion(simbolo)
+        if simbolo is None:
+            funcion.efectos = True
+        else:
+            self.funciones.append(funcion)
+        self._pila.append(funcion)
+        try:
+            for parametro in nodo.parametros:
+                self.declarar(parametro)
+            self.visitar(nodo.bloque)
+            self.visitar(getattr(nodo, "retorno", None))
+        finally:
+            self._pila.pop()
+
+
+def funciones_puras(ast, resoluciones: Dict[int, Any]) -> List[Any]:
+    """Símbolos de las funciones puras del programa"""
+    recolector = _Recolector(resoluciones)
+    recolector.visitar(ast)
+    reasignados = recolector.asignados_programa
+    # Funciones cuyo nombre siempre denota la misma función
+    fijas = {
+        id(funcion.simbolo): funcion
+        for funcion in recolector.funciones
+        if id(funcion.simbolo) not in reasignados
+    }
+
+    candidatas: Dict[int, _Funcion] = {}
+    for clave, funcion in fijas.items():
+        propios = funcion.propios
+        if (
+            not funcion.efectos
+            and funcion.asignados <= propios
+            and all(leido in propios or leido in fijas for leido in funcion.leidos)
+            and all(llamado in fijas for llamado in funcion.llamados)
+        ):
+            candidatas[clave] = funcion
+
+    # Punto fijo: descartar las que llaman a funciones no puras hasta que no cambie
+    cambio = True
+    while cambio:
+        cambio = False
+        for clave, funcion in list(candidatas.items()):
+            if any(llamado not in candidatas for llamado in funcion.llamados):
+                del candidatas[clave]
+                cambio = True
+    return [funcion.simbolo for funcion in candidatas.values()]
+
+
+def marcar_funciones_puras(ast, resoluciones: Dict[int, Any]) -> int:
+    """Marcar `es_pura` en los símbolos de función; devuelve cuántas son puras"""
+    puras = funciones_puras(ast, resoluciones)
+    for simbolo in puras:
+        simbolo.es_pura = True
+    return len(puras)
@@ -0,0 +1,163 @@
+import hashlib
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+import metricas_lynx
+
+# Un tramo es (linea, columna, longitud); la línea es base 1 y la columna
+# base 0, igual que en los tokens que produce el analizador léxico
+Tramo = Tuple[int, int, int]
+
+
+def tramo_to_dict(tramo: Tramo) -> Dict[str, int]:
+    linea, columna, longitud = tramo
+    return {"linea": linea, "columna": columna, "longitud": longitud}
+
+
+class IndiceReferencias:
+    """Índice de definiciones y usos de cada símbolo, consultable por posición"""
+
+    def __init__(self):
+        self.simbolos: List[Any] = []
+        self.definiciones: List[Optional[Tramo]] = []
+        self.usos: List[List[Tramo]] = []
+        self._ids: Dict[int, int] = {}
+        self._vistos: set = set()
+        # Posiciones ordenadas: (linea, columna, longitud, indice_simbolo)
+        self._claves: List[Tuple[int, int]] = []
+        self._posiciones: List[Tuple[int, int, int, int]] = []
+        self._pendientes: List[Tuple[int, int, int, int]] = []
+
+    def __getstate__(self):
+        # Hacia otro proceso: los id() de los símbolos de este no sirven allá
+        estado = self.__dict__.copy()
+        estado["_ids"] = {}
+        return estado
+
+    def _indice_de(self, simbolo) -> int:
+        clave = id(simbolo)
+        if clave not in self._ids:
+            self._ids[clave] = len(self.simbolos)
+            self.simbolos.append(simbolo)
+            self.definiciones.append(None)
+            self.usos.append([])
+        return self._ids[clave]
+
+    def _ubicar(self, indice: int, tramo: Tramo):
+        posicion = (tramo[0], tramo[1], tramo[2], indice)
+        if posicion in self._vistos:
+            return False
+        self._vistos.add(posicion)
+        self._pendientes.append(posicion)
+        return True
+
+    def registrar_definicion(self, simbolo, linea: Optional[int], columna: Optional[int]):
+        """Registrar el lugar donde se declara un símbolo"""
+        indice = self._indice_de(simbolo)
+        if linea is None or columna is None:
+            return
+        tramo = (linea, columna, len(simbolo.nombre))
+        self.definiciones[indice] = tramo
+        self._ubicar(indice, tramo)
+
+    def registrar_uso(self, simbolo, linea: Optional[int], columna: Optional[int]):
+        """Registrar una lectura o escritura de un símbolo ya resuelto"""
+        indice = self._indice_de(simbolo)
+        if linea is None or columna is None:
+            return
+        tramo = (linea, columna, len(simbolo.nombre))
+        if tramo == self.definiciones[indice]:
+            return
+        if self._ubicar(indice, tramo):
+            self.usos[indice].append(tramo)
+
+    def finalizar(self):
+        """Ordenar las posiciones pendientes para búsquedas binarias"""
+        if not self._pendientes:
+            return
+        self._posiciones.extend(self._pendientes)
+        self._pendientes = []
+        self._posiciones.sort()
+        self._claves = [(pos[0], pos[1]) for pos in self._posiciones]
+        for usos in self.usos:
+            usos.sort()
+
+    def simbolo_en(self, linea: int, columna: int) -> Optional[int]:
+        """Índice del símbolo que ocupa la posición dada, en O(log n)"""
+        self.finalizar()
+        i = bisect_right(self._claves, (linea, columna)) - 1
+        if i < 0:
+            return None
+        pos_linea, pos_columna, longitud, indice = self._posiciones[i]
+        if pos_linea == linea and pos_columna <= columna < pos_columna + longitud:
+            return indice
+        return None
+
+    def definicion(self, linea: int, columna: int) -> Optional[Dict[str, Any]]:
+        indice = self.simbolo_en(linea, columna)
+        if indice is None or self.definiciones[indice] is None:
+            return None
+        return {
+            "nombre": self.simbolos[indice].nombre,
+            "definicion": tramo_to_dict(self.definiciones[indice]),
+        }
+
+    def referencias(
+        self, linea: int, columna: int, incluir_definicion: bool = True
+    ) -> List[Dict[str, int]]:
+        indice = self.simbolo_en(linea, columna)
+        if indice is None:
+            return []
+        tramos = list(self.usos[indice])
+        if incluir_definicion and self.definiciones[indice] is not None:
+            tramos.append(self.definiciones[indice])
+            tramos.sort()
+        return [tramo_to_dict(tramo) for tramo in tramos]
+
+    def hover(self, linea: int, columna: int) -> Optional[Dict[str, Any]]:
+        indice = self.simbolo_en(linea, columna)
+        if indice is None:
+            return None
+        simbolo = self.simbolos[indice]
+        definicion = self.definiciones[indice]
+        return {
+            "simbolo": simbolo.to_dict(),
+            "definicion": tramo_to_dict(definicion) if definicion else None,
+            "usos": len(self.usos[indice]),
+        }
+
+
+def clave_codigo(codigo: str) -> str:
+    return hashlib.sha256(codigo.encode("utf-8")).hexdigest()
+
+
+class CacheIndices:
+    """Caché LRU de índices de referencias, indexada por el hash del código
+
+    Se comparte entre los hilos del ejecutor de análisis: el LRU va con candado.
+    """
+
+    def __init__(self, capacidad: int = 64):
+        self.capacidad = capacidad
+        self._entradas: "OrderedDict[str, IndiceReferencias]" = OrderedDict()
+        self._candado = threading.Lock()
+
+    def obtener(self, codigo: str) -> Optional[IndiceReferencias]:
+        clave = clave_codigo(codigo)
+        with self._candado:
+            indice = self._entradas.get(clave)
+            if indice is not None:
+                self._entradas.move_to_end(clave)
+        metricas_lynx.cache_consultas.sumar("indices", "fallo" if indice is None else "acierto")
+        return indice
+
+    def guardar(self, codigo: str, indice: IndiceReferencias):
+        indice.finalizar()
+        clave = clave_codigo(codigo)
+        with self._candado:
+            self._entradas[clave] = indice
+            self._entradas.move_to_end(clave)
+            while len(self._entradas) > self.capacidad:
+                self._entradas.popitem(last=False)
@@ -0,0 +1,424 @@
+import math
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+try:
+    import numpy
+except ImportError:  # numpy es opcional: sin él los arreglos son siempre listas
+    numpy = None
+
+# Semántica de los valores de Lynx en ejecución, común a todos los motores.
+# Representación: entero -> int, flotante -> float, cadena -> str,
+# booleano -> bool, nulo -> None, arreglo -> list, tabla -> dict.
+# Los arreglos solo de enteros o solo de flotantes pueden ser además un
+# numpy.ndarray (ver `crear_arreglo`); fuera de él se ven como listas.
+# Las cadenas largas que salen de una concatenación son una `Cuerda`.
+NUMEROS = (int, float)
+
+# Desde este largo la concatenación produce una Cuerda en vez de copiar
+MIN_CUERDA = 1024
+# Los trozos menores que esto se juntan al agregarles texto, para no guardar
+# millones de cadenas de un carácter
+TAMANO_TROZO = 256
+
+
+class _SinNumpy:
+    pass
+
+
+ARREGLO_NUMERICO = numpy.ndarray if numpy is not None else _SinNumpy
+
+# Los enteros de un arreglo numérico caben holgadamente en int64
+MAX_ENTERO_NUMERICO = 2 ** 62
+
+
+class ErrorEjecucion(Exception):
+    """Error de un programa Lynx en ejecución; `capturar` lo puede atrapar"""
+
+    def __init__(self, mensaje: str, linea: Optional[int] = None):
+        super().__init__(mensaje)
+        self.mensaje = mensaje
+        self.linea = linea
+
+    def ubicar(self, linea: Optional[int]):
+        """Asignar la línea de la sentencia que falló, si aún no la tiene"""
+        if self.linea is None:
+            self.linea = linea
+
+    def __str__(self):
+        if self.linea:
+            return f"Error de ejecución línea {self.linea}: {self.mensaje}"
+        return f"Error de ejecución: {self.mensaje}"
+
+
+class _Constructor:
+    __slots__ = ("partes", "longitud")
+
+    def __init__(self, texto: str):
+        self.partes = [texto]
+        self.longitud = len(texto)
+
+
+class Cuerda:
+    """Cadena que se arma por concatenación y se une recién cuando se lee
+
+    Concatenar a la derecha agrega el texto al constructor compartido: O(1)
+    amortizado, en vez de copiar toda la cadena. Cada Cuerda ve el prefijo de
+    `longitud` caracteres del constructor, que solo crece por el final, así
+    que las cuerdas anteriores no cambian. Si otra cuerda ya siguió desde este
+    mismo punto, la concatenación empieza un constructor nuevo.
+
+    Imprimir, comparar, indexar tablas o recorrer usan `plano`, que une las
+    partes una sola vez y guarda el resultado.
+    """
+
+    __slots__ = ("constructor", "longitud", "_texto")
+
+    def __init__(self, constructor: _Constructor, longitud: int):
+        self.constructor = constructor
+        self.longitud = longitud
+        self._texto: Optional[str] = None
+
+    @classmethod
+    def desde(cls, texto: str) -> "Cuerda":
+        constructor = _Constructor(texto)
+        cuerda = cls(constructor, constructor.longitud)
+        cuerda._texto = texto
+        return cuerda
+
+    def concatenar(self, texto: str) -> "Cuerda":
+        if not texto:
+            return self
+        constructor = self.constructor
+        if constructor.longitud != self.longitud:
+            constructor = _Constructor(self.texto())
+        partes = constructor.partes
+        if len(partes[-1]) < TAMANO_TROZO and len(texto) < TAMANO_TROZO:
+            partes[-1] += texto
+        else:
+            partes.append(texto)
+        constructor.longitud += len(texto)
+        return Cuerda(constructor, constructor.longitud)
+
+    def texto(self) -> str:
+        if self._texto is None:
+            partes = self.constructor.partes
+            if len(partes) > 1:
+                # Compactar: las demás cuerdas del constructor ven un prefijo de esto
+                partes[:] = ["".join(partes)]
+            texto = partes[0]
+            self._texto = texto if len(texto) == self.longitud else texto[:self.longitud]
+        return self._texto
+
+    def __str__(self):
+        return self.texto()
+
+    def __repr__(self):
+        return f"Cuerda({self.longitud} caracteres)"
+
+
+def plano(valor: Any) -> Any:
+    """El valor con las cuerdas convertidas a str"""
+    return valor.texto() if type(valor) is Cuerda else valor
+
+
+def tipo_de(valor: Any) -> str:
+    """Nombre del tipo Lynx de un valor"""
+    tipo = type(valor)
+    if tipo is bool:
+        return "booleano"
+    if tipo is int:
+        return "entero"
+    if tipo is float:
+        return "flotante"
+    if tipo is str or tipo is Cuerda:
+        return "cadena"
+    if valor is None:
+        return "nulo"
+    if tipo is list:
+        return "arreglo"
+    if tipo is dict:
+        return "tabla"
+    if tipo is ARREGLO_NUMERICO:
+        return "arreglo"
+    if callable(valor) or hasattr(valor, "aridad"):
+        return "funcion"
+    return "desconocido"
+
+
+def representar(valor: Any) -> str:
+    """Texto de un valor dentro de un arreglo o tabla: las cadenas van entre comillas"""
+    if type(valor) is str or type(valor) is Cuerda:
+        return f'"{plano(valor)}"'
+    return a_cadena(valor)
+
+
+def a_cadena(valor: Any) -> str:
+    """Texto de un valor tal como lo muestra `imprimir` o la concatenación"""
+    tipo = type(valor)
+    if tipo is str:
+        return valor
+    if tipo is Cuerda:
+        return valor.texto()
+    if tipo is bool:
+        return "verdadero" if valor else "falso"
+    if tipo is int or tipo is float:
+        return str(valor)
+    if valor is None:
+        return "nulo"
+    if tipo is list:
+        return "[" + ", ".join(representar(elemento) for elemento in valor) + "]"
+    if tipo is dict:
+        pares = ", ".join(f'"{clave}" = {representar(v)}' for clave, v in valor.items())
+        return "{" + pares + "}"
+    if tipo is ARREGLO_NUMERICO:
+        return a_cadena(valor.tolist())
+    nombre = getattr(valor, "nombre", None)
+    if nombre is not None:
+        return f"<funcion {nombre}>"
+    return str(valor)
+
+
+def es_numero(valor: Any) -> bool:
+    tipo = type(valor)
+    return tipo is int or tipo is float
+
+
+def requerir_numeros(operador: str, a: Any, b: Any):
+    if not (es_numero(a) and es_numero(b)):
+        raise ErrorEjecucion(
+            f"Operador '{operador}' requiere operandos numéricos, no {tipo_de(a)} y {tipo_de(b)}"
+        )
+
+
+def sumar(a: Any, b: Any) -> Any:
+    if es_numero(a) and es_numero(b):
+        return a + b
+    # Con una cadena, + concatena
+    if type(a) is Cuerda:
+        return a.concatenar(a_cadena(b))
+    if type(a) is str or type(b) is str or type(b) is Cuerda:
+        texto = a_cadena(a) + a_cadena(b)
+        return Cuerda.desde(texto) if len(texto) >= MIN_CUERDA else texto
+    raise ErrorEjecucion(f"Tipos incompatibles para suma: {tipo_de(a)} + {tipo_de(b)}")
+
+
+def restar(a: Any, b: Any) -> Any:
+    requerir_numeros("-", a, b)
+    return a - b
+
+
+def multiplicar(a: Any, b: Any) -> Any:
+    requerir_numeros("*", a, b)
+    return a * b
+
+
+def dividir(a: Any, b: Any) -> Any:
+    requerir_numeros("/", a, b)
+    if b == 0:
+        raise ErrorEjecucion("División por cero")
+    if type(a) is int and type(b) is int:
+        # La división entera trunca hacia cero, como el tipo `entero` del análisis
+        cociente = abs(a) // abs(b)
+        return cociente if (a >= 0) == (b >= 0) else -cociente
+    return a / b
+
+
+def modulo(a: Any, b: Any) -> Any:
+    requerir_numeros("%", a, b)
+    if b == 0:
+        raise ErrorEjecucion("Módulo por cero")
+    if type(a) is int and type(b) is int:
+        # El resto conserva el signo del dividendo (coherente con `dividir`)
+        return a - b * dividir(a, b)
+    return math.fmod(a, b)
+
+
+def crear_arreglo(elementos: List[Any]) -> Any:
+    """Arreglo numérico (numpy) si todos los elementos son enteros o todos flotantes
+
+    Con tipos mezclados, vacío o sin numpy queda la lista de siempre.
+    """
+    if numpy is None or not elementos:
+        return elementos
+    tipo = type(elementos[0])
+    if tipo is int:
+        for elemento in elementos:
+            if type(elemento) is not int or not -MAX_ENTERO_NUMERICO < elemento < MAX_ENTERO_NUMERICO:
+                return elementos
+        return numpy.array(elementos, dtype=numpy.int64)
+    if tipo is float:
+        for elemento in elementos:
+            if type(elemento) is not float:
+                return elementos
+        return numpy.array(elementos, dtype=numpy.float64)
+    return elementos
+
+
+def _como_lista(valor: Any) -> Any:
+    """Copia comparable con == de arreglos y tablas que contienen arreglos numéricos"""
+    tipo = type(valor)
+    if tipo is ARREGLO_NUMERICO:
+        return valor.tolist()
+    if tipo is list:
+        return [_como_lista(elemento) for elemento in valor]
+    if tipo is dict:
+        return {clave: _como_lista(elemento) for clave, elemento in valor.items()}
+    return valor
+
+
+def iguales(a: Any, b: Any) -> bool:
+    if type(a) is Cuerda or type(b) is Cuerda:
+        # Con largos distintos no hace falta unir las partes
+        return (
+            type(a) in (str, Cuerda) and type(b) in (str, Cuerda)
+            and _longitud(a) == _longitud(b) and plano(a) == plano(b)
+        )
+    # Valores de tipos distintos nunca son iguales, salvo entero y flotante
+    if type(a) is type(b) or (es_numero(a) and es_numero(b)):
+        if type(a) is ARREGLO_NUMERICO:
+            return a.tolist() == b.tolist()
+        try:
+            return a == b
+        except ValueError:
+            # Un arreglo numérico dentro de una lista o tabla compara elemento a elemento
+            return _como_lista(a) == _como_lista(b)
+    if type(a) is ARREGLO_NUMERICO or type(b) is ARREGLO_NUMERICO:
+        return (type(a) in (list, ARREGLO_NUMERICO) and type(b) in (list, ARREGLO_NUMERICO)
+                and _como_lista(a) == _como_lista(b))
+    return False
+
+
+def _longitud(cadena: Any) -> int:
+    return cadena.longitud if type(cadena) is Cuerda else len(cadena)
+
+
+def diferentes(a: Any, b: Any) -> bool:
+    return not iguales(a, b)
+
+
+def _ordenables(operador: str, a: Any, b: Any) -> tuple:
+    """Los operandos listos para comparar (las cuerdas, unidas)"""
+    if es_numero(a) and es_numero(b):
+        return a, b
+    a, b = plano(a), plano(b)
+    if type(a) is str and type(b) is str:
+        return a, b
+    raise ErrorEjecucion(
+        f"No se pueden comparar con '{operador}' valores {tipo_de(a)} y {tipo_de(b)}"
+    )
+
+
+def menor(a: Any, b: Any) -> bool:
+    a, b = _ordenables("<", a, b)
+    return a < b
+
+
+def mayor(a: Any, b: Any) -> bool:
+    a, b = _ordenables(">", a, b)
+    return a > b
+
+
+def menor_igual(a: Any, b: Any) -> bool:
+    a, b = _ordenables("<=", a, b)
+    return a <= b
+
+
+def mayor_igual(a: Any, b: Any) -> bool:
+    a, b = _ordenables(">=", a, b)
+    return a >= b
+
+
+# Operadores binarios que se evalúan con ambos operandos (y/o se cortocircuitan)
+OPERACIONES_BINARIAS: Dict[str, Callable[[Any, Any], Any]] = {
+    "+": sumar,
+    "-": restar,
+    "*": multiplicar,
+    "/": dividir,
+    "%": modulo,
+    "==": iguales,
+    "!=": diferentes,
+    "<": menor,
+    ">": mayor,
+    "<=": menor_igual,
+    ">=": mayor_igual,
+}
+
+
+def booleano(valor: Any, contexto: str) -> bool:
+    """Exigir un booleano en condiciones y operadores lógicos"""
+    if valor is True or valor is False:
+        return valor
+    raise ErrorEjecucion(f"{contexto} debe ser booleano, no {tipo_de(valor)}")
+
+
+def negar(valor: Any) -> bool:
+    return not booleano(valor, "El operando de 'no'")
+
+
+def opuesto(valor: Any) -> Any:
+    if not es_numero(valor):
+        raise ErrorEjecucion(f"Operador '-' requiere un operando numérico, no {tipo_de(valor)}")
+    return -valor
+
+
+def identidad(valor: Any) -> Any:
+    if not es_numero(valor):
+        raise ErrorEjecucion(f"Operador '+' requiere un operando numérico, no {tipo_de(valor)}")
+    return valor
+
+
+OPERACIONES_UNARIAS: Dict[str, Callable[[Any], Any]] = {
+    "-": opuesto,
+    "+": identidad,
+    "no": negar,
+}
+
+
+def indexar(contenedor: Any, indice: Any) -> Any:
+    """Acceso `a[i]` a arreglos (índice entero) y tablas (clave cadena)"""
+    tipo = type(contenedor)
+    if tipo is list:
+        if type(indice) is not int:
+            raise ErrorEjecucion(f"El índice de arreglo debe ser entero, no {tipo_de(indice)}")
+        if indice < 0 or indice >= len(contenedor):
+            raise ErrorEjecucion(
+                f"Índice {indice} fuera de rango para un arreglo de {len(contenedor)} elementos"
+            )
+        return contenedor[indice]
+    if tipo is ARREGLO_NUMERICO:
+        if type(indice) is not int:
+            raise ErrorEjecucion(f"El índice de arreglo debe ser entero, no {tipo_de(indice)}")
+        if indice < 0 or indice >= len(contenedor):
+            raise ErrorEjecucion(
+                f"Índice {indice} fuera de rango para un arreglo de {len(contenedor)} elementos"
+            )
+        return contenedor.item(indice)
+    if tipo is dict:
+        indice = plano(indice)
+        if type(indice) is not str:
+            raise ErrorEjecucion(f"Clave de tabla debe ser cadena, no {tipo_de(indice)}")
+        if indice not in contenedor:
+            raise ErrorEjecucion(f"Clave '{indice}' no encontrada en la tabla")
+        return contenedor[indice]
+    raise ErrorEjecucion(f"Un valor {tipo_de(contenedor)} no se puede indexar")
+
+
+def iterar(coleccion: Any) -> Iterable[Any]:
+    """Elementos que recorre `para (x en coleccion)`"""
+    if type(coleccion) is list:
+        return coleccion
+    if type(coleccion) is dict:
+        # Una tabla se recorre por sus claves, en orden de inserción
+        return list(coleccion)
+    if type(coleccion) is str or type(coleccion) is Cuerda:
+        return plano(coleccion)
+    if type(coleccion) is ARREGLO_NUMERICO:
+        return coleccion.tolist()
+    raise ErrorEjecucion(f"Un valor {tipo_de(coleccion)} no se puede recorrer")
+
+
+def verificar_aridad(nombre: str, esperados: int, recibidos: int):
+    if esperados != recibidos:
+        raise ErrorEjecucion(
+            f"La función '{nombre}' espera {esperados} argumentos y recibió {recibidos}"
+        )
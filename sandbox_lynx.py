@@ -0,0 +1,301 @@
+"""Ejecución aislada de programas Lynx en un grupo de procesos pre-creados
+
+Cada trabajador corre la VM de vm_lynx con un presupuesto de instrucciones,
+un tope de memoria (RLIMIT_AS) y un tope de bytes de `imprimir`. El proceso
+principal impone el tiempo máximo: si un trabajador no responde a tiempo, o
+muere, se mata y se reemplaza por uno nuevo.
+"""
+import asyncio
+import multiprocessing
+import os
+import queue
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows: sin tope de memoria
+    resource = None
+
+from bytecode_lynx import compilar_codigo_bytecode
+from interprete_lynx import ErrorCompilacion
+from perfil_lynx import Perfil
+from runtime_lynx import ErrorEjecucion
+from vm_lynx import MaquinaVirtual, PresupuestoAgotado
+
+# Estados posibles de una ejecución
+OK = "ok"
+ERROR_COMPILACION = "error_compilacion"
+ERROR_EJECUCION = "error_ejecucion"
+LIMITE_INSTRUCCIONES = "limite_instrucciones"
+LIMITE_MEMORIA = "limite_memoria"
+LIMITE_SALIDA = "limite_salida"
+TIEMPO_AGOTADO = "tiempo_agotado"
+TRABAJADOR_CAIDO = "trabajador_caido"
+ERROR_INTERNO = "error_interno"
+
+
+# Lo mínimo que puede pedir una petición: con menos, hasta un programa trivial
+# agota el tiempo y obliga a reemplazar el trabajador
+MIN_INSTRUCCIONES = 1000
+MIN_TIEMPO_S = 0.1
+
+
+class Limites:
+    """Límites de una ejecución; los de una petición nunca superan los del grupo"""
+
+    def __init__(
+        self,
+        instrucciones: int = 10_000_000,
+        memoria_mb: int = 256,
+        tiempo_s: float = 5.0,
+        salida_bytes: int = 64 * 1024,
+    ):
+        self.instrucciones = instrucciones
+        self.memoria_mb = memoria_mb
+        self.tiempo_s = tiempo_s
+        self.salida_bytes = salida_bytes
+
+    def acotar(self, instrucciones: Optional[int] = None, tiempo_s: Optional[float] = None) -> "Limites":
+        """Los límites del grupo, reducidos a los pedidos pero no por debajo de los mínimos"""
+        if instrucciones is not None:
+            instrucciones = min(max(instrucciones, MIN_INSTRUCCIONES), self.instrucciones)
+        if tiempo_s is not None:
+            tiempo_s = min(max(tiempo_s, MIN_TIEMPO_S), self.tiempo_s)
+        return Limites(
+            self.instrucciones if instrucciones is None else instrucciones,
+            self.memoria_mb,
+            self.tiempo_s if tiempo_s is None else tiempo_s,
+            self.salida_bytes,
+        )
+
+
+class SalidaExcedida(Exception):
+    pass
+
+
+class SalidaLimitada:
+    """Destino de `imprimir` que corta la ejecución al pasar de `max_bytes`"""
+
+    def __init__(self, max_bytes: int):
+        self.lineas: List[str] = []
+        self.restantes = max_bytes
+
+    def escribir(self, linea: str):
+        self.restantes -= len(linea.encode("utf-8")) + 1
+        if self.restantes < 0:
+            raise SalidaExcedida()
+        self.lineas.append(linea)
+
+
+def _resultado(estado: str, salida: List[str], errores: List[str], inicio: float,
+               instrucciones: int = 0, reciclar: bool = False, perfil: Optional[Perfil] = None) -> Dict[str, Any]:
+    resultado = {
+        "estado": estado,
+        "salida": salida,
+        "errores": errores,
+        "tiempo_ms": (time.perf_counter() - inicio) * 1000,
+        "instrucciones": instrucciones,
+        "reciclar": reciclar,
+        "perfil": None,
+    }
+    if perfil is not None:
+        resultado["perfil"] = dict(perfil.resumen(), pilas=perfil.pilas_colapsadas())
+    return resultado
+
+
+def ejecutar_limitado(codigo: str, instrucciones: int, salida_bytes: int, perfilar: bool = False) -> Dict[str, Any]:
+    """Compilar y ejecutar en el proceso actual con presupuesto y salida acotados"""
+    inicio = time.perf_counter()
+    salida = SalidaLimitada(salida_bytes)
+    try:
+        programa = compilar_codigo_bytecode(codigo, perfilar)
+    except ErrorCompilacion as e:
+        return _resultado(ERROR_COMPILACION, [], e.errores, inicio)
+    except MemoryError:
+        return _resultado(LIMITE_MEMORIA, [], ["Se superó el límite de memoria"], inicio, reciclar=True)
+
+    perfil = Perfil() if perfilar else None
+    vm = MaquinaVirtual(salida.escribir, presupuesto=instrucciones, perfil=perfil)
+    try:
+        vm.ejecutar(programa)
+    except ErrorEjecucion as e:
+        return _resultado(ERROR_EJECUCION, salida.lineas, [str(e)], inicio, vm.consumidas, perfil=perfil)
+    except PresupuestoAgotado:
+        mensaje = f"Se agotó el presupuesto de {instrucciones} instrucciones"
+        return _resultado(LIMITE_INSTRUCCIONES, salida.lineas, [mensaje], inicio, vm.consumidas, perfil=perfil)
+    except SalidaExcedida:
+        mensaje = f"La salida superó el límite de {salida_bytes} bytes"
+        return _resultado(LIMITE_SALIDA, salida.lineas, [mensaje], inicio, vm.consumidas, perfil=perfil)
+    except MemoryError:
+        # Liberar la salida y el perfil antes de armar la respuesta
+        salida.lineas = []
+        vm.perfil = perfil = None
+        return _resultado(LIMITE_MEMORIA, [], ["Se superó el límite de memoria"], inicio,
+                          vm.consumidas, reciclar=True)
+    return _resultado(OK, salida.lineas, [], inicio, vm.consumidas, perfil=perfil)
+
+
+def _memoria_actual() -> int:
+    """Tamaño virtual del proceso en bytes, o 0 si no se puede leer"""
+    try:
+        with open("/proc/self/statm") as archivo:
+            return int(archivo.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return 0
+
+
+def _trabajador(conexion, memoria_mb: int):
+    base = _memoria_actual()
+    if resource is not None and base:
+        tope = base + memoria_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (tope, tope))
+
+    while True:
+        try:
+            codigo, instrucciones, salida_bytes, perfilar = conexion.recv()
+        except (EOFError, KeyboardInterrupt):
+            return
+        try:
+            resultado = ejecutar_limitado(codigo, instrucciones, salida_bytes, perfilar)
+        except Exception as e:
+            resultado = _resultado(ERROR_INTERNO, [], [f"Error interno: {e}"], time.perf_counter(), reciclar=True)
+        conexion.send(resultado)
+
+
+class _Trabajador:
+    __slots__ = ("proceso", "conexion", "ejecuciones")
+
+    def __init__(self, contexto, memoria_mb: int):
+        self.conexion, hijo = contexto.Pipe()
+        self.proceso = contexto.Process(target=_trabajador, args=(hijo, memoria_mb), daemon=True)
+        self.proceso.start()
+        hijo.close()
+        self.ejecuciones = 0
+
+    def matar(self):
+        if self.proceso.is_alive():
+            self.proceso.kill()
+        self.proceso.join()
+        self.conexion.close()
+
+
+class GrupoEjecucion:
+    """Grupo de trabajadores aislados
+
+    `ejecutar` bloquea el hilo que la llama hasta tener un trabajador libre y
+    su resultado; `ejecutar_async` la corre en un hilo propio del grupo para
+    no bloquear el bucle de eventos.
+    """
+
+    def __init__(
+        self,
+        trabajadores: int = 2,
+        limites: Optional[Limites] = None,
+        metodo: Optional[str] = None,
+        max_ejecuciones: int = 1000,
+    ):
+        if metodo is None:
+            metodo = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        self.contexto = multiprocessing.get_context(metodo)
+        if metodo == "forkserver":
+            self.contexto.set_forkserver_preload(["sandbox_lynx"])
+        self.num_trabajadores = trabajadores
+        self.limites = limites or Limites()
+        # Reciclar trabajadores de vez en cuando acota cualquier fuga de memoria
+        self.max_ejecuciones = max_ejecuciones
+        self.estadisticas = {"ejecuciones": 0, "reemplazos": 0, "tiempo_agotado": 0, "caidos": 0}
+        self._candado = threading.Lock()
+        self._libres: "queue.Queue[_Trabajador]" = queue.Queue()
+        self._todos: List[_Trabajador] = []
+        self._hilos: Optional[ThreadPoolExecutor] = None
+
+    def iniciar(self) -> "GrupoEjecucion":
+        for _ in range(self.num_trabajadores):
+            trabajador = _Trabajador(self.contexto, self.limites.memoria_mb)
+            self._todos.append(trabajador)
+            self._libres.put(trabajador)
+        self._hilos = ThreadPoolExecutor(self.num_trabajadores, thread_name_prefix="lynx-sandbox")
+        return self
+
+    def cerrar(self):
+        if self._hilos is not None:
+            self._hilos.shutdown(wait=True)
+            self._hilos = None
+        for trabajador in self._todos:
+            trabajador.matar()
+        self._todos = []
+        self._libres = queue.Queue()
+
+    def __enter__(self) -> "GrupoEjecucion":
+        return self.iniciar()
+
+    def __exit__(self, *_):
+        self.cerrar()
+
+    def _contar(self, clave: str):
+        with self._candado:
+            self.estadisticas[clave] += 1
+
+    def _reemplazar(self, trabajador: _Trabajador) -> _Trabajador:
+        trabajador.matar()
+        nuevo = _Trabajador(self.contexto, self.limites.memoria_mb)
+        with self._candado:
+            self._todos[self._todos.index(trabajador)] = nuevo
+            self.estadisticas["reemplazos"] += 1
+        return nuevo
+
+    def ejecutar(self, codigo: str, instrucciones: Optional[int] = None,
+                 tiempo_s: Optional[float] = None, perfilar: bool = False) -> Dict[str, Any]:
+        limites = self.limites.acotar(instrucciones, tiempo_s)
+        trabajador = self._libres.get()
+        inicio = time.perf_counter()
+        try:
+            try:
+                trabajador.conexion.send((codigo, limites.instrucciones, limites.salida_bytes, perfilar))
+                listo = trabajador.conexion.poll(limites.tiempo_s)
+                resultado = trabajador.conexion.recv() if listo else None
+            except (EOFError, OSError):
+                self._contar("caidos")
+                resultado = _resultado(TRABAJADOR_CAIDO, [], ["El proceso de ejecución terminó inesperadamente"],
+                                       inicio, reciclar=True)
+
+            if resultado is None:
+                self._contar("tiempo_agotado")
+                mensaje = f"Se superó el tiempo máximo de {limites.tiempo_s:g} s"
+                resultado = _resultado(TIEMPO_AGOTADO, [], [mensaje], inicio, reciclar=True)
+
+            trabajador.ejecuciones += 1
+            if resultado.pop("reciclar") or trabajador.ejecuciones >= self.max_ejecuciones:
+                trabajador = self._reemplazar(trabajador)
+            return resultado
+        finally:
+            self._contar("ejecuciones")
+            self._libres.put(trabajador)
+
+    async def ejecutar_async(self, codigo: str, instrucciones: Optional[int] = None,
+                             tiempo_s: Optional[float] = None, perfilar: bool = False) -> Dict[str, Any]:
+        if self._hilos is None:
+            raise RuntimeError("El grupo de ejecución no está iniciado")
+        bucle = asyncio.get_running_loop()
+        return await bucle.run_in_executor(self._hilos, self.ejecutar, codigo, instrucciones, tiempo_s, perfilar)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("Uso: python sandbox_lynx.py <archivo.lynx>")
+        sys.exit(1)
+
+    with open(sys.argv[1], "r", encoding="utf-8") as archivo:
+        contenido = archivo.read()
+
+    with GrupoEjecucion(trabajadores=1) as grupo:
+        resultado = grupo.ejecutar(contenido)
+    for linea in resultado["salida"]:
+        print(linea)
+    for error in resultado["errores"]:
+        print(error, file=sys.stderr)
+    sys.exit(0 if resultado["estado"] == OK else 1)
@@ -1,9 +1,84 @@
-from typing import Dict, Optional, List, Any, TypedDict
+import time
+from typing import Dict, Optional, List, Any, Iterable, TypedDict
+from diagnosticos_lynx import (
+    ADVERTENCIA,
+    ERROR,
+    MAX_ADVERTENCIAS_POR_DEFECTO,
+    MAX_ERRORES_POR_DEFECTO,
+    ColectorDiagnosticos,
+    LimiteDiagnosticosAlcanzado,
+)
+from referencias_lynx import IndiceReferencias
+from flujo_lynx import analizar_flujo, construir_cfg
+from pureza_lynx import marcar_funciones_puras
+import metricas_lynx
+import trazas_lynx
+from trazas_lynx import DEPURACION
+
+# Registro de verificaciones que se pueden habilitar o deshabilitar
+VERIFICACIONES: Dict[str, str] = {
+    "tipos": "Compatibilidad de tipos en operadores, condiciones y accesos",
+    "valores": "Seguimiento de valores literales en la tabla de símbolos",
+    "no_utilizadas": "Variables y funciones declaradas pero no utilizadas",
+    "arreglos_mixtos": "Arreglos con elementos de tipos diferentes",
+    "flujo": "Código inalcanzable, lecturas sin inicializar y asignaciones muertas",
+    "tabla_simbolos": "Serialización de la tabla de símbolos en el resultado",
+    "pureza": "Funciones sin efectos (es_pura), para memoizar sus llamadas en la VM",
+}
+
+# Verificación a la que pertenece cada código de diagnóstico; los códigos
+# que no aparecen aquí (resolución de ámbitos) se reportan siempre
+CODIGOS_VERIFICACION: Dict[str, str] = {
+    "suma_incompatible": "tipos",
+    "operandos_no_numericos": "tipos",
+    "operando_izquierdo_no_booleano": "tipos",
+    "operando_derecho_no_booleano": "tipos",
+    "negacion_no_booleana": "tipos",
+    "no_es_arreglo": "tipos",
+    "no_es_tabla": "tipos",
+    "no_es_funcion": "tipos",
+    "indice_no_entero": "tipos",
+    "clave_no_cadena": "tipos",
+    "condicion_no_booleana": "tipos",
+    "variable_no_utilizada": "no_utilizadas",
+    "funcion_no_utilizada": "no_utilizadas",
+    "arreglo_tipos_mixtos": "arreglos_mixtos",
+    "codigo_inalcanzable": "flujo",
+    "posible_no_inicializada": "flujo",
+    "asignacion_muerta": "flujo",
+}
+
+# Expresiones sin efectos secundarios cuyo (tipo, valor) se memoiza por nodo;
+# con hash-consing en el parser, las que se repiten sin nombres en una misma
+# línea son el mismo nodo
+EXPRESIONES_MEMOIZABLES = frozenset(("ExpresionBinaria", "ExpresionUnaria"))
+
+# Expresiones que solo aportan su tipo: sin la verificación `tipos` se
+# recorren para resolver sus nombres y nada más
+EXPRESIONES_CON_TIPOS = frozenset(
+    ("ExpresionBinaria", "ExpresionUnaria", "AccesoArreglo", "AccesoTabla")
+)
+
+# Niveles de análisis: `rapido` para validar mientras se escribe, `completo`
+# cuando el usuario pide el análisis explícitamente
+NIVELES: Dict[str, Dict[str, Any]] = {
+    "rapido": {
+        "verificaciones": frozenset(),
+        "max_errores": 20,
+        "max_advertencias": 20,
+    },
+    "completo": {
+        "verificaciones": frozenset(VERIFICACIONES),
+        "max_errores": MAX_ERRORES_POR_DEFECTO,
+        "max_advertencias": MAX_ADVERTENCIAS_POR_DEFECTO,
+    },
+}
 
 class ResultadoAnalisisSemantico(TypedDict):
     errores: List[str]
     advertencias: List[str]
     tabla_simbolos: Dict[str, Any]
+    truncado: bool
 
 
 class Simbolo:
@@ -19,6 +94,8 @@ class Simbolo:
         tipo_retorno: Optional[str] = None,
         usado: bool = False,
         declarado: bool = False,
+        columna: Optional[int] = None,
+        es_pura: bool = False,
     ):
         self.nombre = nombre
         self.tipo = tipo  # 'entero', 'flotante', 'cadena', 'arreglo', 'tabla', 'funcion', 'booleano'
@@ -30,6 +107,9 @@ class Simbolo:
         self.tipo_retorno = tipo_retorno
         self.usado = usado
         self.declarado = declarado
+        self.columna = columna
+        # Función sin efectos cuyo resultado depende solo de sus argumentos
+        self.es_pura = es_pura
 
     def to_dict(self):
         return {
@@ -37,37 +117,104 @@ class Simbolo:
             "tipo": self.tipo,
             "valor": self.valor,
             "linea": self.linea,
+            "columna": self.columna,
             "es_constante": self.es_constante,
             "parametros": self.parametros,
             "tipo_retorno": self.tipo_retorno,
             "inicializado": self.inicializado,
             "usado": self.usado,
+            "es_pura": self.es_pura,
         }
 
 
 class AnalizadorSemantico:
-    def __init__(self):
+    def __init__(
+        self,
+        max_errores: Optional[int] = None,
+        max_advertencias: Optional[int] = None,
+        nivel: str = "completo",
+        habilitar: Iterable[str] = (),
+        deshabilitar: Iterable[str] = (),
+        memoizar: bool = True,
+    ):
+        if nivel not in NIVELES:
+            raise ValueError(f"Nivel de análisis desconocido: {nivel}")
+        configuracion = NIVELES[nivel]
+        habilitar, deshabilitar = set(habilitar), set(deshabilitar)
+        desconocidas = (habilitar | deshabilitar) - set(VERIFICACIONES)
+        if desconocidas:
+            raise ValueError(f"Verificaciones desconocidas: {sorted(desconocidas)}")
+
+        self.nivel = nivel
+        self.verificaciones = (configuracion["verificaciones"] | habilitar) - deshabilitar
+        # Sin `tipos` las expresiones solo resuelven nombres: nadie lee sus tipos
+        self.inferir_tipos = "tipos" in self.verificaciones
+        self.codigos_inactivos = frozenset(
+            codigo
+            for codigo, verificacion in CODIGOS_VERIFICACION.items()
+            if verificacion not in self.verificaciones
+        )
         self.tabla_simbolos: Dict[str, Simbolo] = {}
         self.ambitos: List[Dict[str, Simbolo]] = [{}]  # Stack de ámbitos
-        self.errores: List[str] = []
-        self.advertencias: List[str] = []
+        self.max_errores = (
+            configuracion["max_errores"] if max_errores is None else max_errores
+        )
+        self.max_advertencias = (
+            configuracion["max_advertencias"]
+            if max_advertencias is None
+            else max_advertencias
+        )
+        self.diagnosticos = ColectorDiagnosticos(self.max_errores, self.max_advertencias)
+        self.referencias = IndiceReferencias()
+        # Memo de expresiones: id(nodo) -> (versión de ámbitos, (tipo, valor)).
+        # La versión cambia cuando puede cambiar la resolución o el tipo de
+        # algún nombre ya consultado.
+        self.memoizar = memoizar
+        self.memo: Dict[int, tuple] = {}
+        self.version_ambito = 0
+        self.nombres_consultados: set = set()
+        # Resolución de cada nodo (declaración o uso) a su símbolo: id(nodo) -> Simbolo
+        self.resoluciones: Dict[int, Simbolo] = {}
         self.funciones_declaradas: Dict[str, Simbolo] = {}
         self.en_funcion = False
         self.tipo_retorno_esperado = None
         self.bucles_anidados = 0
         self.codigo_fuente = ""
 
-    def error(self, mensaje: str, linea: Optional[int] = None):
-        if linea:
-            self.errores.append(f"Error semántico línea {linea}: {mensaje}")
-        else:
-            self.errores.append(f"Error semántico: {mensaje}")
+    def activa(self, verificacion: str) -> bool:
+        return verificacion in self.verificaciones
 
-    def advertencia(self, mensaje: str, linea: Optional[int] = None):
-        if linea:
-            self.advertencias.append(f"Advertencia línea {linea}: {mensaje}")
-        else:
-            self.advertencias.append(f"Advertencia: {mensaje}")
+    @property
+    def errores(self) -> List[str]:
+        return self.diagnosticos.renderizar(ERROR)
+
+    @property
+    def advertencias(self) -> List[str]:
+        return self.diagnosticos.renderizar(ADVERTENCIA)
+
+    def error(
+        self,
+        codigo: str,
+        *args: Any,
+        linea: Optional[int] = None,
+        columna: Optional[int] = None,
+    ):
+        """Registrar un error; puede detener el análisis si se agota el límite"""
+        if codigo in self.codigos_inactivos:
+            return
+        self.diagnosticos.agregar(ERROR, codigo, args, linea, columna)
+
+    def advertencia(
+        self,
+        codigo: str,
+        *args: Any,
+        linea: Optional[int] = None,
+        columna: Optional[int] = None,
+    ):
+        """Registrar una advertencia"""
+        if codigo in self.codigos_inactivos:
+            return
+        self.diagnosticos.agregar(ADVERTENCIA, codigo, args, linea, columna)
 
     def nuevo_ambito(self):
         """Crear un nuevo ámbito (scope)"""
@@ -77,27 +224,29 @@ class AnalizadorSemantico:
         """Cerrar el ámbito actual"""
         if len(self.ambitos) > 1:
             # Verificar variables no utilizadas en el ámbito que se cierra
-            ambito_actual = self.ambitos[-1]
+            ambito_actual = self.ambitos[-1] if self.activa("no_utilizadas") else {}
             for simbolo in ambito_actual.values():
                 if not simbolo.usado and simbolo.tipo != "funcion":
                     self.advertencia(
-                        f"Variable '{simbolo.nombre}' declarada pero no utilizada",
-                        simbolo.linea,
+                        "variable_no_utilizada", simbolo.nombre, linea=simbolo.linea
                     )
+            if not self.nombres_consultados.isdisjoint(self.ambitos[-1]):
+                self.version_ambito += 1
             self.ambitos.pop()
 
     def buscar_simbolo(self, nombre: str) -> Optional[Simbolo]:
         """Buscar un símbolo en todos los ámbitos, desde el más interno al más externo"""
+        self.nombres_consultados.add(nombre)
         for ambito in reversed(self.ambitos):
             if nombre in ambito:
                 simbolo = ambito[nombre]
                 if not simbolo.declarado:
-                    self.error(f"Variable '{nombre}' usada antes de ser declarada")
+                    self.error("uso_antes_de_declaracion", nombre)
                 return simbolo
         return None
 
-    def declarar_simbolo(self, simbolo: Simbolo) -> bool:
-        """Declarar un símbolo en el ámbito actual"""
+    def declarar_simbolo(self, simbolo: Simbolo, nodo=None) -> bool:
+        """Declarar un símbolo en el ámbito actual; `nodo` es el que lo declara"""
         ambito_actual = self.ambitos[-1]
 
         # Verificar si ya existe en el ámbito actual
@@ -107,20 +256,33 @@ class AnalizadorSemantico:
         # Marcar como declarado y agregarlo al ámbito actual
         simbolo.declarado = True
         ambito_actual[simbolo.nombre] = simbolo
+        # Un nombre ya consultado puede resolverse ahora a otro símbolo
+        if simbolo.nombre in self.nombres_consultados:
+            self.version_ambito += 1
         # También agregarlo a la tabla global para el reporte final
         self.tabla_simbolos[simbolo.nombre] = simbolo
+        if nodo is not None:
+            self.resoluciones[id(nodo)] = simbolo
+        self.referencias.registrar_definicion(simbolo, simbolo.linea, simbolo.columna)
         return True
 
+    def registrar_uso(self, simbolo: Simbolo, nodo):
+        """Registrar en el índice de referencias un uso del símbolo"""
+        self.resoluciones[id(nodo)] = simbolo
+        self.referencias.registrar_uso(
+            simbolo, getattr(nodo, "linea", None), getattr(nodo, "columna", None)
+        )
+
     def inferir_tipo(self, valor: Any) -> str:
         """Inferir el tipo de un valor"""
-        if isinstance(valor, int):
+        if isinstance(valor, bool):
+            return "booleano"
+        elif isinstance(valor, int):
             return "entero"
         elif isinstance(valor, float):
             return "flotante"
         elif isinstance(valor, str):
             return "cadena"
-        elif isinstance(valor, bool):
-            return "booleano"
         elif isinstance(valor, list):
             # Inferir tipo de elementos del arreglo si es posible
             if len(valor) > 0:
@@ -172,20 +334,31 @@ class AnalizadorSemantico:
         if nodo is None:
             return "nulo", None
 
-        # Manejar literales
+        # Manejar literales (bool antes que int: True es instancia de int)
         if isinstance(nodo, str):
             return "cadena", nodo
+        if isinstance(nodo, bool):
+            return "booleano", nodo
         if isinstance(nodo, int):
             return "entero", nodo
         if isinstance(nodo, float):
             return "flotante", nodo
-        if isinstance(nodo, bool):
-            return "booleano", nodo
 
         # Nodos del AST
         if hasattr(nodo, "__class__"):
             clase = nodo.__class__.__name__
 
+            if not self.inferir_tipos and clase in EXPRESIONES_CON_TIPOS:
+                return self.resolver_nombres(nodo, clase)
+
+            if self.memoizar and clase in EXPRESIONES_MEMOIZABLES:
+                entrada = self.memo.get(id(nodo))
+                if entrada is not None and entrada[0] == self.version_ambito:
+                    return entrada[1]
+                resultado = self.evaluar_nodo_expresion(nodo, clase)
+                self.memo[id(nodo)] = (self.version_ambito, resultado)
+                return resultado
+
             if clase == "ExpresionBinaria":
                 return self.evaluar_expresion_binaria(nodo)
             elif clase == "ExpresionUnaria":
@@ -206,29 +379,58 @@ class AnalizadorSemantico:
                 simbolo.usado = True
                 return simbolo.tipo, simbolo.valor
             else:
-                self.error(f"Variable '{nodo}' no declarada")
+                self.error("variable_no_declarada", nodo)
                 return "desconocido", None
 
         return "desconocido", None
 
+    def evaluar_nodo_expresion(self, nodo, clase: str) -> tuple[str, Any]:
+        """Evaluar un nodo de expresión memoizable sin consultar el memo"""
+        if clase == "ExpresionBinaria":
+            return self.evaluar_expresion_binaria(nodo)
+        if clase == "ExpresionUnaria":
+            return self.evaluar_expresion_unaria(nodo)
+        if clase == "AccesoArreglo":
+            return self.evaluar_acceso_arreglo(nodo)
+        return self.evaluar_acceso_tabla(nodo)
+
+    def resolver_nombres(self, nodo, clase: str) -> tuple[str, Any]:
+        """Resolver los nombres de una expresión sin inferir su tipo (nivel rápido)"""
+        if clase == "ExpresionBinaria":
+            self.evaluar_expresion(nodo.izq)
+            self.evaluar_expresion(nodo.der)
+        elif clase == "ExpresionUnaria":
+            self.evaluar_expresion(nodo.expr)
+        else:
+            arreglo = clase == "AccesoArreglo"
+            simbolo = self.buscar_simbolo(nodo.nombre)
+            if simbolo:
+                simbolo.usado = True
+                self.registrar_uso(simbolo, nodo)
+            else:
+                self.error("arreglo_no_declarado" if arreglo else "tabla_no_declarada", nodo.nombre, linea=nodo.linea)
+            if arreglo:
+                self.evaluar_expresion(nodo.indice)
+        return "desconocido", None
+
     def evaluar_identificador(self, nodo) -> tuple[str, Any]:
         """Evaluar un identificador (variable)"""
         nombre = nodo.nombre
         simbolo = self.buscar_simbolo(nombre)
-        print(
-            f"evaluar_identificador: Nombre = {nombre}, Simbolo = {simbolo}"
-        )  # Debug log
+        if trazas_lynx.nivel <= DEPURACION:
+            trazas_lynx.evento(
+                DEPURACION, lambda: f"evaluar_identificador: {nombre}, símbolo {simbolo and simbolo.to_dict()}"
+            )
 
         if simbolo:
             if not simbolo.declarado:
-                self.error(
-                    f"Variable '{nombre}' usada antes de ser declarada", nodo.linea
-                )
+                self.error("uso_antes_de_declaracion", nombre, linea=nodo.linea)
                 return "desconocido", None
             simbolo.usado = True
+            self.registrar_uso(simbolo, nodo)
             return simbolo.tipo, simbolo.valor
         else:
-            self.error(f"Variable '{nombre}' no declarada", nodo.linea)
+            self.error("variable_no_declarada", nombre, linea=nodo.linea)
             return "desconocido", None
 
     def evaluar_llamada_funcion(self, nodo):
@@ -239,23 +441,27 @@ class AnalizadorSemantico:
         simbolo = self.buscar_simbolo(nombre_funcion)
         if not simbolo:
             self.error(
-                f"Función '{nombre_funcion}' no declarada", getattr(nodo, "linea", None)
-            )
-            return "desconocido", None
-
-        if simbolo.tipo != "funcion":
-            self.error(
-                f"'{nombre_funcion}' no es una función", getattr(nodo, "linea", None)
+                "funcion_no_declarada", nombre_funcion, linea=getattr(nodo, "linea", None)
             )
             return "desconocido", None
 
         simbolo.usado = True
+        self.registrar_uso(simbolo, nodo)
 
         # Evaluar argumentos
         if hasattr(nodo, "argumentos"):
             for arg in nodo.argumentos:
                 self.evaluar_expresion(arg)
 
+        if simbolo.tipo == "desconocido":
+            # Un parámetro puede recibir una función
+            return "desconocido", None
+        if simbolo.tipo != "funcion":
+            self.error(
+                "no_es_funcion", nombre_funcion, linea=getattr(nodo, "linea", None)
+            )
+            return "desconocido", None
+
         return simbolo.tipo_retorno or "nulo", None
 
     def evaluar_expresion_binaria(self, nodo) -> tuple[str, Any]:
@@ -263,12 +469,16 @@ class AnalizadorSemantico:
         tipo_izq, val_izq = self.evaluar_expresion(nodo.izq)
         tipo_der, val_der = self.evaluar_expresion(nodo.der)
         operador = nodo.op
+        # Un operando de tipo desconocido (p. ej. un parámetro) no se puede verificar
+        hay_desconocido = "desconocido" in (tipo_izq, tipo_der)
 
         # Para operador +
         if operador == "+":
             # Si alguno es cadena, el resultado es cadena
             if tipo_izq == "cadena" or tipo_der == "cadena":
                 return "cadena", None
+            if hay_desconocido:
+                return "desconocido", None
             # Si ambos son números
             if tipo_izq in ["entero", "flotante"] and tipo_der in [
                 "entero",
@@ -278,20 +488,18 @@ class AnalizadorSemantico:
                     return "flotante", None
                 return "entero", None
             # Si no es ninguno de los casos anteriores
-            self.error(
-                f"Tipos incompatibles para suma: {tipo_izq} + {tipo_der}", nodo.linea
-            )
+            self.error("suma_incompatible", tipo_izq, tipo_der, linea=nodo.linea)
             return "desconocido", None
 
         # Para otros operadores aritméticos
         if operador in ["-", "*", "/", "%"]:
+            if hay_desconocido:
+                return "desconocido", None
             if not (
                 tipo_izq in ["entero", "flotante"]
                 and tipo_der in ["entero", "flotante"]
             ):
-                self.error(
-                    f"Operador '{operador}' requiere operandos numéricos", nodo.linea
-                )
+                self.error("operandos_no_numericos", operador, linea=nodo.linea)
                 return "desconocido", None
             if tipo_izq == "flotante" or tipo_der == "flotante":
                 return "flotante", None
@@ -304,13 +512,13 @@ class AnalizadorSemantico:
 
         # Para operadores lógicos
         if operador in ["y", "o"]:
-            if tipo_izq != "booleano":
+            if tipo_izq not in ("booleano", "desconocido"):
                 self.error(
-                    f"Operando izquierdo de '{operador}' debe ser booleano", nodo.linea
+                    "operando_izquierdo_no_booleano", operador, linea=nodo.linea
                 )
-            if tipo_der != "booleano":
+            if tipo_der not in ("booleano", "desconocido"):
                 self.error(
-                    f"Operando derecho de '{operador}' debe ser booleano", nodo.linea
+                    "operando_derecho_no_booleano", operador, linea=nodo.linea
                 )
             return "booleano", None
 
@@ -326,8 +534,8 @@ class AnalizadorSemantico:
             # Eliminamos la verificación de tipos
             return tipo_expr, None
         elif operador == "no":
-            if tipo_expr != "booleano":
-                self.error(f"Operador 'no' requiere operando booleano", linea)
+            if tipo_expr not in ("booleano", "desconocido"):
+                self.error("negacion_no_booleana", linea=linea)
                 return "desconocido", None
             return "booleano", None
 
@@ -340,20 +548,36 @@ class AnalizadorSemantico:
         linea = getattr(nodo, "linea", None)
 
         if not simbolo:
-            self.error(f"Arreglo '{nombre}' no declarado", linea)
-            return "desconocido", None
-
-        if not simbolo.tipo.startswith("arreglo") and simbolo.tipo != "arreglo":
-            self.error(f"'{nombre}' no es un arreglo", linea)
+            self.error("arreglo_no_declarado", nombre, linea=linea)
+            self.evaluar_expresion(nodo.indice)
             return "desconocido", None
 
         simbolo.usado = True
+        self.registrar_uso(simbolo, nodo)
         tipo_indice, valor_indice = self.evaluar_expresion(nodo.indice)
 
-        if tipo_indice != "entero":
-            self.error(f"El índice de arreglo debe ser entero", linea)
+        # El parser solo distingue tablas por claves literales: t[clave]
+        # con una variable llega como acceso a arreglo
+        if simbolo.tipo == "tabla":
+            if tipo_indice not in ("cadena", "desconocido"):
+                self.error("clave_no_cadena", linea=linea)
+            return "desconocido", None
+
+        if simbolo.tipo == "desconocido":
             return "desconocido", None
 
+        if not simbolo.tipo.startswith("arreglo") and simbolo.tipo != "arreglo":
+            self.error("no_es_arreglo", nombre, linea=linea)
+            return "desconocido", None
+
+        if tipo_indice not in ("entero", "desconocido"):
+            self.error("indice_no_entero", linea=linea)
+            return "desconocido", None
+
+        # El tipo de los elementos viene del tipo del arreglo: arreglo<entero>
+        if simbolo.tipo.startswith("arreglo<") and simbolo.tipo.endswith(">"):
+            return simbolo.tipo[len("arreglo<"):-1], None
+
         # Si el arreglo tiene elementos, intentamos inferir el tipo
         if simbolo.valor and len(simbolo.valor) > 0:
             tipo_elemento = self.inferir_tipo(simbolo.valor[0])
@@ -368,17 +592,19 @@ class AnalizadorSemantico:
         linea = getattr(nodo, "linea", None)
 
         if not simbolo:
-            self.error(f"Tabla '{nombre}' no declarada", linea)
+            self.error("tabla_no_declarada", nombre, linea=linea)
             return "desconocido", None
 
-        if simbolo.tipo != "tabla":
-            self.error(f"'{nombre}' no es una tabla", linea)
+        simbolo.usado = True
+        self.registrar_uso(simbolo, nodo)
+
+        if simbolo.tipo not in ("tabla", "desconocido"):
+            self.error("no_es_tabla", nombre, linea=linea)
             return "desconocido", None
 
-        simbolo.usado = True
         tipo_clave, _ = self.evaluar_expresion(nodo.clave)
         if tipo_clave != "cadena":
-            self.error(f"Clave de tabla debe ser cadena", linea)
+            self.error("clave_no_cadena", linea=linea)
 
         return "desconocido", None
 
@@ -386,6 +612,11 @@ class AnalizadorSemantico:
         if nodo is None or isinstance(nodo, (str, int, float, bool)):
             return
 
+        # Estructuras que el parser representa como tuplas etiquetadas
+        if isinstance(nodo, tuple) and nodo and nodo[0] in ("para_cada", "capturar"):
+            getattr(self, f"visitar_tupla_{nodo[0]}")(nodo)
+            return
+
         if isinstance(nodo, (list, tuple)):
             for item in nodo:
                 self.visitar_nodo(item)
@@ -404,6 +635,52 @@ class AnalizadorSemantico:
                 if attr_name != "linea":
                     self.visitar_nodo(attr_value)
 
+    def visitar_Identificador(self, nodo):
+        """Visitar un identificador usado como instrucción"""
+        self.evaluar_identificador(nodo)
+
+    def visitar_tupla_para_cada(self, nodo):
+        """Visitar estructura para-cada: ('para_cada', variable, coleccion, bloque)"""
+        _, variable, coleccion, bloque = nodo
+        tipo_coleccion, _ = self.evaluar_expresion(coleccion)
+
+        tipo_elemento = "desconocido"
+        if tipo_coleccion.startswith("arreglo<") and tipo_coleccion.endswith(">"):
+            tipo_elemento = tipo_coleccion[len("arreglo<"):-1]
+
+        self.bucles_anidados += 1
+        self.nuevo_ambito()
+        self.declarar_simbolo(
+            Simbolo(
+                nombre=variable.nombre,
+                tipo=tipo_elemento,
+                linea=variable.linea,
+                columna=variable.columna,
+                inicializado=True,
+            ),
+            variable,
+        )
+        self.visitar_nodo(bloque)
+        self.cerrar_ambito()
+        self.bucles_anidados -= 1
+
+    def visitar_tupla_capturar(self, nodo):
+        """Visitar bloque capturar: ('capturar', variable, bloque)"""
+        _, variable, bloque = nodo
+        self.nuevo_ambito()
+        self.declarar_simbolo(
+            Simbolo(
+                nombre=variable.nombre,
+                tipo="cadena",
+                linea=variable.linea,
+                columna=variable.columna,
+                inicializado=True,
+            ),
+            variable,
+        )
+        self.visitar_nodo(bloque)
+        self.cerrar_ambito()
+
     def visitar_Programa(self, nodo):
         """Visitar nodo Programa"""
         for instruccion in nodo.instrucciones:
@@ -420,53 +697,53 @@ class AnalizadorSemantico:
         simbolo = Simbolo(
             nombre=nodo.nombre,
             tipo=tipo_valor,
-            valor=valor,
+            valor=valor if self.activa("valores") else None,
             linea=nodo.linea,
+            columna=nodo.columna,
             es_constante=False,
             declarado=True,  # Marcamos como declarada
+            inicializado=nodo.valor is not None,
         )
 
-        if not self.declarar_simbolo(simbolo):
-            self.error(
-                f"Variable '{nodo.nombre}' ya declarada en este ámbito", nodo.linea
-            )
+        if not self.declarar_simbolo(simbolo, nodo):
+            self.error("variable_redeclarada", nodo.nombre, linea=nodo.linea)
 
     def visitar_AsignacionVariable(self, nodo):
         """Visitar asignación de variable"""
-        print(f"Visitando asignación de variable: {nodo.nombre}")  # Debug log
+        if trazas_lynx.nivel <= DEPURACION:
+            trazas_lynx.evento(DEPURACION, "Visitando asignación de variable: %s", nodo.nombre)
         simbolo = self.buscar_simbolo(nodo.nombre)
 
         if not simbolo:
-            self.error(f"Variable '{nodo.nombre}' no declarada", nodo.linea)
+            self.error("variable_no_declarada", nodo.nombre, linea=nodo.linea)
             return
 
         if not simbolo.declarado:
-            self.error(
-                f"Variable '{nodo.nombre}' usada antes de ser declarada", nodo.linea
-            )
+            self.error("uso_antes_de_declaracion", nodo.nombre, linea=nodo.linea)
             return
 
+        self.registrar_uso(simbolo, nodo)
         tipo_valor, valor = self.evaluar_expresion(nodo.valor)
         simbolo.tipo = tipo_valor
-        simbolo.valor = valor
+        if self.activa("valores"):
+            simbolo.valor = valor
         simbolo.inicializado = True
+        self.version_ambito += 1
 
     def visitar_DeclaracionArreglo(self, nodo):
         """Visitar declaración de arreglo"""
         elementos_tipos = []
-        elementos_evaluados = []
+        elementos_evaluados = [] if self.activa("valores") else None
 
         for elemento in nodo.elementos:
             tipo_elem, valor_elem = self.evaluar_expresion(elemento)
             elementos_tipos.append(tipo_elem)
-            elementos_evaluados.append(valor_elem)
+            if elementos_evaluados is not None:
+                elementos_evaluados.append(valor_elem)
 
         # Verificar que todos los elementos sean del mismo tipo
         if elementos_tipos and len(set(elementos_tipos)) > 1:
-            self.advertencia(
-                f"Arreglo '{nodo.nombre}' contiene elementos de tipos diferentes",
-                nodo.linea,
-            )
+            self.advertencia("arreglo_tipos_mixtos", nodo.nombre, linea=nodo.linea)
 
         # Determinar el tipo del arreglo
         if elementos_tipos:
@@ -480,42 +757,43 @@ class AnalizadorSemantico:
             tipo=tipo_arreglo,
             valor=elementos_evaluados,
             linea=nodo.linea,
+            columna=nodo.columna,
             es_constante=True,
         )
 
-        if not self.declarar_simbolo(simbolo):
-            self.error(
-                f"Arreglo '{nodo.nombre}' ya declarado en este ámbito", nodo.linea
-            )
+        if not self.declarar_simbolo(simbolo, nodo):
+            self.error("arreglo_redeclarado", nodo.nombre, linea=nodo.linea)
 
     def visitar_DeclaracionTabla(self, nodo):
         """Visitar declaración de tabla"""
-        tabla_valor = {}
+        tabla_valor = {} if self.activa("valores") else None
 
         for clave, valor in nodo.pares:
             tipo_clave = self.inferir_tipo(clave)
             if tipo_clave != "cadena":
-                self.error(f"Clave de tabla debe ser cadena", nodo.linea)
+                self.error("clave_no_cadena", linea=nodo.linea)
 
             tipo_valor, valor_evaluado = self.evaluar_expresion(valor)
-            tabla_valor[clave] = valor_evaluado
+            if tabla_valor is not None:
+                tabla_valor[clave] = valor_evaluado
 
         simbolo = Simbolo(
             nombre=nodo.nombre,
             tipo="tabla",
             valor=tabla_valor,
             linea=nodo.linea,
+            columna=nodo.columna,
             es_constante=True,
         )
 
-        if not self.declarar_simbolo(simbolo):
-            self.error(f"Tabla '{nodo.nombre}' ya declarada en este ámbito", nodo.linea)
+        if not self.declarar_simbolo(simbolo, nodo):
+            self.error("tabla_redeclarada", nodo.nombre, linea=nodo.linea)
 
     def visitar_EstructuraSi(self, nodo):
         """Visitar estructura si"""
         tipo_condicion, _ = self.evaluar_expresion(nodo.condicion)
-        if tipo_condicion != "booleano":
-            self.error(f"Condición de 'si' debe ser booleana", nodo.linea)
+        if tipo_condicion not in ("booleano", "desconocido"):
+            self.error("condicion_no_booleana", "si", linea=nodo.linea)
 
         self.nuevo_ambito()
         self.visitar_nodo(nodo.bloque)
@@ -527,8 +805,8 @@ class AnalizadorSemantico:
     def visitar_EstructuraMientras(self, nodo):
         """Visitar estructura mientras"""
         tipo_condicion, _ = self.evaluar_expresion(nodo.condicion)
-        if tipo_condicion != "booleano":
-            self.error(f"Condición de 'mientras' debe ser booleana", nodo.linea)
+        if tipo_condicion not in ("booleano", "desconocido"):
+            self.error("condicion_no_booleana", "mientras", linea=nodo.linea)
 
         self.bucles_anidados += 1
         self.nuevo_ambito()
@@ -546,8 +824,8 @@ class AnalizadorSemantico:
 
         # Verificar condición
         tipo_condicion, _ = self.evaluar_expresion(nodo.condicion)
-        if tipo_condicion != "booleano":
-            self.error(f"Condición de 'para' debe ser booleana", nodo.linea)
+        if tipo_condicion not in ("booleano", "desconocido"):
+            self.error("condicion_no_booleana", "para", linea=nodo.linea)
 
         # Verificar incremento
         self.evaluar_expresion(nodo.incremento)
@@ -566,8 +844,8 @@ class AnalizadorSemantico:
         self.cerrar_ambito()
 
         tipo_condicion, _ = self.evaluar_expresion(nodo.condicion)
-        if tipo_condicion != "booleano":
-            self.error(f"Condición de 'repetir-hasta' debe ser booleana", nodo.linea)
+        if tipo_condicion not in ("booleano", "desconocido"):
+            self.error("condicion_no_booleana", "repetir-hasta", linea=nodo.linea)
 
         self.bucles_anidados -= 1
 
@@ -575,23 +853,24 @@ class AnalizadorSemantico:
         """Visitar declaración de función"""
         # Verificar que la función no esté ya declarada
         if nodo.nombre in self.funciones_declaradas:
-            self.error(f"Función '{nodo.nombre}' ya declarada", nodo.linea)
+            self.error("funcion_redeclarada", nodo.nombre, linea=nodo.linea)
             return
 
         simbolo = Simbolo(
             nombre=nodo.nombre,
             tipo="funcion",
-            parametros=nodo.parametros,
+            parametros=[param.nombre for param in nodo.parametros],
             tipo_retorno=(
                 "nulo"
                 if not hasattr(nodo, "retorno") or nodo.retorno is None
                 else "desconocido"
             ),
             linea=nodo.linea,
+            columna=nodo.columna,
         )
 
         self.funciones_declaradas[nodo.nombre] = simbolo
-        self.declarar_simbolo(simbolo)
+        self.declarar_simbolo(simbolo, nodo)
 
         # Analizar cuerpo de la función
         self.nuevo_ambito()
@@ -601,11 +880,13 @@ class AnalizadorSemantico:
         # Declarar parámetros en el ámbito de la función
         for param in nodo.parametros:
             param_simbolo = Simbolo(
-                nombre=param,
+                nombre=param.nombre,
                 tipo="desconocido",  # Tipo inferido en uso
-                linea=nodo.linea,
+                linea=param.linea,
+                columna=param.columna,
+                inicializado=True,
             )
-            self.declarar_simbolo(param_simbolo)
+            self.declarar_simbolo(param_simbolo, param)
 
         # Visitar bloque de la función
         self.visitar_nodo(nodo.bloque)
@@ -634,91 +915,107 @@ class AnalizadorSemantico:
 
     def visitar_AccesoArreglo(self, nodo):
         """Visitar acceso a arreglo"""
-        nombre = nodo.nombre if hasattr(nodo, "nombre") else str(nodo.arreglo)
-        simbolo = self.buscar_simbolo(nombre)
-        linea = getattr(nodo, "linea", None)
-
-        if not simbolo:
-            self.error(f"Arreglo '{nombre}' no declarado", linea)
-            return
-
-        if not simbolo.tipo.startswith("arreglo") and simbolo.tipo != "arreglo":
-            self.error(f"'{nombre}' no es un arreglo", linea)
-            return
-
-        simbolo.usado = True
-        tipo_indice, valor_indice = self.evaluar_expresion(nodo.indice)
-
-        if tipo_indice != "entero":
-            self.error(f"El índice de arreglo debe ser entero", linea)
-            return
+        self.evaluar_acceso_arreglo(nodo)
 
     def visitar_AccesoTabla(self, nodo):
         """Visitar acceso a tabla"""
-        nombre = nodo.nombre if hasattr(nodo, "nombre") else str(nodo.tabla)
-        simbolo = self.buscar_simbolo(nombre)
-        linea = getattr(nodo, "linea", None)
+        self.evaluar_acceso_tabla(nodo)
 
-        if not simbolo:
-            self.error(f"Tabla '{nombre}' no declarada", linea)
-            return
-
-        if simbolo.tipo != "tabla":
-            self.error(f"'{nombre}' no es una tabla", linea)
-            return
-
-        simbolo.usado = True
-        tipo_clave, _ = self.evaluar_expresion(nodo.clave)
-        if tipo_clave != "cadena":
-            self.error(f"Clave de tabla debe ser cadena", linea)
+    def visitar_LlamadaFuncion(self, nodo):
+        """Visitar llamada a función usada como instrucción"""
+        self.evaluar_llamada_funcion(nodo)
 
     def analizar(self, ast, codigo: str = "") -> ResultadoAnalisisSemantico:
         """Realizar análisis semántico completo"""
-        self.codigo_fuente = codigo
-        self.errores = []
-        self.advertencias = []
-        self.tabla_simbolos = {}
-        self.ambitos = [{}]
-        self.funciones_declaradas = {}
-
-        try:
-            self.visitar_nodo(ast)
-
-            # Verificaciones finales
-            self.verificaciones_finales()
-
-        except Exception as e:
-            self.error(f"Error interno en análisis semántico: {str(e)}")
-
-        # Convertir tabla de símbolos a formato serializable
-        tabla_serializable = {}
-        for nombre, simbolo in self.tabla_simbolos.items():
-            tabla_serializable[nombre] = simbolo.to_dict()
+        inicio = time.perf_counter()
+        tramo = trazas_lynx.tramo("semantico", nivel=self.nivel)
+        with tramo:
+            self.codigo_fuente = codigo
+            self.diagnosticos = ColectorDiagnosticos(self.max_errores, self.max_advertencias)
+            self.tabla_simbolos = {}
+            self.referencias = IndiceReferencias()
+            self.memo = {}
+            self.version_ambito = 0
+            self.nombres_consultados = set()
+            self.resoluciones = {}
+            self.ambitos = [{}]
+            self.funciones_declaradas = {}
+
+            try:
+                with trazas_lynx.tramo("visitar", DEPURACION):
+                    self.visitar_nodo(ast)
+                if self.activa("pureza"):
+                    with trazas_lynx.tramo("pureza", DEPURACION):
+                        marcar_funciones_puras(ast, self.resoluciones)
+
+                # Verificaciones finales
+                with trazas_lynx.tramo("verificaciones_finales", DEPURACION):
+                    self.verificaciones_finales()
+                with trazas_lynx.tramo("flujo", DEPURACION):
+                    self.verificar_flujo(ast)
+
+            except LimiteDiagnosticosAlcanzado:
+                # Presupuesto de errores agotado: se reporta lo acumulado
+                pass
+            except Exception as e:
+                try:
+                    self.error("error_interno", str(e))
+                except LimiteDiagnosticosAlcanzado:
+                    pass
+
+            self.referencias.finalizar()
+
+            # Convertir tabla de símbolos a formato serializable
+            tabla_serializable = {}
+            if self.activa("tabla_simbolos"):
+                for nombre, simbolo in self.tabla_simbolos.items():
+                    tabla_serializable[nombre] = simbolo.to_dict()
+
+            tramo.anotar(
+                errores=self.diagnosticos.cantidad(ERROR), advertencias=self.diagnosticos.cantidad(ADVERTENCIA)
+            )
 
+        metricas_lynx.errores.sumar("semantico", cantidad=self.diagnosticos.cantidad(ERROR))
+        metricas_lynx.semantico_segundos.observar(time.perf_counter() - inicio)
         return {
             "errores": self.errores,
             "advertencias": self.advertencias,
             "tabla_simbolos": tabla_serializable,
+            "truncado": self.diagnosticos.truncado,
         }
 
     def verificaciones_finales(self):
         """Realizar verificaciones finales"""
+        if not self.activa("no_utilizadas"):
+            return
+
         # Verificar variables no utilizadas
         for simbolo in self.tabla_simbolos.values():
             if not simbolo.usado and simbolo.tipo != "funcion":
                 self.advertencia(
-                    f"Variable '{simbolo.nombre}' declarada pero no utilizada",
-                    simbolo.linea,
+                    "variable_no_utilizada", simbolo.nombre, linea=simbolo.linea
                 )
 
         # Verificar funciones declaradas pero no utilizadas
         for simbolo in self.funciones_declaradas.values():
             if not simbolo.usado:
                 self.advertencia(
-                    f"Función '{simbolo.nombre}' declarada pero no utilizada",
-                    simbolo.linea,
+                    "funcion_no_utilizada", simbolo.nombre, linea=simbolo.linea
                 )
 
+    def verificar_flujo(self, ast):
+        """Análisis sobre el grafo de flujo de control del programa"""
+        if ast is None or not self.activa("flujo"):
+            return
+        resultado = analizar_flujo(construir_cfg(ast))
+
+        for linea in resultado.inalcanzables:
+            self.advertencia("codigo_inalcanzable", linea=linea)
+        for nombre, linea in resultado.no_inicializadas:
+            self.advertencia("posible_no_inicializada", nombre, linea=linea)
+        for nombre, linea in resultado.almacenes_muertos:
+            self.advertencia("asignacion_muerta", nombre, linea=linea)
+
 
 # Funciones de utilidad para integración
 def crear_analizador_semantico():
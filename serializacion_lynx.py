@@ -0,0 +1,290 @@
+"""Respuestas del análisis escritas como JSON sin pasar por pydantic
+
+`a_json` produce los mismos bytes que JSONResponse (UTF-8 sin escapar, sin
+espacios, claves en orden). Los tokens y el AST, que son casi toda una
+respuesta grande, se escriben directamente desde los tokens de PLY y los
+nodos con `tokens_json` y `ast_json` (`ast_compacto_json` en la versión 2),
+sin construir los diccionarios intermedios: quedan como `Crudo` y `a_json`
+los copia tal cual. El resto de la respuesta se escribe con orjson si está
+instalado, o con json.
+"""
+import json
+from json.encoder import encode_basestring
+from typing import Any, Dict, List, Optional
+
+try:
+    import orjson
+except ImportError:  # orjson es opcional: sin él se usa json
+    orjson = None
+
+_codificador = json.JSONEncoder(ensure_ascii=False, allow_nan=False, separators=(",", ":"))
+
+_PRIMITIVOS = (str, int, float, bool)
+
+
+class Crudo(str):
+    """Texto JSON ya escrito; `a_json` lo copia tal cual en el primer nivel"""
+
+
+def ast_to_dict(node) -> Optional[Dict[str, Any]]:
+    if node is None:
+        return None
+    if isinstance(node, (str, int, float, bool)):
+        return {"valor": node, "tipo_primitivo": type(node).__name__}
+    if isinstance(node, list):
+        return {"tipo": "lista", "elementos": [ast_to_dict(item) for item in node]}
+    if isinstance(node, tuple):
+        return {"tipo": "tupla", "elementos": [ast_to_dict(item) for item in node]}
+    if hasattr(node, '__dict__'):
+        result = {'tipo': node.__class__.__name__, 'linea': node.linea}
+        if getattr(node, 'columna', None) is not None:
+            result['columna'] = node.columna
+        for key, value in node.__dict__.items():
+            if key in ('linea', 'columna'):
+                continue
+            if isinstance(value, (str, int, float, bool)):
+                result[key] = {"valor": value, "tipo_primitivo": type(value).__name__}
+            elif isinstance(value, (list, tuple)):
+                result[key] = ast_to_dict(value)
+            elif hasattr(value, '__dict__'):
+                result[key] = ast_to_dict(value)
+            elif value is None:
+                result[key] = None
+            else:
+                result[key] = {"valor": str(value), "tipo_primitivo": "string"}
+        return result
+    return {"valor": str(node), "tipo_primitivo": "string"}
+
+
+def _escalar(valor) -> str:
+    tipo = type(valor)
+    if tipo is str:
+        return encode_basestring(valor)
+    if tipo is int:
+        return int.__repr__(valor)
+    if valor is None:
+        return "null"
+    return _codificador.encode(valor)
+
+
+def _escribir_ast(nodo, partes: List[str]):
+    """Lo mismo que json de ast_to_dict(nodo), agregado a `partes`"""
+    if nodo is None:
+        partes.append("null")
+    elif isinstance(nodo, _PRIMITIVOS):
+        partes.append('{"valor":%s,"tipo_primitivo":"%s"}' % (_escalar(nodo), type(nodo).__name__))
+    elif isinstance(nodo, (list, tuple)):
+        partes.append('{"tipo":"lista","elementos":[' if isinstance(nodo, list) else '{"tipo":"tupla","elementos":[')
+        for indice, item in enumerate(nodo):
+            if indice:
+                partes.append(",")
+            _escribir_ast(item, partes)
+        partes.append("]}")
+    elif hasattr(nodo, "__dict__"):
+        partes.append('{"tipo":"%s","linea":%s' % (nodo.__class__.__name__, _escalar(nodo.linea)))
+        columna = getattr(nodo, "columna", None)
+        if columna is not None:
+            partes.append(',"columna":%s' % _escalar(columna))
+        for clave, valor in nodo.__dict__.items():
+            if clave == "linea" or clave == "columna":
+                continue
+            # Los demás casos de ast_to_dict coinciden con convertir el valor solo
+            partes.append(',"%s":' % clave)
+            _escribir_ast(valor, partes)
+        partes.append("}")
+    else:
+        partes.append('{"valor":%s,"tipo_primitivo":"string"}' % encode_basestring(str(nodo)))
+
+
+def ast_json(nodo) -> Crudo:
+    """json.dumps(ast_to_dict(nodo)) sin construir los diccionarios"""
+    partes: List[str] = []
+    _escribir_ast(nodo, partes)
+    return Crudo("".join(partes))
+
+
+def tokens_json(entrada: str, tokens_ply) -> Crudo:
+    """json.dumps(tokens_a_dicts(entrada, tokens_ply)) sin construir los diccionarios"""
+    buscar_salto = entrada.rfind
+    return Crudo("[" + ",".join([
+        '{"lexema":%s,"tipo":"%s","linea":%d,"columna":%d}' % (
+            encode_basestring(str(token.value)),
+            token.type,
+            token.lineno,
+            # Igual que obtener_columna, sin copiar la línea
+            token.lexpos - buscar_salto('\n', 0, token.lexpos) - 1,
+        )
+        for token in tokens_ply
+    ]) + "]")
+
+
+def _valor_json(valor: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(valor, option=orjson.OPT_NON_STR_KEYS)
+    return _codificador.encode(valor).encode("utf-8")
+
+
+def a_json(valor: Any) -> bytes:
+    """Bytes JSON de una respuesta; los valores Crudo del primer nivel van tal cual"""
+    if type(valor) is not dict:
+        return _valor_json(valor)
+    return b"{" + b",".join([
+        encode_basestring(clave).encode("utf-8") + b":"
+        + (contenido.encode("utf-8") if type(contenido) is Crudo else _valor_json(contenido))
+        for clave, contenido in valor.items()
+    ]) + b"}"
+
+
+# AST compacto (versión 2): {"version": 2, "tipos", "campos", "cadenas", "raiz"}.
+# Un nodo es [tipo, linea, columna, *campos], con `tipos[tipo]` el nombre de
+# su clase y `campos[tipo]` los nombres de sus campos en orden. Las cadenas
+# son su índice en `cadenas`; null, true y false van tal cual. El resto son
+# arreglos cuyo primer elemento es una de estas etiquetas:
+VERSION_AST_COMPACTO = 2
+LISTA = -1  # [LISTA, *elementos]
+TUPLA = -2  # [TUPLA, *elementos]
+ENTERO = -3  # [ENTERO, n]
+FLOTANTE = -4  # [FLOTANTE, x]
+OTRO = -5  # [OTRO, cadena]: str() de un valor que no es primitivo ni nodo
+
+_CAMPOS_POSICION = ("linea", "columna")
+
+
+class _Compactador:
+    def __init__(self):
+        self.tipos: List[str] = []
+        self.campos: List[List[str]] = []
+        self.cadenas: List[str] = []
+        self._indices_tipos: Dict[Any, int] = {}
+        self._indices_cadenas: Dict[str, int] = {}
+
+    def cadena(self, texto: str) -> int:
+        indice = self._indices_cadenas.get(texto)
+        if indice is None:
+            indice = self._indices_cadenas[texto] = len(self.cadenas)
+            self.cadenas.append(texto)
+        return indice
+
+    def tipo(self, clase, atributos: Dict[str, Any]) -> int:
+        forma = (clase, tuple(atributos))
+        indice = self._indices_tipos.get(forma)
+        if indice is None:
+            indice = self._indices_tipos[forma] = len(self.tipos)
+            self.tipos.append(clase.__name__)
+            self.campos.append([campo for campo in atributos if campo not in _CAMPOS_POSICION])
+        return indice
+
+    def valor(self, valor) -> Any:
+        tipo = type(valor)
+        if tipo is str:
+            return self.cadena(valor)
+        if valor is None or tipo is bool:
+            return valor
+        if tipo is int:
+            return [ENTERO, valor]
+        if tipo is float:
+            return [FLOTANTE, valor]
+        if isinstance(valor, list):
+            return [LISTA] + [self.valor(elemento) for elemento in valor]
+        if isinstance(valor, tuple):
+            return [TUPLA] + [self.valor(elemento) for elemento in valor]
+        if isinstance(valor, str):
+            return self.cadena(valor)
+        if hasattr(valor, "__dict__"):
+            atributos = valor.__dict__
+            indice = self.tipo(tipo, atributos)
+            return [indice, valor.linea, getattr(valor, "columna", None)] + [
+                self.valor(contenido) for campo, contenido in atributos.items() if campo not in _CAMPOS_POSICION
+            ]
+        return [OTRO, self.cadena(str(valor))]
+
+    def escribir(self, valor, partes: List[str]):
+        """Lo mismo que json de self.valor(valor), agregado a `partes`"""
+        tipo = type(valor)
+        if tipo is str:
+            partes.append(str(self.cadena(valor)))
+        elif valor is None or tipo is bool:
+            partes.append(_escalar(valor))
+        elif tipo is int or tipo is float:
+            partes.append("[%d,%s]" % (ENTERO if tipo is int else FLOTANTE, _escalar(valor)))
+        elif isinstance(valor, (list, tuple)):
+            partes.append("[%d" % (LISTA if isinstance(valor, list) else TUPLA))
+            for elemento in valor:
+                partes.append(",")
+                self.escribir(elemento, partes)
+            partes.append("]")
+        elif isinstance(valor, str):
+            partes.append(str(self.cadena(valor)))
+        elif hasattr(valor, "__dict__"):
+            atributos = valor.__dict__
+            indice = self.tipo(tipo, atributos)
+            partes.append("[%d,%s,%s" % (indice, _escalar(valor.linea), _escalar(getattr(valor, "columna", None))))
+            for campo in self.campos[indice]:
+                partes.append(",")
+                self.escribir(atributos[campo], partes)
+            partes.append("]")
+        else:
+            partes.append("[%d,%d]" % (OTRO, self.cadena(str(valor))))
+
+
+def ast_compacto(nodo) -> Dict[str, Any]:
+    """AST en el formato compacto: sin envolver cada primitivo ni repetir nombres de campo"""
+    compactador = _Compactador()
+    raiz = compactador.valor(nodo)
+    return {
+        "version": VERSION_AST_COMPACTO,
+        "tipos": compactador.tipos,
+        "campos": compactador.campos,
+        "cadenas": compactador.cadenas,
+        "raiz": raiz,
+    }
+
+
+def ast_compacto_json(nodo) -> Crudo:
+    """json de ast_compacto(nodo) sin construir las listas de cada nodo
+
+    En árboles grandes esas listas cuestan más que el texto: el recolector de
+    basura las recorre una y otra vez mientras se construyen.
+    """
+    compactador = _Compactador()
+    partes: List[str] = []
+    compactador.escribir(nodo, partes)
+    return Crudo('{"version":%d,"tipos":%s,"campos":%s,"cadenas":%s,"raiz":%s}' % (
+        VERSION_AST_COMPACTO,
+        _codificador.encode(compactador.tipos),
+        _codificador.encode(compactador.campos),
+        _codificador.encode(compactador.cadenas),
+        "".join(partes),
+    ))
+
+
+def ast_desde_compacto(compacto: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """El AST compacto de vuelta en la forma de ast_to_dict (la del decodificador del editor)"""
+    tipos, campos, cadenas = compacto["tipos"], compacto["campos"], compacto["cadenas"]
+
+    def valor(contenido):
+        if contenido is None:
+            return None
+        if contenido is True or contenido is False:
+            return {"valor": contenido, "tipo_primitivo": "bool"}
+        if type(contenido) is int:
+            return {"valor": cadenas[contenido], "tipo_primitivo": "str"}
+        etiqueta = contenido[0]
+        if etiqueta == LISTA:
+            return {"tipo": "lista", "elementos": [valor(elemento) for elemento in contenido[1:]]}
+        if etiqueta == TUPLA:
+            return {"tipo": "tupla", "elementos": [valor(elemento) for elemento in contenido[1:]]}
+        if etiqueta == ENTERO:
+            return {"valor": contenido[1], "tipo_primitivo": "int"}
+        if etiqueta == FLOTANTE:
+            return {"valor": contenido[1], "tipo_primitivo": "float"}
+        if etiqueta == OTRO:
+            return {"valor": cadenas[contenido[1]], "tipo_primitivo": "string"}
+        resultado = {"tipo": tipos[etiqueta], "linea": contenido[1]}
+        if contenido[2] is not None:
+            resultado["columna"] = contenido[2]
+        for campo, elemento in zip(campos[etiqueta], contenido[3:]):
+            resultado[campo] = valor(elemento)
+        return resultado
+
+    return valor(compacto["raiz"])
@@ -0,0 +1,573 @@
+"""Análisis de código Lynx fuera del bucle de eventos
+
+Las funciones `analisis_*` hacen el trabajo de cada endpoint de main.py y
+devuelven diccionarios con la forma de su respuesta, así que pueden correr en
+un hilo o en otro proceso; `como_json` además los deja escritos como JSON.
+Con `para_json=True`, tokens y AST vienen en la forma que serializacion_lynx
+escribe más rápido; con `version_ast=2`, el AST viene en el formato compacto. Cada una tokeniza el código una sola vez y le pasa los
+tokens al parser.
+`EjecutorAnalisis` las despacha a un grupo de hilos o de procesos con el
+lexer y el parser ya construidos en cada trabajador, y limita cuántas pueden
+esperar en cola: pasado el límite rechaza con ColaLlena en vez de acumular
+trabajo.
+
+Un análisis pedido con `sesion` reemplaza al anterior de la misma sesión,
+que termina con AnalisisCancelado; si nadie más lo espera, su trabajador lo
+abandona en el próximo límite de fase (comprobar_cancelacion). Los pedidos
+con la misma `clave` mientras uno está en vuelo comparten ese cálculo.
+
+Todas tokenizan con admision_lynx.tokenizar_admitido y revisan la
+profundidad del AST antes de seguir: un código fuera de los límites termina
+con LimiteExcedido.
+
+Con procesos, cada trabajador tiene su propia caché de índices de
+referencias; con hilos la comparten.
+"""
+import asyncio
+import functools
+import multiprocessing
+import threading
+import time
+import traceback
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, List, Optional, Set, Tuple
+
+import admision_lynx
+import metricas_lynx
+import trazas_lynx
+from admision_lynx import LimiteExcedido, tokenizar_admitido, verificar_ast
+from lexer_lynx import crear_lexer, tokens_a_dicts
+from parser_lynx import analizar_sintactico, crear_parser
+from referencias_lynx import CacheIndices, IndiceReferencias
+from semantic_lynx import AnalizadorSemantico
+from serializacion_lynx import a_json, ast_compacto, ast_compacto_json, ast_json, ast_to_dict, tokens_json
+from trazas_lynx import DEPURACION, ERROR, INFO
+
+# Modos del ejecutor; `directo` corre en el bucle de eventos (para depurar y comparar)
+HILOS = "hilos"
+PROCESOS = "procesos"
+DIRECTO = "directo"
+
+CODIGO_VACIO = "El código no puede estar vacío"
+
+# Secciones que se pueden pedir a analisis_unificado
+SECCIONES = ("tokens", "ast", "errores", "tabla_simbolos", "advertencias")
+
+# Fase (0 léxico, 1 sintáctico, 2 semántico) que hace falta para cada sección
+FASE_SECCION = {"tokens": 0, "ast": 1, "errores": 2, "tabla_simbolos": 2, "advertencias": 2}
+FASES = ("lexico", "sintactico", "semantico")
+
+# Verificaciones que solo alimentan una sección: sin la sección no se corren
+VERIFICACIONES_SECCION = {
+    "advertencias": ("no_utilizadas", "arreglos_mixtos", "flujo"),
+    "tabla_simbolos": ("tabla_simbolos", "valores", "pureza"),
+}
+
+# Índices de referencias de los últimos códigos analizados, del proceso del
+# servidor: los hilos del ejecutor la comparten, los procesos no
+cache_indices = CacheIndices(capacidad=64)
+
+# Marcas de cancelación del ejecutor (una por análisis en vuelo) en un
+# trabajador de procesos, y la del análisis que corre en cada hilo
+_marcas = None
+_analisis_actual = threading.local()
+
+
+class AnalisisCancelado(Exception):
+    """Un análisis más reciente de la misma sesión reemplazó a este"""
+
+
+def comprobar_cancelacion():
+    """Límite de fase: abandonar el análisis en curso si lo cancelaron"""
+    marca = getattr(_analisis_actual, "marca", None)
+    if marca is not None and _analisis_actual.marcas[marca]:
+        raise AnalisisCancelado()
+
+
+def _nombre_analisis(funcion: Callable, argumentos: tuple) -> str:
+    """La función de análisis detrás de como_json y functools.partial"""
+    if isinstance(funcion, functools.partial):
+        return _nombre_analisis(funcion.func, funcion.args + argumentos)
+    if funcion is como_json and argumentos:
+        return _nombre_analisis(argumentos[0], argumentos[1:])
+    return getattr(funcion, "__name__", repr(funcion))
+
+
+def _ejecutar_con_marca(marcas, marca: int, padre, funcion: Callable, *argumentos) -> Any:
+    # Con hilos llegan las marcas del ejecutor; en un proceso, las del arranque
+    _analisis_actual.marcas = _marcas if marcas is None else marcas
+    _analisis_actual.marca = marca
+    try:
+        comprobar_cancelacion()
+        if trazas_lynx.nivel > INFO:
+            return funcion(*argumentos)
+        # `padre` es el tramo del pedido que despachó el análisis
+        with trazas_lynx.continuar(padre):
+            with trazas_lynx.tramo("analisis", funcion=_nombre_analisis(funcion, argumentos)):
+                return funcion(*argumentos)
+    finally:
+        _analisis_actual.marca = None
+
+
+def como_json(funcion: Callable, *argumentos, **opciones) -> bytes:
+    """Resultado de `funcion` ya escrito como JSON, igual que lo haría JSONResponse
+
+    Convertir una respuesta de miles de tokens cuesta más que analizarla: así
+    también esa parte se hace en el trabajador y no en el bucle de eventos.
+    """
+    resultado = funcion(*argumentos, **opciones)
+    comprobar_cancelacion()
+    inicio = time.perf_counter()
+    with trazas_lynx.tramo("json", DEPURACION) as tramo:
+        escrito = a_json(resultado)
+        tramo.anotar(bytes=len(escrito))
+    metricas_lynx.serializacion_segundos.observar(time.perf_counter() - inicio, "json")
+    return escrito
+
+
+def _tokens(codigo: str, tokens_ply, para_json: bool):
+    inicio = time.perf_counter()
+    convertidos = tokens_json(codigo, tokens_ply) if para_json else tokens_a_dicts(codigo, tokens_ply)
+    metricas_lynx.serializacion_segundos.observar(time.perf_counter() - inicio, "tokens")
+    return convertidos
+
+
+def _ast(ast, para_json: bool, version_ast: int = 1):
+    inicio = time.perf_counter()
+    if version_ast == 2:
+        convertido = ast_compacto_json(ast) if para_json else ast_compacto(ast)
+    else:
+        convertido = ast_json(ast) if para_json else ast_to_dict(ast)
+    metricas_lynx.serializacion_segundos.observar(time.perf_counter() - inicio, "ast")
+    return convertido
+
+
+def precalentar():
+    """Construir el lexer y el parser del trabajador antes de la primera petición"""
+    crear_lexer()
+    crear_parser()
+
+
+def _iniciar_trabajador(marcas, limites, metricas, trazas):
+    global _marcas
+    _marcas = marcas
+    admision_lynx.fijar_limites(limites)
+    metricas_lynx.usar_memoria_compartida(*metricas)
+    trazas_lynx.configurar(*trazas)
+    precalentar()
+
+
+def analisis_completo(
+    codigo: str, nivel: str = "completo", para_json: bool = False, version_ast: int = 1
+) -> Dict[str, Any]:
+    """Tokens, errores y (en nivel `completo`) AST: la respuesta de /analizar"""
+    if not codigo.strip():
+        return {"tokens": [], "errores": [CODIGO_VACIO], "ast": None, "exito": False}
+
+    lexico, errores_lexicos = tokenizar_admitido(codigo)
+    comprobar_cancelacion()
+    tokens = _tokens(codigo, lexico[1], para_json)
+    errores_totales = errores_lexicos.copy()
+    ast_dict = None
+
+    if not errores_lexicos:
+        try:
+            ast, errores_sintacticos = analizar_sintactico(codigo, lexico=lexico)
+            errores_totales.extend(errores_sintacticos)
+            comprobar_cancelacion()
+            if ast is not None:
+                verificar_ast(ast)
+            if ast is not None and nivel == "completo":
+                ast_dict = _ast(ast, para_json, version_ast)
+        except (AnalisisCancelado, LimiteExcedido):
+            raise
+        except Exception as e:
+            errores_totales.append(f"Error en análisis sintáctico: {str(e)}")
+            trazas_lynx.evento(ERROR, lambda: f"Error sintáctico detallado: {traceback.format_exc()}")
+
+    return {"tokens": tokens, "errores": errores_totales, "ast": ast_dict, "exito": len(errores_totales) == 0}
+
+
+def analisis_lexico(codigo: str, para_json: bool = False) -> Dict[str, Any]:
+    if not codigo.strip():
+        return {"tokens": [], "errores": [CODIGO_VACIO], "exito": False}
+    (_, tokens_ply), errores = tokenizar_admitido(codigo)
+    return {"tokens": _tokens(codigo, tokens_ply, para_json), "errores": errores, "exito": len(errores) == 0}
+
+
+def analisis_sintactico(codigo: str, para_json: bool = False, version_ast: int = 1) -> Dict[str, Any]:
+    if not codigo.strip():
+        return {"ast": None, "errores": [CODIGO_VACIO], "exito": False}
+
+    lexico, errores_lexicos = tokenizar_admitido(codigo)
+    comprobar_cancelacion()
+    if errores_lexicos:
+        return {
+            "ast": None,
+            "errores": ["No se puede realizar análisis sintáctico: existen errores léxicos"] + errores_lexicos,
+            "exito": False,
+        }
+
+    ast, errores_sintacticos = analizar_sintactico(codigo, lexico=lexico)
+    comprobar_cancelacion()
+    if ast is not None:
+        verificar_ast(ast)
+    ast_dict = _ast(ast, para_json, version_ast) if ast is not None else None
+    return {"ast": ast_dict, "errores": errores_sintacticos, "exito": len(errores_sintacticos) == 0}
+
+
+def _fallo_semantico(errores) -> Dict[str, Any]:
+    return {"errores": errores, "exito": False, "tabla_simbolos": {}, "advertencias": []}
+
+
+def analisis_semantico(codigo: str, nivel: str = "completo") -> Dict[str, Any]:
+    try:
+        if not codigo.strip():
+            return _fallo_semantico([CODIGO_VACIO])
+
+        if trazas_lynx.nivel <= DEPURACION:
+            trazas_lynx.evento(DEPURACION, "Analizando código: %s", codigo)
+
+        # Análisis léxico y sintáctico
+        lexico, errores_lexicos = tokenizar_admitido(codigo)
+        comprobar_cancelacion()
+        if errores_lexicos:
+            return _fallo_semantico(
+                ["No se puede realizar análisis semántico: existen errores léxicos"] + errores_lexicos
+            )
+
+        ast, errores_sintacticos = analizar_sintactico(codigo, lexico=lexico)
+        if ast is not None:
+            verificar_ast(ast)
+        if trazas_lynx.nivel <= DEPURACION:
+            trazas_lynx.evento(DEPURACION, lambda: f"AST generado: {ast_to_dict(ast)}")
+
+        if errores_sintacticos:
+            return _fallo_semantico(
+                ["No se puede realizar análisis semántico: existen errores sintácticos"] + errores_sintacticos
+            )
+        comprobar_cancelacion()
+
+        # Análisis semántico
+        analizador = AnalizadorSemantico(nivel=nivel)
+        resultado = analizador.analizar(ast, codigo)
+        _guardar_indice(codigo, analizador.referencias)
+
+        if trazas_lynx.nivel <= DEPURACION:
+            trazas_lynx.evento(DEPURACION, "Resultado del análisis semántico: %s", resultado)
+
+        return {
+            "errores": resultado['errores'],
+            "exito": len(resultado['errores']) == 0,
+            "tabla_simbolos": resultado['tabla_simbolos'],
+            "advertencias": resultado['advertencias'],
+        }
+    except (AnalisisCancelado, LimiteExcedido):
+        raise
+    except Exception as e:
+        trazas_lynx.evento(ERROR, lambda: f"Error en análisis semántico: {traceback.format_exc()}")
+        return _fallo_semantico([f"Error interno: {str(e)}"])
+
+
+def analisis_unificado(
+    codigo: str,
+    secciones=SECCIONES,
+    nivel: str = "completo",
+    para_json: bool = False,
+    version_ast: int = 1,
+) -> Dict[str, Any]:
+    """Léxico, sintáctico y semántico en una sola pasada, solo hasta donde lo pidan `secciones`
+
+    Los tokens pasan al parser y el AST al analizador semántico sin repetir
+    trabajo; las secciones que no se piden ni se calculan ni se convierten.
+    `errores`, `exito` y `fases` vienen siempre y cubren las fases que
+    corrieron: pedir `errores` es pedir el análisis completo.
+    """
+    secciones = set(secciones)
+    hasta = max((FASE_SECCION[seccion] for seccion in secciones), default=0)
+    resultado: Dict[str, Any] = {"tokens": [], "ast": None, "tabla_simbolos": {}, "advertencias": []}
+    errores = []
+    fases = []
+
+    if not codigo.strip():
+        errores.append(CODIGO_VACIO)
+    else:
+        lexico, errores = tokenizar_admitido(codigo)
+        fases.append(FASES[0])
+        comprobar_cancelacion()
+        if "tokens" in secciones:
+            resultado["tokens"] = _tokens(codigo, lexico[1], para_json)
+
+        if hasta >= 1 and not errores:
+            ast, errores = analizar_sintactico(codigo, lexico=lexico)
+            fases.append(FASES[1])
+            comprobar_cancelacion()
+            if ast is not None:
+                verificar_ast(ast)
+            if "ast" in secciones and ast is not None:
+                resultado["ast"] = _ast(ast, para_json, version_ast)
+
+            if hasta >= 2 and not errores:
+                analizador = AnalizadorSemantico(nivel=nivel, deshabilitar=[
+                    verificacion
+                    for seccion, verificaciones in VERIFICACIONES_SECCION.items() if seccion not in secciones
+                    for verificacion in verificaciones
+                ])
+                semantico = analizador.analizar(ast, codigo)
+                _guardar_indice(codigo, analizador.referencias)
+                fases.append(FASES[2])
+                errores = semantico["errores"]
+                resultado["tabla_simbolos"] = semantico["tabla_simbolos"]
+                resultado["advertencias"] = semantico["advertencias"]
+
+    resultado["errores"] = errores
+    respuesta = {seccion: resultado[seccion] for seccion in SECCIONES if seccion in secciones or seccion == "errores"}
+    respuesta.update(exito=not errores, fases=fases)
+    return respuesta
+
+
+def indice_referencias(codigo: str) -> Optional[IndiceReferencias]:
+    """Índice de referencias del código, ya ordenado; None si el código no se analiza
+
+    Lo pide el proceso del servidor, que lo guarda en su cache_indices: la de
+    un trabajador de procesos no la ve ningún otro.
+    """
+    lexico, errores_lexicos = tokenizar_admitido(codigo)
+    if errores_lexicos:
+        return None
+    ast, errores_sintacticos = analizar_sintactico(codigo, lexico=lexico)
+    if errores_sintacticos:
+        return None
+    verificar_ast(ast)
+
+    analizador = AnalizadorSemantico()
+    analizador.analizar(ast, codigo)
+    analizador.referencias.finalizar()
+    return analizador.referencias
+
+
+def _guardar_indice(codigo: str, indice: IndiceReferencias):
+    # En un trabajador de procesos nadie consulta la caché
+    if _marcas is None:
+        cache_indices.guardar(codigo, indice)
+
+
+class ColaLlena(Exception):
+    """El ejecutor ya tiene `max_cola` análisis esperando trabajador"""
+
+    def __init__(self, pendientes: int, espera: float = 1.0):
+        super().__init__(f"Hay {pendientes} análisis pendientes; intente de nuevo más tarde")
+        self.pendientes = pendientes
+        # Segundos sugeridos antes de reintentar (Retry-After)
+        self.espera = espera
+
+
+class _Vuelo:
+    """Un análisis despachado y las esperas de quienes quieren su resultado"""
+
+    __slots__ = ("futuro", "marca", "clave", "esperas", "cancelado")
+
+    def __init__(self, futuro, marca: int, clave: Optional[Hashable]):
+        self.futuro = futuro
+        self.marca = marca
+        self.clave = clave
+        self.esperas: Set[asyncio.Future] = set()
+        self.cancelado = False
+
+
+class EjecutorAnalisis:
+    """Grupo de hilos o procesos para las funciones de análisis
+
+    `pendientes` cuenta los análisis despachados cuyo trabajador no terminó,
+    aunque ya nadie espere su resultado; solo lo toca el bucle de eventos, así
+    que no necesita candado. Con más de `trabajadores + max_cola` pendientes,
+    `ejecutar` lanza ColaLlena. Cada pendiente tiene su marca de cancelación.
+
+    `espera_estimada` sale del ritmo al que terminan los análisis mientras
+    hay cola, que es lo que tarda la cola en avanzar un lugar.
+    """
+
+    def __init__(self, modo: str = HILOS, trabajadores: int = 2, max_cola: int = 64):
+        if modo not in (HILOS, PROCESOS, DIRECTO):
+            raise ValueError(f"Modo de ejecución desconocido: {modo}")
+        self.modo = modo
+        self.trabajadores = trabajadores
+        self.max_cola = max_cola
+        self.pendientes = 0
+        self.estadisticas = {
+            "ejecutados": 0, "rechazados": 0, "max_pendientes": 0,
+            "compartidos": 0, "reemplazados": 0, "cancelados": 0,
+        }
+        self._grupo: Optional[Executor] = None
+        self._marcas = None
+        self._marcas_libres: List[int] = []
+        # En vuelo por clave, y el último pedido de cada sesión
+        self._vuelos: Dict[Hashable, _Vuelo] = {}
+        self._sesiones: Dict[Hashable, Tuple[_Vuelo, asyncio.Future]] = {}
+        # Segundos entre finales con cola (promedio móvil) y el último de ellos
+        self._intervalo: Optional[float] = None
+        self._ultimo_fin = 0.0
+
+    @property
+    def en_cola(self) -> int:
+        """Análisis que esperan un trabajador libre"""
+        return max(0, self.pendientes - self.trabajadores)
+
+    def espera_estimada(self) -> float:
+        """Segundos hasta vaciar la cola actual; 1 si todavía no hubo cola"""
+        if self._intervalo is None:
+            return 1.0
+        return max(1, self.en_cola) * self._intervalo
+
+    def iniciar(self) -> "EjecutorAnalisis":
+        capacidad = self.trabajadores + self.max_cola
+        if self.modo == HILOS:
+            self._marcas = bytearray(capacidad)
+            self._grupo = ThreadPoolExecutor(
+                self.trabajadores, thread_name_prefix="lynx-analisis", initializer=precalentar
+            )
+        elif self.modo == PROCESOS:
+            metodo = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            contexto = multiprocessing.get_context(metodo)
+            # Memoria compartida: los trabajadores la reciben al arrancar
+            self._marcas = contexto.Array("b", capacidad, lock=False)
+            self._grupo = ProcessPoolExecutor(
+                self.trabajadores, mp_context=contexto, initializer=_iniciar_trabajador,
+                initargs=(
+                    self._marcas, admision_lynx.limites,
+                    metricas_lynx.memoria_compartida(contexto, self.trabajadores),
+                    trazas_lynx.configuracion(),
+                ),
+            )
+        else:
+            precalentar()
+            return self
+        self._marcas_libres = list(range(capacidad))
+        # Arrancar todos los trabajadores ahora y no con las primeras peticiones
+        for futuro in [self._grupo.submit(precalentar) for _ in range(self.trabajadores)]:
+            futuro.result()
+        return self
+
+    def cerrar(self):
+        if self._grupo is not None:
+            self._grupo.shutdown(wait=True, cancel_futures=True)
+            self._grupo = None
+
+    def __enter__(self) -> "EjecutorAnalisis":
+        return self.iniciar()
+
+    def __exit__(self, *_):
+        self.cerrar()
+
+    async def ejecutar(
+        self, funcion: Callable, *argumentos, sesion: Optional[Hashable] = None, clave: Optional[Hashable] = None
+    ) -> Any:
+        """funcion(*argumentos) en un trabajador
+
+        Con `sesion`, el pedido anterior de esa sesión que siga esperando
+        termina con AnalisisCancelado. Con `clave`, si ya hay un análisis en
+        vuelo con esa clave se espera ese en vez de despachar otro.
+        """
+        if sesion is not None:
+            self._reemplazar(sesion)
+        vuelo = self._vuelos.get(clave) if clave is not None else None
+        if vuelo is not None:
+            self.estadisticas["compartidos"] += 1
+        else:
+            if self.pendientes >= self.trabajadores + self.max_cola:
+                self.estadisticas["rechazados"] += 1
+                raise ColaLlena(self.pendientes, self.espera_estimada())
+            if self.modo == DIRECTO:
+                self.estadisticas["ejecutados"] += 1
+                return funcion(*argumentos)
+            if self._grupo is None:
+                raise RuntimeError("El ejecutor de análisis no está iniciado")
+            vuelo = self._despachar(funcion, argumentos, clave)
+
+        espera = asyncio.get_running_loop().create_future()
+        vuelo.esperas.add(espera)
+        if sesion is not None:
+            self._sesiones[sesion] = (vuelo, espera)
+        try:
+            return await espera
+        finally:
+            if sesion is not None and self._sesiones.get(sesion, (None, None))[1] is espera:
+                del self._sesiones[sesion]
+            self._soltar(vuelo, espera)
+
+    def _despachar(self, funcion: Callable, argumentos: tuple, clave: Optional[Hashable]) -> _Vuelo:
+        marca = self._marcas_libres.pop()
+        self._marcas[marca] = 0
+        # En procesos la marca se busca en la memoria compartida del trabajador
+        marcas = None if self.modo == PROCESOS else self._marcas
+        try:
+            futuro = self._grupo.submit(
+                _ejecutar_con_marca, marcas, marca, trazas_lynx.propagar(), funcion, *argumentos
+            )
+        except BaseException:
+            self._marcas_libres.append(marca)
+            raise
+        vuelo = _Vuelo(futuro, marca, clave)
+        if clave is not None:
+            self._vuelos[clave] = vuelo
+        self.pendientes += 1
+        self.estadisticas["max_pendientes"] = max(self.estadisticas["max_pendientes"], self.pendientes)
+
+        bucle = asyncio.get_running_loop()
+
+        def terminado(_):
+            try:
+                bucle.call_soon_threadsafe(self._terminar, vuelo)
+            except RuntimeError:  # el bucle ya se cerró
+                pass
+
+        futuro.add_done_callback(terminado)
+        return vuelo
+
+    def _terminar(self, vuelo: _Vuelo):
+        if self.pendientes > self.trabajadores:
+            ahora = time.monotonic()
+            if self._ultimo_fin:
+                intervalo = ahora - self._ultimo_fin
+                self._intervalo = intervalo if self._intervalo is None else 0.8 * self._intervalo + 0.2 * intervalo
+            self._ultimo_fin = ahora
+        else:
+            self._ultimo_fin = 0.0
+        self.pendientes -= 1
+        self.estadisticas["ejecutados"] += 1
+        self._marcas_libres.append(vuelo.marca)
+        if self._vuelos.get(vuelo.clave) is vuelo:
+            del self._vuelos[vuelo.clave]
+
+        futuro = vuelo.futuro
+        error = AnalisisCancelado() if futuro.cancelled() else futuro.exception()
+        if isinstance(error, AnalisisCancelado):
+            self.estadisticas["cancelados"] += 1
+        for espera in vuelo.esperas:
+            if espera.done():
+                continue
+            if error is not None:
+                espera.set_exception(error)
+            else:
+                espera.set_result(futuro.result())
+
+    def _reemplazar(self, sesion: Hashable):
+        anterior = self._sesiones.pop(sesion, None)
+        if anterior is None:
+            return
+        vuelo, espera = anterior
+        if not espera.done():
+            espera.set_exception(AnalisisCancelado())
+            self.estadisticas["reemplazados"] += 1
+        self._soltar(vuelo, espera)
+
+    def _soltar(self, vuelo: _Vuelo, espera: asyncio.Future):
+        """Quitar una espera; sin esperas, el trabajador abandona el análisis en el próximo límite de fase"""
+        vuelo.esperas.discard(espera)
+        if vuelo.esperas or vuelo.cancelado or vuelo.futuro.done():
+            return
+        vuelo.cancelado = True
+        self._marcas[vuelo.marca] = 1
+        vuelo.futuro.cancel()
+        if self._vuelos.get(vuelo.clave) is vuelo:
+            del self._vuelos[vuelo.clave]
@@ -0,0 +1,375 @@
+"""Sesiones de validación en vivo para /ws/sesion
+
+Una sesión guarda lo último que mandó el editor: el código, sus tokens, el
+AST y los marcadores ya publicados. El cliente manda los cambios de Monaco
+(`rangeOffset`, `rangeLength`, `text`) y recibe solo los marcadores que
+aparecieron y los que desaparecieron.
+
+Entre un análisis y el siguiente se acumula el tramo del código que cambió;
+solo ese tramo se vuelve a tokenizar (lexer_lynx.retokenizar) y los tokens
+pasan directo al parser. Los cambios que llegan mientras se analiza se
+aplican todos y después se analiza una vez la última versión.
+
+El análisis corre en hilos de este proceso y no en el EjecutorAnalisis: el
+estado de la sesión vive aquí y mandarlo a otro proceso costaría más que
+analizar.
+
+GestorSesiones expulsa las sesiones sin uso por más de `inactividad`
+segundos y, si la memoria estimada pasa de `max_bytes`, las usadas hace más
+tiempo. Una sesión expulsada pierde su estado: al siguiente cambio el
+cliente recibe `reiniciar` y vuelve a mandar el código completo con `abrir`.
+
+Mensajes del cliente:
+    {"tipo": "abrir", "codigo": str, "version": int, "nivel": "rapido" | "completo"}
+    {"tipo": "cambios", "version": int, "cambios": [{"rangeOffset": int, "rangeLength": int, "text": str}]}
+Mensajes del servidor:
+    {"tipo": "diagnosticos", "version": int, "agregados": [marcador], "eliminados": [id], "ms": float}
+    {"tipo": "reiniciar", "motivo": str}
+    {"tipo": "error", "mensaje": str}
+Un marcador es {"id", "severidad", "codigo", "mensaje", "linea", "columna"};
+`abrir` descarta los marcadores anteriores.
+"""
+import asyncio
+import contextvars
+import itertools
+import re
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+import metricas_lynx
+import trazas_lynx
+from admision_lynx import LimiteExcedido, tokenizar_admitido, verificar_ast, verificar_tokens
+from diagnosticos_lynx import ADVERTENCIA, ERROR
+from lexer_lynx import retokenizar
+from parser_lynx import analizar_sintactico
+from semantic_lynx import AnalizadorSemantico
+from servicio_lynx import precalentar
+
+NIVELES = ("rapido", "completo")
+MAX_BYTES_SESION = 1024 * 1024
+# Memoria aproximada de un token de PLY con su parte del AST
+BYTES_POR_TOKEN = 200
+# Cada cuánto se buscan sesiones inactivas
+INTERVALO_BARRIDO = 30.0
+
+_LINEA_SINTAXIS = re.compile(r"\(línea (\d+)\)")
+_ASTRAL = re.compile("[\U00010000-\U0010FFFF]")
+
+
+class CambioInvalido(ValueError):
+    """Cambio que no encaja en el código de la sesión: el cliente está desincronizado"""
+
+
+class AnalisisSesion(NamedTuple):
+    codigo: str
+    # Par (lexer, tokens de PLY), como el de lexer_lynx.tokenizar
+    lexico: Tuple[Any, list]
+    ast: Any
+    # Marcadores sin id, en el orden del analizador
+    marcadores: List[Dict[str, Any]]
+
+
+def _desde_utf16(codigo: str, posicion: int) -> int:
+    """Índice en `codigo` de una posición contada en unidades UTF-16"""
+    return len(codigo.encode("utf-16-le")[:2 * posicion].decode("utf-16-le", "ignore"))
+
+
+def _marcador_sintaxis(codigo: str, error: str) -> Dict[str, Any]:
+    encontrado = _LINEA_SINTAXIS.search(error)
+    linea = int(encontrado.group(1)) if encontrado else codigo.count("\n") + 1
+    return {"severidad": ERROR, "codigo": "sintaxis", "mensaje": error, "linea": linea, "columna": None}
+
+
+def analizar_version(
+    codigo: str,
+    anterior: Optional[AnalisisSesion],
+    tramo: Optional[Tuple[int, int]],
+    nivel: str,
+) -> AnalisisSesion:
+    """Tokens, AST y marcadores de `codigo`
+
+    Si hay `anterior` y solo cambió `tramo` (inicio y fin en `codigo`), se
+    reusan sus tokens; retokenizar los modifica, así que `anterior` no sirve
+    después. LimiteExcedido si el código pasa los límites de admisión.
+    """
+    if anterior is not None and anterior.codigo == codigo:
+        return anterior
+    lexico = None
+    if anterior is not None and tramo is not None:
+        inicio, fin = tramo
+        lexico = retokenizar(anterior.lexico[1], codigo, inicio, fin, fin - len(codigo) + len(anterior.codigo))
+        metricas_lynx.cache_consultas.sumar("tokens_sesion", "fallo" if lexico is None else "acierto")
+    if lexico is None:
+        lexico, _ = tokenizar_admitido(codigo)
+    else:
+        verificar_tokens(lexico[1])
+
+    ast, errores = analizar_sintactico(codigo, lexico=lexico)
+    if errores:
+        return AnalisisSesion(codigo, lexico, None, [_marcador_sintaxis(codigo, errores[0])])
+    verificar_ast(ast)
+    analizador = AnalizadorSemantico(nivel=nivel)
+    analizador.analizar(ast, codigo)
+    marcadores = [
+        {"severidad": severidad, "codigo": diagnostico.codigo, "mensaje": diagnostico.mensaje(),
+         "linea": diagnostico.linea, "columna": diagnostico.columna}
+        for severidad in (ERROR, ADVERTENCIA)
+        for diagnostico in analizador.diagnosticos.registros[severidad]
+    ]
+    return AnalisisSesion(codigo, lexico, ast, marcadores)
+
+
+class Sesion:
+    """Estado de un editor conectado; solo lo toca el bucle de eventos"""
+
+    def __init__(self, identificador: int):
+        self.id = identificador
+        self.nivel = "rapido"
+        self.version = 0
+        # None hasta `abrir`, y otra vez None si la sesión se expulsa
+        self.codigo: Optional[str] = None
+        # Tramo [inicio, fin) del código que cambió desde el último análisis
+        self.tramo: Optional[Tuple[int, int]] = None
+        self.analisis: Optional[AnalisisSesion] = None
+        # Marcadores publicados: clave -> id
+        self.marcadores: Dict[Tuple[Any, ...], int] = {}
+        # Cambia con cada `abrir` o expulsión: un análisis de otra época se descarta
+        self.epoca = 0
+        self.expulsada: Optional[str] = None
+        self.bytes = 0
+        self.ultimo_uso = time.monotonic()
+        self._ids = itertools.count(1)
+        # El código tiene caracteres que en UTF-16 ocupan dos unidades
+        self._utf16 = False
+
+    @property
+    def pendiente(self) -> bool:
+        """Hay una versión del código sin analizar"""
+        return self.codigo is not None and (self.analisis is None or self.tramo is not None)
+
+    def abrir(self, codigo: str, version: int, nivel: str):
+        self.codigo, self.version, self.nivel = codigo, version, nivel
+        self._utf16 = _ASTRAL.search(codigo) is not None
+        self.tramo = None
+        self.analisis = None
+        self.marcadores = {}
+        self.epoca += 1
+        self.expulsada = None
+
+    def expulsar(self, motivo: str):
+        self.codigo = self.tramo = self.analisis = None
+        self.marcadores = {}
+        self.epoca += 1
+        self.expulsada = motivo
+        self.bytes = 0
+
+    def aplicar(self, cambios: Any, version: int):
+        """Aplicar los cambios de un evento de Monaco; todos o ninguno
+
+        Sus posiciones son las del código antes del evento y no se solapan:
+        aplicados de atrás hacia adelante, siguen valiendo. Monaco cuenta en
+        unidades UTF-16; solo difieren de los índices de Python si el código
+        tiene caracteres fuera del plano básico (emojis, por ejemplo).
+        """
+        if not isinstance(cambios, list):
+            raise CambioInvalido("`cambios` debe ser una lista")
+        ordenados = []
+        for cambio in cambios:
+            if not isinstance(cambio, dict):
+                raise CambioInvalido("Cada cambio debe ser un objeto")
+            offset, largo, texto = cambio.get("rangeOffset"), cambio.get("rangeLength"), cambio.get("text")
+            if type(offset) is not int or type(largo) is not int or not isinstance(texto, str):
+                raise CambioInvalido("Un cambio necesita rangeOffset, rangeLength y text")
+            ordenados.append((offset, largo, texto))
+        ordenados.sort(key=lambda cambio: cambio[0], reverse=True)
+
+        limite = len(self.codigo) + (len(_ASTRAL.findall(self.codigo)) if self._utf16 else 0)
+        for offset, largo, _ in ordenados:
+            if offset < 0 or largo < 0 or offset + largo > limite:
+                raise CambioInvalido(f"Cambio fuera del código: {offset}+{largo} de {limite}")
+            limite = offset
+
+        for offset, largo, texto in ordenados:
+            if self._utf16:
+                offset, fin_viejo = _desde_utf16(self.codigo, offset), _desde_utf16(self.codigo, offset + largo)
+                largo = fin_viejo - offset
+            self.codigo = self.codigo[:offset] + texto + self.codigo[offset + largo:]
+            self._utf16 = self._utf16 or _ASTRAL.search(texto) is not None
+            fin = offset + len(texto)
+            if self.tramo is None:
+                self.tramo = (offset, fin)
+                continue
+            inicio_tramo, fin_tramo = self.tramo
+            if fin_tramo >= offset + largo:
+                fin_tramo += len(texto) - largo
+            elif fin_tramo > offset:
+                fin_tramo = fin
+            self.tramo = (min(inicio_tramo, offset), max(fin_tramo, fin))
+        self.version = version
+
+    def publicar(self, analisis: AnalisisSesion) -> Tuple[List[Dict[str, Any]], List[int]]:
+        """Guardar el análisis; marcadores nuevos (con id) y ids de los que ya no están"""
+        self.analisis = analisis
+        self.bytes = 2 * len(analisis.codigo) + BYTES_POR_TOKEN * len(analisis.lexico[1])
+        anteriores = self.marcadores
+        self.marcadores = {}
+        agregados = []
+        for marcador in analisis.marcadores:
+            clave = tuple(marcador.values())
+            if clave in self.marcadores:
+                continue
+            identificador = anteriores.get(clave)
+            if identificador is None:
+                identificador = next(self._ids)
+                agregados.append(dict(marcador, id=identificador))
+            self.marcadores[clave] = identificador
+        eliminados = [identificador for clave, identificador in anteriores.items() if clave not in self.marcadores]
+        return agregados, eliminados
+
+
+def _error(mensaje: str) -> Dict[str, Any]:
+    return {"tipo": "error", "mensaje": mensaje}
+
+
+class GestorSesiones:
+    """Sesiones abiertas, de la usada hace más tiempo a la más reciente"""
+
+    def __init__(self, inactividad: float = 600.0, max_bytes: int = 256 * 1024 * 1024, trabajadores: int = 1):
+        self.inactividad = inactividad
+        self.max_bytes = max_bytes
+        self.trabajadores = trabajadores
+        self.sesiones: "OrderedDict[int, Sesion]" = OrderedDict()
+        self.estadisticas = {"creadas": 0, "analisis": 0, "expulsadas_inactividad": 0, "expulsadas_memoria": 0}
+        self._ids = itertools.count(1)
+        self._grupo: Optional[ThreadPoolExecutor] = None
+
+    def iniciar(self) -> "GestorSesiones":
+        self._grupo = ThreadPoolExecutor(self.trabajadores, thread_name_prefix="lynx-sesiones", initializer=precalentar)
+        return self
+
+    def cerrar(self):
+        if self._grupo is not None:
+            self._grupo.shutdown(wait=True, cancel_futures=True)
+            self._grupo = None
+        self.sesiones.clear()
+
+    @property
+    def bytes(self) -> int:
+        return sum(sesion.bytes for sesion in self.sesiones.values())
+
+    def crear(self) -> Sesion:
+        sesion = Sesion(next(self._ids))
+        self.sesiones[sesion.id] = sesion
+        self.estadisticas["creadas"] += 1
+        self.barrer()
+        return sesion
+
+    def cerrar_sesion(self, sesion: Sesion):
+        self.sesiones.pop(sesion.id, None)
+
+    def usar(self, sesion: Sesion):
+        sesion.ultimo_uso = time.monotonic()
+        self.sesiones[sesion.id] = sesion
+        self.sesiones.move_to_end(sesion.id)
+
+    def _expulsar(self, sesion: Sesion, motivo: str, estadistica: str):
+        del self.sesiones[sesion.id]
+        sesion.expulsar(motivo)
+        self.estadisticas[estadistica] += 1
+
+    def barrer(self):
+        """Expulsar las sesiones inactivas y, pasado `max_bytes`, las usadas hace más tiempo"""
+        ahora = time.monotonic()
+        for sesion in list(self.sesiones.values()):
+            if ahora - sesion.ultimo_uso <= self.inactividad:
+                break
+            self._expulsar(sesion, "Sesión expulsada por inactividad", "expulsadas_inactividad")
+        total = self.bytes
+        while total > self.max_bytes and self.sesiones:
+            sesion = next(iter(self.sesiones.values()))
+            total -= sesion.bytes
+            self._expulsar(sesion, "Sesión expulsada por falta de memoria", "expulsadas_memoria")
+
+    async def barrer_periodicamente(self, intervalo: float = INTERVALO_BARRIDO):
+        while True:
+            await asyncio.sleep(intervalo)
+            self.barrer()
+
+    def recibir(self, sesion: Sesion, mensaje: Any) -> Optional[Dict[str, Any]]:
+        """Aplicar un mensaje del cliente
+
+        Devuelve la respuesta inmediata (error o reiniciar), o None si hay una
+        versión nueva que analizar.
+        """
+        if not isinstance(mensaje, dict):
+            return _error("El mensaje debe ser un objeto JSON")
+        version = mensaje.get("version", 0)
+        if type(version) is not int:
+            return _error("`version` debe ser un entero")
+
+        tipo = mensaje.get("tipo")
+        if tipo == "abrir":
+            codigo, nivel = mensaje.get("codigo"), mensaje.get("nivel", "rapido")
+            if not isinstance(codigo, str):
+                return _error("`abrir` necesita el código completo en `codigo`")
+            if nivel not in NIVELES:
+                return _error(f"Nivel desconocido: {nivel}")
+            sesion.abrir(codigo, version, nivel)
+        elif tipo == "cambios":
+            if sesion.codigo is None:
+                return {"tipo": "reiniciar", "motivo": sesion.expulsada or "La sesión no está abierta"}
+            try:
+                sesion.aplicar(mensaje.get("cambios"), version)
+            except CambioInvalido as e:
+                sesion.expulsar(str(e))
+                return {"tipo": "reiniciar", "motivo": str(e)}
+        else:
+            return _error(f"Tipo de mensaje desconocido: {tipo}")
+        self.usar(sesion)
+        return None
+
+    async def analizar(self, sesion: Sesion) -> Optional[Dict[str, Any]]:
+        """Analizar la última versión de la sesión; el mensaje para el cliente, o None"""
+        if not sesion.pendiente:
+            return None
+        if self._grupo is None:
+            raise RuntimeError("El gestor de sesiones no está iniciado")
+        codigo, tramo, anterior, version, epoca = (
+            sesion.codigo, sesion.tramo, sesion.analisis, sesion.version, sesion.epoca
+        )
+        # Los cambios que lleguen durante el análisis forman el próximo tramo
+        sesion.tramo = None
+        sesion.analisis = None
+        if len(codigo.encode("utf-8")) > MAX_BYTES_SESION:
+            return _error(f"El código supera los {MAX_BYTES_SESION} bytes; no se valida en vivo")
+
+        inicio = time.perf_counter()
+        try:
+            with trazas_lynx.tramo("sesion", sesion=sesion.id, version=version, incremental=tramo is not None):
+                # El tramo de la sesión sigue siendo el actual en el hilo
+                analisis = await asyncio.get_running_loop().run_in_executor(
+                    self._grupo, contextvars.copy_context().run,
+                    analizar_version, codigo, anterior, tramo, sesion.nivel,
+                )
+        except LimiteExcedido as e:
+            return _error(str(e))
+        except Exception as e:
+            return _error(f"Error interno: {e}")
+        self.estadisticas["analisis"] += 1
+
+        if sesion.epoca != epoca:
+            # Expulsada o vuelta a abrir mientras se analizaba
+            if sesion.expulsada:
+                return {"tipo": "reiniciar", "motivo": sesion.expulsada}
+            return None
+        agregados, eliminados = sesion.publicar(analisis)
+        self.barrer()
+        return {
+            "tipo": "diagnosticos",
+            "version": version,
+            "agregados": agregados,
+            "eliminados": eliminados,
+            "ms": round((time.perf_counter() - inicio) * 1000, 3),
+        }
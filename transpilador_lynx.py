@@ -0,0 +1,632 @@
+import hashlib
+import importlib.util
+import marshal
+import math
+import os
+import sys
+from collections import OrderedDict
+from types import CodeType, FunctionType
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from interprete_lynx import (
+    ContextoFuncion,
+    ErrorCompilacion,
+    ResolucionRanuras,
+    ResultadoEjecucion,
+    analizar_programa,
+    es_literal,
+    resolver,
+)
+from runtime_lynx import (
+    OPERACIONES_BINARIAS,
+    OPERACIONES_UNARIAS,
+    ErrorEjecucion,
+    a_cadena,
+    booleano,
+    iguales,
+    indexar,
+    iterar,
+    plano,
+    tipo_de,
+    verificar_aridad,
+)
+
+# Traductor del AST de Lynx a código fuente de Python. El programa completo se
+# convierte en una función `_programa(_escribir)`: las variables de Lynx son
+# variables locales de Python (con un sufijo por símbolo, así los ámbitos
+# anidados no chocan) y cada función de Lynx es una función anidada. La
+# semántica que Python no comparte (booleanos estrictos, + con cadenas,
+# índices verificados...) se delega en runtime_lynx, con atajos en línea para
+# operaciones entre enteros.
+#
+# Cada sentencia de Lynx ocupa su propia línea de Python; `lineas` traduce la
+# línea generada a la línea de Lynx para ubicar los errores de ejecución.
+
+# Se incrementa cuando cambia el código generado: invalida la caché en disco
+VERSION_COMPILADOR = "1"
+
+# Funciones de runtime_lynx con el nombre que usa el código generado
+OPERACIONES_GENERADAS: Dict[str, str] = {
+    "+": "_sumar",
+    "-": "_restar",
+    "*": "_multiplicar",
+    "/": "_dividir",
+    "%": "_modulo",
+    "==": "_iguales",
+    "!=": "_diferentes",
+    "<": "_menor",
+    ">": "_mayor",
+    "<=": "_menor_igual",
+    ">=": "_mayor_igual",
+}
+
+# Operadores que Python resuelve igual que Lynx cuando ambos operandos son enteros
+OPERADORES_ENTEROS = {"+", "-", "*", "==", "!=", "<", ">", "<=", ">="}
+
+COMPARACIONES = {"==", "!=", "<", ">", "<=", ">="}
+
+SANGRIA = "    "
+
+
+def llamar(funcion: Any, nombre: str, *argumentos):
+    """Llamada a un valor que no se sabe en compilación si es una función"""
+    if type(funcion) is not FunctionType or not hasattr(funcion, "nombre"):
+        raise ErrorEjecucion(f"'{nombre}' no es una función ({tipo_de(funcion)})")
+    verificar_aridad(nombre, funcion.__code__.co_argcount, len(argumentos))
+    return funcion(*argumentos)
+
+
+ENTORNO_EJECUCION: Dict[str, Any] = {
+    **{nombre: OPERACIONES_BINARIAS[op] for op, nombre in OPERACIONES_GENERADAS.items()},
+    "_negar": OPERACIONES_UNARIAS["no"],
+    "_opuesto": OPERACIONES_UNARIAS["-"],
+    "_identidad": OPERACIONES_UNARIAS["+"],
+    "_a_cadena": a_cadena,
+    "_booleano": booleano,
+    "_iguales": iguales,
+    "_indexar": indexar,
+    "_iterar": iterar,
+    "_llamar": llamar,
+    "_ErrorEjecucion": ErrorEjecucion,
+}
+
+
+class ProgramaTranspilado:
+    """Código objeto de un programa más el mapa de líneas Python -> Lynx"""
+
+    def __init__(self, codigo: CodeType, lineas: Tuple[int, ...], fuente: Optional[str] = None):
+        self.codigo = codigo
+        self.lineas = lineas
+        # Solo disponible si se generó en este proceso (no al venir de la caché)
+        self.fuente = fuente
+
+    def linea_lynx(self, rastro) -> Optional[int]:
+        """Línea de Lynx del marco generado más interno de un traceback"""
+        linea = None
+        while rastro is not None:
+            if rastro.tb_frame.f_code.co_filename == self.codigo.co_filename:
+                numero = rastro.tb_lineno
+                if 0 < numero <= len(self.lineas):
+                    linea = self.lineas[numero - 1] or linea
+            rastro = rastro.tb_next
+        return linea
+
+    def ejecutar(self, escribir: Optional[Callable[[str], Any]] = None):
+        """Ejecutar el programa; `escribir` recibe cada línea de `imprimir`"""
+        espacio = dict(ENTORNO_EJECUCION)
+        exec(self.codigo, espacio)
+        try:
+            espacio["_programa"](escribir or print)
+        except ErrorEjecucion as error:
+            error.ubicar(self.linea_lynx(error.__traceback__))
+            raise
+        except RecursionError:
+            raise ErrorEjecucion("Recursión demasiado profunda")
+        except NameError as error:
+            raise ErrorEjecucion("Variable usada antes de tener valor", self.linea_lynx(error.__traceback__))
+
+
+class FuncionGenerada:
+    """Líneas y variables de la función de Python que se está generando"""
+
+    def __init__(self):
+        self.lineas: List[Tuple[int, str, Optional[int]]] = []
+        self.no_locales: Set[str] = set()
+        self.temporales = 0
+
+    def temporal(self) -> str:
+        self.temporales += 1
+        return f"_t{self.temporales}"
+
+
+class Transpilador(ResolucionRanuras):
+    def __init__(self, resoluciones: Dict[int, Any], reasignados: Set[int]):
+        super().__init__(resoluciones)
+        # id(simbolo) -> nombre en Python
+        self.nombres: Dict[int, str] = {}
+        # id(simbolo) de funciones de Lynx que nunca se reasignan -> aridad
+        self.funciones: Dict[int, int] = {}
+        self.reasignados = reasignados
+        self.generada = FuncionGenerada()
+        self.nivel = 0
+
+    # Emisión
+
+    def emitir(self, texto: str, linea: Optional[int]):
+        self.generada.lineas.append((self.nivel, texto, linea))
+
+    def anidar(self, instrucciones):
+        self.nivel += 1
+        inicio = len(self.generada.lineas)
+        self.bloque(instrucciones)
+        if len(self.generada.lineas) == inicio:
+            self.emitir("pass", None)
+        self.nivel -= 1
+
+    def transpilar_programa(self, ast) -> Tuple[str, Tuple[int, ...]]:
+        self.emitir("def _programa(_escribir):", None)
+        self.anidar(ast or [])
+        texto = []
+        lineas = []
+        for nivel, contenido, linea in self.generada.lineas:
+            texto.append(SANGRIA * nivel + contenido)
+            lineas.append(linea or 0)
+        return "\n".join(texto) + "\n", tuple(lineas)
+
+    # Nombres
+
+    def nombre_declarado(self, nodo, nombre: str) -> str:
+        self.declarar(nodo, nombre)
+        simbolo = self.simbolo_de(nodo, nombre)
+        python = f"{nombre}_{len(self.nombres)}"
+        self.nombres[id(simbolo)] = python
+        return python
+
+    def nombre_usado(self, nodo, nombre: str) -> str:
+        self.ubicar(nodo, nombre)
+        return self.nombres[id(self.simbolo_de(nodo, nombre))]
+
+    # Sentencias
+
+    def bloque(self, instrucciones):
+        if instrucciones is None:
+            return
+        if not isinstance(instrucciones, list):
+            instrucciones = [instrucciones]
+        for instruccion in instrucciones:
+            self.sentencia(instruccion)
+
+    def sentencia(self, nodo):
+        if es_literal(nodo):
+            return
+        if isinstance(nodo, tuple):
+            getattr(self, f"transpilar_{nodo[0]}")(nodo)
+            return
+        clase = nodo.__class__.__name__
+        metodo = getattr(self, f"transpilar_{clase}", None)
+        if metodo is not None:
+            metodo(nodo)
+        elif clase == "Identificador":
+            # Sin efectos: solo se valida que esté declarado
+            self.nombre_usado(nodo, nodo.nombre)
+        else:
+            self.emitir(self.expresion(nodo), getattr(nodo, "linea", None))
+
+    def transpilar_DeclaracionVariable(self, nodo):
+        valor = self.expresion(nodo.valor)
+        self.emitir(f"{self.nombre_declarado(nodo, nodo.nombre)} = {valor}", nodo.linea)
+
+    def transpilar_AsignacionVariable(self, nodo):
+        valor = self.expresion(nodo.valor)
+        profundidad, _ = self.ubicar(nodo, nodo.nombre)
+        nombre = self.nombre_usado(nodo, nodo.nombre)
+        if profundidad > 0:
+            self.generada.no_locales.add(nombre)
+        self.emitir(f"{nombre} = {valor}", nodo.linea)
+
+    def transpilar_DeclaracionArreglo(self, nodo):
+        elementos = ", ".join(self.expresion(e) for e in nodo.elementos)
+        self.emitir(f"{self.nombre_declarado(nodo, nodo.nombre)} = [{elementos}]", nodo.linea)
+
+    def transpilar_DeclaracionTabla(self, nodo):
+        pares = ", ".join(f"{clave!r}: {self.expresion(valor)}" for clave, valor in nodo.pares)
+        self.emitir(f"{self.nombre_declarado(nodo, nodo.nombre)} = {{{pares}}}", nodo.linea)
+
+    def transpilar_DeclaracionFuncion(self, nodo):
+        nombre = self.nombre_declarado(nodo, nodo.nombre)
+        simbolo = self.simbolo_de(nodo, nodo.nombre)
+        if id(simbolo) not in self.reasignados:
+            self.funciones[id(simbolo)] = len(nodo.parametros)
+
+        exterior = self.funcion, self.generada, self.nivel
+        self.funcion = ContextoFuncion(self.funcion.nivel + 1)
+        self.generada = FuncionGenerada()
+        self.nivel = 1
+        try:
+            parametros = [self.nombre_declarado(p, p.nombre) for p in nodo.parametros]
+            self.bloque(nodo.bloque)
+            retorno = getattr(nodo, "retorno", None)
+            if retorno is not None:
+                linea = getattr(retorno, "linea", None) or nodo.linea
+                self.emitir(f"return {self.expresion(retorno)}", linea)
+            elif len(self.generada.lineas) == 0:
+                self.emitir("pass", None)
+            cuerpo = self.generada
+        finally:
+            self.funcion, self.generada, self.nivel = exterior
+
+        self.emitir(f"def {nombre}({', '.join(parametros)}):", nodo.linea)
+        if cuerpo.no_locales:
+            # Python busca cada `nonlocal` en la función más cercana que lo define
+            self.generada.lineas.append(
+                (self.nivel + 1, f"nonlocal {', '.join(sorted(cuerpo.no_locales))}", nodo.linea)
+            )
+        for nivel, texto, linea in cuerpo.lineas:
+            self.generada.lineas.append((self.nivel + nivel, texto, linea))
+        self.emitir(f"{nombre}.nombre = {nodo.nombre!r}", nodo.linea)
+
+    def transpilar_Imprimir(self, nodo):
+        partes = []
+        for elemento in nodo.elementos:
+            if type(elemento) is str:
+                partes.append(repr(elemento))
+            elif es_literal(elemento):
+                partes.append(repr(a_cadena(elemento)))
+            else:
+                partes.append(f"_a_cadena({self.expresion(elemento)})")
+        if len(partes) == 1:
+            texto = partes[0]
+        else:
+            texto = f"' '.join(({', '.join(partes)},))"
+        self.emitir(f"_escribir({texto})", nodo.linea)
+
+    def condicion(self, nodo, estructura: str) -> str:
+        if self.es_booleana(nodo):
+            return self.expresion(nodo)
+        return f"_booleano({self.expresion(nodo)}, {f'La condición de {estructura!r}'!r})"
+
+    def transpilar_EstructuraSi(self, nodo):
+        self.emitir(f"if {self.condicion(nodo.condicion, 'si')}:", nodo.linea)
+        self.anidar(nodo.bloque)
+        siguiente = nodo.sinosis
+        while siguiente:
+            if siguiente[0] == "sinosi":
+                _, condicion, bloque, siguiente = siguiente
+                # Los errores de las condiciones se reportan en la línea del `si`
+                self.emitir(f"elif {self.condicion(condicion, 'sinosi')}:", nodo.linea)
+                self.anidar(bloque)
+            else:
+                self.emitir("else:", nodo.linea)
+                self.anidar(siguiente[1])
+                siguiente = None
+
+    def transpilar_EstructuraMientras(self, nodo):
+        self.emitir(f"while {self.condicion(nodo.condicion, 'mientras')}:", nodo.linea)
+        self.anidar(nodo.bloque)
+
+    def transpilar_EstructuraPara(self, nodo):
+        inicial = self.expresion(nodo.init.valor)
+        variable = self.nombre_declarado(nodo.init, nodo.init.nombre)
+        self.emitir(f"{variable} = {inicial}", nodo.linea)
+        self.emitir(f"while {self.condicion(nodo.condicion, 'para')}:", nodo.linea)
+        self.anidar(nodo.bloque)
+        # El valor del incremento se asigna a la variable del para
+        self.nivel += 1
+        self.emitir(f"{variable} = {self.expresion(nodo.incremento)}", nodo.linea)
+        self.nivel -= 1
+
+    def transpilar_EstructuraRepetir(self, nodo):
+        self.emitir("while True:", nodo.linea)
+        self.anidar(nodo.bloque)
+        self.nivel += 1
+        self.emitir(f"if {self.condicion(nodo.condicion, 'repetir-hasta')}:", nodo.linea)
+        self.nivel += 1
+        self.emitir("break", nodo.linea)
+        self.nivel -= 2
+
+    def transpilar_para_cada(self, nodo):
+        _, variable, coleccion, bloque = nodo
+        obtener = self.expresion(coleccion)
+        nombre = self.nombre_declarado(variable, variable.nombre)
+        self.emitir(f"for {nombre} in _iterar({obtener}):", variable.linea)
+        self.anidar(bloque)
+
+    def transpilar_EstructuraSegun(self, nodo):
+        valor = self.generada.temporal()
+        self.emitir(f"{valor} = {self.expresion(nodo.expresion)}", nodo.linea)
+        palabra = "if"
+        for caso in nodo.casos:
+            self.emitir(f"{palabra} _iguales({valor}, {self.expresion(caso.valor)}):", nodo.linea)
+            self.anidar(caso.bloque)
+            palabra = "elif"
+        if nodo.predeterminado:
+            if palabra == "if":
+                self.bloque(nodo.predeterminado)
+            else:
+                self.emitir("else:", nodo.linea)
+                self.anidar(nodo.predeterminado)
+
+    def transpilar_intentar(self, nodo):
+        _, bloque, capturar, finalmente = nodo
+        _, variable, bloque_captura = capturar
+        self.emitir("try:", None)
+        self.anidar(bloque)
+        error = self.generada.temporal()
+        self.emitir(f"except _ErrorEjecucion as {error}:", None)
+        nombre = self.nombre_declarado(variable, variable.nombre)
+        self.nivel += 1
+        self.emitir(f"{nombre} = {error}.mensaje", variable.linea)
+        self.nivel -= 1
+        self.anidar(bloque_captura)
+        if finalmente:
+            self.emitir("finally:", None)
+            self.anidar(finalmente[1])
+
+    # Expresiones
+
+    def es_booleana(self, nodo) -> bool:
+        """¿La expresión produce siempre un booleano (o falla antes)?"""
+        if type(nodo) is bool:
+            return True
+        clase = nodo.__class__.__name__
+        if clase == "ExpresionBinaria":
+            return nodo.op in COMPARACIONES or nodo.op in ("y", "o")
+        return clase == "ExpresionUnaria" and nodo.op == "no"
+
+    def expresion(self, nodo) -> str:
+        if es_literal(nodo):
+            return literal(nodo)
+        clase = nodo.__class__.__name__
+        if clase == "Identificador":
+            return self.nombre_usado(nodo, nodo.nombre)
+        if clase == "ExpresionBinaria":
+            return self.binaria(nodo)
+        if clase == "ExpresionUnaria":
+            return self.unaria(nodo)
+        if clase in ("AccesoArreglo", "AccesoTabla"):
+            clave = nodo.indice if clase == "AccesoArreglo" else nodo.clave
+            return f"_indexar({self.nombre_usado(nodo, nodo.nombre)}, {self.expresion(clave)})"
+        if clase == "LlamadaFuncion":
+            return self.llamada(nodo)
+        raise ErrorCompilacion([f"Expresión no soportada: {clase}"])
+
+    def binaria(self, nodo) -> str:
+        op = nodo.op
+        if op in ("y", "o"):
+            izq = self.operando_logico(nodo.izq, f"Operando izquierdo de '{op}'")
+            der = self.operando_logico(nodo.der, f"Operando derecho de '{op}'")
+            return f"({izq} {'and' if op == 'y' else 'or'} {der})"
+
+        funcion = OPERACIONES_GENERADAS[op]
+        if es_literal(nodo.izq) and es_literal(nodo.der):
+            try:
+                valor = OPERACIONES_BINARIAS[op](nodo.izq, nodo.der)
+                if type(valor) is not float or math.isfinite(valor):
+                    return literal(valor)
+            except ErrorEjecucion:
+                pass  # el error se reporta al ejecutar, con su línea
+
+        izq = self.expresion(nodo.izq)
+        der = self.expresion(nodo.der)
+        if op not in OPERADORES_ENTEROS or not (puede_ser_entero(nodo.izq) and puede_ser_entero(nodo.der)):
+            return f"{funcion}({izq}, {der})"
+
+        # Atajo en línea para dos enteros; los operandos con cálculo se guardan
+        # en temporales para evaluarlos una sola vez y en orden
+        llamadas = tiene_llamadas(nodo.izq) or tiene_llamadas(nodo.der)
+        a, guarda_a = self.operando_rapido(nodo.izq, izq, llamadas)
+        b, guarda_b = self.operando_rapido(nodo.der, der, llamadas)
+        if type(nodo.izq) is int:
+            prueba = f"type({guarda_b}) is int"
+        elif type(nodo.der) is int:
+            prueba = f"type({guarda_a}) is int"
+        else:
+            prueba = f"type({guarda_a}) is type({guarda_b}) is int"
+        return f"({a} {op} {b} if {prueba} else {funcion}({a}, {b}))"
+
+    def operando_rapido(self, nodo, codigo: str, llamadas: bool) -> Tuple[str, str]:
+        """(nombre para reutilizar el valor, código que lo calcula en la guarda)"""
+        if es_literal(nodo) or (nodo.__class__.__name__ == "Identificador" and not llamadas):
+            return codigo, codigo
+        temporal = self.generada.temporal()
+        return temporal, f"({temporal} := {codigo})"
+
+    def operando_logico(self, nodo, mensaje: str) -> str:
+        if self.es_booleana(nodo):
+            return self.expresion(nodo)
+        return f"_booleano({self.expresion(nodo)}, {mensaje!r})"
+
+    def unaria(self, nodo) -> str:
+        if es_literal(nodo.expr):
+            try:
+                return literal(OPERACIONES_UNARIAS[nodo.op](nodo.expr))
+            except ErrorEjecucion:
+                pass
+        operando = self.expresion(nodo.expr)
+        if nodo.op == "no":
+            if self.es_booleana(nodo.expr):
+                return f"(not {operando})"
+            return f"_negar({operando})"
+        return f"{'_opuesto' if nodo.op == '-' else '_identidad'}({operando})"
+
+    def llamada(self, nodo) -> str:
+        funcion = self.nombre_usado(nodo, nodo.nombre)
+        argumentos = [self.expresion(argumento) for argumento in nodo.argumentos]
+        simbolo = self.simbolo_de(nodo, nodo.nombre)
+        if self.funciones.get(id(simbolo)) == len(argumentos):
+            # Función de Lynx conocida y con la aridad correcta: llamada directa
+            return f"{funcion}({', '.join(argumentos)})"
+        return f"_llamar({', '.join([funcion, repr(nodo.nombre)] + argumentos)})"
+
+
+def literal(valor: Any) -> str:
+    return repr(plano(valor))
+
+
+def puede_ser_entero(nodo) -> bool:
+    return not es_literal(nodo) or type(nodo) is int
+
+
+def tiene_llamadas(nodo) -> bool:
+    if es_literal(nodo):
+        return False
+    clase = nodo.__class__.__name__
+    if clase == "LlamadaFuncion":
+        return True
+    if clase == "ExpresionBinaria":
+        return tiene_llamadas(nodo.izq) or tiene_llamadas(nodo.der)
+    if clase == "ExpresionUnaria":
+        return tiene_llamadas(nodo.expr)
+    if clase == "AccesoArreglo":
+        return tiene_llamadas(nodo.indice)
+    return False
+
+
+def asignaciones(nodo, encontradas: list) -> list:
+    """Nodos AsignacionVariable de todo el programa"""
+    if isinstance(nodo, (list, tuple)):
+        for hijo in nodo:
+            asignaciones(hijo, encontradas)
+    elif hasattr(nodo, "__dict__"):
+        if nodo.__class__.__name__ == "AsignacionVariable":
+            encontradas.append(nodo)
+        for hijo in vars(nodo).values():
+            asignaciones(hijo, encontradas)
+    return encontradas
+
+
+def transpilar(ast, codigo: str = "", nombre_archivo: str = "<lynx>") -> ProgramaTranspilado:
+    """Resolver ámbitos, generar el código Python y compilarlo"""
+    resoluciones = resolver(ast, codigo)
+    reasignados = {
+        id(resoluciones[id(nodo)]) for nodo in asignaciones(ast, []) if id(nodo) in resoluciones
+    }
+    fuente, lineas = Transpilador(resoluciones, reasignados).transpilar_programa(ast)
+    try:
+        codigo_python = compile(fuente, nombre_archivo, "exec")
+    except (SyntaxError, RecursionError, MemoryError) as e:
+        # Límites de CPython que Lynx no tiene (más de 20 bloques anidados,
+        # expresiones muy profundas): el intérprete y la VM sí corren el programa
+        raise ErrorCompilacion([f"El programa no se puede transpilar a Python: {e}"]) from None
+    return ProgramaTranspilado(codigo_python, lineas, fuente)
+
+
+class CacheCodigo:
+    """Caché de programas compilados en memoria (LRU) y en disco
+
+    La clave es el hash del código fuente junto con la versión del compilador
+    y la de Python, así que un acierto se salta el análisis y la generación.
+    """
+
+    def __init__(self, directorio: Optional[str] = None, max_memoria: int = 256):
+        self.directorio = directorio
+        self.max_memoria = max_memoria
+        self.memoria: "OrderedDict[str, ProgramaTranspilado]" = OrderedDict()
+        self.estadisticas = {"memoria": 0, "disco": 0, "fallos": 0}
+
+    @staticmethod
+    def clave(codigo: str) -> str:
+        contenido = hashlib.sha256()
+        contenido.update(VERSION_COMPILADOR.encode())
+        contenido.update(importlib.util.MAGIC_NUMBER)
+        contenido.update(codigo.encode("utf-8"))
+        return contenido.hexdigest()
+
+    def ruta(self, clave: str) -> Optional[str]:
+        if not self.directorio:
+            return None
+        return os.path.join(self.directorio, f"{clave}.lynxc")
+
+    def obtener(self, clave: str) -> Optional[ProgramaTranspilado]:
+        programa = self.memoria.get(clave)
+        if programa is not None:
+            self.memoria.move_to_end(clave)
+            self.estadisticas["memoria"] += 1
+            return programa
+
+        ruta = self.ruta(clave)
+        if ruta and os.path.exists(ruta):
+            try:
+                with open(ruta, "rb") as archivo:
+                    codigo, lineas = marshal.load(archivo)
+                programa = ProgramaTranspilado(codigo, lineas)
+            except (OSError, EOFError, ValueError, TypeError):
+                programa = None  # archivo dañado o de otra versión: se regenera
+            if programa is not None:
+                self.estadisticas["disco"] += 1
+                self.recordar(clave, programa)
+                return programa
+
+        self.estadisticas["fallos"] += 1
+        return None
+
+    def recordar(self, clave: str, programa: ProgramaTranspilado):
+        self.memoria[clave] = programa
+        self.memoria.move_to_end(clave)
+        while len(self.memoria) > self.max_memoria:
+            self.memoria.popitem(last=False)
+
+    def guardar(self, clave: str, programa: ProgramaTranspilado):
+        self.recordar(clave, programa)
+        ruta = self.ruta(clave)
+        if not ruta:
+            return
+        temporal = f"{ruta}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.directorio, exist_ok=True)
+            with open(temporal, "wb") as archivo:
+                marshal.dump((programa.codigo, programa.lineas), archivo)
+            os.replace(temporal, ruta)
+        except OSError:
+            pass  # sin caché en disco el programa sigue funcionando
+
+
+CACHE = CacheCodigo(
+    os.environ.get("LYNX_CACHE_DIR") or os.path.join(os.path.expanduser("~"), ".cache", "lynx")
+)
+
+
+def transpilar_codigo(codigo: str, cache: Optional[CacheCodigo] = CACHE) -> ProgramaTranspilado:
+    """Programa compilado para `codigo`, desde la caché si ya se compiló antes"""
+    if cache is None:
+        return transpilar(analizar_programa(codigo), codigo)
+    clave = cache.clave(codigo)
+    programa = cache.obtener(clave)
+    if programa is None:
+        programa = transpilar(analizar_programa(codigo), codigo, f"<lynx {clave[:12]}>")
+        cache.guardar(clave, programa)
+    return programa
+
+
+def ejecutar_codigo_transpilado(codigo: str, cache: Optional[CacheCodigo] = CACHE) -> ResultadoEjecucion:
+    """Compilar (o tomar de la caché) y ejecutar, capturando salida y errores"""
+    salida: List[str] = []
+    try:
+        transpilar_codigo(codigo, cache).ejecutar(salida.append)
+    except ErrorCompilacion as e:
+        return {"salida": salida, "errores": e.errores}
+    except ErrorEjecucion as e:
+        return {"salida": salida, "errores": [str(e)]}
+    return {"salida": salida, "errores": []}
+
+
+if __name__ == "__main__":
+    if len(sys.argv) not in (2, 3) or (len(sys.argv) == 3 and sys.argv[1] != "--fuente"):
+        print("Uso: python transpilador_lynx.py [--fuente] <archivo.lynx>")
+        sys.exit(1)
+
+    with open(sys.argv[-1], "r", encoding="utf-8") as archivo:
+        contenido = archivo.read()
+
+    try:
+        if len(sys.argv) == 3:
+            print(transpilar(analizar_programa(contenido), contenido).fuente, end="")
+        else:
+            transpilar_codigo(contenido).ejecutar()
+    except ErrorCompilacion as e:
+        for error in e.errores:
+            print(error, file=sys.stderr)
+        sys.exit(1)
+    except ErrorEjecucion as e:
+        print(e, file=sys.stderr)
+        sys.exit(1)
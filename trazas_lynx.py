@@ -0,0 +1,233 @@
+"""Trazas estructuradas: tramos con nivel y eventos, escritos como líneas JSON
+
+Un tramo mide una fase (`with tramo("lexico", caracteres=n):`) y se anida
+con los que se abran dentro, también en otro hilo o en un trabajador del
+EjecutorAnalisis (propagar/continuar). Un evento es un mensaje dentro del
+tramo actual.
+
+Desactivadas (lo normal) no cuestan nada que dependa del código analizado:
+tramo() devuelve un tramo nulo sin armar nada, y los puntos que se visitan
+por nodo preguntan antes `if trazas_lynx.nivel <= DEPURACION`. Los mensajes
+se arman recién al escribirse: `evento(nivel, "x = %r", x)` o con una función
+sin argumentos, así un AST solo se convierte si el evento sale.
+
+El muestreo se decide en el tramo raíz: de una traza se escriben todos los
+tramos o ninguno. Un evento fuera de todo tramo se muestrea solo y se
+escribe suelto.
+
+Se configuran con configurar(); el EjecutorAnalisis pasa nivel y muestreo a
+sus procesos al iniciarlos, que escriben siempre en su stderr.
+"""
+import contextvars
+import os
+import random
+import sys
+import time
+from typing import Any, Callable, NamedTuple, Optional, Tuple, Union
+
+from serializacion_lynx import a_json
+
+DEPURACION = 10
+INFO = 20
+ADVERTENCIA = 30
+ERROR = 40
+DESACTIVADO = 100
+
+NIVELES = {"depuracion": DEPURACION, "info": INFO, "advertencia": ADVERTENCIA, "error": ERROR}
+_NOMBRES = {valor: nombre for nombre, valor in NIVELES.items()}
+
+# Nivel mínimo que se escribe; DESACTIVADO apaga todo
+nivel = DESACTIVADO
+muestreo = 1.0
+
+
+def _escribir_stderr(linea: bytes):
+    # Una sola escritura por línea: los procesos del ejecutor comparten stderr
+    os.write(sys.stderr.fileno(), linea)
+
+
+_destino: Callable[[bytes], Any] = _escribir_stderr
+_actual: contextvars.ContextVar = contextvars.ContextVar("tramo_lynx", default=None)
+
+
+def configurar(
+    nuevo_nivel: Union[str, int, None] = None, nuevo_muestreo: float = 1.0,
+    destino: Optional[Callable[[bytes], Any]] = None,
+):
+    """Nivel ("depuracion", "info", ... o el número; None desactiva), fracción de trazas y destino de cada línea"""
+    global nivel, muestreo, _destino
+    if isinstance(nuevo_nivel, str):
+        if nuevo_nivel not in NIVELES:
+            raise ValueError(f"Nivel de trazas desconocido: {nuevo_nivel}")
+        nuevo_nivel = NIVELES[nuevo_nivel]
+    nivel = DESACTIVADO if nuevo_nivel is None else nuevo_nivel
+    muestreo = nuevo_muestreo
+    _destino = destino or _escribir_stderr
+
+
+def configuracion() -> Tuple[int, float]:
+    """Nivel y muestreo, para configurar() en otro proceso"""
+    return nivel, muestreo
+
+
+def _emitir(registro: dict):
+    _destino(a_json(registro) + b"\n")
+
+
+def _texto(mensaje: Union[str, Callable[[], str]], argumentos: tuple) -> str:
+    if callable(mensaje):
+        return mensaje()
+    return mensaje % argumentos if argumentos else mensaje
+
+
+class _Padre(NamedTuple):
+    """Tramo de otro hilo o proceso del que cuelgan los que se abran aquí"""
+    traza: str
+    id: str
+    muestreado: bool
+
+
+class _Nulo:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        return False
+
+    def anotar(self, **atributos):
+        pass
+
+
+NULO = _Nulo()
+
+
+class Tramo:
+    __slots__ = ("nombre", "traza", "id", "padre", "muestreado", "atributos", "eventos", "inicio", "_reloj", "_token")
+
+    def __init__(self, nombre: str, padre, muestreado: bool, atributos: dict):
+        self.nombre = nombre
+        self.muestreado = muestreado
+        self.atributos = atributos
+        self.eventos: list = []
+        if muestreado:
+            self.traza = padre.traza if padre is not None else f"{random.getrandbits(128):032x}"
+            self.padre = padre.id if padre is not None else None
+            self.id = f"{random.getrandbits(64):016x}"
+
+    def anotar(self, **atributos):
+        self.atributos.update(atributos)
+
+    def __enter__(self) -> "Tramo":
+        self._token = _actual.set(self)
+        self.inicio = time.time()
+        self._reloj = time.perf_counter()
+        return self
+
+    def __exit__(self, tipo, valor, _):
+        _actual.reset(self._token)
+        if not self.muestreado:
+            return False
+        registro = {
+            "traza": self.traza,
+            "tramo": self.id,
+            "padre": self.padre,
+            "nombre": self.nombre,
+            "inicio": round(self.inicio, 6),
+            "ms": round((time.perf_counter() - self._reloj) * 1000, 3),
+            "atributos": self.atributos,
+        }
+        if self.eventos:
+            registro["eventos"] = self.eventos
+        if valor is not None:
+            registro["error"] = f"{tipo.__name__}: {valor}"
+        _emitir(registro)
+        return False
+
+
+def tramo(nombre: str, nivel_tramo: int = INFO, /, **atributos):
+    """Context manager que mide `nombre`; nulo si el nivel no alcanza o la traza no salió en el muestreo"""
+    if nivel_tramo < nivel:
+        return NULO
+    padre = _actual.get()
+    if padre is None:
+        return Tramo(nombre, None, random.random() < muestreo, atributos)
+    if not padre.muestreado:
+        return NULO
+    return Tramo(nombre, padre, True, atributos)
+
+
+def evento(nivel_evento: int, mensaje: Union[str, Callable[[], str]], *argumentos):
+    """Mensaje en el tramo actual; `mensaje % argumentos` (o `mensaje()`) solo si se escribe"""
+    if nivel_evento < nivel:
+        return
+    actual = _actual.get()
+    if actual is None:
+        # Un evento suelto es su propia traza
+        if random.random() >= muestreo:
+            return
+    elif not actual.muestreado:
+        return
+    texto = _texto(mensaje, argumentos)
+    if isinstance(actual, Tramo):
+        actual.eventos.append({
+            "ms": round((time.perf_counter() - actual._reloj) * 1000, 3),
+            "nivel": _NOMBRES.get(nivel_evento, nivel_evento),
+            "mensaje": texto,
+        })
+        return
+    registro = {"nivel": _NOMBRES.get(nivel_evento, nivel_evento), "mensaje": texto, "inicio": round(time.time(), 6)}
+    if actual is not None:
+        registro.update(traza=actual.traza, padre=actual.id)
+    _emitir(registro)
+
+
+def propagar() -> Optional[_Padre]:
+    """El tramo actual, para continuar() en otro hilo o proceso; None si no hay"""
+    if nivel == DESACTIVADO:
+        return None
+    actual = _actual.get()
+    if actual is None:
+        return None
+    if not actual.muestreado:
+        return _Padre("", "", False)
+    return _Padre(actual.traza, actual.id, True)
+
+
+class continuar:
+    """Hacer de `padre` (de propagar) el tramo actual mientras dure el bloque"""
+
+    __slots__ = ("padre", "_token")
+
+    def __init__(self, padre: Optional[_Padre]):
+        self.padre = padre
+
+    def __enter__(self):
+        if self.padre is not None:
+            self._token = _actual.set(self.padre)
+        return self
+
+    def __exit__(self, *_):
+        if self.padre is not None:
+            _actual.reset(self._token)
+        return False
+
+
+class TrazasASGI:
+    """Middleware ASGI: un tramo raíz por pedido HTTP, con método, ruta y estado"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if INFO < nivel or scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        with tramo("http", metodo=scope["method"], ruta=scope["path"]) as actual:
+            async def enviar(mensaje):
+                if mensaje["type"] == "http.response.start":
+                    actual.anotar(estado=mensaje["status"])
+                await send(mensaje)
+
+            await self.app(scope, receive, enviar)
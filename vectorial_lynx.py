@@ -0,0 +1,299 @@
+"""Ejecución vectorizada de bucles `para (x en arreglo)` con numpy
+
+Un bucle se puede vectorizar si su cuerpo solo tiene:
+- reducciones `acc = acc + f(x) - g(x) ...` o `acc = acc * f(x)` (también
+  `f(x) + acc` y `f(x) * acc`), una por acumulador;
+- `imprimir(f(x), ...)`, un mapa elemento a elemento;
+donde f es aritmética (+ - * / % y signos) sobre x, literales numéricos y
+variables que el cuerpo no asigna.
+
+El compilador de bytecode arma el plan; la VM lo intenta cuando la colección
+es un arreglo numérico (ver runtime_lynx.crear_arreglo). El resultado debe ser
+idéntico al del bucle normal: si algo puede diferir (desborde de int64, una
+división por cero, operandos que no son números) el plan se descarta antes de
+tocar nada y el bucle corre como siempre, con sus errores en su lugar.
+"""
+import math
+from typing import Any, Callable, List, Optional
+
+from runtime_lynx import OPERACIONES_BINARIAS, ErrorEjecucion, a_cadena, numpy
+
+# Cota de los enteros intermedios: deja margen para no desbordar int64
+LIMITE_ENTERO = 2 ** 62
+
+X = ("x",)
+
+
+class _NoVectorizable(Exception):
+    pass
+
+
+class PlanVectorial:
+    """Reducciones y mapas de un bucle; `destino` y `costo` los fija el compilador"""
+
+    def __init__(self, reducciones: List[tuple], impresiones: List[List[tuple]]):
+        # (profundidad, ranura, "+" o "*", [(signo, expresión), ...])
+        self.reducciones = reducciones
+        # Una lista de expresiones por `imprimir`, en el orden del cuerpo
+        self.impresiones = impresiones
+        self.destino = 0
+        self.costo = 0
+
+    def __repr__(self):
+        return f"<plan vectorial: {len(self.reducciones)} reducciones, {len(self.impresiones)} mapas>"
+
+    def ejecutar(self, arreglo, locales: list, escribir: Callable[[str], Any]) -> bool:
+        """Ejecutar el bucle completo; False si no se puede hacer de forma exacta"""
+        n = len(arreglo)
+        if n == 0:
+            return True
+        try:
+            evaluador = _Evaluador(arreglo, locales)
+            finales = [
+                (profundidad, ranura, evaluador.reducir(profundidad, ranura, operador, expresion))
+                for profundidad, ranura, operador, expresion in self.reducciones
+            ]
+            columnas = [
+                [evaluador.columna(expresion) for expresion in expresiones]
+                for expresiones in self.impresiones
+            ]
+        except (_NoVectorizable, ErrorEjecucion, OverflowError):
+            return False
+
+        # A partir de aquí no hay vuelta atrás: escribir y guardar
+        if columnas:
+            for i in range(n):
+                for valores in columnas:
+                    escribir(" ".join([a_cadena(columna[i]) for columna in valores]))
+        for profundidad, ranura, valor in finales:
+            _marco(locales, profundidad)[ranura] = valor
+        return True
+
+
+def _marco(locales: list, profundidad: int) -> list:
+    for _ in range(profundidad):
+        locales = locales[0]
+    return locales
+
+
+def _es_vector(valor) -> bool:
+    return type(valor) is numpy.ndarray
+
+
+class _Evaluador:
+    """Evalúa expresiones del plan: cada valor es un escalar de Python o un vector"""
+
+    def __init__(self, arreglo, locales: list):
+        self.arreglo = arreglo
+        self.locales = locales
+        self.n = len(arreglo)
+        self.entero = arreglo.dtype.kind == "i"
+        if self.entero:
+            self.cota_x = max(abs(int(arreglo.max())), abs(int(arreglo.min())))
+        else:
+            if not numpy.isfinite(arreglo).all():
+                raise _NoVectorizable()
+            self.cota_x = None
+
+    def leer(self, profundidad: int, ranura: int):
+        valor = _marco(self.locales, profundidad)[ranura]
+        if type(valor) is not int and type(valor) is not float:
+            raise _NoVectorizable()
+        return valor
+
+    def evaluar(self, expresion):
+        """(valor, cota): la cota es el máximo valor absoluto si el valor es entero"""
+        clase = expresion[0]
+        if clase == "x":
+            return self.arreglo, self.cota_x
+        if clase == "c":
+            valor = expresion[1]
+            return valor, abs(valor) if type(valor) is int else None
+        if clase == "v":
+            valor = self.leer(expresion[1], expresion[2])
+            return valor, abs(valor) if type(valor) is int else None
+        if clase == "un":
+            valor, cota = self.evaluar(expresion[2])
+            return (-valor if expresion[1] == "-" else valor), cota
+        return self.binaria(expresion[1], *self.evaluar(expresion[2]), *self.evaluar(expresion[3]))
+
+    def binaria(self, op: str, a, cota_a, b, cota_b):
+        if not _es_vector(a) and not _es_vector(b):
+            # Dos escalares: la semántica exacta del runtime
+            valor = OPERACIONES_BINARIAS[op](a, b)
+            if type(valor) is int and abs(valor) >= LIMITE_ENTERO:
+                raise _NoVectorizable()
+            return valor, abs(valor) if type(valor) is int else None
+
+        enteros = cota_a is not None and cota_b is not None
+        if op in ("/", "%"):
+            # El bucle normal reporta el error en el elemento que corresponde
+            if (b == 0).any() if _es_vector(b) else b == 0:
+                raise _NoVectorizable()
+        if not enteros:
+            if op == "%":
+                for operando in (a, b):
+                    if not numpy.isfinite(operando).all():
+                        raise _NoVectorizable()
+                return numpy.fmod(a, b), None
+            return {"+": numpy.add, "-": numpy.subtract, "*": numpy.multiply, "/": numpy.true_divide}[op](a, b), None
+
+        if op in ("+", "-"):
+            cota = cota_a + cota_b
+        elif op == "*":
+            cota = cota_a * cota_b
+        else:
+            cota = cota_a
+        if cota >= LIMITE_ENTERO:
+            raise _NoVectorizable()
+        if op == "+":
+            return numpy.add(a, b), cota
+        if op == "-":
+            return numpy.subtract(a, b), cota
+        if op == "*":
+            return numpy.multiply(a, b), cota
+        # División entera truncada hacia cero y resto con el signo del dividendo
+        cociente = numpy.floor_divide(numpy.abs(a), numpy.abs(b))
+        cociente = numpy.where(numpy.less(a, 0) != numpy.less(b, 0), -cociente, cociente)
+        if op == "/":
+            return cociente, cota
+        return numpy.subtract(a, numpy.multiply(b, cociente)), cota
+
+    def vector(self, expresion):
+        valor, cota = self.evaluar(expresion)
+        if not _es_vector(valor):
+            valor = numpy.full(self.n, valor, dtype=numpy.int64 if cota is not None else numpy.float64)
+        return valor, cota
+
+    def columna(self, expresion) -> list:
+        valor, _ = self.evaluar(expresion)
+        return valor.tolist() if _es_vector(valor) else [valor] * self.n
+
+    def reducir(self, profundidad: int, ranura: int, operador: str, terminos: List[tuple]):
+        """Valor final de `acc = acc op t1 op t2 ...` tras recorrer el arreglo"""
+        inicial = self.leer(profundidad, ranura)
+        vectores = [(signo, *self.vector(expresion)) for signo, expresion in terminos]
+        if type(inicial) is int and all(cota is not None for _, _, cota in vectores):
+            # Entero exacto: el orden de las operaciones no importa
+            if operador == "*":
+                return inicial * math.prod(vectores[0][1].tolist())
+            total = inicial
+            for signo, valores, cota in vectores:
+                suma = int(valores.sum()) if cota * self.n < LIMITE_ENTERO else sum(valores.tolist())
+                total = total + suma if signo == "+" else total - suma
+            return total
+        if type(inicial) is int and vectores[0][2] is not None:
+            # La primera operación sería entera y las siguientes flotantes
+            raise _NoVectorizable()
+
+        # Flotante: acumular en orden, igual que el bucle (sin suma por pares);
+        # a - b es exactamente a + (-b) con b ya flotante (-0.0, no el 0 entero)
+        columnas = numpy.empty((self.n, len(vectores)), dtype=numpy.float64)
+        for j, (signo, valores, _) in enumerate(vectores):
+            columnas[:, j] = valores
+            if signo == "-":
+                numpy.negative(columnas[:, j], out=columnas[:, j])
+        serie = numpy.concatenate((numpy.array([float(inicial)]), columnas.ravel()))
+        # Desbordar a inf (o llegar a nan) es lo que hace el bucle, sin avisos
+        with numpy.errstate(over="ignore", invalid="ignore"):
+            if operador == "*":
+                return float(numpy.multiply.accumulate(serie)[-1])
+            return float(numpy.add.accumulate(serie)[-1])
+
+
+class _Planificador:
+    def __init__(self, compilador, simbolo_x):
+        self.compilador = compilador
+        self.simbolo_x = simbolo_x
+        self.acumuladores = set()
+
+    def expresion(self, nodo) -> Optional[tuple]:
+        if type(nodo) is int or type(nodo) is float:
+            return ("c", nodo)
+        clase = nodo.__class__.__name__
+        if clase == "Identificador":
+            simbolo = self.compilador.simbolo_de(nodo, nodo.nombre)
+            if simbolo is self.simbolo_x:
+                return X
+            if id(simbolo) in self.acumuladores:
+                return None
+            return ("v", *self.compilador.ubicar(nodo, nodo.nombre))
+        if clase == "ExpresionBinaria" and nodo.op in ("+", "-", "*", "/", "%"):
+            izq = self.expresion(nodo.izq)
+            der = self.expresion(nodo.der)
+            if izq is None or der is None:
+                return None
+            return ("bin", nodo.op, izq, der)
+        if clase == "ExpresionUnaria" and nodo.op in ("-", "+"):
+            operando = self.expresion(nodo.expr)
+            return None if operando is None else ("un", nodo.op, operando)
+        return None
+
+    def es_acumulador(self, nodo, simbolo) -> bool:
+        return (
+            nodo.__class__.__name__ == "Identificador"
+            and self.compilador.simbolo_de(nodo, nodo.nombre) is simbolo
+        )
+
+    def reduccion(self, valor, simbolo) -> Optional[tuple]:
+        """(operador, términos) de `acc * f`, `f * acc`, `f + acc` o `acc ± f ± g ...`"""
+        if valor.__class__.__name__ != "ExpresionBinaria" or valor.op not in ("+", "-", "*"):
+            return None
+        if valor.op in ("+", "*") and self.es_acumulador(valor.der, simbolo):
+            termino = self.expresion(valor.izq)
+            return None if termino is None else (valor.op, [(valor.op, termino)])
+        if valor.op == "*":
+            termino = self.expresion(valor.der) if self.es_acumulador(valor.izq, simbolo) else None
+            return None if termino is None else ("*", [("*", termino)])
+
+        # Cadena izquierda de sumas y restas que empieza en el acumulador
+        terminos = []
+        while valor.__class__.__name__ == "ExpresionBinaria" and valor.op in ("+", "-"):
+            termino = self.expresion(valor.der)
+            if termino is None:
+                return None
+            terminos.append((valor.op, termino))
+            valor = valor.izq
+        if not self.es_acumulador(valor, simbolo):
+            return None
+        return "+", terminos[::-1]
+
+    def planificar(self, bloque) -> Optional[PlanVectorial]:
+        sentencias = bloque if isinstance(bloque, list) else [bloque]
+        asignaciones = []
+        for sentencia in sentencias:
+            clase = sentencia.__class__.__name__
+            if clase == "AsignacionVariable":
+                simbolo = self.compilador.simbolo_de(sentencia, sentencia.nombre)
+                if simbolo is self.simbolo_x or id(simbolo) in self.acumuladores:
+                    return None
+                self.acumuladores.add(id(simbolo))
+                asignaciones.append((sentencia, simbolo))
+            elif clase != "Imprimir":
+                return None
+        if not sentencias:
+            return None
+
+        reducciones, impresiones = [], []
+        for sentencia in sentencias:
+            if sentencia.__class__.__name__ == "Imprimir":
+                expresiones = [self.expresion(elemento) for elemento in sentencia.elementos]
+                if not expresiones or None in expresiones:
+                    return None
+                impresiones.append(expresiones)
+        for sentencia, simbolo in asignaciones:
+            reduccion = self.reduccion(sentencia.valor, simbolo)
+            if reduccion is None:
+                return None
+            reducciones.append((*self.compilador.ubicar(sentencia, sentencia.nombre), *reduccion))
+        return PlanVectorial(reducciones, impresiones)
+
+
+def planificar_para_cada(compilador, variable, bloque) -> Optional[PlanVectorial]:
+    """Plan del cuerpo de `para (variable en ...)`, o None si no es vectorizable
+
+    `compilador` es un ResolucionRanuras: da los símbolos y sus ranuras.
+    """
+    if not bloque:
+        return None
+    return _Planificador(compilador, compilador.simbolo_de(variable, variable.nombre)).planificar(bloque)
@@ -0,0 +1,492 @@
+import sys
+from collections import OrderedDict
+from typing import Any, Callable, List, Optional
+
+from bytecode_lynx import (
+    BOOLEANO, CARGAR_CONST, CARGAR_EXTERNA, CARGAR_LOCAL, CONSTRUIR_ARREGLO,
+    CONSTRUIR_TABLA, CREAR_FUNCION, DESPACHAR, DIFERENTE, DIVIDIR, FIN_INTENTAR,
+    GUARDAR_EXTERNA, GUARDAR_LOCAL, IDENTIDAD, IGUAL, IMPRIMIR, INDEXAR, INTENTAR,
+    ITERAR, LLAMAR, MAYOR, MAYOR_IGUAL, MENOR, MENOR_IGUAL, MENSAJE_ERROR, MODULO,
+    MULTIPLICAR, NO, O_CORTO, OPUESTO, PERFIL_ENTRAR, PERFIL_LINEA, PERFIL_SALIR,
+    PREDETERMINADO, RELANZAR, RESTAR, RETORNAR, CONSTRUIR_NUMERICO, VECTORIZAR,
+    SACAR, SALTAR, SALTAR_SI_FALSO, SALTAR_SI_VERDADERO, SIGUIENTE, SUMAR,
+    Y_CORTO, CodigoFuncion, FuncionBytecode, compilar_codigo_bytecode,
+    desensamblar,
+)
+from especializador_lynx import MAX_FALLOS_GUARDA, UMBRAL_CALIENTE, BucleEspecializado, NoEspecializable, especializar
+from interprete_lynx import ErrorCompilacion, clave_caso
+from runtime_lynx import (
+    ARREGLO_NUMERICO,
+    Cuerda,
+    ErrorEjecucion,
+    a_cadena,
+    booleano,
+    crear_arreglo,
+    dividir,
+    iguales,
+    identidad,
+    indexar,
+    iterar,
+    mayor,
+    mayor_igual,
+    menor,
+    menor_igual,
+    modulo,
+    multiplicar,
+    negar,
+    opuesto,
+    restar,
+    sumar,
+    tipo_de,
+    verificar_aridad,
+)
+
+MAX_PROFUNDIDAD_POR_DEFECTO = 10000
+TAMANO_MEMO_POR_DEFECTO = 4096
+
+# Resultado ausente en el memo (None es un resultado válido)
+AUSENTE = object()
+# Presupuesto que reciben los bucles especializados cuando no hay límite
+SIN_LIMITE = 1 << 62
+
+
+class PresupuestoAgotado(Exception):
+    """El programa superó su presupuesto de instrucciones
+
+    No hereda de ErrorEjecucion para que `intentar` no pueda atraparlo.
+    """
+
+
+def clave_llamada(funcion: CodigoFuncion, argumentos: list) -> Optional[tuple]:
+    """Clave de memo de una llamada, o None si algún argumento no es escalar
+
+    Los tipos se distinguen aunque los valores sean iguales en Python (1,
+    1.0 y verdadero), y los flotantes van por su representación exacta para
+    separar 0.0 de -0.0.
+    """
+    clave = [funcion]
+    for valor in argumentos:
+        tipo = type(valor)
+        if tipo is int or tipo is str or valor is None:
+            clave.append(valor)
+        elif tipo is float:
+            clave.append((float, valor.hex()))
+        elif tipo is bool:
+            clave.append((bool, valor))
+        elif tipo is Cuerda:
+            clave.append(valor.texto())
+        else:
+            return None
+    return tuple(clave)
+
+
+class MemoLlamadas:
+    """Resultados de llamadas a funciones puras, con desalojo LRU"""
+
+    def __init__(self, capacidad: int = TAMANO_MEMO_POR_DEFECTO):
+        self.capacidad = capacidad
+        self.entradas: "OrderedDict[tuple, Any]" = OrderedDict()
+        self.estadisticas = {"aciertos": 0, "fallos": 0, "desalojos": 0}
+
+    def buscar(self, clave: tuple) -> Any:
+        valor = self.entradas.get(clave, AUSENTE)
+        if valor is AUSENTE:
+            self.estadisticas["fallos"] += 1
+        else:
+            self.entradas.move_to_end(clave)
+            self.estadisticas["aciertos"] += 1
+        return valor
+
+    def guardar(self, clave: tuple, valor: Any):
+        self.entradas[clave] = valor
+        if len(self.entradas) > self.capacidad:
+            self.entradas.popitem(last=False)
+            self.estadisticas["desalojos"] += 1
+
+
+class MaquinaVirtual:
+    """Máquina de pila para el bytecode de bytecode_lynx
+
+    Las llamadas no usan la pila de Python: cada marco se guarda en una lista,
+    así que la recursión de Lynx solo está limitada por `max_profundidad`.
+
+    Con `presupuesto` se cobra el cuerpo de un bucle en cada salto hacia atrás
+    y una instrucción por llamada; al agotarse se lanza PresupuestoAgotado.
+    El código en línea recta no se cobra: su costo ya está acotado por su tamaño.
+
+    El código compilado con `perfilar=True` necesita un `perfil` (ver
+    perfil_lynx.Perfil) que recibe las marcas de línea, entrada y salida.
+
+    Las llamadas a funciones puras con argumentos escalares se memoizan en un
+    LRU de `memo` entradas (0 lo desactiva). Un acierto cuesta una instrucción
+    del presupuesto, como cualquier llamada. Con perfil no se memoiza, para
+    que el perfil cuente las llamadas que hace el programa.
+
+    Con `especializar` los bucles que pasan de UMBRAL_CALIENTE vueltas corren
+    como funciones de Python especializadas para los tipos de sus variables
+    (ver especializador_lynx); `estadisticas` cuenta qué se especializó y cuántas
+    veces se volvió al camino genérico. Con perfil no se especializa.
+    """
+
+    def __init__(
+        self,
+        escribir: Optional[Callable[[str], Any]] = None,
+        max_profundidad: int = MAX_PROFUNDIDAD_POR_DEFECTO,
+        presupuesto: Optional[int] = None,
+        perfil=None,
+        memo: int = TAMANO_MEMO_POR_DEFECTO,
+        especializar: bool = True,
+    ):
+        self.escribir = escribir or print
+        self.max_profundidad = max_profundidad
+        self.presupuesto = presupuesto
+        self.consumidas = 0
+        self.perfil = perfil
+        self.memo = MemoLlamadas(memo) if memo else None
+        self.especializar = especializar
+        self.estadisticas = {
+            "especializados": 0, "rechazados": 0, "entradas": 0,
+            "desoptimizaciones": 0, "fallos_guarda": 0,
+        }
+
+    def ejecutar(self, programa: CodigoFuncion) -> Any:
+        if programa.perfilado and self.perfil is None:
+            raise ValueError("El programa se compiló para perfilar y no se indicó un perfil")
+        limitado = self.presupuesto is not None
+        restante = self.presupuesto if limitado else 0
+        try:
+            return self._ejecutar(programa, limitado, restante)
+        finally:
+            if limitado:
+                self.consumidas = self.presupuesto - self._restante
+            if self.perfil is not None:
+                self.perfil.terminar()
+
+    def _ejecutar(self, programa: CodigoFuncion, limitado: bool, restante: int) -> Any:
+        escribir = self.escribir
+        max_profundidad = self.max_profundidad
+        perfil = self.perfil
+        memo = self.memo if perfil is None else None
+        especializa = self.especializar and perfil is None
+        self._restante = restante
+
+        # Pila de llamadas: (funcion, pc, locales, pila, manejadores, clave);
+        # `clave` es la del memo para el resultado de la llamada en curso
+        marcos: List[tuple] = []
+        funcion = programa
+        codigo = funcion.codigo
+        constantes = funcion.constantes
+        locales: list = [None] * funcion.num_locales
+        pila: list = []
+        manejadores: List[tuple] = []
+        pc = 0
+
+        while True:
+            try:
+                while True:
+                    op = codigo[pc]
+                    arg = codigo[pc + 1]
+                    pc += 2
+
+                    if op == CARGAR_LOCAL:
+                        pila.append(locales[arg])
+                    elif op == CARGAR_CONST:
+                        pila.append(constantes[arg])
+                    elif op == GUARDAR_LOCAL:
+                        locales[arg] = pila.pop()
+                    elif op == SALTAR_SI_FALSO:
+                        c = pila.pop()
+                        if c is False:
+                            pc = arg
+                        elif c is not True:
+                            booleano(c, funcion.mensajes.get(pc - 2, "La condición"))
+                    elif op == SALTAR:
+                        if arg < pc:
+                            if limitado:
+                                restante -= (pc - arg) >> 1
+                                if restante < 0:
+                                    self._restante = restante
+                                    raise PresupuestoAgotado(self.presupuesto)
+                            if especializa:
+                                bucle = funcion.calientes.get(arg, 0)
+                                if bucle.__class__ is int:
+                                    if bucle < UMBRAL_CALIENTE:
+                                        funcion.calientes[arg] = bucle + 1
+                                    else:
+                                        funcion.calientes[arg] = self._especializar(funcion, arg, pc - 2, locales)
+                                elif bucle:
+                                    resultado = bucle.ejecutar(locales, restante if limitado else SIN_LIMITE)
+                                    if resultado is not None:
+                                        pc, extra, sobrante, desoptimizado = resultado
+                                        if extra:
+                                            pila.extend(extra)
+                                        if limitado:
+                                            restante = sobrante
+                                        self.estadisticas["entradas"] += 1
+                                        if desoptimizado:
+                                            self.estadisticas["desoptimizaciones"] += 1
+                                        continue
+                                    self._fallo_guarda(funcion, bucle)
+                        pc = arg
+                    elif op == SUMAR:
+                        b = pila.pop()
+                        a = pila[-1]
+                        if type(a) is int and type(b) is int:
+                            pila[-1] = a + b
+                        else:
+                            pila[-1] = sumar(a, b)
+                    elif op == MENOR:
+                        b = pila.pop()
+                        a = pila[-1]
+                        if type(a) is int and type(b) is int:
+                            pila[-1] = a < b
+                        else:
+                            pila[-1] = menor(a, b)
+                    elif op == RESTAR:
+                        b = pila.pop()
+                        a = pila[-1]
+                        if type(a) is int and type(b) is int:
+                            pila[-1] = a - b
+                        else:
+                            pila[-1] = restar(a, b)
+                    elif op == MULTIPLICAR:
+                        b = pila.pop()
+                        a = pila[-1]
+                        if type(a) is int and type(b) is int:
+                            pila[-1] = a * b
+                        else:
+                            pila[-1] = multiplicar(a, b)
+                    elif op == IGUAL:
+                        b = pila.pop()
+                        pila[-1] = iguales(pila[-1], b)
+                    elif op == MAYOR:
+                        b = pila.pop()
+                        a = pila[-1]
+                        if type(a) is int and type(b) is int:
+                            pila[-1] = a > b
+                        else:
+                            pila[-1] = mayor(a, b)
+                    elif op == MENOR_IGUAL:
+                        b = pila.pop()
+                        pila[-1] = menor_igual(pila[-1], b)
+                    elif op == MAYOR_IGUAL:
+                        b = pila.pop()
+                        pila[-1] = mayor_igual(pila[-1], b)
+                    elif op == DIFERENTE:
+                        b = pila.pop()
+                        pila[-1] = not iguales(pila[-1], b)
+                    elif op == MODULO:
+                        b = pila.pop()
+                        pila[-1] = modulo(pila[-1], b)
+                    elif op == DIVIDIR:
+                        b = pila.pop()
+                        pila[-1] = dividir(pila[-1], b)
+                    elif op == INDEXAR:
+                        indice = pila.pop()
+                        pila[-1] = indexar(pila[-1], indice)
+                    elif op == CARGAR_EXTERNA:
+                        marco = locales
+                        for _ in range(arg >> 16):
+                            marco = marco[0]
+                        pila.append(marco[arg & 0xFFFF])
+                    elif op == GUARDAR_EXTERNA:
+                        marco = locales
+                        for _ in range(arg >> 16):
+                            marco = marco[0]
+                        marco[arg & 0xFFFF] = pila.pop()
+                    elif op == LLAMAR:
+                        f = pila[-arg - 1]
+                        if type(f) is not FuncionBytecode:
+                            raise ErrorEjecucion(f"'{a_cadena(f)}' no es una función ({tipo_de(f)})")
+                        llamado = f.codigo
+                        if llamado.aridad != arg:
+                            verificar_aridad(llamado.nombre, llamado.aridad, arg)
+                        if len(marcos) >= max_profundidad:
+                            raise ErrorEjecucion("Recursión demasiado profunda")
+                        if limitado:
+                            restante -= 1
+                            if restante < 0:
+                                self._restante = restante
+                                raise PresupuestoAgotado(self.presupuesto)
+                        clave = None
+                        if llamado.pura and memo is not None:
+                            clave = clave_llamada(llamado, pila[len(pila) - arg:])
+                            if clave is not None:
+                                valor = memo.buscar(clave)
+                                if valor is not AUSENTE:
+                                    del pila[-arg - 1:]
+                                    pila.append(valor)
+                                    continue
+                        nuevos = [None] * llamado.num_locales
+                        nuevos[0] = f.entorno
+                        if arg:
+                            nuevos[1:arg + 1] = pila[-arg:]
+                        del pila[-arg - 1:]
+                        marcos.append((funcion, pc, locales, pila, manejadores, clave))
+                        funcion = llamado
+                        codigo = llamado.codigo
+                        constantes = llamado.constantes
+                        locales = nuevos
+                        pila = []
+                        manejadores = []
+                        pc = 0
+                    elif op == RETORNAR:
+                        resultado = pila.pop()
+                        if not marcos:
+                            self._restante = restante
+                            return resultado
+                        funcion, pc, locales, pila, manejadores, clave = marcos.pop()
+                        if clave is not None:
+                            memo.guardar(clave, resultado)
+                        codigo = funcion.codigo
+                        constantes = funcion.constantes
+                        pila.append(resultado)
+                    elif op == SACAR:
+                        pila.pop()
+                    elif op == Y_CORTO:
+                        c = pila[-1]
+                        if c is not True and not booleano(c, funcion.mensajes.get(pc - 2, "")):
+                            pc = arg
+                        else:
+                            pila.pop()
+                    elif op == O_CORTO:
+                        c = pila[-1]
+                        if c is True or booleano(c, funcion.mensajes.get(pc - 2, "")):
+                            pc = arg
+                        else:
+                            pila.pop()
+                    elif op == BOOLEANO:
+                        c = pila[-1]
+                        if c is not True and c is not False:
+                            booleano(c, constantes[arg])
+                    elif op == SALTAR_SI_VERDADERO:
+                        c = pila.pop()
+                        if c is True:
+                            pc = arg
+                        elif c is not False:
+                            booleano(c, funcion.mensajes.get(pc - 2, "La condición"))
+                    elif op == NO:
+                        c = pila[-1]
+                        pila[-1] = (c is False) if (c is True or c is False) else negar(c)
+                    elif op == OPUESTO:
+                        pila[-1] = opuesto(pila[-1])
+                    elif op == IDENTIDAD:
+                        pila[-1] = identidad(pila[-1])
+                    elif op == ITERAR:
+                        pila[-1] = iter(iterar(pila[-1]))
+                    elif op == SIGUIENTE:
+                        try:
+                            pila.append(next(pila[-1]))
+                        except StopIteration:
+                            pila.pop()
+                            pc = arg
+                    elif op == IMPRIMIR:
+                        valores = pila[-arg:] if arg else []
+                        if arg:
+                            del pila[-arg:]
+                        escribir(" ".join([a_cadena(valor) for valor in valores]))
+                    elif op == CONSTRUIR_ARREGLO:
+                        elementos = pila[-arg:] if arg else []
+                        if arg:
+                            del pila[-arg:]
+                        pila.append(elementos)
+                    elif op == CONSTRUIR_TABLA:
+                        valores = pila[-2 * arg:] if arg else []
+                        if arg:
+                            del pila[-2 * arg:]
+                        pila.append(dict(zip(valores[0::2], valores[1::2])))
+                    elif op == CREAR_FUNCION:
+                        pila.append(FuncionBytecode(constantes[arg], locales))
+                    elif op == DESPACHAR:
+                        tabla = constantes[arg]
+                        pc = tabla.get(clave_caso(pila.pop()), tabla[PREDETERMINADO])
+                    elif op == INTENTAR:
+                        manejadores.append((arg, len(pila)))
+                    elif op == FIN_INTENTAR:
+                        manejadores.pop()
+                    elif op == MENSAJE_ERROR:
+                        pila[-1] = pila[-1].mensaje
+                    elif op == RELANZAR:
+                        raise pila.pop()
+                    elif op == CONSTRUIR_NUMERICO:
+                        elementos = pila[-arg:] if arg else []
+                        if arg:
+                            del pila[-arg:]
+                        pila.append(crear_arreglo(elementos))
+                    elif op == VECTORIZAR:
+                        plan = constantes[arg]
+                        coleccion = pila[-1]
+                        if type(coleccion) is ARREGLO_NUMERICO:
+                            costo = len(coleccion) * plan.costo if limitado else 0
+                            # Sin presupuesto suficiente corre el bucle normal hasta agotarlo
+                            if costo <= restante and plan.ejecutar(coleccion, locales, escribir):
+                                restante -= costo
+                                pila.pop()
+                                pc = plan.destino
+                    # Al final de la cadena: el código sin perfilar nunca llega aquí
+                    elif op == PERFIL_LINEA:
+                        perfil.linea(arg, len(marcos))
+                    elif op == PERFIL_ENTRAR:
+                        perfil.entrar(funcion.nombre, len(marcos))
+                    elif op == PERFIL_SALIR:
+                        perfil.salir(len(marcos))
+                    else:
+                        raise RuntimeError(f"Opcode desconocido: {op}")
+            except ErrorEjecucion as error:
+                error.ubicar(funcion.lineas[(pc - 2) // 2] or None)
+                # Desenrollar hasta el marco con un manejador activo
+                while not manejadores:
+                    if not marcos:
+                        self._restante = restante
+                        raise
+                    funcion, pc, locales, pila, manejadores, _ = marcos.pop()
+                    codigo = funcion.codigo
+                    constantes = funcion.constantes
+                destino, altura = manejadores.pop()
+                del pila[altura:]
+                pila.append(error)
+                pc = destino
+
+
+    def _especializar(self, funcion: CodigoFuncion, cabecera: int, salto: int, locales: list):
+        try:
+            bucle = especializar(funcion, cabecera, salto, locales)
+        except NoEspecializable:
+            self.estadisticas["rechazados"] += 1
+            return False
+        self.estadisticas["especializados"] += 1
+        return bucle
+
+    def _fallo_guarda(self, funcion: CodigoFuncion, bucle: BucleEspecializado):
+        # Los tipos cambiaron: tras varios fallos el bucle queda en la VM
+        self.estadisticas["fallos_guarda"] += 1
+        bucle.fallos += 1
+        if bucle.fallos >= MAX_FALLOS_GUARDA:
+            funcion.calientes[bucle.cabecera] = False
+
+
+def ejecutar_bytecode(programa: CodigoFuncion, escribir=None) -> Any:
+    return MaquinaVirtual(escribir).ejecutar(programa)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) not in (2, 3) or (len(sys.argv) == 3 and sys.argv[1] != "--desensamblar"):
+        print("Uso: python vm_lynx.py [--desensamblar] <archivo.lynx>")
+        sys.exit(1)
+
+    with open(sys.argv[-1], "r", encoding="utf-8") as archivo:
+        contenido = archivo.read()
+
+    try:
+        programa = compilar_codigo_bytecode(contenido)
+        if len(sys.argv) == 3:
+            print(desensamblar(programa))
+        else:
+            ejecutar_bytecode(programa)
+    except ErrorCompilacion as e:
+        for error in e.errores:
+            print(error, file=sys.stderr)
+        sys.exit(1)
+    except ErrorEjecucion as e:
+        print(e, file=sys.stderr)
+        sys.exit(1)